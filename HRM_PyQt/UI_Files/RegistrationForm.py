@@ -1,18 +1,46 @@
 import sys
-import re
+import sqlite3
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QComboBox,
     QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QSizePolicy
 )
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
+from database import get_repository
+from credentials import CredentialStore
+from audit import record
+from email_registry import get_email_registry
+from workers import run_in_background
+from form_validation import FieldValidator, repolish
+from theme import apply_theme, set_role, set_variant
+from permissions import REGISTER_EMPLOYEES, unrestricted_session
+from assets import logo_pixmap
+from tracing import install_from_environment
+from validation_rules import (
+    EMAIL_TAKEN, POSITIONS, ValidationResult, check_name, check_email, check_registration_password
+)
+
+NOT_ALLOWED = "Sign in with an account that may register employees."
+
 
 class RegistrationWindow(QWidget):
-    def __init__(self):
+    def __init__(self, repository=None, session=None):
         super().__init__()
+        self.repository = repository or get_repository()
+        # Registering creates an employee and a login account: only a session
+        # allowed to register employees may submit (there is no default)
+        self.session = session
+        self.credentials = CredentialStore(self.repository)
+        self.email_registry = get_email_registry(self.repository)
         self.setWindowTitle("HRM System - Registration")
         self.setFixedSize(900, 500)
+        apply_theme()
         self.setup_ui()
+        if not self.can_register():
+            for widget in (self.name_input, self.email_input, self.password_input,
+                           self.position_input, self.submit_btn):
+                widget.setEnabled(False)
+            self.show_status(NOT_ALLOWED, "error")
 
     def setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -20,33 +48,20 @@ class RegistrationWindow(QWidget):
 
         # ================= LEFT LOGO PANEL =================
         left_panel = QFrame()
+        left_panel.setObjectName("brandPanel")
         left_panel.setFixedWidth(300)
-        left_panel.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e3a5f,
-                    stop:1 #2b6cb0
-                );
-            }
-        """)
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(20, 50, 20, 20)
         left_layout.setSpacing(10)
 
         # Logo
         logo_label = QLabel()
-        try:
-            pixmap = QPixmap('fbsl_logo.png')
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(180, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                raise Exception("Pixmap is null")
-        except:
+        pixmap = logo_pixmap("registration")
+        if not pixmap.isNull():
+            logo_label.setPixmap(pixmap)
+        else:
             logo_label.setText("FBSL")
             logo_label.setFont(QFont("Segoe UI", 38, QFont.Bold))
-            logo_label.setStyleSheet("color: white;")
         logo_label.setAlignment(Qt.AlignCenter)
         left_layout.addWidget(logo_label, alignment=Qt.AlignTop)
 
@@ -54,7 +69,6 @@ class RegistrationWindow(QWidget):
         welcome_label = QLabel("Welcome to FBSL HRM System!\nPlease register below.")
         welcome_label.setWordWrap(True)
         welcome_label.setFont(QFont("Segoe UI", 11))
-        welcome_label.setStyleSheet("color: white;")
         welcome_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
         left_layout.addSpacing(30)
         left_layout.addWidget(welcome_label)
@@ -62,12 +76,7 @@ class RegistrationWindow(QWidget):
 
         # ================= RIGHT FORM PANEL =================
         right_panel = QFrame()
-        right_panel.setStyleSheet("""
-            QFrame {
-                background-color: white; 
-                border-radius: 12px;
-            }
-        """)
+        right_panel.setObjectName("registrationFormPanel")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(30, 30, 30, 30)
         right_layout.setSpacing(10)
@@ -75,7 +84,7 @@ class RegistrationWindow(QWidget):
         # Header
         header = QLabel("Register New Employee")
         header.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        header.setStyleSheet("color: #1e3a5f;")
+        set_role(header, "heading")
         right_layout.addWidget(header, alignment=Qt.AlignTop)
         right_layout.addSpacing(10)
 
@@ -84,14 +93,14 @@ class RegistrationWindow(QWidget):
         self.name_input.setPlaceholderText("Full Name")
         self.name_input.setFixedHeight(28)
         self.name_error = QLabel()
-        self.name_error.setStyleSheet("color: red; font-size: 10px;")
+        set_role(self.name_error, "error")
         self.name_error.setFixedHeight(12)
 
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Email Address")
         self.email_input.setFixedHeight(28)
         self.email_error = QLabel()
-        self.email_error.setStyleSheet("color: red; font-size: 10px;")
+        set_role(self.email_error, "error")
         self.email_error.setFixedHeight(12)
 
         self.password_input = QLineEdit()
@@ -99,11 +108,11 @@ class RegistrationWindow(QWidget):
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setFixedHeight(28)
         self.password_error = QLabel()
-        self.password_error.setStyleSheet("color: red; font-size: 10px;")
+        set_role(self.password_error, "error")
         self.password_error.setFixedHeight(12)
 
         self.position_input = QComboBox()
-        self.position_input.addItems(["HR", "Project Manager", "Director"])
+        self.position_input.addItems(POSITIONS)
         self.position_input.setFixedHeight(28)
 
         # Add fields
@@ -120,14 +129,20 @@ class RegistrationWindow(QWidget):
         btn_layout.setSpacing(10)
         self.submit_btn = QPushButton("Submit")
         self.submit_btn.setFixedHeight(30)
-        self.submit_btn.setStyleSheet("background-color:#4299e1; color:white; border-radius:5px;")
+        set_variant(self.submit_btn, "primary")
         self.cancel_btn = QPushButton("Cancel")
         self.cancel_btn.setFixedHeight(30)
-        self.cancel_btn.setStyleSheet("background-color:#e2e8f0; color:#2d3748; border-radius:5px;")
+        set_variant(self.cancel_btn, "secondary")
         btn_layout.addWidget(self.submit_btn)
         btn_layout.addWidget(self.cancel_btn)
         right_layout.addSpacing(10)
         right_layout.addLayout(btn_layout)
+
+        # Outcome of the last submit; cleared once the form is edited again
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        self.status_label.setVisible(False)
+        right_layout.addWidget(self.status_label)
         right_layout.addStretch()
 
         # ================= Assemble Main Layout =================
@@ -137,43 +152,98 @@ class RegistrationWindow(QWidget):
         main_layout.setStretch(1, 2)  # Right panel takes more space
 
         # ================= Signals =================
-        self.name_input.textChanged.connect(self.validate_name)
-        self.email_input.textChanged.connect(self.validate_email)
-        self.password_input.textChanged.connect(self.validate_password)
+        # Debounced checks shared with the login form; labels keep their fixed slot
+        self.name_check = FieldValidator(
+            self.name_input, check_name, self.name_error, style_field=False, hide_empty_label=False
+        )
+        # Taken emails are flagged as you type: the in-memory registry rules
+        # out most new addresses and the rest are confirmed on a worker
+        self.email_check = FieldValidator(
+            self.email_input, check_email, self.email_error, style_field=False, hide_empty_label=False,
+            confirm=self.check_email_free, prefilter=self.email_registry.might_exist
+        )
+        if not self.email_registry.ready:
+            run_in_background(self.email_registry.build)
+        self.password_check = FieldValidator(
+            self.password_input, check_registration_password, self.password_error,
+            style_field=False, hide_empty_label=False
+        )
 
         # Optional: connect buttons
         self.submit_btn.clicked.connect(self.submit_form)
         self.cancel_btn.clicked.connect(self.close)
+        for field in (self.name_input, self.email_input, self.password_input):
+            field.textEdited.connect(lambda _: self.status_label.setVisible(False))
 
-    # -------- Validation Functions --------
-    def validate_name(self):
-        text = self.name_input.text()
-        self.name_error.setText("" if len(text.strip()) >= 3 else "Name must be at least 3 characters")
+    def can_register(self):
+        return self.session is not None and self.session.can(REGISTER_EMPLOYEES)
 
-    def validate_email(self):
-        text = self.email_input.text()
-        self.email_error.setText("" if re.match(r"[^@]+@[^@]+\.[^@]+", text) else "Invalid email format")
+    # -------- Validation Functions --------
+    def validate_form(self):
+        """Run every field check now, skipping the debounce"""
+        checks = (self.name_check, self.email_check, self.password_check)
+        return all([check.flush().valid for check in checks])
 
-    def validate_password(self):
-        text = self.password_input.text()
-        self.password_error.setText("" if len(text) >= 6 else "Password must be at least 6 characters")
+    def check_email_free(self, email):
+        """Worker-thread confirmation for a possible hit in the email registry"""
+        if self.email_registry.exists(email):
+            return ValidationResult("false", EMAIL_TAKEN, 0)
+        return None
 
     # -------- Button Actions --------
     def submit_form(self):
-        self.validate_name()
-        self.validate_email()
-        self.validate_password()
-        if not self.name_error.text() and not self.email_error.text() and not self.password_error.text():
-            print("Form Submitted:")
-            print("Name:", self.name_input.text())
-            print("Email:", self.email_input.text())
-            print("Position:", self.position_input.currentText())
+        if not self.can_register():
+            self.show_status(NOT_ALLOWED, "error")
+            return
+        if self.validate_form():
+            # An account without an employee (e.g. a seeded one) keeps its password
+            if self.credentials.account_exists(self.email_input.text()):
+                self.email_check.show_error(EMAIL_TAKEN)
+                return
+            try:
+                employee_id = self.repository.add_employee(
+                    self.name_input.text(),
+                    self.email_input.text(),
+                    position=self.position_input.currentText()
+                )
+            except sqlite3.IntegrityError:
+                self.email_check.show_error(EMAIL_TAKEN)
+                return
+            record(self.repository, "employee.register", user=self.session.username,
+                   employee_id=employee_id, email=self.email_input.text(),
+                   position=self.position_input.currentText())
+            emp_no = self.repository.get_employee(employee_id)["emp_no"]
+            # Hashing takes a few hundred milliseconds; keep it off the GUI thread
+            run_in_background(
+                self.credentials.create_account,
+                self.email_input.text(), self.password_input.text(), employee_id,
+                on_error=lambda message, emp_no=emp_no: self.show_status(
+                    f"{emp_no} was registered, but its login account could not be created: "
+                    "the email already has one.", "error")
+            )
+            self.show_status(f"Registered {self.name_input.text().strip()} as {emp_no}.", "success")
+            # Ready for the next employee
+            for field in (self.name_input, self.email_input, self.password_input):
+                field.clear()
+            for check in (self.name_check, self.email_check, self.password_check):
+                check.reset()
+            self.name_input.setFocus()
         else:
-            print("Fix the errors before submitting.")
+            self.show_status("Fix the errors before submitting.", "error")
+
+    def show_status(self, message, role):
+        self.status_label.setText(message)
+        if self.status_label.property("role") != role:
+            set_role(self.status_label, role)
+            repolish(self.status_label)
+        self.status_label.setVisible(True)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 10))
-    window = RegistrationWindow()
+    apply_theme(app)
+    install_from_environment()
+    # Run on its own for development: the local user may do everything
+    window = RegistrationWindow(session=unrestricted_session())
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,136 @@
+"""Non-blocking animations: shake feedback, page fades, number tweens
+
+Everything here runs on Qt's animation timer, so nothing re-enters the
+event loop or waits for an animation to end. Values are computed from the
+elapsed time on each tick, so when the GUI thread is busy the animation
+skips ahead to where it should be instead of queueing the missed frames.
+
+Starting an animation on a target that is already animating the same thing
+takes over the running one (a second shake restarts from the widget's
+resting position, a tween continues from the value on screen), so rapid
+updates never stack up.
+
+HRM_ANIMATIONS=0 (or set_animations_enabled(False)) turns every animation
+into its end state, for low-end terminals and remote sessions.
+"""
+import os
+from PyQt5.QtCore import Qt, QPoint, QPropertyAnimation, QVariantAnimation, QEasingCurve, QAbstractAnimation
+from PyQt5.QtWidgets import QGraphicsOpacityEffect
+
+SHAKE_MS = 360
+SHAKE_PX = 8
+FADE_MS = 160
+TWEEN_MS = 600
+
+_enabled = os.environ.get("HRM_ANIMATIONS", "1") != "0"
+
+
+def animations_enabled():
+    return _enabled
+
+
+def set_animations_enabled(enabled):
+    """Turn animations on or off app-wide; running ones are left to finish"""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def _running(target, kind):
+    """The `kind` animation currently running on `target`, if any"""
+    # Stopped ones linger until their deferred delete, so the state is checked too
+    for animation in target.findChildren(QAbstractAnimation, f"hrm-{kind}", Qt.FindDirectChildrenOnly):
+        if animation.state() == QAbstractAnimation.Running:
+            return animation
+    return None
+
+
+def _start(animation, target, kind, on_finished=None):
+    animation.setObjectName(f"hrm-{kind}")
+    if on_finished is not None:
+        animation.finished.connect(on_finished)
+    # Parented to the target, so it goes with it; deleted as soon as it ends
+    animation.setParent(target)
+    animation.start(QAbstractAnimation.DeleteWhenStopped)
+    return animation
+
+
+def finish(target, kind):
+    """Jump a running animation to its end state (its finished handlers run)"""
+    animation = _running(target, kind)
+    if animation is not None:
+        animation.setCurrentTime(animation.totalDuration())
+
+
+# ================= Animations =================
+def shake(widget, amplitude=SHAKE_PX, duration=SHAKE_MS):
+    """Shake `widget` sideways, e.g. on a rejected sign-in"""
+    if not _enabled:
+        return None
+    running = _running(widget, "shake")
+    if running is not None:
+        # Restarting keeps the resting position the first shake recorded
+        running.setCurrentTime(0)
+        return running
+    origin = widget.pos()
+    animation = QPropertyAnimation(widget, b"pos")
+    animation.setDuration(duration)
+    animation.setStartValue(origin)
+    for step, offset in enumerate((1, -1, 0.6, -0.6, 0.3, -0.3), start=1):
+        animation.setKeyValueAt(step / 7, origin + QPoint(round(amplitude * offset), 0))
+    animation.setEndValue(origin)
+    return _start(animation, widget, "shake")
+
+
+def fade_in(widget, duration=FADE_MS):
+    """Fade `widget` in from transparent, e.g. a page that has just been switched to
+
+    The opacity effect renders the widget off-screen on every frame, so it
+    is removed again as soon as the fade ends.
+    """
+    finish(widget, "fade")
+    if not _enabled:
+        return None
+    effect = QGraphicsOpacityEffect(widget)
+    effect.setOpacity(0.0)
+    widget.setGraphicsEffect(effect)
+    animation = QPropertyAnimation(effect, b"opacity")
+    animation.setDuration(duration)
+    animation.setStartValue(0.0)
+    animation.setEndValue(1.0)
+    animation.setEasingCurve(QEasingCurve.OutCubic)
+    return _start(animation, widget, "fade", lambda: widget.setGraphicsEffect(None))
+
+
+def fade_out_window(window, on_finished, duration=FADE_MS):
+    """Fade a top-level window out, then call `on_finished` (straight away when disabled)"""
+    if not _enabled:
+        on_finished()
+        return None
+    animation = QPropertyAnimation(window, b"windowOpacity")
+    animation.setDuration(duration)
+    animation.setStartValue(window.windowOpacity())
+    animation.setEndValue(0.0)
+    return _start(animation, window, "window-fade", on_finished)
+
+
+def tween(target, start, end, on_value, duration=TWEEN_MS):
+    """Call `on_value` with values running from `start` to `end` (ints stay ints)
+
+    If a tween is already running on `target` it continues from the value it
+    has reached, so only the latest `end` is ever animated towards.
+    """
+    running = _running(target, "tween")
+    if running is not None:
+        start = running.currentValue()
+        running.stop()
+    if not _enabled or start == end:
+        on_value(end)
+        return None
+    animation = QVariantAnimation()
+    animation.setDuration(duration)
+    animation.setStartValue(start)
+    animation.setEndValue(end)
+    animation.setEasingCurve(QEasingCurve.OutCubic)
+    animation.valueChanged.connect(on_value)
+    on_value(start)
+    return _start(animation, target, "tween")
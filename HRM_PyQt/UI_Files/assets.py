@@ -0,0 +1,115 @@
+"""Logos and icons, decoded and scaled once per process
+
+Images are compiled into assets_rc.py (regenerate it with
+`pyrcc5 assets.qrc -o assets_rc.py` after changing assets.qrc), so they load
+from memory no matter which directory the app is started from. Without the
+compiled module they are read from this directory instead.
+
+Each source image is decoded once. Scaled copies are kept in QPixmapCache
+keyed by (asset, logical size, device pixel ratio) and are rendered at the
+device resolution, so they stay sharp on hi-DPI screens. prewarm() does the
+smooth scaling on a worker ahead of time.
+"""
+import os
+import threading
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication, QImage, QPixmap, QPixmapCache
+from workers import run_in_background
+
+try:
+    import assets_rc  # noqa: F401  (registers the :/assets resources)
+    ASSET_ROOT = ":/assets"
+except ImportError:
+    ASSET_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+ASSETS = {
+    "logo": "fbsl_logo.png",
+}
+
+# Logical sizes the windows draw the logo at (the image is fitted inside)
+LOGO_SIZES = {
+    "login": (600, 70),
+    "registration": (180, 60),
+    "sidebar": (200, 60),
+}
+
+_sources = {}
+_lock = threading.Lock()
+
+
+def asset_path(name):
+    return f"{ASSET_ROOT}/{ASSETS[name]}"
+
+
+def source_image(name):
+    """The decoded original (a null QImage if it cannot be read); thread-safe"""
+    with _lock:
+        image = _sources.get(name)
+        if image is None:
+            image = _sources[name] = QImage(asset_path(name))
+        return image
+
+
+def device_pixel_ratio():
+    """Highest ratio among the connected screens, so one copy is sharp everywhere"""
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def cache_key(name, width, height, dpr):
+    return f"hrm-asset:{name}:{width}x{height}@{dpr:g}"
+
+
+def scaled_image(name, width, height, dpr):
+    """`name` fitted into width x height logical pixels at `dpr`; safe off the GUI thread"""
+    image = source_image(name)
+    if image.isNull():
+        return image
+    image = image.scaled(
+        round(width * dpr), round(height * dpr), Qt.KeepAspectRatio, Qt.SmoothTransformation
+    )
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+def pixmap(name, width, height, dpr=None):
+    """Cached pixmap of `name` fitted into width x height; null if the asset is unreadable"""
+    dpr = dpr or device_pixel_ratio()
+    key = cache_key(name, width, height, dpr)
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+    result = QPixmap.fromImage(scaled_image(name, width, height, dpr))
+    if not result.isNull():
+        QPixmapCache.insert(key, result)
+    return result
+
+
+def logo_pixmap(size_name):
+    return pixmap("logo", *LOGO_SIZES[size_name])
+
+
+def _scale_variants(requests):
+    return [(cache_key(*request), scaled_image(*request)) for request in requests]
+
+
+def _install(variants):
+    # QPixmap may only be created on the GUI thread
+    for key, image in variants:
+        if not image.isNull() and QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+
+
+def prewarm(sizes=None, name="logo"):
+    """Decode and scale `name` for every size and screen ratio on a worker thread"""
+    app = QGuiApplication.instance()
+    ratios = {screen.devicePixelRatio() for screen in app.screens()} or {1.0}
+    ratios.add(device_pixel_ratio())
+    requests = [
+        (name, width, height, dpr)
+        for width, height in (sizes or LOGO_SIZES.values())
+        for dpr in sorted(ratios)
+        if QPixmapCache.find(cache_key(name, width, height, dpr)) is None
+    ]
+    if requests:
+        return run_in_background(_scale_variants, requests, on_result=_install)
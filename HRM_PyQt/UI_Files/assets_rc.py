@@ -0,0 +1,2234 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x88\x11\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x1e\x00\x00\x00\x8d\x08\x06\x00\x00\x00\x61\x4c\x15\x8f\
+\x00\x00\x10\x00\x49\x44\x41\x54\x78\x01\xec\x5d\x07\x9c\x14\x45\
+\xd6\xaf\xea\xdc\x3d\x79\x66\x73\x22\x2e\x39\xa9\x18\x8e\x33\x9c\
+\xe9\xcc\xa2\x62\xce\x39\x80\x22\x98\x15\x03\x66\x3d\xcf\xac\x67\
+\xce\x62\xc0\xf3\x3c\xcf\x3b\xef\xf3\xd4\xe3\x4c\x08\x08\x46\xf2\
+\xc2\x2e\xcb\xe6\x30\x79\xa6\x73\x77\x7d\xaf\x1a\x17\x41\x41\x40\
+\x41\x11\x66\x7e\xf3\xa6\xaa\x2b\xbc\x7a\xf5\xaa\xde\xbf\x5e\x55\
+\xcd\xec\x32\xa8\xf0\x2a\x68\xa0\xa0\x81\x82\x06\x7e\x61\x0d\x14\
+\x80\xe7\x17\x56\x78\xa1\xb9\x82\x06\x0a\x1a\x40\xa8\x00\x3c\x85\
+\x59\x50\xd0\x40\x41\x03\xbf\xb8\x06\x0a\xc0\xf3\x8b\xab\xbc\xd0\
+\xe0\x86\x34\x50\xc8\xdf\xf6\x35\x50\x00\x9e\x6d\x7f\x8c\x0b\x3d\
+\x2c\x68\x60\xab\xd3\x40\x01\x78\xb6\xba\x21\x29\x08\x54\xd0\xc0\
+\xb6\xaf\x81\x02\xf0\x6c\xfb\x63\x5c\xe8\x61\x41\x03\x5b\x9d\x06\
+\x7e\x73\xc0\xb3\xd5\x69\xb0\x20\x50\x41\x03\x05\x0d\x6c\xb2\x06\
+\x0a\xc0\xb3\xc9\x2a\x2b\x54\x28\x68\xa0\xa0\x81\x9f\xab\x81\x02\
+\xf0\xfc\x5c\x0d\x16\xea\x17\x34\x50\xd0\xc0\x26\x6b\xa0\x00\x3c\
+\x9b\xac\xb2\x42\x85\x82\x06\xbe\xa7\x81\xc2\xe3\x26\x6b\xa0\x00\
+\x3c\x9b\xac\xb2\x42\x85\x82\x06\x0a\x1a\xf8\xb9\x1a\x28\x00\xcf\
+\xcf\xd5\x60\xa1\x7e\x41\x03\x05\x0d\x6c\xb2\x06\x0a\xc0\xb3\xc9\
+\x2a\xdb\xb6\x2b\x10\x42\x30\xed\x61\x32\x99\x0c\x77\x77\x77\x0f\
+\x4e\xa7\xd3\x07\xe6\xb3\xd9\x09\x5d\x5d\x5d\xe7\x25\x3b\x93\x7b\
+\x76\x36\x35\xf5\x6f\x6f\x6f\xf7\xd1\x32\x05\x2a\x68\xe0\xa7\x6a\
+\xa0\x00\x3c\x3f\x55\x73\x1b\x5b\xef\x37\x50\xae\x07\x6c\xda\xda\
+\xda\x8a\x3b\x9b\x9b\x87\x77\x34\xb5\x8e\x13\x18\xee\x52\xc6\x25\
+\x77\x22\xdb\xb9\x0f\xb9\xe4\xa6\x90\xcf\x7f\x13\x2f\xb0\x0f\xb2\
+\x82\x78\x1b\xb2\xdc\x8b\x56\xd6\xd7\xff\xb1\xb9\xb9\x79\x00\x05\
+\xa8\xdf\x40\x17\x0b\x22\x6e\x65\x1a\x28\x00\xcf\x56\x36\x20\xbf\
+\x94\x38\x00\x36\x1c\xf5\x5c\x5a\x5b\x5b\x7b\xc5\xe3\xf1\x9d\xe3\
+\x9d\x9d\x67\xc2\x64\xb8\x31\x12\x2b\x7a\x58\xf4\xc9\xf7\x60\x8c\
+\x27\x33\x3c\xbf\x1f\xc3\x30\x11\xdd\x34\xbb\x01\x60\xf2\x9a\xa1\
+\xf7\x16\x45\xf1\x48\x86\x67\xaf\x2f\x2a\x2e\x7e\x42\xe4\xf8\x87\
+\x73\xd9\xec\x14\xa8\x7f\x4c\x63\x63\xe3\x90\xce\xce\xce\xb2\x5f\
+\x4a\xfe\x42\x3b\xbf\x6d\x0d\xc0\x5c\xfb\x6d\x77\xa0\x20\xfd\xc6\
+\x6b\x00\xc0\x86\x6d\x68\x68\x90\x00\x6c\x6a\x00\x74\x7e\xef\xba\
+\xee\xb9\x3c\xcf\xdf\x0e\x60\xf2\x48\x20\x18\xbe\x4d\x52\x94\x33\
+\x00\x64\x76\x70\x11\x61\x2c\xdb\x9e\x6f\x5a\xe6\x2b\x39\x55\xbb\
+\x59\xd5\xb5\xf3\x74\xc3\x3a\x8f\xe5\xb9\x3b\x53\x99\xcc\x3f\x4c\
+\xdb\x5a\xa9\x1b\x66\x98\x61\xd9\xbd\x65\x49\xbe\xd8\x27\x2b\x0f\
+\x04\xfc\x81\xa7\x5d\xdb\xbe\xb9\xa5\xa5\xe5\xac\xe6\x86\x86\x51\
+\xc0\xbf\x04\xda\xf3\xb6\x6d\x1b\x2f\x61\xa1\xe4\xf6\xa2\x81\x02\
+\xf0\x6c\xc3\x23\x0d\x86\xcf\x00\x71\x75\x75\x75\x41\x38\xab\xe9\
+\x9f\xc9\x64\x0e\x94\x24\xe9\x6a\x00\x9b\x47\x02\x81\xc0\xe3\x91\
+\x48\x64\xaa\x20\x08\x47\x3b\x8e\xd3\xcf\xb0\x8c\xac\x69\x9a\x9f\
+\x5a\x8e\xfd\x94\x65\x59\x57\x77\x74\x77\x9e\x51\x52\x52\x72\x66\
+\x79\x65\xf9\x43\xd5\xd5\xd5\xff\xeb\xd5\xb7\xd7\xbb\xd1\x68\xf4\
+\xb6\xaa\x9a\xea\x71\xe0\x05\x9d\xdc\x15\xef\xbe\x06\x00\x68\x1a\
+\xc3\x32\x0b\xc0\xe3\x11\x6c\xcb\x1a\xcd\x71\xfc\xd9\x01\x9f\xff\
+\x9e\x48\x51\xf1\x34\x9e\x65\x1f\xec\x6c\xef\xbc\x54\xd3\xb4\x3d\
+\xe1\x7c\xa8\x82\x02\xde\x36\xac\xea\xdf\x58\xd7\x7e\x7d\x71\x0b\
+\xc0\xf3\xeb\x8f\xc1\x66\x95\x80\x02\x0d\x65\x08\x5e\x8d\x02\x87\
+\xc3\xfd\x3b\x3a\x3a\xc6\x55\x56\x56\xde\x0a\x60\xf1\x34\xd0\x5f\
+\x8a\x8a\x8a\x2e\xf3\xfb\xfd\xfb\x03\x20\x94\xaa\xaa\xda\x0d\x5e\
+\xcf\x3b\xb0\xad\xba\x2f\x9b\xcd\x5e\x64\xdb\xf6\x71\xb1\x58\xec\
+\xe2\xd2\xd2\xd2\x17\x07\x0c\x18\xb0\x88\xf2\x59\x17\x55\x54\x54\
+\xcc\x1d\x38\x70\xe0\xc3\xe5\xe5\xe5\xa7\xa5\x33\x99\x23\xc1\x13\
+\x1a\xaf\xf8\x7c\x0f\xba\x8e\xfb\xb1\x61\x18\xc0\x56\xed\x27\x8a\
+\xd2\xd1\xa1\x50\xf0\x7a\x53\x37\x9e\x84\x49\xf6\x64\xd0\x1f\xbc\
+\x26\xde\xd1\x71\x40\xbc\xb9\xb9\x8a\xca\xb6\x2e\xbe\x85\xb4\xed\
+\x47\x03\x30\x27\xb6\x9f\xce\x6e\xab\x3d\x05\xb0\xe1\x81\x18\x38\
+\x63\xf1\x83\xb7\x32\x22\x95\x4a\x9d\x0f\x00\xf3\x88\xa2\x28\xaf\
+\x82\x57\xf3\x08\x78\x34\x13\xa0\xef\xbb\x01\xc0\x48\x70\x56\xb3\
+\x3c\x97\xcb\xbd\x06\x9e\xce\xf5\x00\x34\x27\x43\xfc\xd8\x50\x28\
+\x34\x15\xc0\xe4\xff\x00\x48\xba\xa0\xdc\x26\xbd\xfb\xf4\xe9\xb3\
+\xa2\xac\xac\xec\x55\x7f\xc0\x3f\x59\xb4\xa5\xb1\x98\xb8\xa7\x70\
+\x1c\x7b\xab\xaa\x6a\xff\xca\xe7\xd5\x2e\x9e\xe3\xca\x14\xc5\xf7\
+\xc7\x40\xc0\x7f\x35\x2f\x4a\xcf\xfa\x63\xc5\xaf\xc2\xf6\xec\x0e\
+\xdb\xb0\x4f\x04\x2f\xac\x16\xb6\x64\x85\x1b\xb2\x4d\xd2\xf8\xb6\
+\x51\x98\xd9\x36\xba\xb1\xfd\xf5\x82\x02\x0d\xed\x35\x6c\x73\x82\
+\xe0\xad\xec\x06\x74\x15\x6c\x85\xa6\xc1\x36\x6a\x5a\x30\x18\xbc\
+\x1d\x3c\x8f\x93\xc1\xc3\x19\x02\xe0\xa2\x43\xfc\x53\x88\x3f\x0a\
+\x5e\xce\x24\x00\x9c\x23\x8a\x8b\x8b\x4f\x0a\x85\x42\x0f\x80\x67\
+\xf3\x29\x6c\xa3\x34\xca\x67\x73\x50\xa8\x3a\x94\x28\x2a\x2b\x7b\
+\x2f\x12\x8b\xdd\x5c\x52\x56\x72\x78\x40\x16\x61\x5b\x86\xaf\xc8\
+\xe7\x73\xd3\x32\xe9\xf4\x22\x8e\xe3\x24\x4d\x53\x77\x13\x05\x61\
+\xbc\x6e\x68\xf7\x05\x03\xc1\xe9\x70\xbe\xf4\x18\xc8\x7e\x41\x3e\
+\x9f\xdf\x01\xfa\xa4\x6c\x0e\x39\x0a\x3c\xb6\x7e\x0d\x14\x80\x67\
+\xeb\x1f\x23\x4f\x42\x30\xca\xd5\x07\xb5\xaa\xaa\x56\x6a\x9a\x36\
+\x16\xce\x64\xee\xf5\xf9\x7c\x6f\x05\x02\x81\x97\xe0\xec\xe6\x06\
+\x48\x3b\x04\xbc\x9b\x32\xd8\x3e\x75\x43\xde\xbb\x40\xb7\x83\x07\
+\x74\x2a\x18\xfc\xa1\x50\x6e\x22\x00\xce\xcb\xe1\x70\xb8\xde\x63\
+\xb8\xde\x8f\xcd\x97\x21\xf8\xfd\x5f\x4a\x3e\xdf\xa3\x45\x25\x25\
+\xa7\x29\x01\xff\xa1\x8e\xed\x9e\x4d\x88\xfb\x00\x22\x68\x0e\x00\
+\xa4\x99\xcd\x64\x06\xc1\xb6\xef\x24\x90\xfd\x2e\x90\xf1\x55\xe8\
+\xd7\x4b\xe0\x05\x5d\x4f\x08\xd9\x8f\x02\xea\xe6\x93\xa4\xc0\x69\
+\x6b\xd3\x40\x01\x78\xb6\xb6\x11\x59\x8f\x3c\xe0\x15\x0c\x84\x2d\
+\xd4\xb9\x70\x6e\xf3\xbc\x2c\xcb\xff\x04\x7a\x1c\xb6\x4e\x17\x42\
+\xf1\x3d\xc0\x50\xa9\xd7\xd3\x08\x69\xaf\x02\xf8\x5c\x0d\x74\x04\
+\x9c\xd5\x1c\x08\x5e\xcd\x54\x00\x9a\xf7\x80\x92\x50\xee\x57\x7d\
+\x2b\x8a\xb2\x32\x10\x0e\xbc\x1e\x89\xc5\x26\xcb\xed\xad\x7b\x1b\
+\x9a\x79\x9c\xcf\xe7\xbf\x11\xc0\xf1\x9f\x00\x32\x29\x00\xcb\x1a\
+\x28\x73\x38\xd0\x35\x00\x9e\xcf\x02\x50\xfe\x0b\xb6\x81\xf7\x03\
+\x18\x1d\x05\x61\xd9\xaf\x2a\x7c\xa1\xf1\xcd\xae\x81\x02\xf0\x6c\
+\x76\x95\x6e\x1e\x86\xa9\x54\x2a\x02\xe7\x31\x7f\x80\x2d\xc8\x14\
+\x30\xbe\x37\x01\x54\xfe\x06\x40\x72\x07\xd0\x71\xd0\x42\x2d\x6c\
+\x9f\x2c\x00\x98\x2f\xc0\x48\x1f\x82\xdb\xaa\xb3\x60\x2b\xb5\x3f\
+\x78\x0d\x27\x81\xf7\xf3\x28\xd0\x02\x28\xb3\xd5\xbe\x71\x6d\xad\
+\x11\x8c\x06\x3f\x61\x79\xf6\x0e\x00\x98\xc3\xe0\x1c\xea\x60\x10\
+\x76\x02\x78\x3b\xcf\x40\x7f\xeb\x00\x84\x24\xf0\x88\x76\x81\x6d\
+\xe1\x05\x2c\xcb\x3e\x0e\xe1\xbf\x01\x7c\x5e\x04\x90\xba\x00\x74\
+\x32\x0a\xca\x16\xde\xbf\x71\x0d\x14\x80\x67\x2b\x1a\xc0\x44\x22\
+\x51\x93\x48\x24\x8e\x07\x7a\x08\x8c\xed\xef\xb0\xfa\xd3\x9b\xa8\
+\xab\xc0\x08\x0f\x02\xaf\xa6\x02\x8c\x32\x05\x40\xf3\x1e\x18\xe0\
+\xed\x60\x88\xa7\x42\xda\x81\x60\xb8\x13\xc3\xe1\xf0\x5f\xc1\x78\
+\x1b\xb7\xa2\xae\x6c\x92\x28\xa2\x28\x7e\x0d\xc0\xfa\x14\xf4\xe3\
+\x2c\xe8\xd3\xa1\xb6\x6d\x9f\x03\x74\x1f\x80\xeb\x2c\x00\x21\x0b\
+\x80\x77\x28\xe8\xe0\x44\x5d\xd7\xef\x84\xfe\xbe\x0a\x40\xfb\x2f\
+\x00\xa0\x9b\xc0\xfb\xdb\xb7\x70\x38\xbd\x49\xaa\xde\x6a\x0a\x6f\
+\x22\xf0\x6c\x35\x72\x6f\x13\x82\xcc\x9f\x3f\x5f\x00\xe3\xd9\x15\
+\x68\x22\x18\xd0\x8b\x60\x74\x6f\x82\x81\xdd\x0f\x67\x1e\xe7\x82\
+\xd1\x8d\x81\xad\x54\x10\x8c\xad\x01\x0c\xef\x75\x00\x9a\x6b\xc0\
+\x18\x8f\x69\x6a\x6a\x3a\x0a\x0c\xf5\x56\xb8\xb5\x7a\x0f\xbc\x9f\
+\xc4\x36\xa1\x88\x35\x3a\x41\x01\x14\x00\xf7\x0d\xe8\xe3\x95\x00\
+\xb2\x63\xa1\xdf\xc7\x43\xf6\xf5\x70\x56\xf5\x36\xc4\xbb\x20\xac\
+\x02\x30\x3a\x18\xbc\xbb\x2b\xe1\x7c\xe8\x39\x00\xab\x7f\x03\x50\
+\x3f\x08\x74\x12\xe8\xb0\x2f\x94\x2d\xbc\x7f\x03\x1a\x28\x00\xcf\
+\x2f\x3c\x48\xad\xad\xad\x45\x70\xed\x7d\x20\x84\x37\xc1\x15\x36\
+\xbd\xd6\x7e\x06\x56\xfb\x9b\xc1\xd8\x4e\x02\x83\x1a\x01\xc0\xc3\
+\xc0\x36\xeb\x2b\x30\xba\xc7\x60\x65\x9f\x04\x69\xd4\x03\x3a\x03\
+\x6e\xac\xfe\x02\x46\x36\xaf\x16\xb6\x29\xbf\xb0\xc8\xbf\x5a\x73\
+\xd0\xdf\x24\x1c\x88\x7f\x00\xe1\x1d\x00\x38\x27\x03\xd0\x1e\x0b\
+\xe1\x64\x00\xe8\xe7\xe1\xcc\x6b\x39\x80\x73\x10\x40\xf9\xf7\x0c\
+\xc3\x9c\x0b\x60\x7d\x37\x80\xd5\x6b\x00\xe2\xd3\x1a\x1a\x1a\x26\
+\xd5\xd7\xd7\xef\x42\x81\xfd\x57\x13\xbe\xd0\xf0\x8f\x6a\xa0\x00\
+\x3c\x3f\xaa\x9e\xcd\x93\x09\x67\x17\x51\x30\x84\x63\x61\x45\x7e\
+\x00\x0c\xe4\x35\xf0\x62\x1e\x07\xce\x97\xc3\xaa\x7d\x38\x6c\x9b\
+\xfa\xc2\x4a\x0e\x76\x94\xfd\x2f\x18\xd5\x9d\xe0\xd1\x9c\x0d\xe0\
+\x73\x32\x78\x3b\xd7\x80\x57\xf3\x22\x1c\x12\x2f\xec\xd3\xa7\x8f\
+\x0e\xe5\xb7\xeb\x37\x78\x42\x29\xd8\x66\xcd\x03\x10\x7a\x1c\xf4\
+\x34\x01\xce\xb1\x8e\x06\xe0\x39\x0b\xf4\xf4\x00\x78\x82\x73\x21\
+\x8e\x00\x78\x86\xc3\x99\xd0\x09\xc1\x60\xf0\x36\xf0\x86\xe8\x0d\
+\xde\xdf\x01\x84\xee\x5c\xb6\x6c\xd9\xde\xd3\xa7\x4f\x67\xb7\x6b\
+\x05\x6e\x65\x9d\x2f\x00\xcf\x2f\x30\x20\x00\x2c\xbf\x07\x63\xb8\
+\x12\xce\x6d\xce\x02\x03\xd9\x1d\x8c\x28\x02\xf1\x66\xf0\x6c\xde\
+\x80\xbc\xeb\x00\x88\x4e\x07\x00\x3a\x0b\xbc\x9c\x9b\xc1\xa3\x79\
+\x13\x56\xf9\x25\x00\x38\x99\x5f\x40\xb4\xdf\x64\x13\x25\x25\x25\
+\x39\x00\x9e\x85\x10\xbe\x66\xdb\xf6\xf5\x00\x48\x27\x02\x18\x9d\
+\xd1\xd5\xd5\x75\x0b\xe8\xf1\x3f\xa0\xe3\x14\x78\x41\x35\x00\xf2\
+\xfb\x81\x97\x74\x11\x80\xd1\xc4\x9d\x76\xda\xa9\xdf\x6f\xb2\xb3\
+\xdb\xa8\xd0\x05\xe0\xf9\x05\x06\x16\xb6\x03\x41\x98\xfc\x45\x60\
+\x14\x16\x18\xc5\x9b\x70\x30\x7a\x79\x5b\x5b\xdb\x69\x74\x2b\xd5\
+\xab\x57\xaf\x7b\x80\xde\x03\xaf\x66\xc5\xe6\xfc\x32\xdf\x2f\xd0\
+\xad\xad\xa2\x09\x00\xe9\x2c\x6c\x55\x1b\x01\x84\xfe\x0d\x7a\xbc\
+\x09\xf4\x4c\xc1\xfd\x04\x70\x21\xaf\x00\x30\xa2\x5f\x9c\x64\xc0\
+\xb3\x0c\x82\x17\x29\x6c\x15\x02\x17\x84\xf0\x34\x50\x00\x1e\x4f\
+\x0d\x5b\xf6\x03\x26\x3d\x81\xc9\x8f\x61\x4b\x10\x07\xf0\x79\xb6\
+\xa6\xa6\xe6\xd1\xe1\xc3\x87\xcf\x1c\x36\x6c\xd8\x4a\xd8\x2a\x38\
+\x5b\xb6\xf5\xed\x8b\x3b\x6c\x4f\x5b\x00\xc4\x3f\x00\xba\x17\xce\
+\x82\xfe\x0d\xbd\xcf\xc2\xf9\x99\x0b\x71\x17\xe2\x85\xf7\x56\xa2\
+\x81\x02\xf0\xfc\x02\x03\x01\x2b\x2f\x43\x09\xdc\x7f\x07\xae\xc4\
+\x7f\xf5\x2f\xf3\xfd\x02\x5d\xde\x2a\x9a\x00\xa0\xcf\x00\xe8\xbb\
+\xb0\x9d\xc5\x70\xe6\xb3\x55\xc8\x54\x10\x62\x95\x06\xb6\x75\xe0\
+\x59\xd5\xcb\x5f\xf9\x13\xb6\x02\x0c\x78\x3a\x18\x56\x5d\x0c\xe7\
+\x0e\xdc\xaf\x2c\xce\x76\xd3\x3c\xdc\x08\x62\xe2\xb8\x58\x14\x04\
+\x04\x5b\x5c\xb2\xdd\x74\xfc\x37\xd0\xd1\x6d\x1a\x78\x66\xcc\x98\
+\x21\x7d\xf6\xd9\x67\x3b\xcc\x9b\x37\x6f\xa7\x59\xb3\x66\x05\x7f\
+\xad\xf1\x80\x33\x1d\x02\xee\x3e\x82\x6d\x95\x0b\xab\xf0\xea\xdf\
+\x5c\xfd\x5a\xf2\x6c\x6f\xed\x12\xd7\xfd\x55\x75\xfe\xcd\x9c\x6f\
+\xaa\x61\x0e\xee\xb6\x60\xc1\x82\xfe\xdb\x9b\xee\xd7\xd7\xdf\x6d\
+\x0e\x78\x3e\xff\xfc\xf3\xe2\x4f\x3f\xfd\xf4\x0f\xf3\xbf\x9e\x3f\
+\xa1\xbc\xb4\xfc\xde\xd2\xe2\xe2\x7b\x83\x3e\xff\xfd\xc1\x40\xf0\
+\xde\xaf\xbe\xf8\x6a\xd2\xdc\xb9\x73\xff\x38\x67\xce\x9c\xea\xf5\
+\x29\x64\x4b\xa4\x83\xbb\x4f\x60\xab\x45\x60\xab\xe5\xc2\x75\xf0\
+\x96\x68\xa2\xc0\xf3\xc7\x34\x00\x88\x4f\xdf\x3f\x56\x64\x73\xe6\
+\xd5\xd5\xd5\x89\x5f\xce\xfe\x72\xc0\xa2\xf9\xf3\xc7\x7d\xf3\xd5\
+\x37\x37\x04\x62\xbe\xbb\x15\x49\xbe\x97\xd8\xee\xbd\xcb\x97\x2d\
+\xbb\x13\xe6\xe8\xa9\x30\x07\x77\xfe\xe2\x8b\x2f\xc2\x9b\xb3\xdd\
+\xdf\x12\xaf\xdf\x34\xf0\xd0\xad\x0b\xa5\x45\x5f\x2e\x1a\x00\xab\
+\xc9\xd8\xfa\x65\xcb\x2e\x93\x25\xe9\xae\x68\x38\xf2\x27\x96\x65\
+\x6e\x54\x14\xf9\x7c\x41\x10\xf7\xf2\xf9\xfd\xbf\x0f\x05\x83\x67\
+\x0a\x02\x7f\x87\x24\x88\xf7\x41\xfc\xae\x65\x4b\x97\x4e\x81\x09\
+\x30\xee\xab\xaf\xbe\x1a\x06\x60\xc4\xa3\x2d\xf8\xa2\xc0\x23\x08\
+\x02\x88\x4a\x08\x9c\x37\x14\x5c\xfe\x2d\xa8\xeb\xef\xb1\xa6\x9e\
+\x0e\x26\x2e\xc2\xc8\xfc\x5e\xce\x66\x7e\x84\xf9\x17\x5d\xbe\x7c\
+\xf9\xce\xf5\x75\x75\xa7\xd8\xa6\x7d\x7d\x30\x16\xfc\x13\xc3\x70\
+\x77\x86\xc3\xa1\xab\x18\x96\x3d\xa6\xbc\xbc\x7c\xb7\x70\x24\x7c\
+\x28\x83\x99\xcb\x04\x8e\xbb\x1d\x16\xc2\xbb\x88\xe3\xdc\xfe\xcd\
+\x37\xdf\x5c\x34\x73\xe6\xcc\x7d\xc1\x23\xaf\xda\xcc\x22\x6d\xd5\
+\xec\x7e\x93\xc0\x43\x57\x94\xf9\xf3\xe7\x8f\x02\xd0\x38\x76\x45\
+\xfd\x8a\xeb\x59\x11\xdf\xca\x31\xdc\xad\x0c\xc3\x5e\x1f\x0e\x85\
+\x4f\xab\xaa\xaa\xda\x39\x06\x2f\xb0\xf4\x84\xa6\x69\x73\x1c\xc7\
+\xfd\x6f\x22\x11\x6f\x54\x7c\x0a\x0b\xd7\xaf\x83\xfd\x3e\xff\x71\
+\x3c\x2f\x5c\x2b\x89\xd2\x9d\x3c\xcb\xdf\x1e\x8b\xc4\x6e\x9e\xf5\
+\xc9\xac\x53\xe6\x7f\xf9\xe5\x2e\x74\x02\x6d\xee\x11\x83\x03\x65\
+\x04\xb7\x5a\x08\xc0\xc7\x2d\x1c\x72\x6e\x6e\xed\xae\x9f\x5f\x8f\
+\x97\xe3\x12\x17\x5b\xd8\xda\xec\x73\xbd\xa1\xa1\xa1\xac\x7e\x69\
+\xfd\x9e\x2d\x4d\x4d\x67\x05\xfc\x81\xeb\x38\xcc\xdc\x2c\x88\xd2\
+\x54\x58\xf0\x26\x07\x83\x81\xb1\x00\x34\xfd\x1c\xc7\x51\x61\x7b\
+\x3d\x2f\x91\x4c\xbe\x8f\x10\x5e\x04\x9e\xaf\x16\x8d\xc6\x2a\x8a\
+\x8b\x8a\xf6\xaa\xa8\xa8\x3c\xc7\xaf\xf8\xae\x0d\xf8\xfc\x77\xfa\
+\x14\xe5\x76\xf0\x8e\xae\x06\x10\x3a\x02\x3c\xf6\xc1\xf4\x98\x00\
+\x6d\xc3\xaf\xcd\x3e\x18\x5b\x4a\x57\x4b\x96\x2c\x29\x5a\xb6\x68\
+\xd1\x98\xe6\xc6\xc6\xd3\x8c\xbc\x76\x23\xcf\xb0\x37\x83\x67\x73\
+\xab\x69\x1a\x57\x95\x94\x96\x1e\x5d\x5a\x5a\x32\x14\xda\x0e\xa8\
+\xaa\xda\x51\x5f\xdf\xf0\x71\x57\x77\xf7\x43\xd9\x6c\xee\xaa\x74\
+\x32\x03\x14\xbf\x5a\xe0\xa5\x49\x90\x76\x5d\x26\x9d\x7e\x15\x80\
+\x60\x11\x1c\x36\x1a\x91\x70\xb8\x1f\xac\x48\x87\x5a\x96\x79\x65\
+\x51\x71\xec\x6e\x82\x99\x3f\x21\x17\xdd\x50\x5f\x57\x7f\xd6\x82\
+\xaf\x16\xec\x01\x9e\x50\x39\xf0\xdc\x2c\x6f\xd7\x75\x91\x65\x59\
+\x08\x26\xe1\x66\xe1\x57\x60\xb2\xf1\x1a\xc0\x84\x50\x0c\xc2\x1b\
+\x5f\x63\xdd\x25\x61\x21\xe3\x9a\x9a\x9a\x6a\x97\x2d\x5b\x76\xe0\
+\x8a\x15\x2b\x26\x60\x84\xaf\xe7\x45\xee\x66\xd7\x25\x37\x8a\x82\
+\x30\x01\x33\xcc\x01\x8a\xa2\x54\x40\x3c\x91\xcd\x66\x3f\xcc\xe5\
+\xb2\x8f\x10\x82\xa6\xd8\x30\x47\x6d\xdd\x9e\x92\x8c\x77\x5d\xce\
+\xb2\xdc\x75\x9a\xae\x3f\xdb\xdd\xdd\xf5\x85\x9a\xcf\xa7\xe0\xb2\
+\xa1\x08\xbc\xa1\x9d\x62\xd1\xd8\xc9\x92\x24\x5e\x17\x0e\x86\xfe\
+\x04\xf1\x5b\x43\x81\xd0\x94\x2f\xbf\xfc\xf2\x38\x58\x5c\x77\x9c\
+\xf5\x2b\x9e\x4f\xae\x5b\x13\x3f\x3f\x75\xab\x05\x1e\x18\x64\x76\
+\xd1\x17\x5f\xf4\x5e\xbe\x74\xe9\x7e\x75\x4b\x96\x8c\xe7\x31\xbe\
+\x9e\x61\xf9\x1b\x4d\xc3\xbc\xb9\xbc\xbc\xec\x52\x58\x31\x0e\xf5\
+\xc9\x72\x3f\x18\x68\xd4\xd1\xd1\x51\x0f\x03\xf9\x36\x80\xd0\x9d\
+\xae\xeb\x5c\x2e\x48\xc2\xa5\x04\x91\xab\x87\x8d\x18\xf6\xc4\xa8\
+\xd1\xa3\x66\x0c\x1b\x35\x6a\xce\xc0\x21\x03\xff\x3e\x7a\xf4\xe8\
+\x3b\x74\xcb\xbc\xdc\xb4\xad\xc9\x0c\xc7\x5e\x67\xea\xc6\x63\x9a\
+\xa6\xcd\x14\x25\xb1\x1b\x26\x00\xb0\x2c\xda\x2b\x16\x8b\x4e\x74\
+\x89\x73\x27\x62\xc8\x9f\xa3\xe1\xf0\x4d\x0b\xe7\x2f\x9c\xf0\xcd\
+\x17\xdf\xec\xff\xf5\xd7\x5f\xf7\x25\x84\xfc\xa4\xaf\xdd\xc3\xad\
+\x16\x72\x5d\x17\xe6\x25\x43\xbf\xcc\x86\x7f\xfe\xb0\x15\x38\x6c\
+\x8a\x06\x5c\x42\x30\xb6\x7e\x9a\xc7\x03\x86\xef\x03\xa0\x19\xb6\
+\xb2\x61\xe5\x11\x75\x4b\xea\x26\x23\x17\x5d\x17\x0a\x04\x6e\xf4\
+\xc9\xca\x75\xe1\x50\xe8\xec\x40\x20\xb0\x27\xcc\x8b\x30\x20\xdb\
+\x4a\x18\xe7\x7f\xc3\x3c\x7c\x90\xe3\xb9\x29\xd8\x75\xae\x32\x6d\
+\xfb\xba\x3e\xfd\xfa\x3c\x3a\x60\xc8\x90\xf7\x06\x0c\x1d\x30\x7b\
+\xf8\x0e\x3b\xfc\xab\x5f\x6d\xbf\x7b\x55\x4d\xbd\x2a\x9f\xd5\x26\
+\x3b\x8e\x7d\x5d\x32\x9e\x78\xc4\x30\xf4\x8f\xd2\xe9\x74\x87\xe3\
+\x38\x22\x78\xeb\xb5\xa1\x60\xf0\xc8\xa2\xa2\xd8\xa5\xc0\xff\x56\
+\x91\x17\x6f\x2e\x8a\x16\x4d\x01\xf0\x39\x65\xf1\xe2\xc5\xbf\x87\
+\xb3\xa1\xb2\x4d\xe9\xfb\xd6\x5a\x76\xab\x02\x1e\x7a\xd8\x56\xbf\
+\x64\xc9\xc8\xba\x45\x75\x87\xd5\x2f\x5d\x76\xb1\x12\x08\xde\x20\
+\xf0\xfc\x6d\x70\x2e\x73\x93\xa2\xf8\x2e\x82\xc1\xd8\x2f\x1c\x0e\
+\x57\xc3\x20\xe5\x92\xa9\xd4\xc2\x44\x22\xf1\x57\x55\xd5\x6e\xb7\
+\x4c\xfb\x0a\x53\xd3\xae\xac\x1d\x38\xf0\x6a\xa0\x17\x06\x0e\x1c\
+\x38\x67\xd8\xb0\x61\xb9\x75\x29\x7d\xf8\xf0\xe1\x4d\x90\xf7\x4e\
+\xff\xfe\xfd\x1f\xcc\xe9\xea\x35\x96\x63\x5f\x91\xcb\xe6\xaf\xcc\
+\xe6\x72\x74\x42\xbc\xa7\x69\x5a\x13\x6c\x8b\x82\xb1\x58\x6c\x17\
+\x68\xf3\x6c\x41\xe0\xef\xc5\x2c\xba\x5f\x96\xe4\x9b\x97\x2f\x5d\
+\x3e\x69\xf9\xd2\xa5\x87\xc0\x56\x6f\x68\x53\x53\x93\xbc\x2e\xfe\
+\xeb\x49\xc3\xa6\x69\x62\x98\x58\x1b\x04\x9e\xf5\xd4\x2f\x24\xff\
+\x04\x0d\x00\x20\xac\x3e\x4f\xb3\x19\x66\xa3\xe7\x3a\x00\x4d\x49\
+\x53\x43\xd3\xae\x2d\x2d\x2d\xc7\x97\x14\x95\x5c\x26\xf2\xfc\x54\
+\x5e\xe0\x6e\x0f\x06\x03\xd7\xc2\x7c\x38\x19\x21\xbc\x23\x00\x0d\
+\x03\x73\x70\x71\x3a\x93\x79\xdd\xb2\xec\xbb\x34\x35\x7f\x4d\x3e\
+\x93\x9e\x22\xfb\x7c\x37\x14\x95\x94\x3c\xd7\xbb\xb6\xf6\xd3\xc1\
+\x83\x07\xc7\xd1\x3a\x5e\x30\x07\x3b\x76\xdc\x65\xc7\x0f\x6a\x07\
+\x0d\x7a\xc4\x70\xac\x6b\x53\x99\xcc\xe5\x2c\xc3\x5d\x05\x27\x51\
+\xf7\x40\x9b\xef\xa6\x52\xa9\x06\x10\xd7\x91\x44\xa9\x5f\x2c\x16\
+\x3d\x58\x51\xe4\x2b\x8a\xa2\xb1\x7b\x74\x55\xbb\x33\xe8\xf7\x5f\
+\xbf\x64\xd1\x92\x73\xbf\xfa\xfc\xf3\x7d\xe1\x7c\xa8\x1f\x78\xe5\
+\xfc\x3a\x9a\xd8\xea\x93\x36\x7a\x30\xb6\x54\x4f\xe8\x16\x0a\x90\
+\x7c\x74\xdd\x82\xc5\xc7\x06\x15\x65\x12\x58\xe6\xb5\x3e\x9f\x74\
+\xbb\xcf\xa7\x4c\xf5\x07\x02\xa7\x8b\xa2\xb4\x33\x9c\x8d\x84\x5d\
+\xc7\x69\xeb\xea\xea\x9c\x99\xcb\x66\x9f\x82\x33\x9b\x9b\x33\xe9\
+\xd4\xe5\xae\xa1\x4f\x1a\x38\x78\xe0\x4d\xc3\x46\x0e\x7b\x7d\xc8\
+\xc8\x91\xf3\x31\xc6\xab\x27\xda\xc6\xc8\x3b\x74\xe8\xd0\xc4\xa0\
+\x41\x83\x3e\x19\x3a\x7c\xe8\xd3\xed\x1d\xed\x57\x10\x13\x4d\x76\
+\x6c\xf7\x72\xcb\x32\x6f\xd7\x34\xf5\xef\x5d\x5d\x5d\xf5\x86\x61\
+\x60\x58\x85\x06\xfb\x14\xe5\x44\x9f\x5f\xb9\x95\xe3\x85\x07\x88\
+\xed\xdc\x06\x8a\xbb\x62\xc5\xf2\x15\xe3\x1a\x1a\x1a\x46\x01\xfd\
+\xe8\xed\x04\xf5\x76\x40\x36\xef\x4e\x95\xd5\x58\x00\x00\x10\x00\
+\x49\x44\x41\x54\x5f\xcd\x00\xbf\x8d\x11\xad\x50\x66\x33\x68\x80\
+\xe7\x79\xba\xbd\xa5\x7a\xc7\x3c\xe2\x7f\xd4\xd3\xec\xa8\xef\x28\
+\xed\x68\x6e\xfe\x5d\x6b\x6b\xeb\x29\x3e\x51\xbe\x94\x15\x98\x1b\
+\x05\x8e\xbf\x0d\x63\x74\xa5\xa2\xf8\xc6\x11\xd7\xed\x07\x0b\x92\
+\xea\xba\x64\x96\x6e\xe8\xcf\xeb\xba\x76\x07\x83\xc8\x14\xf0\x5e\
+\x2e\xeb\x57\xdb\xef\xc6\x5e\x7d\xfb\x4e\xef\x5d\x5b\xfb\xc5\xa6\
+\xfe\xec\x65\x87\x1d\x76\x48\xc1\x3c\x9c\x3d\x60\xf0\x80\x67\xbf\
+\xfe\xe6\x9b\xab\x54\x5d\xbb\x98\xc1\xec\x95\xf9\x7c\xee\xae\x6c\
+\x2e\x4b\x7f\x6d\xbf\xd0\x75\x5c\xfa\xed\xeb\xa2\x8a\x8a\x8a\xdf\
+\xc7\x62\x45\x17\x28\x8a\xfc\x27\xc5\xe7\xbf\x4b\x96\xa4\xeb\x23\
+\xa1\xc8\x85\x8b\x17\x2c\x3e\x90\x2e\x86\x8b\x17\x2f\x0e\x6c\x06\
+\xb5\xfd\x22\x2c\xc0\x7e\x7e\x91\x76\x56\x37\x02\xab\x10\xae\xaf\
+\xaf\xef\x05\xab\xca\x98\xc6\xfa\xc6\x93\x25\x4e\xb8\x5c\x11\xc4\
+\x5b\x02\xa1\xc0\x9d\x70\xe8\x76\x15\x1c\xd2\x1d\x0d\xdb\x9e\xa1\
+\x30\xc8\x2c\xdc\x00\x35\x02\x00\xcc\xd0\x74\xed\xd1\x74\x3a\x35\
+\xd5\x65\x98\xcb\x54\xcb\x9c\x5c\x3b\x78\xe0\x3d\x3b\xec\xbc\xf3\
+\xdb\x03\x47\x8d\x6a\x59\xcd\xf8\x67\x46\xf6\xde\x7b\x6f\xbb\xff\
+\x90\xfe\xf3\xfb\x0f\xec\xff\x6a\xed\xc0\x81\x37\x74\x74\x75\x5d\
+\x14\xf0\x29\x17\x0a\x3c\x77\x6d\x6b\x73\xcb\xcb\xf9\x7c\x7e\x41\
+\x3e\x9f\xd7\x41\xfe\xbe\xc5\x25\x25\x87\x23\x84\x6f\x60\x58\x7c\
+\xbf\x28\x8a\xb7\xc3\x04\xbf\x02\x56\xaa\x13\xda\xda\xda\x76\x81\
+\xbd\x7f\x39\x94\x59\x6b\x92\xab\xaa\xca\x3a\x8e\xc3\x5a\x96\x05\
+\xdd\xe2\xd6\xca\x43\x85\xd7\x96\xd4\x00\x76\x5d\x97\xc5\x0c\x43\
+\x92\xb9\xa4\xbb\x66\x43\x74\x0b\xd5\xd9\xd4\x59\x9b\xea\x4e\xed\
+\xd3\xde\xde\x7e\xb6\x10\xe2\xae\xe6\x45\xe9\x36\x4c\xf0\x1d\xb2\
+\x4f\xb9\x18\x2e\x20\xfe\xa8\xeb\x7a\x31\x2f\xf0\x1d\xb9\x7c\x1e\
+\xe6\xa0\xf1\x84\x6e\x1a\x37\xe6\xb5\xfc\xe5\xe0\xe9\x5c\x56\x55\
+\x53\x73\x0f\x80\xcd\x5b\xe0\xd5\xac\x58\x93\xef\xcf\x89\x1f\x7b\
+\xec\xb1\xce\x4e\x3b\xed\xb4\xa8\x76\x50\xed\x6b\x03\x07\x0f\xbe\
+\xc9\xc9\xe5\x26\x21\x06\x5f\x02\x07\xd3\x53\x61\xfe\x3f\x1b\x8f\
+\xc7\xbf\xc8\x66\xb2\x09\xf0\x86\x02\xd1\x68\x74\x87\x68\x24\x7a\
+\xaa\xeb\x3a\x77\x88\x92\xf0\x80\x63\xda\x37\x86\x83\xc1\x89\x0d\
+\x75\x0d\x63\xeb\x16\xd4\xed\x40\x17\xf4\x9f\x23\xcb\x96\xae\xbb\
+\xc5\x81\x87\x1a\x21\xdc\x40\x09\x80\xc8\xfd\xda\x9a\xda\xf6\x02\
+\x2f\xe1\x5c\x96\xe0\xab\xa2\xa1\xc8\x9d\x1c\xcf\xde\x29\xca\xd2\
+\xa5\x91\x58\xec\x00\xdb\x75\x7b\xe7\x34\xcd\xd0\x4d\x73\x71\x2a\
+\x9b\x79\x2b\x9d\xcd\xdc\x6f\x98\xc6\x35\xa6\xae\x5f\xd4\xbb\x5f\
+\xbf\x0b\x07\x8f\x18\xf1\x78\x2d\xb8\xaf\xe0\xa1\x64\xb7\xb4\x52\
+\x28\xff\xdd\x76\xdb\xad\xb9\x77\xff\xfe\xff\x06\x77\xf8\x4e\xd5\
+\xd4\x2f\x60\x31\x1a\x8f\x31\x73\x0d\xc7\xb0\x8f\xe4\xf3\xb9\x4f\
+\x30\x83\x3b\xa0\x6f\xc5\x8a\xa2\x1c\x00\xfb\xfc\xcb\x00\x80\xee\
+\x83\x49\x7e\x2f\x20\xcb\xf5\x00\x40\xe7\xac\x5c\xb9\x72\xcf\xa5\
+\x4b\x97\x0e\xa6\xbc\x82\xc1\xa0\x04\x21\x1c\x33\x58\x44\xd7\xb7\
+\xfb\xbf\x70\x01\xaa\xf8\xc5\xde\x04\x00\x1f\x8e\xf3\x58\x04\x63\
+\xe5\xc2\x1c\x14\xe1\x3c\x70\x44\x5b\x53\xd3\xc1\x15\x65\x65\xe7\
+\x73\x32\x73\xbd\x83\x9c\x3b\x59\x86\xbd\xdd\xb6\x9d\x09\x96\x6d\
+\xef\xe9\xba\xb6\x1f\x16\x8a\x15\xdd\xf1\xee\x7f\x82\xd7\xfd\x50\
+\x3a\x99\xbc\xce\x31\xf4\xc9\x7d\xfb\xf7\x9d\x08\x9e\xef\xa3\xfd\
+\xfb\xf7\xff\x64\xc4\x88\x11\xbf\xc8\xcf\x5e\x06\xed\xb8\x63\x2b\
+\x00\xdb\x3b\x23\x46\x8d\xb8\xc7\x21\xe4\x3c\x86\xb8\xe7\xe9\x86\
+\x76\xa5\x65\x99\x0f\xb7\xb6\xb5\x7d\x98\x4c\x26\x3b\x7c\x3e\x1f\
+\x0b\x67\x4b\xb5\xd5\x35\xd5\xe3\x58\x96\xbb\x46\x94\xc5\xbb\x79\
+\x99\xbb\x2d\xa8\xf8\x2f\x87\x1b\xda\x93\xe8\x4d\xed\xf2\xe5\xcb\
+\x6b\xa8\x0d\xfe\x64\xad\x6f\x81\x8a\x5b\x04\x78\x60\x90\x19\xe8\
+\x6c\xa8\xad\xb1\x71\x08\x0c\xf2\x1f\xa3\xe1\xe8\x84\x80\x2f\x70\
+\xa3\x6e\xe9\x0f\x06\x82\xfe\x3f\xc1\x8a\x72\xbe\xed\xd8\xbb\x03\
+\x72\xd3\xff\x88\x90\xe8\x8e\xc7\xbf\x51\x55\xed\x35\x8c\xc8\x5d\
+\xe9\x54\xf2\x32\xc7\x75\xc7\xf7\xab\xad\xbd\x66\xc0\xe0\xc1\x2f\
+\xd5\x0e\x1d\xba\x60\x0b\xf4\x7b\x93\x58\xc2\xa1\x74\xba\xef\x80\
+\x01\x1f\xf6\xab\xed\xf7\x97\xaa\xde\x35\xe3\x73\xaa\x3a\x3e\xaf\
+\xaa\x57\x08\x82\x78\x5f\x26\x93\xf9\x0f\x4c\xe6\x26\xdb\xb6\x15\
+\x98\x00\x63\x00\x80\xce\x87\x7e\xdd\x0b\xd7\xe6\x0f\x85\xc3\xe1\
+\xeb\xc1\x75\x9f\x08\xdb\xab\x9d\x2c\xcb\x62\x20\xcd\x06\x70\xb2\
+\x37\xa9\xf1\x42\xe1\x9f\xac\x01\x96\x65\xe9\xfc\x86\x9d\xb1\x1d\
+\xf4\xc9\xbe\xc3\x60\x1e\x5e\xa9\xe5\xf2\xb7\x72\x82\x78\x3f\x18\
+\xe9\xcd\xf9\xbc\x7a\xb2\x69\x18\xa3\x2c\xd3\x24\x1c\xcb\x7d\x23\
+\x0a\xc2\x74\xcb\x72\xfe\xc4\x60\x74\x39\x66\x98\x89\xd1\xa2\xa2\
+\xab\xfb\xd6\xd6\xbe\xd8\x77\xe0\xc0\xaf\x30\xc6\xbf\xea\x8f\x79\
+\xe1\x5c\xd2\x1c\x38\x6c\xd8\x67\x43\x86\x0d\x7b\xb2\x77\xdf\xbe\
+\x13\x59\x8e\x3d\xdb\x21\xee\xe4\x6c\x36\x77\x57\x3a\x93\xf9\xbf\
+\xe6\xa6\xe6\xe5\x20\xa3\x09\x5d\xee\x13\x0a\x85\x0e\xe4\x45\xe1\
+\x8a\xa0\x3f\xf0\x60\x28\x12\x7d\x10\x16\xef\x29\x12\x2f\x9d\x06\
+\x3b\x8d\x3d\x96\x2d\x58\xd0\x1f\x40\xc8\xff\x93\x95\xba\x99\x2a\
+\xd2\x81\xd9\x2c\xac\x00\x6c\x30\x1c\xf6\x86\xc0\x1d\x1c\xd2\xda\
+\xd4\x74\xa8\x5f\xf1\x4f\xc2\x82\x70\x47\x28\x1c\x79\x08\x21\x72\
+\x1b\x5c\x15\x9e\x14\x0c\x04\x86\x83\xa1\xd2\x3f\xe4\xdd\x9a\xcb\
+\x65\x67\x39\xb6\xfd\x7c\x32\x9d\xba\x19\x6e\xa0\x2e\x54\xfc\xca\
+\x05\x55\x35\x35\xb7\x0c\x19\x3e\xfc\x5f\xe0\xd9\x34\x6f\x16\xa1\
+\xb6\x10\x13\xf0\xba\xbe\x06\x19\x5f\x28\xaf\x2c\x87\xbd\x78\xfe\
+\x7c\x58\x75\x26\xc1\xa0\xff\x29\x9f\xcf\xff\x0d\x3c\x9a\xf9\x40\
+\x26\xac\xb4\x43\x81\x8e\x67\x18\xe6\x0e\x41\x10\x8e\x15\x04\xc1\
+\x07\xe0\x23\x41\xb9\xdf\x37\xc0\xb9\xd0\xb7\x5b\xb2\xc2\xef\xb6\
+\x36\xe3\x18\x11\xb8\xbd\x82\x6d\x93\x0f\xe6\x61\x0d\x1c\xfe\x0f\
+\x87\x2d\xf0\x08\x96\x65\x91\x28\x88\x7d\x58\x96\xb9\x8c\x10\x77\
+\x6a\x28\x1c\x3e\x14\xc6\xa5\xc6\xb2\xad\x04\x2c\x0c\x1f\xf9\x02\
+\xfe\xa7\x31\xcb\xdc\x94\x55\x73\x93\xd2\xb9\xec\xf8\xde\x7d\x7b\
+\xdf\x5a\x56\x59\xf9\x56\x9f\x3e\x7d\x36\xdb\x16\x0a\x6d\x81\xd7\
+\x90\x21\x43\xea\x06\x0c\x18\xf0\x32\x9c\x71\x5e\x8d\x30\x3a\x9b\
+\x10\xe7\xc2\x78\x3c\x71\x17\x00\xe9\xeb\x30\x0f\xbf\x81\x03\xea\
+\x14\x34\x1b\x09\x04\x02\xbb\x94\x94\x94\x9e\x1b\x8e\x84\xee\x06\
+\x6f\xfd\x51\xc9\x17\xb8\x19\x3c\xf0\x73\xc1\x31\xd8\xb7\xb3\xb3\
+\xb3\xff\xaf\x75\x2e\xf4\xb3\x80\x87\xc0\x40\xc3\x8a\x5e\x04\x67\
+\x31\x23\x3a\xda\x3a\x4e\xb0\x4d\x73\xaa\x6d\x98\x8f\x8a\x92\xfc\
+\x98\x6d\x5b\xd7\xc3\x79\xcd\x61\xa9\x74\xba\x3f\x28\xc0\x05\x63\
+\x5c\x01\xf4\x5f\x58\x69\xfe\xd2\xd1\xde\x79\xa5\xad\x69\x67\x56\
+\xf5\xaa\x39\x03\x0e\xd6\x1e\xec\xdb\xb7\xef\x87\xe0\xc6\xae\xf3\
+\x06\x00\xea\x6e\xd5\x6f\x70\x85\x57\x54\xc2\x44\x2d\x2d\x2d\xbd\
+\x19\x3c\x9f\xe3\x7d\x3e\xdf\xf9\xb0\xfd\xba\x56\x55\xd5\xa7\x61\
+\xe2\xcf\x66\x59\x36\x07\x2b\x90\x04\x93\x9d\x05\x8f\xa8\x02\xe8\
+\x32\x48\x7b\x1c\xca\x5d\x07\x87\xd7\xa7\x80\xfe\x46\xc3\xb6\xac\
+\x82\x6e\x03\xb6\xea\x8e\x6e\xa5\xc2\xc1\x1c\xf4\xbc\x6b\x30\xb4\
+\xbe\x30\xbf\xf6\x02\x80\x3f\x03\xe8\x26\x38\x27\x7c\x1e\xe6\xe5\
+\xb1\x60\x84\x7e\xf0\x32\x45\xd0\x37\x0b\x06\xba\xd2\x34\x8d\x77\
+\x78\x9e\x7b\x80\x81\x03\xdc\x5c\x2a\x7f\x3e\x18\xe1\x79\xe5\xe5\
+\xe5\x0f\xd5\xd4\xd4\x7c\xd8\xab\x57\xaf\x5f\x64\x0b\xb5\xb9\x55\
+\x09\xb7\xb8\x2d\x83\x86\x0e\xfd\x3f\x00\xa1\xdb\x6c\xe2\x9e\x9a\
+\x49\x66\xcf\x15\x24\xf1\x1a\x00\xd7\xa7\x12\x70\x2e\x04\x40\xdc\
+\xa9\x69\x9a\x04\x3a\x18\xe2\x0b\xf8\x8f\xe7\x39\xee\x8e\x50\x30\
+\xf8\x94\xa1\x19\xf7\x16\x17\x17\x5f\x02\xf9\x87\x64\x32\x99\x01\
+\xe0\x34\x04\x37\xb7\x6c\xeb\xe3\xb7\xc9\xc0\x03\x6e\x9a\xd0\xd9\
+\xd9\x59\x06\x86\xf2\x3b\xd8\x63\x9e\xaf\x88\xf2\x9f\xb2\xe9\xcc\
+\xd3\xa1\x50\xf0\x3e\x9f\xcf\x7f\xb1\xac\x28\x7b\x80\x91\x95\x41\
+\x27\x73\x60\x58\x4b\x18\x8c\xdf\xb2\xe8\x75\x63\x3e\x77\x7e\x77\
+\x22\x7e\x42\xaf\x3e\xbd\x26\x0f\x1a\x3a\xe8\xc5\x01\xc3\x87\xaf\
+\xf7\x7f\x73\xaf\x4f\xd8\xad\x3d\x1d\xb6\x64\x16\x1c\xfa\x7d\x52\
+\x52\x52\xf2\x30\x4c\xe2\x73\x60\x8b\x75\x1a\x78\x39\xf4\x6f\x04\
+\xff\x05\x0c\xe0\x53\x18\xdc\x76\x30\x08\xd8\x71\xf9\x77\x06\x83\
+\x39\x8f\xe7\xf9\xbb\x01\xa4\x9e\x01\xba\x0b\xf4\x75\x01\x80\xd0\
+\x9e\xb0\x12\xd5\x80\xde\x7e\x33\xb7\x13\xe8\x57\x18\x14\x98\x7b\
+\x22\xe8\x32\xd6\xde\xde\xde\x17\x74\x75\x40\x59\x59\xd9\x44\xf0\
+\x24\xef\x35\x4d\xf3\x51\xf0\x30\x6f\x01\xbd\x9f\x0a\x5b\xdf\x11\
+\xa1\x50\xc8\x05\xdd\xd6\x49\xa2\xf4\xb6\xaa\x6b\x77\xf2\x8c\x70\
+\x1e\x62\x98\xd3\x62\xc5\xc5\x97\x17\x97\x16\x4f\x2b\xef\x55\xbe\
+\xf0\x57\x10\x7f\x8b\x36\x09\x9e\x9a\x3e\x64\xe4\x90\x59\x00\xa4\
+\x8f\xf4\xed\xd7\xef\x6c\x53\xb5\xc7\x61\xc4\x4c\x84\x05\xff\x41\
+\x00\xe6\xff\x02\x40\xaf\x24\x2e\xb1\x11\x41\xbd\x42\xa1\xe0\xa1\
+\xa0\xaf\x2b\x61\x21\x7c\x08\xc0\xf9\x11\x38\x9f\xbc\x01\x16\xcc\
+\x63\x01\x80\x86\x02\x6d\x51\x10\xda\x28\xe0\x21\x84\x88\x74\x90\
+\x41\x98\xfd\xe1\x50\xee\x52\x10\xf4\x2f\xc5\xc5\xc5\xcf\xc1\x60\
+\xff\x19\xb6\x49\x67\xc0\x2a\xbe\x93\xa6\xa9\x41\x98\x0c\x9d\x30\
+\xe8\x5f\xe5\xf2\xf9\x57\x92\x89\xd4\x75\x9c\xc0\x9f\x8e\x39\x96\
+\x82\xcd\xd4\x3e\xb5\xb5\xef\x8c\x1c\x39\xb2\x13\x6d\x47\x2f\xf0\
+\x84\x96\xc0\x15\xe8\x34\x00\xa2\xc9\xb0\x0a\x9f\x08\x46\x70\x1e\
+\x00\xd0\x1d\x30\x01\xde\x06\xd0\x59\x06\xa0\x44\xff\x5c\xc3\x30\
+\xd0\xe7\x89\xa0\xe3\xbb\x01\x94\xa6\x45\x22\x91\x47\xc0\x68\x2e\
+\x6d\x6b\x6b\x3b\x84\xea\xfc\xd7\x72\x85\xb7\xb6\x61\x02\xfd\xf0\
+\x30\xbf\x8a\x40\x77\x03\x60\xee\x8d\x05\xf9\xae\x01\x6f\xe5\x49\
+\xd0\xe9\xd3\x90\x76\x1d\xcc\xc5\xc3\x41\x9f\xbd\xc0\x78\x54\x30\
+\xa2\x2f\x21\xfd\x25\x30\xa2\xeb\x1d\xcb\x3c\x53\xb7\x8c\x53\xc0\
+\x10\x6f\x0d\xc5\x42\xef\x80\x67\xda\x01\x75\xb7\x9b\xf7\xa0\x91\
+\x83\x1a\xfa\xc3\x4d\x6d\x45\x55\xc5\xa5\x46\xca\x3c\x51\xe4\xa5\
+\x73\x60\x37\x72\xab\x61\x1a\xff\x00\xfd\x2c\x06\xbd\xaa\x00\xd8\
+\xf4\xac\x75\x6f\xd0\xdf\xc5\x40\x8f\x80\x72\x9e\x03\x40\xba\x17\
+\xec\xfd\x2c\x70\x2e\x76\x00\xbd\xc7\x20\x6d\xb3\xbe\x37\x08\x3c\
+\xb4\xd1\x44\x67\xf7\x04\x99\x30\xcf\x45\x7c\x81\xa7\x18\x84\x6f\
+\x64\x31\x73\x24\x18\x47\xad\xa6\x69\xbc\xe5\xd8\xad\xb6\xeb\xcc\
+\x34\x2c\xeb\x09\xd3\xb6\x2e\xef\xec\xee\x3a\xba\x5f\xff\x7e\x27\
+\xf4\xe9\xdf\xe7\x01\xd8\x3e\xcd\x82\xd5\x28\xbf\x59\x25\xfe\x8d\
+\x32\x03\x5d\x34\x83\x2e\xfe\x09\x9e\xd0\x0d\xd0\x85\x63\xd2\xe9\
+\xf4\xe9\x00\x38\x37\x02\xd1\x7f\x54\xf7\x0d\x00\x51\x1e\x0c\xa8\
+\x0a\x0c\xe7\x60\x00\xa0\x6b\xe1\xf9\x29\x08\xa7\x85\x42\xa1\x6b\
+\xe1\xbc\xa2\x16\xea\x6c\xb7\x6f\x30\x0e\x16\xf4\x35\x42\x14\xf9\
+\x3b\x09\x71\xa7\xc9\xb2\x78\x3f\xc3\xa0\x8b\x74\x5d\xfd\x03\xcc\
+\xc3\x10\x80\x4e\x17\x78\xd9\x1f\xc1\xc1\xfe\x13\x00\xec\x57\x41\
+\x78\x02\xe8\xed\x14\x00\xfd\x07\x4a\x2b\x2b\x67\x82\xde\x0b\x73\
+\x10\x66\x4f\xdf\xe1\x7d\x3b\x2a\x6a\x2a\xfe\x53\xd3\xbb\xf7\xad\
+\xc9\x54\xea\x18\xc3\x32\x4f\x06\xf0\x99\x02\xf3\xec\x45\xd0\xe3\
+\x5c\xa0\x24\xd8\x74\x08\x40\x67\x27\xd0\xe9\x99\x30\x37\xef\x85\
+\x79\xf8\x0a\xe8\xf6\x19\xd0\x3f\xfd\x37\x43\xc0\x65\xf3\xbc\x99\
+\x0d\xb1\xc9\x74\x24\x06\x84\x14\xff\xd1\x8a\xac\xec\x9e\xe8\xea\
+\xae\x32\x75\x83\xde\xcc\xac\x80\xf3\x9c\xf7\x60\x65\xf9\x53\x36\
+\x9b\x3d\x0d\x06\xfb\x50\xd8\x27\x5f\x04\x46\xf5\x02\x9c\xd9\x2c\
+\xdb\x10\xcf\xed\x3d\xbf\xa2\xa2\x42\xed\xdd\xbb\xf7\xa7\xb1\x58\
+\xec\xfe\xa2\xa2\xa2\x53\x60\xc5\x19\x07\x13\xe0\x7c\xcb\xb2\x1e\
+\x85\x41\xfe\x8c\x10\xd2\x05\x83\x1f\x06\xda\x0d\xe2\xa7\x18\x86\
+\xb1\xd3\xf6\xac\xb3\xe6\xe6\x66\xc1\x71\xcc\xdd\xc1\x30\x4e\x86\
+\x33\x9a\x11\x00\xce\x2c\xe8\xa3\x01\xbc\xc8\x77\x40\x77\xf7\x81\
+\x8e\xe8\xdf\x59\x3e\x1a\x0e\x52\x27\x82\x47\xf3\x3c\x78\x42\x4b\
+\x20\xbf\xf0\xfe\x11\x0d\xd0\x5b\x32\xb0\xd7\x79\xb0\x20\x3e\x06\
+\x7a\x3b\x07\x40\x66\x1c\xd8\xf3\xb9\xa0\xcb\xfb\x41\xa7\x1f\xc1\
+\x7c\x6c\x87\x38\x07\x73\xb2\x2f\xa4\x1f\x04\xf3\xf2\xc4\x1f\x61\
+\xb7\xc9\x59\x1b\x04\x9e\x68\x2c\xca\xc0\x01\x95\x09\x82\xe4\x31\
+\x46\x9f\x3a\xb6\x73\x43\x77\x47\xfc\xf8\x6c\x3e\x7f\x28\x08\x7d\
+\x6d\xbf\x7e\xfd\xde\x83\x0e\xac\xfb\x50\x6e\x93\xc5\xd9\x3e\x2b\
+\x54\x57\x57\xd7\x01\x10\xbd\x04\x7a\xbc\x00\xdc\xdb\x43\xe1\x50\
+\xf4\x34\x18\xe8\xdb\x80\xde\x07\x63\x6b\x05\xd2\xb6\x4f\xcd\x7c\
+\xd7\x6b\xc7\x71\x73\x08\xe1\x65\xb2\xac\xbc\x0e\x7a\x99\xaa\xeb\
+\xf9\x93\x93\xc9\xf4\x51\xb0\x8d\xbd\x06\x00\xfc\xff\xc0\xab\xd9\
+\xae\xb6\xf1\x68\x33\xbf\x40\x87\x4d\xb0\x20\xbe\x01\x0e\xc4\xa5\
+\x60\xeb\x7f\x04\xc0\x39\x06\xc2\x3b\x40\xd7\xf4\xab\x04\x2a\x34\
+\xb7\x59\xe7\xe0\x06\x81\x27\x95\x4a\xb1\x0c\xcb\xf0\xb0\x67\x56\
+\xc1\x28\xde\x2e\xef\x5d\x7d\x17\xfd\xc1\x1b\x5c\x27\x1b\x20\x4c\
+\xe1\xbd\x99\x35\xd0\xbf\x7f\xff\x4e\x38\x8f\xf8\x0f\x9c\x63\xdc\
+\x14\x89\x44\xf6\x83\xd5\x87\xde\x94\x7d\xb4\x99\x9b\xf9\x4d\xb1\
+\x03\x60\xd6\x5c\x17\xd1\x4b\x8a\x43\x05\x41\x3c\x51\x10\xa4\xbf\
+\x14\x15\x95\x7f\x46\xd3\x7f\x53\x1d\xf9\x8d\x08\x4b\x0f\xa8\x61\
+\x11\xfc\x18\xce\x28\x6f\x02\xaf\xe7\x9f\xe0\x61\x62\xf0\xbe\xd7\
+\xfa\xe6\xf7\xcf\xed\xca\x06\x81\x87\xc7\x18\xf3\x3c\xcf\x82\x01\
+\x60\x51\x92\x7e\xd5\x2f\x51\xfd\xdc\xce\xfe\x16\xeb\x03\x10\x2d\
+\x03\x03\xdb\xe6\xfe\x55\xf1\xa6\x8e\x05\xf5\x68\xc2\xe1\x70\xc3\
+\xa6\xd6\x2b\x94\xff\xe9\x1a\x00\xd0\xc1\xb6\x6d\x63\xd8\x86\x51\
+\x9c\xd8\xac\x3f\xf5\xa1\x0c\x7f\x54\x32\x0b\x5a\x07\x77\x8b\x80\
+\xeb\x45\x00\xf5\x36\xe9\x47\x98\x3f\xca\xb8\x90\x59\xd0\xc0\xaf\
+\xa2\x81\x42\xa3\x9b\xa0\x01\x06\xcc\x9f\x05\xbb\x47\x70\xce\xb3\
+\x09\xd5\x36\x5c\x74\x83\xc0\x43\xbf\x5a\x0b\x4e\x8f\x0b\x27\xdf\
+\x2e\xc7\xb2\x85\xaf\xfb\x6f\x58\xa7\x85\x12\x05\x0d\x6c\x13\x1a\
+\x00\xbb\x77\x28\xe0\x80\xc7\xe3\x02\xf8\x6c\x56\xa7\x63\x83\xc0\
+\x83\x38\x8e\x08\x02\x4f\x7f\x64\x47\x30\xe6\x0a\x5b\xad\x6d\x62\
+\x4a\x15\x3a\x51\xd0\xc0\xc6\x69\x00\xce\x77\x00\x02\x38\xb0\xfd\
+\xcd\xba\xd3\x42\x1b\x06\x1e\x90\xcf\xb6\x1d\x6f\x9b\xb5\xb9\x51\
+\x0f\x58\x17\xde\x05\x0d\x14\x34\xb0\x15\x6b\x00\x3c\x1e\xfa\xa7\
+\x45\x36\x2f\xea\x40\x7f\x37\x0a\x78\xa0\xdc\x76\xf2\x2e\x74\xb3\
+\xa0\x81\x82\x06\x7a\x34\x00\xe7\x3b\x1e\xe8\x40\x48\x93\x7e\xe1\
+\xad\x16\x6d\x12\x61\x0f\xf1\xe0\x03\xde\x5e\x42\xe1\xa3\xa0\x81\
+\x82\x06\xb6\x13\x0d\x00\xf0\x60\xa0\xcd\xda\xdb\x4d\xf3\x78\xb0\
+\x5b\x00\x9e\xcd\xaa\xfe\x02\xb3\x82\x06\xb6\x6a\x0d\x50\xc0\xa1\
+\xb4\xd9\x85\xdc\x34\xe0\xd9\xec\xcd\x17\x18\x16\x34\x50\xd0\xc0\
+\x06\x34\xb0\x55\x64\x63\xbc\x79\x7d\x8e\x4d\x01\x1e\xba\xc7\xdb\
+\xbc\xad\x6f\x15\x2a\x2d\x08\x51\xd0\x40\x41\x03\x3f\xa6\x01\x8c\
+\x31\xbd\x5c\xfa\xb1\x22\x9b\x9c\xb7\x29\xc0\x43\x99\x17\x80\x87\
+\x6a\xa1\x40\x05\x0d\x6c\x47\x1a\x00\xe0\xa1\xbd\xa5\x8e\x07\x0d\
+\x37\x0b\x6d\x2a\xf0\x6c\x96\x46\x0b\x4c\x0a\x1a\x28\x68\xe0\x37\
+\xa5\x01\x0a\x3a\x94\x36\x9b\xd0\x1b\x01\x3c\x36\x42\xae\x8d\x78\
+\x81\x25\xb6\x0d\xf1\xcd\xd6\x74\x81\xd1\x66\xd0\x40\x81\x45\x41\
+\x03\x5b\x58\x03\x2e\xdc\x69\x13\xc2\xd2\x3f\x44\xb2\x19\x5b\xda\
+\x08\xe0\x81\xd6\x18\x44\xbf\xb9\xb8\x59\x11\x0f\xb8\x16\xde\x05\
+\x0d\x14\x34\xf0\x1b\xd0\x00\x6c\xb5\xc0\xf6\x31\xd0\xe6\x13\x76\
+\x83\xc0\x03\x5e\x0e\xc6\x08\xd3\x16\x5d\xfa\x51\xa0\x6d\x47\x03\
+\x64\xfa\x31\xec\xfc\xf9\xc7\x08\x75\x75\x07\x89\x34\x5c\x93\xc8\
+\xdc\x73\xf9\x1f\xa5\x19\x7f\xe0\xe6\x42\x99\xb9\x73\x77\xe2\x69\
+\xd8\x53\x97\x90\xa9\x1b\x9c\x53\xdb\x8e\x06\xb7\xab\x9e\xfc\xb2\
+\xc0\xe3\xa9\x96\x20\x82\xbc\x93\x6d\xef\xa9\xf0\xf1\x0b\x68\x80\
+\x90\xe9\x2c\xa9\x7b\x40\x24\x4d\xf7\xc8\xa4\x61\xaa\x94\x58\x7e\
+\x47\xa8\x6b\xc5\x35\xe5\xed\x2b\xae\xed\xd3\xd6\x78\xe5\xd0\x96\
+\x15\x93\x76\x6c\xaf\xbb\x60\xb7\xce\xa5\xe7\xed\xd9\xbe\xf4\xd4\
+\xfd\xda\x96\x1e\x73\x48\x67\xdd\xf1\x47\x2f\xfb\xea\xc8\x53\x9b\
+\x97\x9e\x79\xfe\xc2\x59\xc7\x4d\x5a\x32\xf7\xa4\x4b\xbf\xfe\xe8\
+\xc8\x2b\x97\xce\x3e\x66\xca\x97\xff\x3b\xe8\xba\x45\x1f\x1f\x72\
+\xe3\x92\x8f\x0f\xb8\x75\xe9\xa7\x7f\xb8\x63\xc1\x87\x43\xef\x5e\
+\x5e\xf9\xf9\x3d\x72\xf7\x27\xf7\x72\x4d\xf3\xee\x55\xba\x3f\x00\
+\xfa\xdf\xb7\xf4\xdf\x7b\x1b\xb3\xaf\xdf\xdb\x90\x7f\xfd\xde\x66\
+\xfd\xcd\x7b\x9a\xcd\x37\xee\x69\xd5\xdf\xbc\xbb\xd9\x78\xf3\xee\
+\xd5\x21\xbf\xe8\x9e\x62\xe3\x8d\xbb\x8b\x99\xe6\xbb\x03\xe6\xf4\
+\x7b\x44\xf5\x93\x7b\xd8\xcc\xac\xbb\xeb\x3e\x7d\xf5\x9e\xc5\x1f\
+\xef\x74\xd7\xf2\x39\xfb\xde\xb6\xe0\xc3\xfd\x6f\x5c\x3a\xf3\xa8\
+\xeb\xea\x66\x9d\x70\xf5\xb2\xcf\x4e\xbd\xbc\x61\xde\xb9\x93\x9b\
+\xbe\xbc\xe0\xa2\xb6\x6f\x2e\xba\xa0\x65\xf1\xc5\x67\x75\xd4\x5d\
+\x72\x72\x67\xdd\xa5\x47\xb7\xd7\x4d\x1e\xdb\xb9\xe4\xd2\x83\xda\
+\x97\x4e\xda\xaf\x75\xe9\xa5\x7b\x76\x2c\xba\x64\x4c\xeb\xe2\x2b\
+\x46\x77\x2c\xbe\x6c\x44\xd3\xc2\xcb\x6b\xbb\x16\x5f\x51\x91\x6c\
+\x98\x1a\x6e\xa2\xba\xa0\x3a\x99\xfb\x18\xef\xe9\x87\x10\x6f\x45\
+\xfc\x05\x86\x63\xbb\x6d\x02\x83\xdd\x53\xda\x14\x05\x6c\x4c\xd9\
+\x8d\x5b\x9d\x18\x18\x5f\x10\x60\x63\x18\x16\xca\x20\xfa\x83\x5a\
+\xfa\xa5\x2b\x50\xda\x2a\x6d\x10\x30\x94\xa6\xa6\xc9\x72\xe7\xfc\
+\xa9\xfe\x54\xe3\x55\x91\xce\x86\xcb\xcb\xda\x1b\x27\xf5\x6d\x6f\
+\x9a\x3c\x7c\xc5\xa2\x49\xbf\x4b\xb5\x5f\xbf\x6f\xdb\xb2\x49\x07\
+\x75\x37\x4c\x3a\x22\xd5\x72\xf1\x71\x99\x95\xe3\x4f\xef\x5a\xfa\
+\xd6\xf9\x69\x6e\xee\xa4\x84\x3a\xfb\xaa\x94\xf9\xf5\x2d\xc8\xfc\
+\xe4\x4f\x8c\x3a\xef\x6e\x26\xfb\xf1\xfd\x28\xf5\xc1\x83\x28\xf5\
+\xc9\xc3\x8e\xfa\xd9\x83\x1c\x5e\xfc\x00\x20\xd4\xfd\x2c\x6e\xba\
+\x0f\xe3\x86\x7b\x65\xa1\xe1\x2e\x1e\x7d\x73\x47\x79\x59\xeb\x2d\
+\x3e\x79\xc9\x4d\x35\x95\xc9\x1b\xc3\xa1\xa6\x1b\x2b\x4b\xe3\x37\
+\x86\x42\x4d\xd7\x17\x15\xb5\x5f\x13\x0e\x36\x5f\x59\x53\x69\x5f\
+\x52\x14\xb3\x26\x96\x55\x4a\xe3\x4b\x6a\x94\x0b\xca\x2a\xe4\xf1\
+\x25\x95\xf2\xf8\x55\xa1\x0f\xe2\xbe\x09\x25\x15\xf2\x84\x48\x31\
+\x7b\x61\x28\xc6\x5f\x18\x2a\xe2\x2f\xfa\x3e\x45\x20\xcd\x2f\x9a\
+\x17\x55\x96\xc9\xd5\x13\xe1\x7b\x00\x00\x10\x00\x49\x44\x41\x54\
+\x17\x96\xc7\xf0\x84\x5e\xe5\xdc\x85\xd1\x70\xfe\xe2\x92\xa2\xd4\
+\x65\x3e\xa9\xf1\xea\x8a\xb2\xee\xeb\x8b\x63\x4d\x37\x44\xa3\xcb\
+\x6f\x0c\x05\x97\xdc\xe4\xf3\x7d\x7d\x33\x2f\x7f\x71\x1b\xe2\xe7\
+\xdc\x8e\xc9\xa7\x7f\xb2\xed\x99\x7f\xb6\xdd\xd9\xf7\xda\xce\x67\
+\xf7\x98\xee\x9c\x7b\x4d\xeb\xb3\xfb\x4d\x73\xd6\x83\x9a\x39\xfb\
+\x61\x5d\xfb\xe4\x51\x55\x9f\xf5\x08\x8b\xbf\x7e\xd0\x46\x5f\xdf\
+\x6f\x58\x9f\xdd\x2d\x1a\x33\xee\x48\xa2\x19\xd7\x27\x43\xef\x5c\
+\x9e\x5a\xf1\xda\x85\x89\x86\x53\xce\xea\x5a\x71\xe5\x89\x1d\x2b\
+\xa6\x1c\xd9\xb6\xec\xca\x83\xda\x96\x5d\xb1\x77\x5b\xfd\x15\xbb\
+\xb4\x35\x5e\x3a\x24\xbe\x6c\x4a\x35\xd5\x75\x7b\xfb\x5d\xbe\x06\
+\x00\x6e\x52\xf0\xc4\x56\x4d\xc6\x4d\xfb\x24\x50\x9c\x50\xe0\xa1\
+\x04\xf1\xcd\xf6\xde\x20\xf0\xd0\xe3\x64\xaf\x51\x86\x71\x1d\xb0\
+\xa9\xcd\xd6\xf2\x36\xc2\x88\xc0\xaa\x4b\x66\x4c\xe5\x5a\xe7\x4e\
+\x55\xda\xea\xae\x2e\x4e\x35\x4e\xed\xdb\xb5\xf0\xd2\x51\xed\xf3\
+\x2f\xda\xab\x73\xc9\x79\x07\x77\x2f\x3b\xf3\xc8\xae\xe0\xc7\x27\
+\x49\x6a\xcb\xf9\x36\x37\xf7\xca\xac\xfa\xf9\x54\x2d\x3f\xef\x76\
+\x35\xfd\xd9\x3d\xb9\xc4\x9c\x87\x91\xf3\xe5\x13\xcd\x2b\xde\x7e\
+\xc2\x50\xe7\x3d\xa9\xe7\x3f\x7f\x5c\xcb\xcc\xfb\x8b\x6b\x2d\x7a\
+\xb0\x28\x98\xb8\x9b\x77\x1b\x6f\x09\x88\x9d\xd7\xfb\xe5\xc4\xa5\
+\x61\x5f\xf6\xdc\x68\x50\x3d\xa1\x38\x6a\x1d\x56\x56\x82\xf6\xae\
+\x28\x63\x76\xab\x28\x67\x46\xfb\x95\xfc\xc8\x48\xd8\x1d\x12\x09\
+\xa1\xfe\xd1\x08\xae\xaa\xa8\x92\x4a\x64\x39\x19\xf2\xf9\x92\xbe\
+\xf2\x72\x47\x11\x84\x6e\xd1\x27\x65\xd9\xa2\x62\x82\xcb\xcb\x18\
+\x14\x0e\x6a\x28\x18\x30\x90\xdf\x67\x21\x45\x71\x91\xa4\x38\x48\
+\x90\x11\x12\x14\x02\x21\x41\x3c\xa4\x09\x40\xab\x42\x84\xe4\x00\
+\x83\x94\x20\x83\x64\xa0\xef\x87\x3e\xc8\x8b\x46\x64\xe4\xf3\xf3\
+\x48\x12\x6c\x24\xf1\x26\x8a\x15\x71\x28\x12\x63\x50\x24\x62\xa2\
+\x50\x40\x45\x8a\x3f\xcd\xfa\xfd\x19\x3e\x14\xcc\x48\x91\x48\xde\
+\x57\x14\xd1\xfd\xc5\xc5\x56\xa8\xb4\xd4\x89\x96\x95\x38\xa5\x45\
+\x25\x46\x55\x49\x89\xd9\xb7\xa4\xd4\x1a\x58\x56\xee\x0c\x29\x2f\
+\x77\x47\x94\x57\xb9\xa3\x2a\xab\x99\x9d\xaa\x2a\xf1\x98\xa2\x98\
+\x7e\x40\x34\xa2\x1e\x1d\x0e\xe4\xce\xf4\xcb\xa9\x89\xa2\xd8\x7d\
+\x8d\x20\x74\xdd\xca\xa2\xd6\xbb\x38\xdc\x72\xbf\x95\xfb\xe2\x2f\
+\x66\xf6\x8b\xc7\x8c\x3c\xe8\x2f\xf7\xd9\x53\x5a\x7a\xd6\x53\x7a\
+\x6a\xce\x5f\x72\xea\xa7\xf7\xa4\xb2\x73\xef\xc4\x99\xd9\x53\x59\
+\x6d\xd1\xa5\xf1\x86\xae\x0b\xb2\x2b\xaf\x3b\x3e\xbd\xe2\xb6\x83\
+\x9b\x17\xdc\xba\x6f\xfb\x82\xfb\x76\x6d\x5b\xf0\xf8\xd0\xee\xa6\
+\xe7\x2a\xeb\xea\x1e\x08\xd6\xd5\xbd\x2d\x6e\x23\x53\x72\xb3\x76\
+\x83\x61\x18\xf2\x2d\xc3\x9e\xf0\xdb\xc7\x9f\x17\x6c\x10\x78\x00\
+\x74\x7a\x7e\x28\x01\x1b\x2e\xb2\x59\x1b\xff\x79\xa2\xff\x72\xb5\
+\xe7\x82\xc7\x42\x27\xe7\xb2\x6f\x6e\xa9\x5e\xb1\xf4\xe6\xc1\x0d\
+\x4b\xaf\xdb\xb5\xbb\xf9\xce\x7d\x57\x2e\xbb\xfa\x88\x96\xa5\xe3\
+\x4f\x4d\xd5\x76\x5f\xe4\x06\x1a\xae\x65\x70\xcb\xcd\x9a\xb1\xe4\
+\x4e\x03\xad\xb8\x0f\x09\x2d\x8f\x12\xd2\xfe\x98\x4b\xba\x9f\xc0\
+\x4c\xe2\x01\x96\xcf\xdf\xe3\xf3\x31\xd7\xc6\x22\xbe\x89\x65\x65\
+\xe1\xd3\xab\xab\xca\xc7\xf6\xae\x29\xdb\xa3\xb2\x22\x3a\x74\xd0\
+\x80\xaa\x3e\x35\x35\xd1\x8a\xca\x3e\x45\xc5\x91\x30\x1f\x0d\x04\
+\x91\x1f\x31\x59\x51\xf6\x39\x1c\xcb\x1b\x88\x61\x4d\x44\x80\x1c\
+\x64\x23\xd7\xb5\x90\xed\xb8\xc8\x31\x6d\x64\x19\x0e\x72\x1c\x07\
+\xb1\x1c\x07\xcf\x04\xa5\x13\x69\x64\x64\x73\x28\xe0\xf7\x21\x5d\
+\x4b\x23\x2d\x9f\x42\x02\xc7\x42\x3e\x83\xf2\xd9\x24\xd2\x72\x69\
+\x64\xd9\x9a\x97\xe6\x9a\x04\x61\xcc\x22\x9b\xd8\xc0\xd5\x80\xd0\
+\x84\xd0\x42\x0e\x81\x10\xc8\x41\x3a\xa4\xe9\xc8\x74\x34\x64\x40\
+\x1d\xd3\xc9\x43\x98\x47\x26\xc4\xbd\x67\x08\x4d\xdb\x80\x67\xa8\
+\xaf\xeb\x20\x97\x0b\x72\x99\xc8\xd4\x55\xa4\xe7\xd3\x20\x33\xf1\
+\xda\x22\xc4\x42\x2e\x10\x95\xd3\x32\x69\xbe\x85\x8c\xbc\x89\xb4\
+\xac\x8e\xf2\x79\x5a\x36\xe7\xc9\x6a\x68\x19\xa8\x9b\x47\x8e\xa5\
+\xc1\x25\xaa\x8e\x88\x63\x20\xd7\x23\x13\x11\xe8\x33\x06\xe9\x38\
+\x96\x00\xc0\x31\x48\x91\x58\x14\xf0\x09\x7c\xc0\xcf\x2b\xe5\x55\
+\x72\xa8\xa2\x4a\x28\xae\xaa\x96\x2b\xaa\xaa\x7d\x7d\xaa\x6b\x82\
+\xc3\xaa\xaa\x42\x7b\x55\x56\x05\x8e\xae\xaa\x0c\x9c\x23\x2b\xc6\
+\x65\xe5\xe5\xc2\x2d\xb9\xdc\x8a\x87\x12\x99\x45\xcf\x75\xc5\xbf\
+\x7c\x51\x33\x16\x3d\xa7\x9b\x0b\x9f\xd4\xac\xcf\xef\x4f\x25\x3e\
+\xbd\x4b\xc1\x2b\x6e\x15\xec\x7f\x5f\xd9\xb0\x74\xf2\xf9\x5d\x2b\
+\xa7\x9c\xd0\xd2\x38\xe5\xb0\x15\xcb\xae\xda\xa7\xa9\x7e\xca\x2e\
+\x2b\x96\x5e\x3b\xb8\x69\xc9\x2d\x00\x4e\x53\x01\x9c\x1e\x10\x7f\
+\xb9\x59\xb7\x55\xb4\x84\x99\xef\x80\x67\xb3\x0a\xc4\x6c\x34\x37\
+\xcc\xd0\x6f\x2f\xba\x1b\x5d\xfe\x37\x52\x90\x90\x19\x5c\x7b\xfb\
+\xf3\xbe\x78\xfc\xc5\x60\xae\xe3\x89\xd2\x74\xd3\x93\xfd\x93\xcd\
+\x8f\x8e\x4c\x34\x3e\xbc\x7b\xa2\xf9\xbe\x43\x93\x8d\xb7\x9e\xda\
+\xa7\xa8\x69\x62\x90\x5d\x71\x83\x4f\x6a\xba\x0b\x99\x8b\x1e\x12\
+\x71\xfd\x63\x7a\xee\xf3\xc7\xc3\x4a\xdb\x5f\x7c\x81\xd4\x43\xa6\
+\xd3\x7a\x4f\x59\x19\x73\x75\x38\x8a\xce\x2b\x2b\x97\x8e\x2e\x2d\
+\x97\xf6\x2c\x29\x91\x07\x96\x54\x05\xab\x8a\x8a\xa4\x58\x34\x2a\
+\x05\x82\x21\x11\x29\x32\x0b\x20\x40\x10\x21\x0e\xb2\xc0\xc0\x0c\
+\x03\x8c\xcc\x31\x91\xaa\x66\x91\x0d\xcf\xa9\xee\x56\x30\x58\x1b\
+\x0c\xd5\x40\x59\x2d\x85\x30\x07\x71\x00\x1c\x17\xc8\x61\xc0\x80\
+\x59\x1b\xd9\xac\x8b\x5c\xc6\x85\x10\x41\x88\x10\x2f\x0a\x28\x99\
+\x48\x20\x41\xe0\x90\xcf\x27\x7b\x40\x94\xcb\xa8\x88\xe7\x14\xc4\
+\x71\x22\xd2\x34\x0d\x42\x0e\xb1\x70\x1f\x2a\x0a\x12\xc2\x88\x85\
+\xb6\x1d\x64\x81\xff\x0a\x8b\x0a\xa2\x2f\x86\x20\x44\xe3\x0c\x59\
+\x35\xbc\x2c\x26\xde\x33\x8b\xf1\x0f\x43\x28\xdc\x93\x8f\x31\x46\
+\x30\x31\x01\x7c\x5c\xc4\x01\x6f\x82\x79\x78\xe6\x10\xc3\x0a\x88\
+\xb8\x0c\xb2\x81\x5c\x4a\x0e\x46\x04\xd6\x2c\x8c\x31\xa2\x3b\x76\
+\x86\xc5\x88\xe3\x59\xc4\x01\x28\xd2\xfa\x94\x56\xe5\xad\x2a\x07\
+\xa2\x21\xd7\x76\x90\x0b\xe2\x40\x73\x88\x71\x31\xc2\x2e\x41\xc8\
+\x81\x3e\x43\xba\x63\xd9\x68\x15\x19\x48\x57\x93\x48\xd7\x53\xc8\
+\x34\x73\xd0\xaf\x3c\xb2\x6d\x15\x39\xb6\xee\x81\x9e\x65\x1a\x48\
+\x56\x58\x00\xe8\x1c\x2a\xaf\x0c\xa2\x9a\x5e\x21\xa1\x77\xdf\x50\
+\xa4\xff\x80\x70\x65\x75\x1f\x71\x58\x75\x0d\xbb\x6f\xaf\x6a\xf6\
+\x84\xe2\x22\xf3\xc2\x80\x92\xbe\x31\xe2\x4f\x3c\xe8\x3a\xf5\x8f\
+\x20\xbb\xee\x09\xe4\x2c\x7b\xc2\x34\x97\x3e\x62\x3b\x4b\xef\xb1\
+\x99\xe5\xb7\xc9\x5c\xe2\x2a\xd1\x6d\x3c\x2b\xd5\x79\xdf\x31\xed\
+\x8d\xf7\xef\xdb\xdd\xf4\xd8\xae\xd9\xb6\x17\x87\x74\x77\x3f\x52\
+\x99\x48\x3c\x16\x22\x0d\xcf\x48\x74\x2e\xa1\x6d\xeb\x85\x61\xd8\
+\x40\xf1\x9b\xbf\x53\xcc\x86\x58\x12\xcb\x82\x3b\x7c\x96\x20\x3a\
+\x59\xb8\xdf\xe6\x1f\x02\x23\x64\x2a\xd3\xd9\x39\xdd\xdf\xd0\x70\
+\x6f\xb8\xa3\xfe\x89\xd2\xae\xe6\x87\x06\xac\xa8\xfb\xd3\x8e\xdd\
+\xed\x77\xed\x93\x6c\xfd\xe0\xe8\xa8\xb0\xe2\x0c\x26\xbf\xf0\x32\
+\x4c\x5a\x6e\x43\xa4\xf1\x41\xc7\x58\xf1\x14\x4b\x9a\x9e\xe3\x9c\
+\x96\x67\x79\xa6\xfb\x49\x81\x8d\xff\xb9\x24\x64\x5d\x52\x56\xcc\
+\x1c\xd7\xab\x4f\x78\x9f\xf2\xca\xe0\xc8\xb2\x98\xd0\x37\x10\xe6\
+\xcb\xfd\x32\xe7\x0f\x07\x15\x00\x0e\xc3\x9b\xf0\x3a\x80\x88\x63\
+\xe9\x60\x08\x3a\x32\xb4\x1c\x18\x82\x0d\x2b\x7b\x1e\x39\xe0\x99\
+\x00\x76\x03\x10\xe4\x11\x03\x5a\xa7\xcf\x08\x5e\x36\x18\x92\x2c\
+\x2a\x10\x63\x00\x38\x02\xc8\x72\x08\xd2\x21\x8d\x57\x24\xa4\xc3\
+\xa8\xdb\xa0\x77\x4a\x0e\x87\x90\x47\x02\x46\x8e\x40\x90\x25\xb8\
+\xc8\x82\xe1\xb0\xc1\x1a\x7d\x41\x19\x59\x44\x45\x84\x71\x11\x03\
+\x60\xc3\xf1\x21\x30\xf4\x20\x18\x6e\x00\x09\xa2\x1f\x42\x48\x67\
+\x45\xf0\x66\x58\xc4\x32\x0a\x62\x39\x09\xb1\x3c\x34\x89\x2d\xc4\
+\x20\x0c\xc4\x7a\xc4\x62\x0e\x86\x99\x03\x23\x67\x56\x13\x43\x58\
+\xb4\x4e\x42\x90\x0e\x44\xa0\x0e\x2f\xc8\xc8\x76\x18\x84\xb1\x08\
+\xed\xca\x70\x13\x41\xdb\xf4\x21\x96\x0d\x20\x96\xf1\x23\x16\x40\
+\x90\x81\xf6\x31\x03\x65\x38\x17\x11\x00\x52\xc2\xea\x08\x43\x48\
+\x41\x87\x65\x24\xc4\x79\x24\x20\x0e\x78\xf0\xac\x84\x04\x46\xf6\
+\x88\x21\x02\xc2\x40\x0c\x12\x3d\x05\xb0\x90\x8f\x09\x8f\xbc\x3a\
+\x18\xf2\x30\x87\x18\x00\x3c\x80\x32\x08\xa1\x0c\x92\x10\xc2\x12\
+\xd4\x01\x42\x02\x72\x6c\x16\x64\xc2\x88\x38\x0e\xca\x82\xd7\xa7\
+\x1b\x69\x18\xab\x34\xca\xab\x6d\x20\x73\x02\x00\x2c\x8d\x88\x91\
+\x41\x41\x99\x41\x01\x91\xe7\x4a\xc2\x81\x50\x79\x2c\x56\xda\xab\
+\xbc\xbc\x6f\xdf\xea\x8a\x1d\xfb\x56\x96\x1c\xd8\xbb\x3a\x76\x6a\
+\x58\xb1\xae\x8e\x84\xcd\x87\x19\xa7\xf1\x79\x1e\xd7\xbf\x60\x9b\
+\x0b\x9f\xd6\xf4\xaf\x1f\xc1\x7a\xeb\x9f\x19\xab\x7b\x4a\x4a\xec\
+\x18\x9f\xe9\xfc\xea\xc4\x74\xdb\x83\x07\xc5\xdb\xff\xb2\x5b\x7b\
+\xd3\x83\xc3\x93\xad\x0f\xf5\x4a\x2c\x7f\x2c\x34\x7f\xfe\x54\x01\
+\xfd\x06\x5f\xf3\xe6\xcd\x83\xe1\xc1\x8e\x6d\xdb\x84\xe7\x79\x77\
+\x73\x76\x81\xd9\x20\x33\x70\xe3\x55\x55\x65\x60\xf4\x58\xc3\xb2\
+\x36\x58\xfc\xd7\x2e\x50\x07\x7b\xf5\x86\x86\x37\xc2\x5d\x2b\x5f\
+\xae\xe8\xea\x7a\x61\x60\xbc\xf9\x89\xdd\x52\x1d\xb1\x43\x65\xd2\
+\x7c\xaa\x8c\x93\x97\x19\xf6\xe2\x3b\x73\xd9\xc5\x8f\x2b\x7c\xdb\
+\x34\x6c\xb5\x3c\x17\x89\x58\x7f\x51\xb5\xb6\x3f\x07\x82\xf6\xb5\
+\x4a\x18\x9d\xe9\xf3\x39\x07\xc6\x4a\xc5\x9d\x82\x51\x0e\x80\x85\
+\x89\xf9\xfc\x2e\xef\x0f\x62\x84\xe0\xfc\xc2\x36\xb3\x28\x9f\xe8\
+\x42\x08\x56\x52\x8c\x31\xd2\x92\x19\x98\xd8\x18\xb9\x60\x74\xc4\
+\x65\x11\x06\x03\x60\x80\x58\x56\x40\x1c\x05\x00\x30\x20\x04\xcf\
+\x8a\x2f\x04\x93\x1c\x00\x03\x56\x7f\x45\x09\x7a\x9e\x00\x03\xc6\
+\xcf\x51\x82\x32\xba\x61\x43\x3e\x83\x72\x39\x1b\x09\x42\x18\x49\
+\x62\x31\x18\x09\x00\x85\x1d\x45\x86\x1e\x05\x23\x89\xa2\x6c\x2e\
+\x8a\x52\xd9\x30\x4a\xa6\x82\xa8\x33\xe1\x43\x9d\xdd\x12\xea\x88\
+\x4b\xa8\xb1\xc9\x45\x8d\x2b\x81\x9a\x6c\xb4\xb2\xd9\x21\x2b\x9b\
+\xb0\xb5\xb2\x89\xc9\x01\x65\x28\xad\x58\xe9\xa6\x1a\x9a\x9c\xd4\
+\xca\x26\x37\xde\xd8\x42\xba\x57\x34\xe3\xce\xc6\x66\xb6\x7d\x65\
+\x1b\x6e\x69\x6a\x65\x56\xb6\xb5\x8b\x2b\xdb\xda\xc4\xa6\xf6\x76\
+\xa9\xa9\xbd\x43\x5a\xd9\xd1\x29\x37\x76\x75\x07\x1a\xba\xba\xfd\
+\x2b\xba\xba\x7d\x0d\x9d\xdd\xfe\xfa\xee\x6e\xff\x72\x78\x5e\x46\
+\xc3\xce\xee\x40\x3d\xc4\x69\xde\xca\xce\x6e\x5f\x73\x73\x1b\xd7\
+\xb1\xb2\x9d\xeb\x5a\xd9\xca\xa6\x1a\x5a\x98\x6c\x43\x13\xce\xd7\
+\xaf\x20\xfa\xf2\x06\x64\xd6\xd5\x3b\xee\xb2\x15\x0e\x59\x5e\xef\
+\xba\x0d\x8d\x2e\x6a\xa0\xb2\xb6\x20\xd4\x0c\xd4\xd2\x86\x50\x4b\
+\x2b\x46\x1d\x9d\x22\xea\xe8\x50\x50\x57\xf7\x2a\x8a\x27\x15\x94\
+\x48\xc9\x28\x99\x95\x50\x22\xc3\xa3\x44\x9a\x41\x0c\x1f\x45\x99\
+\x3c\x83\x08\xe7\x47\x88\xf3\x21\x87\x11\x01\x9c\x31\x32\x00\x14\
+\x3d\x90\x61\x04\x0f\x88\x30\x80\x12\x05\x24\x04\x20\x45\x00\x74\
+\x5c\xc8\x07\xbc\x41\x0c\xc7\xc3\x78\x70\xa0\x5b\x18\x17\x1e\xea\
+\x99\x2a\x78\x42\x1c\x62\xb1\x0b\x60\xe5\x00\x01\x18\x22\x17\xb9\
+\xb6\x85\x6c\x93\x92\x89\x6c\xf0\x46\x6d\x35\x8f\x10\xb8\x5f\xd9\
+\xee\x0e\xc4\xb1\x0e\x52\x24\x17\xc8\x92\x42\x01\xb7\xbc\xb4\x5c\
+\x1c\x52\x5c\x29\xed\x19\x8d\x30\xc7\x2b\x92\x76\x39\xcf\x26\xfe\
+\x24\xf2\xf1\x07\x38\xae\xe3\x29\x4b\x5f\xfe\xa2\xa1\x2d\x7b\x3e\
+\x9b\x5b\xf6\x80\xce\xac\xb8\xa9\x3c\xca\x5d\xd8\xd6\x78\xdb\xd1\
+\x9d\x2b\x1f\xd8\x23\xde\xf8\xec\xd0\x78\xdd\x8b\x55\x89\xe5\xd3\
+\x43\x64\xfe\x74\xe1\xd7\xb6\x97\x1f\x6b\x5f\x92\x24\x98\xf8\xa0\
+\x3e\x8e\xc3\xae\x4b\x68\xfc\xc7\x8a\x6f\x52\x1e\xb3\xa1\xd2\xb2\
+\x28\xe6\x58\x8e\x69\x4a\x26\xe2\x2d\xb2\x2c\x6f\x35\xff\x3f\x8b\
+\x7a\x31\x4d\x4d\x33\xe5\xd6\xd6\x97\x8a\x92\xc9\x37\x7a\xe7\x12\
+\xd3\x87\x77\x74\x3c\x7f\x40\x59\xa4\xeb\xac\x80\xdc\x71\x95\xe5\
+\xb6\xfc\xc9\xd1\x5b\x9e\xc5\xb8\xfb\x15\xdb\x8a\x4f\xc3\x24\xf7\
+\x70\x24\x28\x4e\xa9\xee\x5b\x7d\x5a\xef\x5e\x55\x7b\x45\x83\xe1\
+\x41\xd1\x92\xd2\x2a\xdb\x24\x91\x40\x20\x26\x3a\x2e\x87\x73\xa9\
+\x1c\x72\x40\xbd\x36\x9d\x80\x70\xbe\x90\x83\x73\x12\x98\x82\x28\
+\xa3\xe5\x51\x46\x55\x11\xf8\x36\x48\xf4\x03\x18\xd8\x1c\x42\x5c\
+\x18\x11\x36\x82\x30\xf6\x23\x06\xf9\x10\x83\x7d\xb0\xca\x2a\xc8\
+\x25\x3e\x70\xf9\x25\x64\x5a\x3c\xd2\x0d\x06\x69\x3a\x42\x79\xcd\
+\x45\xba\x89\x51\x32\x65\xa2\xee\xb8\x86\xba\xbb\x55\x3b\x97\x73\
+\xf3\xc9\x8c\x96\x4e\x66\x73\xdd\xe9\x6c\xae\x35\x93\xb6\x1a\xb3\
+\x59\x5c\xd7\xdc\x6c\x2c\x58\x5a\xa7\x7d\x19\xef\x0a\xcf\x59\xba\
+\x98\xf9\xa4\x7e\x79\xf8\xbd\x15\xf5\x45\x6f\x36\x36\x94\xbd\xdc\
+\xdc\xd8\xeb\xa9\xd6\x96\x7e\x0f\x75\xb7\x0f\xfe\x73\x22\x3e\xfc\
+\xb6\x54\xd7\xd0\xeb\x74\x67\xf4\x15\x06\x19\x7d\xb1\xee\xec\x72\
+\xbe\x6e\xed\x7c\xa6\xe6\x8c\x3e\x59\x77\x47\x9e\x64\xbb\x23\x8e\
+\x35\xdc\x51\x47\x99\x64\xf4\x91\x3a\x1a\x7d\xb8\xe6\xec\x72\x98\
+\xe9\xee\x78\xa8\x8d\x77\x3d\x04\xca\x1e\xac\x39\xbb\x1d\xa2\xa1\
+\x31\x87\x64\xf5\x5d\x0e\x4e\x59\xbb\x1d\x92\x35\x7e\x77\x70\xd6\
+\xfd\xfd\x21\x69\x7b\xf7\x43\x92\xc6\xae\x87\xe6\xdd\x31\x07\xe7\
+\x9c\x5d\x0f\xb6\x9c\x3d\x0e\xd1\x99\xdf\x1d\x62\x30\xbf\x3b\xd4\
+\x70\xf6\x38\x54\x23\x7b\x1c\xa6\xe2\xdd\x0f\xcd\xa3\xdd\xc7\x6a\
+\x78\xcc\xe1\x36\xda\x6d\xac\xc5\xee\x7a\x84\x85\xc7\x1c\xe9\x90\
+\x5d\x8f\xb2\xd0\xae\xe3\x0c\x66\xe7\xa3\x6d\x66\xa7\xa3\x2d\xb4\
+\xf3\xb1\x39\x63\xc4\x71\x79\x6b\xe4\x89\x79\x6d\xc4\x49\x59\x63\
+\x87\x53\xd2\xea\xa8\x33\x32\xf9\x1d\xcf\x49\xe5\x47\x8f\x4f\xe7\
+\x77\x9c\x9c\x4c\x0e\xbb\x3a\x99\xac\x9d\xda\x9d\xa8\xbd\xad\x3b\
+\xd5\xef\xee\xce\x78\xcd\x43\xed\xf1\x8a\xc7\xdb\x13\xc5\xcf\xb7\
+\x25\xc2\x7f\x6d\x4b\xf9\xfe\xfd\xf9\xa2\xf8\x87\xed\x59\x3c\x7b\
+\x69\x6b\xfa\xf3\x45\x2b\x3b\xe7\xb7\x24\xd5\x45\x1d\x79\x6d\x69\
+\x42\x35\xeb\xf2\x9a\x55\x9f\x57\xcd\xc6\xbc\x6a\xb4\xa8\xaa\xd9\
+\x91\xcb\x1b\x89\xac\xaa\x65\x33\x10\x01\x72\x54\xdd\x44\x10\xa2\
+\x78\x12\x3c\x1d\x1b\xc6\x41\x33\x10\x46\x0c\x2c\x18\x08\x19\x16\
+\x00\x0f\xb8\x7e\x98\xe1\x11\xc3\x0a\x08\x03\x21\x58\x28\x08\x66\
+\x01\x86\x18\x44\x43\xcb\x72\x50\x00\xf6\xd0\xc8\xc5\x08\xc3\xe2\
+\x42\x08\xa4\x43\x68\xc2\x39\x55\xa6\xbb\x1b\x25\xe2\x6d\x88\x17\
+\x08\xe2\x39\x87\x15\x78\x14\x52\x64\xae\xbc\xb4\x38\xda\xaf\xba\
+\xac\x74\x54\x75\xaf\x5e\x87\xc7\x82\xc1\x89\xd1\x80\xef\x6e\x81\
+\x98\xaf\x60\x37\xf3\xaa\xed\xb4\xbc\x62\x31\xcd\x7f\x31\x9c\xfa\
+\x9b\x3b\x95\x96\x89\xf1\xd6\xc7\xc7\xa5\xdb\x9f\xd9\x2d\xdd\x39\
+\xad\x76\xc5\x8a\xc7\xca\x29\x20\xcd\x85\x33\x45\xb4\x15\xbc\x86\
+\x0d\x1b\x66\x82\x18\x1d\x84\xa0\x46\x55\xcd\xc3\x52\x01\x4f\x9b\
+\xe9\xcd\x6c\x88\x4f\x71\x65\xe5\xe7\xd9\x6c\xfe\xcf\xa9\x54\x7a\
+\x4a\x5a\x55\xdf\xdf\x50\xf9\x9f\x93\xbf\xbe\xba\x84\xcc\x17\x12\
+\x89\x77\x43\xb9\xdc\xbf\xca\x88\xfe\x76\x3f\x4b\xfd\xc7\xee\x99\
+\xe4\x90\xe3\x83\xca\xf2\x2b\x14\x3e\x7d\xbf\x9e\xab\x7b\xc5\xb0\
+\x9a\xdf\x66\x51\xfb\xeb\x0e\xea\x7c\x18\x3c\x96\x2b\xc3\x11\x72\
+\x52\x49\x11\xbf\x1b\x78\x2b\xbd\x8a\x4a\xfc\x7e\x41\x22\x88\xe3\
+\x09\xd2\x12\xdd\x48\xcf\x67\xc1\xc3\x30\x91\x9e\xcd\x20\x13\x0e\
+\x69\x1d\x82\x10\x66\x58\x98\x40\x22\x72\x5c\x02\x13\x8e\x41\x89\
+\x54\x1a\xf9\x03\x51\x44\x10\x8f\x24\x25\x82\x14\xa5\x08\xb6\x49\
+\x0c\xd2\x0c\x09\x69\xba\x0f\x28\x08\xe4\x47\x5d\x09\x8c\x3a\xe3\
+\x04\xb5\x77\xbb\xa8\xad\x8b\x90\xd6\x76\x27\xdf\xdc\x4e\xba\x57\
+\x36\x91\xfa\xc6\x66\xb4\xa0\xa9\x95\xfb\xa4\xb3\x3b\xf4\x66\x22\
+\x53\xf2\x4c\x4e\xab\xb9\xdb\x46\x03\xaf\xd3\xed\xfe\x97\x1a\x76\
+\xff\x0b\x93\x99\xca\x33\x33\xe9\xea\x13\x18\x61\xe4\xd8\x4c\xa6\
+\x78\x1f\x86\xe9\xb3\x5b\xdc\xea\xb3\x0b\xf1\xef\xb1\xeb\xe0\x5d\
+\x77\xfa\xdd\x8e\x7b\xff\x6b\xf7\x1d\xff\xf0\xea\xfe\xa3\xf7\x9e\
+\x76\xc4\xce\xfb\x3c\x77\xe2\xce\x7b\x3f\x79\xf6\xce\x7b\x3d\x7e\
+\xd1\xe8\x3d\x1f\xbb\x7c\xe7\xdd\x1f\x9f\x32\x7a\xaf\xa7\x6e\x19\
+\xb9\xeb\xe3\x77\x0d\xdf\xe5\xc9\x07\x46\xec\xfa\xd4\x63\x23\x7e\
+\xf7\xf4\xb3\xa3\x7e\xf7\xc4\xf4\x91\xbf\x7b\xe2\x1f\xc3\xc6\x3c\
+\xf1\xce\xc8\x31\x8f\xbd\x3f\xfc\x77\x4f\xfe\x6f\xe4\xae\xcf\x7e\
+\x34\xe2\xf7\x4f\x7f\x3a\xf4\x77\x2f\xcc\x1e\xb4\xeb\xd3\x73\x87\
+\x8e\x79\xfe\x8b\x61\xbb\xbe\xfa\xd5\x90\x9d\x5f\x9d\x3f\x74\xf7\
+\x97\x17\x8c\x18\x33\xed\x9b\x21\xbf\x7f\x61\xfe\x90\x9d\x5f\x98\
+\x3f\x74\x97\xe7\x16\x0c\xdb\x6d\xda\xc2\x01\x3b\xbd\xb0\x68\xe0\
+\xe8\x97\x17\xf7\x19\xfd\xec\xe2\xbe\x23\x5f\x5c\x42\x89\xc6\x6b\
+\x77\x7c\x66\x61\xed\xa8\xe7\x16\x0c\xd8\xe1\xd9\x2f\x6b\x47\x3d\
+\xff\xc5\x80\xd1\xaf\xcc\x1e\xbc\xc3\x2b\x33\x07\xef\xfc\xe2\xff\
+\x86\xfc\xee\xa5\xf7\x86\x8d\x79\xe1\x9d\x1d\x7e\xff\xe2\xbf\x46\
+\xee\xf1\xc2\x5b\x3b\xee\xf9\xdc\xeb\xbb\xee\xfb\xd2\x6b\xbb\xec\
+\x3d\xed\xd5\xd1\xfb\xbc\xf2\xd2\x2e\x7b\xbe\xfc\xe2\x2e\x7b\xbe\
+\xf2\xec\xe8\x3d\x5f\x7e\x72\xf4\xef\x5f\x7a\x64\xa7\xdd\xa7\xdd\
+\xb7\xe3\x5e\xcf\xde\xb1\xc3\x5e\xcf\xde\xb8\xc3\x9e\x4f\x4f\x19\
+\xf5\xfb\x67\x2e\x1b\xb5\xfb\xf3\x17\x8d\x1a\xf3\xe2\x79\xc3\x77\
+\x7b\xf9\xb4\x11\xbb\xfd\xf5\x98\x91\x63\xfe\x79\xf0\xce\x7f\xf8\
+\x60\xaf\x21\x3b\xbd\xb7\xdb\xb0\x9d\x3e\x1a\x3d\x64\xf4\xac\x11\
+\x2a\x2a\x1d\xe5\x43\xb5\xa3\x1d\x67\xc0\xde\xba\xd1\xff\x60\xc3\
+\xe9\x7b\xb4\x6e\xf5\x3b\x49\x77\xfa\x9e\xa9\x9b\x7d\xce\xd5\xf5\
+\xbe\xe3\x75\xbb\xef\x44\xcd\xee\x77\x59\xde\xa8\xb9\x2e\x93\xab\
+\xb8\x3b\x99\x2d\x7e\xaa\x23\x11\xfc\x5b\x6b\x87\xf4\xfe\xb2\x06\
+\x6b\x6e\x7b\x97\xb4\xb8\xbd\x93\x6d\x5e\xba\x3c\x97\x5a\xde\xa8\
+\xea\x2b\x9a\x0c\xd4\xd2\xe9\xa2\xee\x14\x07\xde\xa6\x0f\xc6\x36\
+\x80\x74\x23\x88\x0c\x33\x80\xf2\x39\x16\x11\x58\x60\xf2\x3a\x81\
+\xf9\xc1\x21\xc2\x72\xc8\x45\x18\xbc\x26\x05\x45\x4b\x4b\x51\x2a\
+\x91\x40\x2c\xcf\x42\xd9\x3c\x4a\xa5\xbb\x91\x05\x1e\x95\x8b\x2c\
+\x94\x4b\xc6\x91\x20\x72\x28\x95\x4a\xa0\x68\x49\x98\x2d\x8a\xf9\
+\xca\xc3\x21\x6e\x58\x69\xef\xd0\x61\x65\xbd\xa4\x8b\x62\xc5\xd6\
+\x5d\xb6\xd5\xfc\x12\x66\x3a\xfe\x9e\x48\x2e\xfc\xbb\x8f\x4b\x3f\
+\x66\xf0\xcd\xd7\xf5\xa9\xc0\xa7\xe7\xe2\xd3\x0f\x6c\x6f\x9a\x3e\
+\x3c\x1e\x7f\xbb\xaa\xb9\xf9\xbd\x58\x43\xc3\x0c\x09\xfd\x0a\x2f\
+\xfc\x52\xf0\x03\x00\x00\x10\x00\x49\x44\x41\x54\xdb\x76\xdf\x8a\
+\xc7\x13\x97\x48\x92\xf2\xec\xe6\x6c\x7e\x83\xc0\x43\x1b\xeb\x5d\
+\x5b\xfb\x79\xdf\x01\x03\x3e\xec\xd3\xa7\x4f\x3b\x7d\xde\x52\xb4\
+\xea\x4b\x61\x75\x22\x28\x3b\x48\xb2\x9f\x94\xa4\xd3\x6f\xd5\x6a\
+\xd9\xb7\xfe\xa0\xab\x4b\x4f\xf6\x49\xa9\x6b\x5c\xab\xe3\xf1\x44\
+\xaa\xfe\x8d\x54\xba\xfe\x4d\x59\xc8\x4c\x0b\x06\xac\xa9\xa1\x08\
+\x73\x62\x28\xc4\xed\x1a\x2d\x92\xaa\x62\x25\x41\x9f\x20\xd8\xb0\
+\x1d\x6a\x42\xb2\x8c\x61\xf2\x64\x00\x50\x2c\x94\xce\x74\x22\x86\
+\x47\x48\xb7\x54\x64\xb8\x3a\xc2\x02\x83\x04\xbf\x84\x6c\xd7\x46\
+\x9c\xc0\x22\x17\x3c\x1c\x5d\x53\x21\x04\xd0\x01\xf7\x5c\xcd\x5b\
+\x70\xde\x52\x8c\x9a\x9a\xe2\x04\xb0\x29\x97\x48\xb8\x89\xf6\x36\
+\xa3\xa5\xa5\xc9\x68\x88\x77\x71\xdf\x64\x93\xbe\x0f\x57\x2c\x37\
+\xfe\x91\x4c\xfb\x9f\x30\x51\xc5\xcd\x1a\xae\xb8\xc0\xc4\x7d\x8e\
+\xb5\x99\x7e\x07\xba\xfc\xa0\xfd\x4c\x6e\xc8\x9e\xb6\xb4\xd3\x18\
+\xc1\xd9\x75\x8c\x18\xd9\x75\xdf\xda\x91\x4f\x1e\x51\x3b\xfc\xb1\
+\x33\xfb\x0f\xff\xcb\x65\x35\x03\xee\xbd\x65\xc0\xf0\x87\x1f\xa8\
+\x19\x70\xcf\xb3\x83\x47\x3d\xf9\xb7\x01\x3b\x3e\xfd\x5e\x45\xbf\
+\x87\xe6\x0e\xd8\xf9\xa5\xfa\xea\xa1\x4f\x25\x46\x8f\x7e\x5c\x1d\
+\x36\x6c\xaa\x89\xf1\x54\x77\x4b\xe9\xf9\xb7\xca\x17\x63\xb0\x7f\
+\xa0\x61\xc3\x5e\x33\x8b\x07\x3d\x9d\xad\x1e\xf8\x68\x4b\xe5\xa0\
+\x47\x96\x54\xf4\x7b\x6c\x6e\x79\xed\x23\x1f\x94\xf7\x7b\xf8\xed\
+\x8a\x01\x0f\xbd\x5e\x3d\xe8\xa1\x17\x7b\x0d\x7c\xf8\xf1\x3e\x83\
+\x1e\xbe\xaf\xf7\xa0\x87\x6f\xa9\x1d\xfe\xf8\x65\x83\x46\x3d\x7b\
+\x76\xbf\x21\x4f\x8e\x1b\xb2\xd3\x2b\xfb\x8d\xd8\xf5\xc4\xdd\x72\
+\xce\xce\x3b\x1b\xec\x8e\x3b\x2b\xe1\x5d\xc7\x08\x81\xd1\x7f\xc0\
+\xe2\x0e\x07\x38\xcc\xd0\xe3\x54\xb3\xff\x84\x54\xae\xe6\xfa\x44\
+\xaa\xe2\x81\xae\x54\xf1\x8b\x1d\xdd\xa1\x7f\xc2\x16\xf7\x83\xee\
+\xb4\x30\x0f\xf1\x45\xf3\xb1\x14\x58\x9a\x35\x8d\x26\x2c\x09\x5d\
+\xba\xeb\xe4\x93\xa9\x9c\xed\xb2\x32\xca\x9b\x2e\xe2\x14\x05\xc9\
+\x01\x05\xb1\x12\x83\x34\x2b\x87\x04\x85\x43\xaa\x91\x47\x0a\xa4\
+\xe9\xba\x86\x4c\xb8\x48\x70\x19\x0b\xe5\x93\xad\x48\xd7\x12\x30\
+\xff\xf2\xa8\xa4\xaa\x54\x08\x04\xfc\xa5\xbd\x7b\x55\x0e\x29\x2a\
+\x8b\x1e\x16\x09\x49\x97\xfa\xfc\xe8\x71\xcb\xee\x7a\x5d\x14\x93\
+\x6f\x10\xbb\xed\x39\x89\x6f\xbd\xc5\xe7\x6b\x3b\x27\x9d\x7e\xf3\
+\xc0\x6c\xf6\xdd\xc1\xed\xed\x7f\x2b\xe9\xea\xfa\x38\x40\xbd\xfe\
+\x2d\x3d\x96\x95\x95\x95\x4d\xc5\xc5\xc5\xff\x93\x24\x69\xe9\xe6\
+\x6c\x8b\xd9\x9c\xcc\x36\x95\x17\xbd\x05\x20\x9d\x33\xfc\x10\x16\
+\x11\xfd\x83\x5a\xe4\x54\xfc\x31\x9f\x59\x7a\x3e\x47\xd4\x3b\x0d\
+\xdc\x3d\xdd\xd6\xbb\xff\x23\x88\xfa\x3f\x78\x46\x7b\x4a\xe0\x8c\
+\x2b\x02\x61\xe1\xb0\x50\x90\x1b\x1e\x09\x09\x51\x8c\x35\xa4\xe5\
+\xba\x90\x9a\x89\x23\x09\x3c\x19\x35\x9d\x40\xd9\xee\x0e\x44\x6c\
+\x1b\x40\x47\x46\xc9\x78\x0a\x66\x29\x0f\x87\xb5\x2c\xf2\xf9\x4b\
+\x90\x6e\x0a\xb0\x4a\x05\x91\xec\xab\x44\x39\x4d\x44\x1d\xdd\x0e\
+\xca\xaa\x32\x9c\x31\xb8\x16\x84\x89\x54\x56\xae\x6b\x6e\x75\x3e\
+\xab\x6f\xb0\xde\xea\x4e\x05\x9e\x68\x69\x13\x6e\xb4\xdd\xaa\x73\
+\x34\xb3\xec\x68\x35\x57\x7e\xa0\x61\x57\xff\x21\x18\x1c\xfc\x3b\
+\xd4\x1d\xd8\xa5\x66\xf8\x2d\x7b\x0d\xfb\xfd\x5d\x63\x6b\x47\x4e\
+\x3d\xb7\xef\x80\x29\xd7\x0f\x18\x70\xfd\xa3\xb5\x83\xae\x7e\xad\
+\x76\xf0\xd5\xff\xa9\x1d\x72\xe5\xac\xe1\xc3\xaf\x5c\x34\x7c\xf8\
+\xa4\x8e\xda\xdd\x26\x66\x6a\x6b\x27\x1a\x9b\xaa\x97\x42\xf9\x2d\
+\xab\x01\x8c\x8f\x75\x86\x0d\x9b\x90\x1b\x36\xec\x8a\xf6\xde\x03\
+\xae\x5c\xd4\x67\xc0\xe5\xb3\xfb\x0e\xbe\xe4\x3f\x7d\x07\x5d\x32\
+\xbd\xdf\xb0\x4b\xfe\xd2\x7f\xc4\xe4\x9b\xfb\x0e\xbf\xf4\xe2\x7e\
+\x43\xaf\x38\xa5\x76\xe4\xf5\x87\x55\xd5\x5e\xff\x87\xb4\x2e\x8e\
+\xc9\x9a\x65\x7b\x37\x37\xe1\xc3\x30\xe9\x7b\x42\x2a\x13\xb8\x48\
+\x55\x8b\xae\x33\xad\xaa\xbb\x54\xb5\xe4\x29\x4d\x8b\xfd\xb3\xa9\
+\xc9\x9a\x0d\x73\x69\x21\x78\xc5\x4d\xb9\x3c\x1f\xd7\x0c\x5e\xcd\
+\xa9\xac\x85\xb9\x10\x32\x0c\x1e\xd9\x36\x87\x38\x38\xa7\xf2\xf9\
+\x23\x48\x94\x14\x84\x60\x4b\x97\x05\x6f\xc9\x34\x4d\xa4\xa9\x79\
+\x64\xa9\x39\xd8\xaa\x9b\xc8\x85\xc5\x31\x1c\x55\x14\xbf\x9f\xe9\
+\x17\x0e\x31\xfb\xc4\x4a\xc4\xf3\x23\x21\xf4\x80\xa5\xb7\xbd\xc5\
+\x33\x5d\x6f\x23\xd2\xf1\x26\x87\xeb\xee\x73\x8d\xd1\x97\xe4\x33\
+\xff\x1d\x4b\xc8\xe2\x81\xd9\xec\xe7\xc5\xa4\xfd\x2b\x1f\xfa\x8d\
+\xbc\x7e\x51\xe0\xe9\xd9\x32\x69\xda\x07\x7d\x74\x6b\xc6\x7e\x86\
+\x61\x9d\x67\x04\xf5\x3b\xb3\xd9\xf8\xeb\x39\xbd\xfd\x7d\xc7\x49\
+\xfc\x8d\x17\xf4\xfb\x82\x31\xff\xf9\x96\x9d\xda\x2b\x1a\xf3\xf5\
+\x36\xb5\x4c\xc0\xb6\x00\x64\xf2\x69\xa4\xa7\xd3\xc8\xd2\x0d\x00\
+\x17\x07\x39\x70\xd0\x2d\x70\x22\x42\x74\xef\x8d\x39\xc4\xb3\x02\
+\xf2\xfb\xc2\x48\x14\xc0\x3d\xd6\x31\x92\xe4\x22\x58\x55\x44\x27\
+\x9f\x15\x33\x9d\xed\xa4\x3d\x11\x17\x97\xad\x68\x74\x3e\x6d\x69\
+\xe1\xff\xda\xd6\x2e\x3f\x98\x4c\xc7\xae\x4c\x65\x4b\x8f\xcf\x69\
+\xbd\xf6\x6c\x89\x97\x8e\x68\xee\x1e\x31\x72\xc0\xa8\x3b\x77\x19\
+\xbe\xcb\x9d\x87\xf7\x1f\x72\xed\xb9\x03\x47\xde\x30\xb5\xef\x90\
+\xeb\x9e\xaa\xa9\xbd\xea\x9d\x7e\xc3\xae\xfe\xac\xff\xd0\xab\x97\
+\x95\xf6\x9d\xd4\xd1\x67\xef\xa9\x3a\x2a\xbc\xb6\x1f\x0d\x7c\xdb\
+\x53\xea\x85\x56\x54\x9c\xd7\xdd\x6f\xf0\xd4\xa5\xd1\xd2\xc9\x9f\
+\x94\x55\x5e\xfb\x6a\x59\xd5\x94\x7b\xcb\xaa\x2e\xbd\xa6\xba\xef\
+\x55\x67\x97\x55\x5f\x7d\x58\xdf\x01\x77\xee\xa6\x5b\x43\x47\xa7\
+\x72\x25\x63\xfc\x81\x61\xe3\x5c\x5c\x75\x9e\xc8\xf5\x9e\x92\x4c\
+\x88\xf7\x18\x46\xe4\xe5\xbc\x1a\xf8\x5f\x67\xa7\xb3\xb0\xb5\x5d\
+\x5b\x19\x8f\x3b\x1d\x04\xf9\x73\x0c\x27\x39\x98\xe5\x90\x0b\x5b\
+\x37\x07\x0e\x53\x30\x86\xb9\x2b\x49\x28\x9f\xc9\x82\x07\xee\xc0\
+\xb6\x4d\x47\x79\xd8\xb2\xd9\x00\x4a\x11\xbf\xc2\x89\x0c\xea\x5d\
+\x1a\x8d\xec\x16\x8e\x85\xce\x64\x90\x7a\x97\x63\x77\xfc\x55\xcb\
+\x2d\x9e\x81\x50\xf3\x3f\xb2\xd2\xca\xfb\xe0\x34\x64\x92\x9e\x9b\
+\x71\x20\x21\x9f\x0d\x4c\xa7\x67\x46\x09\x99\x29\x13\x02\x07\x53\
+\xdf\xf6\x63\x6b\x09\xb6\x28\xf0\x80\x27\xc3\x11\xb2\x20\x6a\x18\
+\x73\x87\x9b\xe6\xc7\x67\x59\x4e\xe7\x7d\x0c\x97\xff\x07\xc3\x66\
+\x67\xd8\x56\x02\xc2\xfc\x43\x3c\x97\x1f\x1f\x08\x70\x7b\xca\x3e\
+\x54\x6d\x39\x69\xc9\xb6\xb3\x28\x9f\x6d\x41\x96\xad\x02\x70\x64\
+\x10\xc3\x61\x57\x94\x65\x53\x92\x03\x96\x24\xfb\x6d\xc9\x1f\x21\
+\x04\x4b\x2e\xc3\x06\x5c\x17\x41\x9a\x52\x09\x9e\x6f\xb8\xc9\xb4\
+\x63\x0b\xb3\x69\xff\xc7\xe9\xac\xff\x15\x55\x2f\xbe\x23\x9b\x09\
+\x8f\x47\xb8\x7a\x9c\xe6\x94\xee\xa7\x39\xb1\x5d\x54\x3b\xb4\xe3\
+\xf0\x1d\xa6\x8c\xe9\x37\xe8\xc2\x63\x86\x8f\xba\x74\xe2\x90\x61\
+\x17\xfd\x69\xc8\xf0\x09\xaf\x0e\x19\x39\x7e\xd6\xa8\x51\x17\xb4\
+\x8c\x19\x73\xac\xb6\xb5\x0c\x4a\x41\x8e\xdf\xae\x06\xaa\xab\x8f\
+\xd5\xaa\xaa\xce\x69\x0e\x44\x4e\xfc\x20\x5a\x74\xda\x8b\xe1\xf2\
+\x53\xee\x2a\xad\x39\xeb\xd2\xd2\xde\x67\x9d\x58\x52\x73\xee\xde\
+\x15\x7d\xab\x47\x04\xb8\xc1\x3b\x06\x83\xc3\xf7\x35\xac\x8a\x71\
+\x88\xad\x3a\x3b\x9f\x0f\x4c\xcd\xe7\x02\xcf\x59\x66\xf8\xbf\x9a\
+\xe6\xfb\x2a\x93\xe1\x56\xf0\x42\x71\xdc\x76\x64\x8d\xe3\x82\x36\
+\x66\x64\x22\x05\x63\x0e\x1c\x82\x5b\x48\x10\xe8\x3c\x55\xed\x5c\
+\xc6\xb4\x2c\x9d\xc8\x92\xcb\x09\x82\x59\x2e\x8b\xd6\x6e\x81\x10\
+\x7b\xb6\xc4\x6b\xf7\xb2\x9c\xfa\x37\xc7\xca\xbe\x8b\x49\xe6\xed\
+\x74\x22\xff\xb0\xa5\x7e\x76\xbe\xa9\xce\xdb\x2d\x9f\x9f\x5b\x4e\
+\xc8\x57\x3e\x6a\x97\xbf\xb6\x86\x37\x3b\xf0\x10\x75\x7e\x0d\xb1\
+\x17\x1e\xe2\x18\xf3\xa6\x20\x12\x78\xd9\xd2\xbb\x3e\x14\x04\x7d\
+\x26\xcf\x5b\x8f\x61\xd7\x38\x3f\x14\x08\xec\x61\x5b\x46\x2f\x8e\
+\xc1\xb2\x05\xfb\xde\x34\x6c\x91\x4c\x3d\x85\x1c\x5b\x03\xcc\xb7\
+\x61\x2b\x24\xb8\xb2\x4f\xa0\x21\x11\x7d\x8a\xc3\x49\xb2\xe1\x20\
+\x16\x4e\x5d\x84\xf6\xac\xc6\x2c\x4c\xe7\x98\x77\xf2\xba\xf2\xb4\
+\xe5\xc6\x6e\xb4\xb9\x8a\xd3\x18\x7e\xd0\x81\x0e\x3f\x70\x8c\x3f\
+\x76\xd6\xd0\x50\xf9\x59\x7b\xc4\xca\xcf\x3a\xa1\xa8\xe2\xb4\xab\
+\x4b\x6b\x4e\x7f\xa4\xa8\xec\xf8\x37\x6b\x6a\x4e\xfe\xac\x7f\xff\
+\x33\x9b\x06\x0d\x3a\x2b\xfb\x6b\x2b\xbb\xd0\x7e\x41\x03\x74\x9b\
+\x17\xac\x3a\x2a\x2e\x06\x0e\x5f\x10\x8e\x1d\xff\x1f\x7f\xf0\x84\
+\x67\x23\xa5\x67\xdc\x58\x5a\x73\xde\xe9\xc1\xe2\x33\xf6\x8d\x96\
+\x9d\x3d\x0a\x09\xb5\x3b\x9a\xa8\x7a\x2f\x41\xae\x85\x9b\xc2\x92\
+\x89\x26\x09\xdd\x97\x4a\x9a\x6f\xa6\x55\xfb\x4b\xcb\x22\xcd\x88\
+\x65\xf3\x9c\x3f\x68\xf2\x8a\xa4\x63\x96\xb7\x58\x5e\x24\x8e\xe3\
+\xb8\x96\xa1\x21\x55\xcb\x21\xc7\x31\x64\x44\xf4\xaa\x40\x48\xda\
+\x39\x14\x15\x4f\xe7\x44\xe3\x41\x5e\xb4\xde\x15\x38\xf3\xbf\x46\
+\x2e\x3b\xcd\xd6\xe5\x6b\x00\x80\x0e\x23\xfa\x82\xfe\x84\x34\xfc\
+\x2a\x87\xd6\xcc\xcf\x99\x0a\xa4\xb5\x55\x21\x46\xfd\x08\x62\x2f\
+\x39\xdb\x31\xe7\x3f\xe9\x5a\x5f\xcf\x35\xdc\xec\xa7\x88\xb5\xde\
+\x60\x04\xfb\x46\xd3\x48\x1d\xc9\x70\xd6\x20\x35\x1f\xf7\x39\x66\
+\x9e\x68\x7a\xd6\x46\x8e\xae\x89\xa2\x68\x88\x62\xc8\x16\x45\xc5\
+\x89\x44\xfb\xd8\x0c\x8e\x38\x82\x50\xa2\x89\x52\x59\xa7\x6d\x4a\
+\x4b\x52\x29\xf4\x91\x65\x05\xa7\x25\x93\xec\x6d\x84\x44\xcf\x71\
+\xdc\xd8\x5e\xba\x11\x1e\x15\x08\x9d\x3c\x2a\x1c\x3d\xf9\xa0\x48\
+\xf1\x49\xe7\xf8\x42\x47\xdd\xa4\x28\x07\xbd\x8c\xf9\x5d\x66\x2a\
+\xca\x6e\xcd\x1b\xea\xc7\xfc\xf9\xf3\x85\xb9\x73\xe7\x2a\x94\x66\
+\xce\x9c\x29\xcf\x9f\x3f\x5d\xd8\xd0\xe1\xdc\x74\x32\x9d\x85\xf2\
+\x7c\x43\x43\x83\xd4\xd4\xd4\x24\x37\xc1\xf5\xfd\x77\xd4\xf3\x4c\
+\xc3\xef\x88\x96\x05\xd7\x96\x05\xc2\x40\x0c\x6d\x97\x90\xb9\xfc\
+\xc6\xc8\x07\xe5\xa5\xba\xba\x3a\x91\x10\x4a\x04\xc2\xf9\xc2\x7c\
+\x32\x1f\xe4\x24\x3c\xe4\x51\x9e\x3f\x6b\xbc\x36\x24\xc3\x96\xc8\
+\xa7\x7a\xeb\xe8\xe8\x28\x4d\x26\xdb\x7a\xe7\x72\xc9\x51\x9a\x96\
+\xfd\x83\x6d\xeb\x07\x13\x62\x1c\x05\x74\x82\x4d\x8c\x93\x20\x3c\
+\x3e\x6f\x64\xc6\x6a\x56\x76\xcf\x6c\xb6\x7b\x70\x26\xd3\x1c\xdb\
+\x12\xb2\xac\xc9\x93\x10\x42\xc7\x87\x9d\x31\x63\x06\x47\x89\x8e\
+\x33\xd5\x3d\x0d\x69\xde\x9a\x65\x7f\xe9\x78\x38\xbc\x47\x32\x10\
+\xd8\x7d\x01\x2f\x8d\x79\x47\xf2\xed\xff\x48\x24\x72\xd4\x25\x91\
+\xa2\x13\xc6\x45\x62\xa7\xec\xc2\x8b\x95\x23\x35\x33\xba\x83\x6d\
+\x47\x8e\xb4\xac\xc8\x95\xba\xa5\x3c\x9c\xcd\x90\x37\x79\xbe\xf8\
+\x73\x96\x89\xac\x94\xe5\x92\x9c\xa8\x94\x58\x98\x91\x6c\x84\x18\
+\x97\x00\x22\x39\x8e\x65\x23\x86\x08\xae\xab\x0e\x10\xfd\x68\x2c\
+\xc1\xf9\xa9\x08\x69\xd3\x1d\x9c\xfe\x40\xcd\xc4\x3f\x36\xb5\xc5\
+\x4f\x11\xb3\x1e\x3c\xaf\xba\x1d\x08\x69\xf7\xfd\x12\xfd\xdd\xa4\
+\x89\xbc\x7c\xf9\xbb\xa1\xf6\xf6\x59\xbb\x25\xba\x3f\xbf\x32\x97\
+\xfe\xf2\x65\x54\x96\xff\x18\x71\xfa\x7b\x04\xeb\x0f\x99\x66\xf6\
+\x14\xcc\x39\x23\x39\x01\x55\x24\x13\xcd\xbc\x6d\xe9\x8c\x20\xc9\
+\x2e\xcb\xf1\x88\x17\x61\x6b\xc4\x09\x38\x10\x28\x65\x10\x2b\xb8\
+\x2c\x2b\xc7\xf3\xf9\x74\x9d\x69\x8a\xff\x67\x64\xfd\xf7\x70\xe2\
+\xd0\xf1\xb6\x56\x75\x38\x32\x7a\xef\xca\x8b\xfd\x76\x8e\xc5\x4e\
+\xd9\x33\x18\x3c\xe6\x94\x58\xec\xb8\xeb\x39\xee\x80\x69\xa2\xb8\
+\xff\x37\xa1\xd0\x81\x09\x8c\x31\xf9\xa9\x4a\xf1\x05\xc4\xf1\xa1\
+\x88\xf4\x8a\x3f\xc8\xff\xad\xa8\x28\xf0\x86\xac\x0c\xff\x57\xdd\
+\xf2\x63\xde\x59\xbe\x7c\xd9\xbb\x0d\x0d\xcb\xff\xb3\x78\xf1\xa2\
+\x77\x1a\x1a\xea\xff\xb3\x7c\x79\xdd\x7f\x3a\x3a\xda\xdf\x59\x5e\
+\xbf\xe4\x3f\x63\x5a\x77\xfe\x77\x59\x79\xec\x5f\xbc\x80\xfe\x81\
+\x19\x07\xb6\x86\x15\x1e\xb1\x6c\xe5\x9b\x2c\xeb\xfe\x83\xe3\x2b\
+\xde\x82\xee\xbd\x05\xf9\xff\xfc\x96\xde\x52\xfc\xfc\x5b\x9d\xdd\
+\x2d\xef\x74\x75\xb5\xbd\xd3\xd5\xdd\xf6\xaf\xca\xaa\xd2\x77\xdb\
+\xdb\x4b\x6f\x5b\xb9\x72\x65\xc5\xba\x64\x4f\x24\x12\xa1\xf6\xce\
+\xf6\x8b\x2a\xaa\x4a\xdf\x4c\x65\xe2\x6f\xc5\x62\xa1\x7f\xe4\xf2\
+\x45\x6f\xa5\x33\xdd\xff\x54\xd5\xaa\x7f\xf5\xb7\x7a\xfd\x3b\x91\
+\xea\xfc\xbf\x6c\x2e\xf1\x9f\xbc\x96\x7e\x37\x91\xea\xfa\xaf\xaa\
+\x65\xde\xcf\xa9\xd9\xf7\x52\x99\xe4\xfb\xaa\x9a\x7b\x4f\xd7\x55\
+\x08\xb3\xef\x99\xa6\xf6\x5e\x3e\x9f\x7b\x57\xd3\xf2\xef\x9a\xa6\
+\x4e\xd3\xde\x77\x5d\xeb\xbf\xb9\x5c\x66\x86\x6d\x9b\xef\x43\xb9\
+\x37\x1c\xc7\x7e\xd4\xb2\x8c\x2b\x34\x4d\xdb\x9b\x10\x22\xac\x4b\
+\xa6\x9f\x9b\x96\x4c\x26\x7b\x67\xb3\xd9\xf1\xb9\x5c\xea\xc9\xd2\
+\xd2\x22\xd8\x72\x84\x3e\x0a\x85\x63\xff\xf5\xf9\xfc\x6f\x0b\xa2\
+\xf0\x57\xcc\xe0\x97\x5c\x82\x5e\x20\x08\x3f\xe3\xda\xce\x53\x96\
+\xed\x3c\xad\x08\xf2\xf3\x3c\xc3\xbf\x26\xca\xbe\xff\x73\x88\xf4\
+\x21\xf4\xeb\xfd\x78\xbc\xfb\xfe\x54\x2a\x75\x6c\x63\x63\x63\xe4\
+\xa7\xca\xd4\xd2\xd2\x32\x30\x91\xe8\x7e\xa4\xa3\xa3\xed\xff\xe2\
+\xf1\xae\xb7\xe3\x89\x8e\xff\x6b\x6d\x5f\xf9\x4e\x57\xbc\xed\x9d\
+\xce\xae\xd6\x7f\x0f\x18\xd8\xfb\xed\xc1\x43\xfa\xfd\x3b\x16\x0b\
+\xfe\x8b\x61\x6c\xf0\x40\xe4\x97\x17\x2f\x5e\x70\xe8\x4f\x6d\x6f\
+\x4b\xd7\xc3\x78\x8c\xa6\x28\xfb\xb6\xf0\xfc\xde\xef\x09\xd2\xfe\
+\x0f\xfa\xfd\x87\x4e\x0e\x86\x8f\x38\x12\xb3\x7f\xd8\x85\x51\x8b\
+\x46\x31\x5c\xd5\x7e\xc8\x0a\x9e\xeb\xba\xe1\xbb\xb5\x3c\xf3\x6f\
+\xe2\x2a\x4b\x58\x4e\x8a\x23\x42\x1c\x41\xf2\xb9\x08\x39\x84\x17\
+\x05\x8c\x90\x21\xb2\x82\x53\x21\xfb\xad\x1d\x31\x93\x3a\x15\xf1\
+\xb9\x87\x14\x45\xfd\x8f\xa9\xb7\x7e\xda\xdd\xfd\xe9\x5f\xdb\xda\
+\x3e\xbd\x32\x9b\x5d\xb4\x57\x3c\x5e\x17\xdc\x12\x7d\x5a\x2f\xf0\
+\xd0\x55\x37\x99\x5c\x04\xab\xd4\xa2\x3f\x66\x32\x5f\x5d\xd3\xd1\
+\xf1\xc9\x9b\x35\x55\xa5\x33\x4b\x4b\x83\xff\x0e\x86\xc8\xcd\xb2\
+\xcf\x3d\x92\x90\xcc\x30\xc4\xe4\xc3\x98\x21\x8c\xe4\xe3\x80\x97\
+\x8b\xc0\xed\xb3\x22\xd1\xa8\xcd\xf1\xa2\x6a\x98\x56\x93\x63\xb3\
+\xb3\x5d\x47\x79\x33\x93\x25\x77\xe5\xf3\xf8\x6c\xdb\x0e\x1e\xac\
+\xaa\xe2\xce\x3e\x5f\xcd\x48\xc5\x7f\xd0\xa1\x52\xf0\x77\x57\x62\
+\xdc\xff\x71\xde\x3f\xe2\x3d\x2c\x0f\x5e\x81\xf1\xc8\xfc\x96\xe8\
+\x68\x36\x9b\x1b\x02\xa8\xb7\x8f\xc0\x4b\x07\x20\xcc\x1c\xa0\xaa\
+\xfa\x7e\xa6\xee\xc0\x01\xb7\xbe\x9f\xaa\xaa\xfb\xbb\xae\xf3\x47\
+\x5d\xd7\xf6\xb7\x6d\x7b\xff\x54\x2a\xf9\x47\xd7\x75\xf7\x57\x55\
+\x6d\x7f\x4d\xd3\x3d\xd2\x75\x7d\xbf\x55\x64\xec\xa7\x1b\xfa\xfe\
+\xba\x01\xa1\x6e\xee\x6b\x18\xc6\xbe\x90\xbe\x8f\xae\x1b\xfb\x78\
+\x71\x0d\xd2\x35\x48\xa3\x65\x74\xfd\x40\x8c\xf1\x9e\x60\xe0\x23\
+\xe1\x3a\xd2\xb7\xae\x7e\x41\x1d\x81\xe3\x98\x81\x70\x60\xb5\x97\
+\x65\x59\xfb\xb1\x1c\xfb\x47\x48\xdb\xdf\x71\xdc\xfd\x0c\xd3\xd8\
+\x2f\x9f\xcb\xef\xe3\xd8\xf6\x3e\x84\x20\x08\x9d\x7d\x80\xcf\xde\
+\x79\x55\xdf\x07\xca\xee\x0b\xfc\xf6\x61\x18\x86\xca\xb0\x0f\x42\
+\x18\x42\x73\x5f\x42\xdc\xfd\x08\x21\xfb\x41\xbb\xfb\xb8\x2e\xd9\
+\x07\xfa\xb0\x37\xcb\xb2\x7f\x30\x4d\x93\x96\x3d\xc2\xb6\xad\xf3\
+\x20\xef\x36\x51\xe4\x5f\x41\xc8\x79\x0f\xf8\x5c\x0b\x20\xd4\x1b\
+\x6d\x86\x17\xe8\xee\x70\x00\x9c\x57\x02\x81\xc0\x7b\x7e\xbf\xf2\
+\x67\x8c\xd9\xb3\x4c\xd3\xda\xd9\xd0\xcc\xda\x7c\x4e\xeb\x93\xc9\
+\x66\xca\x33\xe9\x5c\x0c\xc0\x24\x94\x4c\xa4\x95\x44\x22\x21\x42\
+\x79\x4a\x72\x77\xbc\x3b\x08\x80\x55\x92\x4c\x24\x6a\x5c\xc7\x19\
+\xa2\xaa\xea\x3e\x2c\xcb\x4c\x74\x1c\xeb\xe9\x8a\x8a\xb2\x19\xf1\
+\x78\xfc\xcf\x5d\x5d\x5d\x03\x36\x55\x4c\x96\x25\x11\xcb\xb2\x77\
+\x83\x7e\x1e\xd0\xdd\xdd\x7d\x10\xc8\x78\x80\x65\x5a\x7f\xd4\x60\
+\x6c\xd3\xe9\xf4\xfe\x96\xe5\xec\x9f\xcf\xab\xfb\xb9\x84\xec\x2f\
+\x88\xd2\x9e\x3c\xc7\xed\xa1\xea\x5a\xcd\xa6\xb6\xf3\x6b\x97\x87\
+\x31\x25\x38\x3c\x22\x89\xf1\x80\xd9\x58\x18\xf1\x2c\x2f\xee\x78\
+\xb5\xe2\xdf\xfd\x70\x86\x6f\x1c\x69\x98\xd2\xef\x10\x0e\x1d\xaa\
+\x1a\x64\x42\xde\xc0\xf7\x75\xc5\x33\x6f\x69\x26\xf9\x02\x21\xbe\
+\x19\x33\x44\xe5\x04\x44\x00\x88\xc0\xa3\x36\xc2\x82\x24\x0c\x8a\
+\xc5\x22\x87\x16\x15\x05\xaf\x87\x31\x7c\x83\x63\x8d\x39\xd9\xcc\
+\xf2\x37\xf2\xd9\x95\xd7\xb5\xb7\x2f\xdf\x37\x97\xeb\x28\xdd\x1c\
+\x7d\x65\x7a\x98\xc0\x64\xc5\x9a\x56\xdf\xcb\xd6\x9b\x0f\xc9\xa6\
+\x97\x5c\xaf\xe6\xc9\x5f\x5d\x2b\xf7\x3e\x43\xac\x57\x44\x9e\x5c\
+\x57\x52\x1c\x3e\xd8\x75\xb4\x21\x08\x99\x61\x30\x0e\x0e\xce\x64\
+\x38\xcc\x20\x40\x50\x37\x65\x91\xf4\x8a\x64\xb6\x73\x6e\x5a\xed\
+\x7e\xb3\xb3\x73\xe5\x7d\x96\x43\xce\xd2\x34\x67\x7f\x57\x28\xda\
+\xbb\xb3\x4b\xde\x5f\x14\xdb\x8e\x0d\x87\x0f\xb8\xda\xef\xdf\xf3\
+\x59\x9e\xdf\xf5\x23\x9f\x6f\xf7\x56\x8c\x47\x5b\x3d\x6d\xff\x12\
+\x61\x38\x18\x31\x33\x19\x15\x75\x77\x25\x51\x32\x91\x41\xba\x66\
+\xc3\xb5\x25\x42\xba\xae\x23\xe8\x3b\xc4\x5d\xd8\x1b\x3b\xde\xb3\
+\x0b\x28\x90\x4e\x65\x91\xeb\x20\x64\x1a\xf6\x77\x64\x5a\xab\xe2\
+\x10\x5a\xa6\x83\xc0\xa8\xe0\x10\xdc\x05\x72\x80\xd6\x0c\x5d\x64\
+\x5a\x0e\x32\xe8\x97\x13\x5d\x94\x2f\x2e\x29\xcd\x03\x4f\xe0\xf6\
+\xc3\x9e\x0a\x82\x60\xb0\xac\x68\xb2\x2c\xaf\x21\xc4\xa0\xd6\x96\
+\x76\x04\x46\x82\x00\x0c\x40\x1e\x17\xe2\x36\xe2\x79\x01\x81\xe1\
+\x82\xec\x09\x94\xc9\xe4\x10\xc7\x09\x28\x97\x53\x11\xcb\xf2\x28\
+\x91\x48\x21\x86\xe1\x50\x36\x9b\xf7\x42\x5d\x37\xbd\x78\x77\x77\
+\x02\xea\x13\x2f\x8d\x96\xa5\xbc\x69\x5d\x5a\x0e\x42\x16\xca\x95\
+\x68\x9a\xb9\x2b\xc7\x71\x57\x00\x78\xbd\x96\xcf\xe7\xcf\x04\x3d\
+\x6c\x70\x4b\xf8\xc3\x1e\x80\xd3\xae\x69\x7d\x40\xe6\xd7\x81\xcf\
+\x93\x00\x8c\x47\xe5\x72\xb9\x7e\xd0\x86\x0c\x6a\xf4\x64\xb0\x40\
+\x17\x26\xe8\x82\xea\xcc\xb6\x5d\x4f\xaf\x5e\x9e\x4d\x10\x46\x2c\
+\xa2\xe9\x04\x6e\x27\xa9\xbe\x59\x86\x47\x9a\x6a\x20\x96\x65\xa1\
+\xaf\x19\x3a\x2e\xbe\x8e\x8e\x8e\x91\x2c\x8b\x27\x80\x21\xfc\x35\
+\x1e\xef\x9a\x8c\x36\xe1\x45\x08\xeb\x42\x5d\x15\xc0\x1c\xc9\xb2\
+\x0c\x63\x9f\x46\xd9\x4c\x1e\x39\xd0\x36\x6d\x8b\xb6\x6d\x59\x36\
+\xcc\x07\x13\xe5\xb2\x2a\x6d\xdb\x09\x05\x82\xbf\xe8\xdc\xdc\x84\
+\xee\x6c\x72\x51\x7a\xa6\x24\xcb\x3b\x36\x62\x3c\xf4\xbf\x3e\x69\
+\xcc\xe3\x7e\x69\xcf\x4b\x8a\x63\xca\x51\x86\x1a\x82\x85\x8a\xdd\
+\x0b\x21\xdf\x41\x8e\xc5\x9e\x6f\x18\xd6\x7d\x9a\x66\xff\x23\x9d\
+\x4a\x02\x20\x31\x2d\x1c\xc3\x9a\x08\x39\x81\x60\x28\xd8\xd7\xef\
+\xe7\x0f\x94\x24\xe6\xca\x48\x58\x78\x03\x39\xf9\x59\xe9\xe4\xf2\
+\x7f\x58\x46\xdb\x15\x6a\xa6\x75\xf7\x4c\x73\xf3\x4f\xda\x16\x33\
+\x84\xc4\x0f\x20\x24\x75\xa5\xa1\xae\x7c\xd5\x36\x6b\x20\xa0\x3c\
+\x00\x00\x10\x00\x49\x44\x41\x54\xdd\x77\x11\x83\x9f\x87\x33\x98\
+\xcb\x65\x81\xdf\x37\x5a\x54\x52\x2d\xfb\xfd\x41\x41\x0a\x30\xc4\
+\x26\x69\x41\x8e\xd4\xa5\xba\xd3\x9f\xe4\x33\xb9\x69\x96\x41\x6e\
+\xcb\xa4\xd4\x73\xb3\x59\xe7\x08\x3d\xc7\x1c\x0a\x0b\xcb\x21\xd9\
+\x44\xe0\x94\x92\x92\x2f\xaf\x12\xb8\x31\xcf\x2b\xca\xef\x3f\x55\
+\xf0\xb0\x95\x15\x15\xa3\x55\xda\xf9\x4d\xd6\xd8\x66\xae\x60\xdb\
+\x0e\x06\xc3\x62\x78\x5e\x44\x3e\x5f\x08\x2e\x07\x24\x98\xd4\x08\
+\x61\xcc\x22\xd3\xa4\xdf\x9d\x70\x3d\x00\x02\x43\x44\x74\x92\x86\
+\x42\x21\x64\xdb\xb0\x4d\x46\xdf\xbd\xa8\x71\x50\x03\x46\x84\x81\
+\xb2\x18\xf5\x84\xc4\xfb\x19\xcb\xaa\x34\x1a\x87\x76\x80\xf7\x2a\
+\x7e\x3c\xcf\x3b\x89\x54\xc2\x81\x15\x09\x2a\x7c\xc7\xab\x27\x96\
+\xc9\x64\x4c\xd7\xb5\x31\x18\x3e\x63\x81\x81\x96\x94\x94\x78\x7c\
+\x19\xcc\x79\x72\x39\x8e\x83\x20\x0f\xc1\x98\x20\x2a\x13\x06\x79\
+\xc1\x1b\x40\x91\x48\x04\x41\x5d\x04\x86\xee\xc9\x49\x0d\x15\x3c\
+\x08\x44\xe5\xf7\xfb\xfd\x5e\x79\x1a\x07\x8f\xc2\x2b\xa3\x69\x9a\
+\x17\xfa\x7c\x3e\xe8\xbb\xe0\xc9\x07\xbc\x05\xe0\x1d\x80\xfe\x8e\
+\x00\xfe\xd7\x81\x57\x71\x39\xc8\xce\xf7\xc8\xb6\x31\x21\x00\xce\
+\x18\xa8\xfb\x77\xe0\x75\x28\xc8\x53\x0c\xed\xf0\x10\xf7\xda\xa0\
+\x7a\x85\x7e\x23\x4a\x00\x4a\x88\x61\x38\x44\x65\xa2\xc0\x49\x43\
+\x16\x80\x93\xf6\x99\xe6\x61\xcc\x82\x4e\x09\xa2\x75\x29\x40\x80\
+\x5c\x1e\x50\x00\x60\x7b\xb2\x42\x3b\x52\x2a\x95\x1a\x02\xf2\x5d\
+\x95\x4c\xc6\xef\xde\x18\xd9\x68\x19\x68\x1b\xe7\x72\x79\x86\xea\
+\x87\xf2\x16\x04\xc1\xd3\x0d\x95\x8d\x2e\x3a\x34\xa4\xe3\x48\x65\
+\xa2\x72\xb0\x2c\x03\x0b\x04\x4b\xab\xfe\x46\x69\xc3\x62\x63\xbc\
+\xb7\x1d\x89\xec\x90\x92\xa4\x9d\xeb\x61\x87\xf1\x11\x27\xec\xfc\
+\xb4\x24\x8d\xb9\x5c\x51\xca\x4f\x62\x39\xdf\xa1\xf1\x78\xf6\x50\
+\xc4\x28\x63\x61\x91\x3a\x2f\x9b\x4e\x3f\x90\x57\xe9\xd6\x5d\x6d\
+\xe4\x79\xd7\xe1\x78\xd2\x3b\x18\x56\xf6\xe5\x04\x7c\xa5\xec\xc7\
+\xd3\xd9\x90\x33\x2b\xde\x55\xff\xaa\xaa\xb6\x4f\xca\x64\x5a\xc6\
+\xb4\xb7\x6f\xdc\x19\x11\x63\xea\xea\x4b\x86\x91\xbd\x0c\xf6\x7d\
+\x87\xb0\x1c\x57\x0b\xc6\x16\x34\x4d\x4b\x4b\x67\xb4\xc5\xd9\xb4\
+\xfe\x56\x36\x6d\xdc\xa5\x66\xad\xf1\x18\xfb\xc6\x19\x69\xfd\x40\
+\xce\x0e\x1c\x69\x3a\xd2\x85\x8b\xea\xa4\x9b\x43\x91\x3d\x9e\x0f\
+\x06\xc7\xcc\x0c\x06\xf7\x58\x1a\x0a\x8d\x49\x54\x57\x8f\xd1\xb6\
+\xd6\x6f\xdc\xc2\x96\x09\x0b\x82\x04\xf3\x90\xf5\x0c\xd5\x04\x4f\
+\xc6\x85\x29\x06\xc0\x80\x28\x41\x86\x37\xf1\xe9\x4a\x4c\x8d\xc0\
+\x30\x2c\x78\xc6\x1e\x21\xc4\xac\x0e\x69\x7c\x4d\x72\x60\xe5\xa4\
+\x75\x28\x2f\x0f\x74\x60\xe5\xa6\x21\x2d\x43\x43\x20\x1c\x0a\x45\
+\xa1\x3e\x21\xeb\x9a\x12\x60\x60\x2e\x83\x04\x00\x44\x1e\xd4\xcf\
+\x21\x4d\x33\x56\x17\x93\x44\x05\xf9\x94\x00\x62\x19\x1e\x3c\x31\
+\x0a\x8e\xe8\x5b\xc3\xe5\x90\x9a\xd7\xbd\x74\x30\x48\x0f\x28\x69\
+\x25\x0a\x4c\xd4\x98\x68\x1a\x7d\xce\xe5\x72\x48\x51\x14\xda\x36\
+\xa2\x7d\xa4\xe9\x36\x80\x29\x25\x9a\x4f\x89\xe3\x38\x6a\xd8\x02\
+\x00\x46\x55\x20\x10\x38\x0d\xce\x53\x4e\xa1\xe9\x1b\x43\x00\x58\
+\x83\x01\x18\x1e\x03\x83\x1e\x0a\xed\x0a\x00\x40\x5e\x3b\x90\xe6\
+\xe9\x98\x3e\x3b\x0e\xed\x36\x03\x72\x0b\xb6\x24\x29\x44\x86\x3d\
+\xba\xa2\xf8\x6d\x4a\xb0\xa6\x39\x81\x40\x08\x00\xc6\x07\x60\x20\
+\x23\x16\x80\x88\x61\x38\x44\xc1\x88\x02\x81\xa7\x57\x17\x01\x88\
+\x49\x1e\x3f\x16\x5e\x00\x0e\x25\xd0\x97\x53\xba\xbb\x3b\xaf\x46\
+\x1b\xf1\x82\x7e\xc1\xd9\x62\x80\xa5\xe3\x9b\xc9\x64\x56\xd7\x00\
+\x56\x88\x02\x34\xc8\x04\xfa\xc1\x00\x78\xab\xe4\x14\x04\x99\x85\
+\x7e\xe1\xd5\x05\xb7\xa3\x08\xc6\x7d\xf4\x40\x60\xc7\xae\xa2\xa2\
+\x9d\x16\x61\x5c\xf3\x61\x30\x38\xfc\xe9\x40\x68\xd8\x15\xa6\x29\
+\x9c\x62\xbb\xda\xde\x9a\x9e\xdf\x17\x63\xf7\x94\x4c\xa6\xeb\x0e\
+\xb8\x2c\x78\x2f\x93\x4d\xb4\x9b\x66\x3e\x12\x0a\x4a\x87\xc9\x22\
+\x73\x75\xc0\x2f\x4e\x97\x65\x6d\x76\x22\xbe\xfc\xa5\x6c\x76\xe5\
+\xf8\xd6\xae\xe5\xa3\x1b\xe0\x62\x66\x5d\x2a\x64\x34\x5d\x4b\xea\
+\xa6\xf1\xb5\xae\x99\xcf\xc3\xb2\x30\x09\xe6\xc9\x51\x0c\x91\x0e\
+\x65\x78\xe1\x58\xcd\xe4\xc7\xa7\xb3\xfe\x9b\x7c\xc1\x41\x4f\x61\
+\xbe\xcf\x07\x52\x78\x44\x7d\xa0\x7c\xc7\xae\x68\x74\x74\x7a\xf4\
+\xe8\x5f\x76\xab\xb4\x2e\xe1\x37\x25\x8d\xae\x74\x60\x10\x04\x08\
+\xd1\x49\x48\x27\x1e\x35\x3a\x13\xbc\x1d\xca\x07\x26\x34\xa2\x79\
+\x34\xa4\x79\x34\x8d\x1a\x2d\x25\xba\x02\x83\xa1\x20\x30\x1a\x20\
+\x19\xc8\xe7\x19\x34\x7d\xa6\x1e\x84\x22\xfb\x09\x84\x2e\x80\x84\
+\x0d\x93\xd9\xf6\xfb\x82\x2e\x3c\x3b\x10\x27\xc0\x4f\x81\x09\x2f\
+\x01\x3f\x3a\xb3\x21\x58\xfb\x0d\xc6\x09\x5b\xdc\x3c\x12\xf8\x55\
+\xc6\x05\xe5\x3d\x43\xa0\xb2\x81\xd1\x20\xea\xdd\x50\x79\xa9\x67\
+\x43\x43\x0a\x1a\x50\xc7\x0c\x06\x83\x56\x71\x71\x91\x05\x9e\x8f\
+\x1b\x0e\x87\x09\x6d\x0b\x0c\xd2\x2d\x2d\x2d\x75\xa8\xcc\xf0\x8c\
+\xa0\x8c\xd7\x18\x05\x1c\xca\x8f\xea\x80\xf2\xa0\x71\x4a\xe0\x3d\
+\x00\xa0\xe9\x60\xd8\x02\x2d\xc7\x41\xb9\xbe\xc0\xeb\x38\xf0\x2c\
+\x76\xa4\x09\x3f\x46\x50\x57\x00\x7d\xdd\x00\x3c\x07\x42\xff\x58\
+\x08\x01\x30\x2c\x4f\x5e\x0a\x80\x90\x87\xa8\x6e\xa1\x1d\x02\xf2\
+\x5a\x20\x7f\x0a\xca\xbc\x07\xba\xbd\x0f\xf8\xde\x00\x4e\xde\xb5\
+\x00\x4a\x37\x41\xfe\x53\x08\xe1\xcf\x11\x42\x69\x0a\x36\xb4\xff\
+\x54\x46\x28\xeb\xf1\x83\xf2\xde\xb8\x40\xbe\xf7\x4c\x3d\x38\x00\
+\xeb\x62\x28\x77\x0a\x9c\xf9\x6c\x50\x4e\xd0\x09\x76\x5d\x07\x43\
+\xdf\x3c\xa0\xa1\x7c\x28\x7f\x90\x1f\xe4\x83\x4b\x56\x98\xf0\x14\
+\xec\x68\x3b\x04\x3c\xd7\x6f\x41\x67\xbb\x04\x1e\xaa\x9b\xef\x13\
+\xe8\xca\x8d\x46\xfb\xa5\x03\x81\x91\x9d\x3e\xdf\x90\xcf\x45\xb9\
+\xf6\x45\x00\xa4\x5b\x22\x6c\xd1\x05\xb0\x6d\x1e\x2b\x48\xca\xfe\
+\x8e\x6d\x9f\x90\x4d\xa5\xef\xec\x6c\x6f\xfb\x9f\x96\xcf\x58\x2c\
+\x87\xf7\x92\x04\x7e\x4a\x49\x30\xf0\x8a\x3f\xe0\x7c\xdc\xd6\x51\
+\xf7\x5c\x43\xe3\x82\xf3\x9a\x9a\x16\x0d\xef\xe1\xcf\xb0\x9c\x70\
+\x98\x9a\x33\xcf\xcc\xa9\xce\xd4\xae\x2e\xf4\xb8\xcf\xd7\xeb\x2d\
+\x25\x54\x3d\x27\x14\xea\xbf\xac\xb4\xb4\x6f\x47\x75\x75\xb5\xd6\
+\x53\xf8\xb7\x1c\x9a\x26\xec\xf8\x30\x41\x2c\x8b\xbd\x89\x0c\xca\
+\x81\x13\x35\x07\xc1\xc4\x84\xd5\xce\x01\x22\x88\x4e\x7c\x58\xbd\
+\x3d\x60\x82\x89\x9f\x02\xe3\xf9\x86\xe3\xf8\x59\x90\x3e\x0b\xca\
+\x7d\x22\x49\xe2\x07\xb0\x42\x7e\x20\x4b\xbe\x0f\x81\x56\x85\x0a\
+\xc4\x15\xdf\x47\xb2\x24\x7f\x2c\x88\xf2\xa7\x1c\xcf\xcd\x81\x49\
+\x3c\x9b\x67\xc5\xcf\x44\x5e\xfa\x14\x26\xfc\xd7\xae\xed\x2c\x65\
+\x18\x66\x9d\x7a\x94\x60\xf3\x2c\x08\x3c\xb4\xef\x20\x8c\x56\x6d\
+\x37\x60\xb0\xe1\x99\x80\x6c\x22\xc8\xcb\x23\x84\x18\xb4\x2a\xcd\
+\x41\x01\x7f\xc8\xe0\x39\xb1\x15\x61\xe6\x29\x84\xd1\xbd\xd0\xd6\
+\x7d\x40\x77\x83\x71\xff\x19\x78\xdd\x03\xc6\x7e\x0f\xb4\xf5\x28\
+\x54\x7a\x1f\xc2\x76\x20\x44\x81\x08\x3c\x12\xe8\x1f\x07\xc9\x08\
+\x61\x8c\x7b\x3c\x08\x2f\x0d\xe3\x55\x3a\xe1\xe0\x05\xe5\x47\x02\
+\xb8\xed\x86\x36\xf0\x32\xe0\x70\x1d\xda\x3b\x20\x97\xcb\xf1\x10\
+\x02\x58\x12\x04\x75\xc1\x73\x11\x3d\x80\x60\x18\x0e\x9e\x39\xba\
+\xbd\xb3\xc1\xc8\x93\xaa\xaa\xdf\xef\x38\xf8\x62\x8e\x63\xae\x10\
+\x45\xfe\x36\xb8\xfd\xbb\xd3\xe7\x13\x6f\x6a\x6c\x64\x27\x98\x26\
+\x39\x05\x9a\xbe\x15\x68\x3e\xd4\x83\x33\x19\x1e\x00\xd1\x04\x40\
+\xa4\xdb\x61\xd7\xe3\x4d\x75\x00\x40\xe5\x81\x29\x05\x63\x51\x14\
+\xaa\x81\xd7\x04\xb4\x11\x2f\xc7\x41\x04\xc6\x10\xf8\xd0\x7e\x22\
+\x2f\x64\x59\xde\xab\x89\x31\xf6\xf4\x01\x32\x22\x68\x1f\xe6\x06\
+\x7d\x64\xb1\x97\x59\xf8\x58\xa7\x06\x30\xc6\x04\x87\xaa\x13\xb1\
+\xd8\xf0\x26\x9f\xaf\xf7\x17\xa2\xaf\xe6\xcd\x40\x9b\xf1\x90\x12\
+\x90\x2f\x21\xd8\x3d\x52\xcb\x68\x47\x81\x23\x73\x71\x7b\x47\xe7\
+\x73\x96\x6d\x2f\x71\x1d\xab\x37\x2f\xe0\x09\xbc\x28\x3c\x5f\xb7\
+\xfc\x8b\xff\xd4\xaf\xfc\xfa\x21\x26\x10\xe8\xbd\xa8\xa2\x62\x48\
+\x63\xe9\x36\x04\x32\xeb\xd2\x16\xac\x66\xcc\x77\xe9\x2e\x44\x57\
+\x11\x80\x0b\xc4\x11\x18\x09\x43\x67\x9c\x47\x90\x40\xbf\xfe\xb0\
+\x10\x8c\xf5\x96\x4c\x46\xbb\x40\xd7\xd5\x0b\xe0\x8a\xfa\x5c\x4d\
+\x53\xcf\x53\x55\xe3\x3c\xb8\x55\x3a\x2f\x97\xd7\xce\x07\x3a\x2f\
+\x9f\x55\xcf\xa7\x94\xcb\x69\x17\x68\x79\x6d\xbc\xa1\xa9\x17\x58\
+\xa6\x7e\x81\x61\xd8\xe7\xd9\xb6\x79\xbe\x65\x98\xa7\xf3\x1c\x7f\
+\x0f\x9c\xdd\xac\xf3\x07\xb6\xa2\x28\xb2\xd0\x3a\x34\xb9\xea\x0d\
+\x83\xba\x2a\xf2\xed\xa7\x03\x56\x43\x0d\x1b\x00\xcc\x4b\x31\x0d\
+\xd3\x25\x2e\x59\x69\x9b\xda\x8d\xf5\xcb\xd0\xf5\xf5\xf5\xf5\xd7\
+\x80\xc1\xc0\xcd\x20\xbe\x02\xea\x5e\x0e\xfc\xae\x80\xb3\x9e\xcb\
+\xa1\xde\xd9\x50\xe7\x0c\xa8\xf4\x1f\x00\x07\xd8\xe6\x48\x88\x10\
+\x02\xab\xbc\x09\x86\x47\xc0\x6b\x93\x21\x0b\x79\xfd\x85\xb2\x00\
+\x72\xab\x0c\x11\xea\x04\x14\x45\xa9\x46\x3f\xf2\x22\x84\x48\x40\
+\x63\x81\xc2\x3d\xc5\xa0\xed\x9e\xa8\xc7\xbf\xe7\x01\xf4\xeb\xb0\
+\x2c\xf3\x6f\x51\x54\x5e\x15\x45\x0c\x2e\x3c\x76\x7a\xf2\x68\x58\
+\x5b\x8b\x8d\x58\x2c\xb0\x50\x51\xa4\xbb\x08\x71\xee\x87\xf6\x1b\
+\x00\xd4\x3c\x79\x28\x90\x51\xa2\xbc\xa1\x8f\x1e\x30\xc0\x39\x94\
+\x07\x6e\xaa\xaa\x49\x90\xb6\x57\x2a\x95\xea\x4b\xf9\x6c\x46\x62\
+\x10\x82\xfd\xf2\x66\x64\xb8\x3d\xb0\xc2\xc3\x86\x99\x81\x40\xff\
+\xce\xf2\xf2\x1d\x56\x94\x55\x0f\x9d\x1d\x08\xf7\xfa\x6b\x65\xf5\
+\xd0\x5b\x0d\xcd\xbe\x14\x11\xe6\x5c\x43\xd5\xcf\xcc\xa4\x52\x37\
+\xc3\x58\x7e\x68\x1b\x96\xcc\x6c\x0f\x4a\x59\xd5\x47\xda\x55\x4a\
+\xab\x9e\x60\x72\x41\xc4\x45\x2e\xf8\x3d\x98\xe5\x10\x78\xd9\x5e\
+\x9c\x86\x0c\xc7\x12\xd7\xc5\x59\xc3\x20\x8b\x86\x0d\x1b\xf0\xe5\
+\x80\x01\x03\xbe\xac\xad\xad\x5d\xd8\xb7\x6f\xdf\x25\x7d\xfb\x56\
+\x2e\xe9\xd3\xa7\x62\x71\x0f\xf5\xee\x5d\xb1\x88\x52\xaf\x5e\xe5\
+\x0b\x6b\x6a\xca\xe6\x83\x87\xf8\x75\x55\x55\xd5\x57\xd5\xd5\xa5\
+\x5f\x97\x95\x95\x7d\x03\x5b\x9f\xaf\x63\xb1\xd8\x7a\xbf\xe0\x08\
+\x03\x81\x11\x62\x08\x84\x94\x3c\x20\x80\xb8\x17\x82\x80\x5e\x08\
+\xc6\xe8\x79\x11\x7e\x38\x34\x46\x18\x31\xd9\x5c\x96\x6e\xe5\x3a\
+\xa9\xd1\x82\x5c\x06\x94\xa7\x28\x8a\x7a\x5e\x00\x72\x39\x59\x96\
+\x57\x40\xf9\xff\x03\xf0\xbc\x07\xb6\x4f\x0d\x14\x5c\xc0\x93\x41\
+\x81\x40\xc0\x03\x59\xba\x65\x01\x50\xf0\x8c\x99\xd6\x03\x23\x06\
+\x0f\x43\xa0\x80\xc4\x41\x7b\x74\x6b\x48\x93\xd7\x49\x50\xd7\x0f\
+\x75\x87\x40\xbb\x68\x4d\xa2\x20\xb1\x66\x05\x9a\x27\x08\x1c\xe3\
+\xba\xa4\x29\x95\xea\x68\x5d\x33\x6f\x5d\xf1\x6e\x4d\x7b\x4b\xf6\
+\x29\xef\xc4\x8a\x8a\x10\x2f\x08\xc8\x25\x04\x31\x2c\x8f\x38\x5e\
+\x44\xa2\x2c\x51\x72\x63\xc5\x25\x8e\xec\xf3\x1b\x0c\xc7\x1b\xbc\
+\x28\x06\x5d\xd7\xda\x65\x5d\xbc\xbe\x97\x46\x7a\x9e\x31\x66\x11\
+\xfe\x96\x40\xef\x3d\xc9\x85\x70\x0b\x68\x00\xc6\xdf\xed\xd3\x67\
+\x58\x7b\x65\xe5\xa0\x25\xfd\xfa\xed\x38\x77\xc0\x80\x9d\xfe\xd6\
+\xaf\xcf\xc8\x5b\x89\xcb\x5e\xcf\x6c\x81\xf6\xb6\x52\x96\x18\xe4\
+\xea\xe9\xae\x8b\x10\x5e\x45\x0c\x24\xf5\x18\x0c\x35\x4e\x04\x2f\
+\x96\x65\x11\x10\x66\x18\x7b\xad\xd5\x19\xb2\x36\xfb\x1b\xbc\x86\
+\x1e\xa3\xe8\x09\xd7\x6a\xc3\xe7\xf3\xc1\x81\xb3\xe6\x79\x00\xf9\
+\x7c\x9e\x82\x03\x2b\xf0\x3c\x03\x48\x26\xae\x55\x70\x3d\x0f\xd1\
+\x68\x74\x06\x78\x10\x4b\x01\x58\x5c\x78\x79\x07\xd1\x00\x46\xde\
+\xf6\x0b\xfa\xe8\x6d\xb9\x78\x9e\x47\x34\xcf\x84\xf3\x2e\xf0\x8e\
+\x4c\x41\x10\x52\xeb\x61\xe7\x25\x03\x2f\x11\xea\x2a\x3d\xfa\x82\
+\x3e\x78\xe9\xf4\x03\x26\x1b\x0d\x3c\xa2\x7a\xb5\x6d\xea\x3d\x90\
+\xbd\x00\x80\xe9\xf7\x99\x18\x2f\x63\x3d\x1f\x7d\x4b\x4b\x3b\x72\
+\x99\xfc\xdb\x20\xc3\x6b\x96\x69\xbd\x09\xdb\xd7\x97\x38\x9e\x7f\
+\x06\x64\x7b\x4c\xd7\xb5\xfb\x73\xb9\xfc\x9f\x55\x35\x7f\x0b\xc4\
+\xaf\xb7\x2c\xf3\x6a\xdd\xb0\x6e\x40\xc8\x5d\xb8\x1e\x76\x3d\xc9\
+\x9e\x5e\xa9\x5c\x94\x7a\x12\xd7\x1f\x62\xaf\xfc\xfa\xf3\x0b\x39\
+\x3f\x47\x03\x30\x06\x64\xe0\xc0\x51\x2d\x3f\x3a\x11\x7e\x4e\x03\
+\x5b\x5b\x5d\x42\x58\x82\x08\x03\x93\x6a\xc3\x5d\x06\xe5\xb8\x98\
+\x75\x5d\x87\x75\x36\x5c\xf8\x67\x76\x14\x8c\x0a\xec\x16\xae\xc6\
+\x80\x0f\xb4\x0b\x9f\x6b\xbf\x33\x70\x13\x43\xbd\x14\x9a\x47\x01\
+\xc2\x30\x0c\xd7\x71\x5d\xc4\xb6\xb5\x51\x24\x5d\xbb\xf0\x3a\x9e\
+\xa0\x9e\x29\x49\x8a\x09\x57\xa3\x2e\x84\x00\x30\x08\xbc\x9e\x90\
+\x77\x86\x04\x6c\x10\x05\x07\x5a\x8d\x82\x08\x00\x0a\x02\xa0\xeb\
+\x06\x60\x5a\x41\xd3\xd6\x47\xe0\x39\x19\xe0\xf5\x68\x00\x3e\x08\
+\xf8\x7b\xc5\xa0\x13\x5e\x48\x9f\x57\x11\x01\xde\x08\xb6\x5d\x8e\
+\xcb\xf3\xdc\x28\x55\x55\xaf\x81\x2d\xe0\x75\x9d\x9d\x9d\x07\xb7\
+\xb6\xb6\xae\xf7\x0b\x7a\xa2\xc8\x7e\xac\xa9\xd6\x14\x84\x9c\x2b\
+\x3b\x53\xf1\xa9\xd9\x74\xf2\x36\xd7\xb1\x6e\xef\xce\xa9\x77\xc2\
+\x60\xdc\xa9\xe6\xd4\xdb\xcb\x4b\xcb\xff\x54\x56\x52\xf6\x60\x38\
+\x10\x78\x24\x1a\x2d\xfd\xda\x6b\x78\x3d\x1f\x20\x17\x59\x95\x05\
+\xb5\x11\xa5\x55\x4f\xdf\x7d\xba\x10\x5d\x93\x1c\xd0\x11\x05\x4b\
+\x48\x2e\xbc\xb7\x98\x06\xd6\x18\x89\x2d\xd6\xc6\x56\xc4\xf8\x87\
+\xb6\x0a\x13\x13\x8c\x63\xd5\xdc\xa4\x46\x48\x09\xd2\x00\x75\x5c\
+\xd8\xde\xe0\x1f\x56\xd8\x02\xbd\x81\x56\xbc\x76\xa0\xdd\x1f\x70\
+\x17\x45\x91\x1a\x82\x67\xe0\x96\x65\x81\x31\x33\x60\xc8\xbc\x0b\
+\x46\xbc\xf6\x97\x8c\x7e\x50\x73\x55\x02\x78\x49\xa3\x5d\x97\xf4\
+\x91\x65\x99\xa3\xfc\xe9\x79\x11\x80\x80\xd7\x67\xf0\x6c\xbc\x42\
+\x18\x63\xaf\x0d\xca\x1f\xbc\x9e\x05\x00\x40\x73\xbc\x8c\xf5\x7c\
+\x00\x10\x66\xc1\x93\x5a\x0c\x20\x48\x3d\x43\x4f\x36\xca\x7b\xcd\
+\xe2\x18\x7b\x5d\xa2\x67\x4a\xf4\x7a\x9a\x7e\x8f\x61\x57\x9e\xe7\
+\x2f\xf6\xf9\x82\x77\x49\x92\xef\xf1\x4c\x26\xfb\x78\x3a\x9d\xbd\
+\xb6\x2b\x9e\x3a\xbb\xbd\xbd\xeb\x70\x38\xab\xd9\xb1\xa1\xa1\xb3\
+\x0c\xf8\xa6\xab\xab\x4b\xea\x8a\x8b\x8b\x97\xf4\xab\xae\xae\x83\
+\xad\xeb\xb2\x8a\x8a\x8a\xc6\x21\xbd\x7b\xb7\x41\x3c\x41\xb7\x96\
+\x6b\xb6\xb3\x31\x71\x90\x8d\x7e\x87\x6b\xad\xa2\x90\xb6\xd6\xf3\
+\x1a\x0f\xab\x26\xc3\x1a\x09\x85\xe8\xe6\xd7\xc0\x76\x03\x3c\x0c\
+\xe2\x60\x42\x41\x77\x09\x90\xb7\xf2\xc1\x23\x22\xab\x8d\xe6\x7b\
+\x13\x91\x20\x06\x63\x30\x40\x17\xfd\x02\x2f\xda\x08\xb4\xbf\xca\
+\x52\x57\xb7\x07\xa7\x4f\x84\xee\xf4\x28\x00\x1a\x5e\x2a\x05\x0d\
+\x90\x89\x58\x70\x0d\x04\x80\xf4\xbd\xf2\x5e\x91\xd5\x1f\xc0\x4f\
+\x01\xef\x62\x77\xb8\x09\x9a\x98\xcf\xe7\xfa\xd3\xba\xe0\xa5\x50\
+\x20\x40\x00\x42\x1e\xd0\x80\xe7\xe2\x01\x10\x00\x82\xa7\x07\x78\
+\x5e\x02\xc0\xfb\x2a\x00\xcb\xa2\xd5\x8c\xd6\x11\xc1\x18\x1b\x9a\
+\xa6\xfd\x15\x64\xe8\x02\x79\xbc\xba\xd0\x9e\xc7\x8b\x16\x87\x7c\
+\x1a\xf4\x10\x05\x3c\x7a\x72\x4d\xcf\x8e\x22\x8a\x22\x0e\x81\x9d\
+\xec\x01\x99\x4c\xfa\x6c\x38\x7c\xbf\xd2\x75\xec\x5b\xe0\x2c\xe7\
+\x0e\xf0\xbe\xee\xf6\x07\xb8\x3f\x77\x74\x74\xdd\x94\x4c\x66\xce\
+\x00\xaf\x68\x8f\xa6\xa6\xa6\x4a\xe0\xcb\xf5\x30\xfa\x29\xa1\x6d\
+\x63\xd0\x13\x25\xb4\x5a\x3e\xe0\xe9\xb1\xea\x09\x11\xa2\x23\xb0\
+\x26\x79\xd9\x85\x8f\x2d\xa8\x01\x6a\x85\x5b\x90\xfd\xd6\xc3\x1a\
+\xa6\x15\x4c\xc0\x35\x5d\x68\x78\x44\xd8\x5b\xb1\x11\xbc\xe8\x24\
+\xec\x21\x78\x44\x1c\xcb\xf6\x52\x04\xee\xec\x85\x8b\x17\x5e\xbe\
+\x68\xd1\xa2\xab\x17\xd7\xd5\x5d\xb9\x74\xd9\xb2\x2b\xea\x57\xd4\
+\x5f\x5e\xbf\x62\xc5\x65\x2b\x56\x52\x5a\x79\xd9\xca\x95\xdf\x51\
+\x4b\x4b\xcb\x65\x6d\x6d\x6d\x97\x02\x5d\x0e\x46\x73\x36\xd0\xaa\
+\xab\x23\xca\x70\x13\x89\xca\xd2\x53\x05\x63\x4c\xcf\x76\x50\x1e\
+\xce\x78\x30\xc6\x48\xf6\x29\xd5\xe1\x68\xd1\x94\x9c\x6a\x5c\x91\
+\x4a\x65\xae\x4e\x24\x52\x94\xae\x82\xf8\x55\x99\x4c\xee\x4a\x78\
+\xbe\x4a\xd3\x8c\xdb\x64\x59\xb9\x15\x63\x7c\x24\x00\x84\x1f\x3c\
+\x19\xba\x8d\x42\xf0\x0c\xdb\x2c\x07\x01\xc0\x78\x3c\xe9\x76\x29\
+\xaf\xa9\x36\x42\xe8\x4b\xf0\x78\xee\x87\x72\x7f\x87\xf8\x06\xdf\
+\xb0\x25\xfb\x00\xb6\x64\x6f\x00\x1f\x30\x6d\xaa\xcb\xb5\xab\x50\
+\xf9\x29\x51\x60\x32\x0c\x83\x9e\x25\x61\xda\x16\x80\xa1\xd7\x36\
+\x80\x1b\x06\x8f\xcb\x0f\x54\x1a\x8d\x46\x06\x03\xf8\xfc\x01\x78\
+\x9d\x04\xd7\xaf\x53\x92\xa9\xe4\x1d\x92\xe2\xbb\x13\xe4\xbf\xb9\
+\xb3\xb3\xfb\xe2\xd6\xd6\x8e\x3f\x76\x75\x75\xad\xf3\x47\xb6\x6b\
+\xb7\xfa\xc3\x27\x8c\x11\x78\x3b\x94\xc8\x5a\x99\x54\xb6\x55\x80\
+\xb3\x56\x72\xe1\xe1\x17\xd2\x00\xf3\x0b\xb5\xf3\xab\x37\xc3\x30\
+\x16\x42\xf4\x26\x17\x0e\x95\x31\xc6\x08\xce\x7b\x10\x01\x1c\xa2\
+\x4e\x05\x83\x30\xea\x21\xe4\x12\x64\x19\xa6\xe0\x58\x4e\x8d\x24\
+\x48\xa7\x33\x88\xb9\x06\x63\x7c\x25\x76\xdd\xab\x90\xeb\x5e\x0d\
+\xe9\xd7\x10\xc7\x99\x42\x1c\x32\x05\x9e\xaf\x61\x38\xf6\x1a\xcb\
+\xb1\xaf\x46\x0c\xbe\xca\x76\x9d\xab\xc0\x4f\xb9\x46\x37\x8d\xa9\
+\xb6\x6b\x4f\x04\x43\x5a\xef\x59\x06\x5a\xe3\x65\xbb\x04\x04\x42\
+\x9e\x41\xd2\x64\x6a\x14\x18\xb3\x10\x05\xa9\xc0\x43\x93\x04\xd9\
+\xfb\x62\x1e\xf5\x4c\x74\x4d\xe3\x59\xcc\x54\x80\x35\x4d\xb2\x4d\
+\xe3\x3a\xd7\x75\xa7\x40\x79\x4a\xd7\x02\x68\xd0\xe7\x1b\xa0\xdc\
+\x0d\xe0\x91\x5c\x8c\x10\xde\x13\x0e\xcf\xfd\x40\x08\xa1\x1e\xcf\
+\xc9\x85\x76\x10\x80\x0e\x67\x6b\x5a\x3e\x01\xf2\x2e\x48\xe7\x72\
+\x2f\x82\xac\x37\x01\x9f\x69\xb0\xc5\xc9\x42\xe1\x0d\xbe\x41\x27\
+\x1a\xd4\xb9\x17\xb6\x6d\xff\x27\x8a\xa2\x0d\x5e\x14\x01\x20\x42\
+\x10\xf7\x0e\xb0\x29\x03\x0a\x3a\x20\x13\xb4\x25\x20\x0a\x3a\x8e\
+\xe3\x78\xe0\x07\x00\x87\xa0\x2d\x0a\x46\xc8\xb6\x0c\x94\xcf\x65\
+\x10\x71\x6d\xc4\x32\x20\x17\xcf\x32\xc5\x45\xd1\x12\x81\x63\x7f\
+\x67\xdb\xd6\x69\x70\x2b\x76\x0d\x78\x48\xb7\x43\x9d\xdb\x9a\x9b\
+\x9b\xcf\x07\x30\x1f\x41\x79\x6f\x34\x71\x08\xd9\xc4\xc6\x08\x8e\
+\xf7\x08\x8c\x3d\x0d\x19\x0e\x23\x1a\xc7\xd0\xa0\x0b\xae\x16\xc3\
+\x40\x21\xc4\x80\x5e\x38\x44\x08\x86\xa1\x86\x89\x81\x0a\xaf\x2d\
+\xa9\x01\x18\xea\x2d\xc9\x7e\x6b\xe2\x0d\x3e\x0f\x18\x1f\x35\xc0\
+\x55\x52\xd1\xae\x33\x30\xd1\xc8\xaa\xc7\xb5\x3f\xc1\xae\x09\xbd\
+\xb5\x09\x82\xf1\x84\x81\x42\x60\x38\x61\x86\x61\xc2\x60\x70\xf4\
+\xbb\x2b\x61\x30\x1c\x4a\x11\x30\xbc\x08\x18\x7a\x14\x0c\x23\x06\
+\xab\x77\x0c\x0c\x3e\x0a\xd7\xd8\x0a\xac\xd6\x0a\x18\x22\x6d\x74\
+\x6d\xce\xdf\x7b\xea\x66\x18\xfc\x6d\x52\x4f\xe8\x3d\x42\x3b\x88\
+\x12\xb4\x83\x80\xa7\x67\xd0\xe0\x65\xc0\xb9\x93\xc5\xc1\x96\x49\
+\x81\xb6\x02\x60\x34\xd4\x63\xf0\x41\x7b\x3e\xd8\x4a\xf9\x22\x91\
+\x08\x95\x59\x86\x74\x09\x64\x02\x70\x55\x2c\x40\x00\x00\x10\x00\
+\x49\x44\x41\x54\x43\x62\x3c\xe3\xa6\x1e\x07\xc8\x07\x87\xca\x01\
+\x04\x7d\x41\x20\x17\x60\xa6\x1b\x87\xfe\xbc\xa9\x6a\xf9\xa9\xbc\
+\xe2\xbb\x5a\x51\x94\x37\xe0\xda\xff\xbb\xdf\x14\x78\x52\xfc\xf8\
+\x07\x80\xcc\x62\x90\xf1\x46\x38\x9f\x79\x03\xb6\x69\x2d\x70\x3e\
+\x63\x81\x3e\x56\x03\x0d\xa4\x79\x71\xca\x85\xb6\x0f\x6d\x78\x7d\
+\x01\xd9\xbd\xbe\x81\x9c\xde\x6d\x1d\x0d\x41\xbf\x1e\x60\x51\xf9\
+\xa8\x67\x47\xbf\xaf\x03\xe5\x18\x88\x47\x21\xdc\x11\xe8\x34\xd0\
+\x05\x05\xd5\xdb\x92\xc9\xe4\xe9\xf5\xf5\xf5\x1b\xf7\x2b\x69\x6c\
+\x63\x50\x2c\xbc\xa9\x14\x1b\x45\x05\xe0\xd9\x28\x35\xfd\xbc\x42\
+\xcc\xcf\xab\xfe\x9b\xab\x4d\x01\x65\xb5\xd0\x18\xaf\x3d\x1f\x31\
+\xc6\x9e\x41\xc0\x04\xf7\x00\x09\x56\x68\x86\x1a\x29\x25\x6a\xbc\
+\x94\xa8\x01\xad\x49\xd4\x50\xe8\xaa\x4e\xf3\x72\xb9\x9c\x57\x2f\
+\x9d\x4e\x23\x49\x14\x4d\x30\xa8\x0d\x02\x0f\x15\x86\xc0\xaa\x0b\
+\x6d\x62\x1a\xa7\x84\xf1\xea\xa8\xc7\x0f\x80\xc5\x33\x4a\x38\x50\
+\xf6\x3c\x06\x30\x42\x0f\x3c\x68\x59\x6a\xe8\x54\xbe\x0c\xdc\x7e\
+\x51\xa2\xc6\x0d\xed\x7a\x40\x45\x0d\x9f\xca\x07\xde\x88\x07\x38\
+\xb4\x3e\x95\x35\x18\x0c\x52\x00\xc0\x00\x4e\xa2\xc0\x4b\x31\x05\
+\xa1\x61\xed\xa9\x54\x5f\x90\x61\x93\xe7\x03\x80\xe1\x5c\xe0\x7f\
+\x15\xc8\x71\x2f\x6c\x87\x66\x61\x8c\xe9\x37\xbe\x5d\xd0\x1d\x15\
+\xcf\xf3\xd4\x68\x84\xca\x41\xe5\x83\xf2\x9e\xec\x34\x1f\x80\x0b\
+\x09\x82\xe0\xc9\x0a\xf5\xbc\xbe\x52\xdd\x4a\x92\xe4\x7d\x43\x99\
+\xca\x4f\xfb\xa3\x69\x9a\xd7\x7f\xd8\x9e\x95\x41\xb9\x43\xa0\xad\
+\xa9\xc0\xf3\x1a\xd0\x73\x7f\x08\x7f\xf4\x8d\x11\xff\x9d\x32\xd7\
+\x51\x12\xf8\x79\xa9\xd0\x77\xaf\x7d\x78\xf8\xd1\xf2\x90\x5f\x78\
+\x6f\x06\x0d\x6c\xf2\x44\xdb\x0c\x6d\x6e\x95\x2c\xe8\x04\xa4\x93\
+\x8f\x0a\x47\xe3\x34\xa4\xcf\xe0\x15\x78\x9e\x03\x4d\xeb\x89\xd3\
+\xd5\xb9\x87\xa8\x21\x53\x43\xa7\x06\xd2\x63\x28\xd4\xc8\x68\x3a\
+\x96\xf0\x46\x4e\xe2\x1f\xba\xf6\x18\x63\x0f\x04\x31\xc6\x14\x24\
+\x10\x80\x84\x77\x28\x4c\xdb\xa0\xed\x61\x8c\x3d\x30\xa1\xa0\x44\
+\xdb\x0a\x87\xc3\x1e\x28\x81\x31\x7a\xe9\x14\x08\x7b\xfa\x40\x0d\
+\x9e\xca\x44\x01\x87\xf6\x89\x1a\x32\xf0\x2b\xc6\x18\x1f\xe3\x38\
+\xf6\x5d\x9a\xa1\xdf\x2f\x71\xcc\xb5\x00\x4c\xc7\x40\xd9\x22\x5a\
+\x6f\x53\x08\x80\xa2\x1e\xbc\xad\x7b\xa0\x8d\x6b\x00\x04\xef\x06\
+\x7a\xcb\x71\x9c\x85\xc0\x3f\x09\x6d\xd2\xef\x05\x79\x6e\x25\xb4\
+\x89\xa8\xde\x68\x48\xfb\x00\x00\x82\xa0\x4d\xea\xc5\x79\x00\x45\
+\x7f\xe3\x05\x3c\xbc\xfe\x42\x7d\x0f\x08\x68\xdf\x68\x79\xda\x6f\
+\xf0\x7e\xa8\xa7\x46\xfb\xd9\x0b\xca\x9e\x01\x20\x35\x05\xfa\x1b\
+\xdd\x90\xac\x20\xc7\xea\x22\xb4\xff\x3d\xb4\x3a\xb1\x10\xf9\xc5\
+\x35\xf0\x5b\x06\x9e\x4d\x56\x16\x4c\x38\xbc\xae\x4a\x3d\x13\x13\
+\xf2\xbd\xc9\x4e\x9f\x7b\x88\x4e\x7a\x4a\xd4\x20\xa8\xd1\xd0\x74\
+\xca\xa3\xa7\x2c\x5d\xb5\x01\x74\xa8\x61\xb9\x00\x02\x70\x6e\xa2\
+\xd9\x14\xa0\x00\x35\x18\xc6\x62\x58\x5a\x76\x23\x69\x9d\xb2\x51\
+\x83\x63\xe1\x90\x83\xca\x40\x8d\x15\x8c\x9a\x02\x8b\x03\x69\x3a\
+\x18\xa7\x01\xcf\x60\x7f\x96\x05\x71\x0b\x40\xc3\x02\xef\x03\xaa\
+\xd8\x1e\x58\x52\x39\xa8\xdc\xe0\x29\x78\x5e\x06\x05\x23\x00\x09\
+\xaf\x8f\x50\x0e\x43\x45\x3e\x14\x08\x06\x22\xa1\xf0\x10\x1e\xb3\
+\x67\x40\x3f\x6e\x83\xb4\x89\xb0\x95\xf9\x49\x7f\x18\x0c\xb6\x5a\
+\x1f\x17\x15\x15\xdd\x02\x72\x5e\x0a\x80\x71\xa5\xae\x9b\xf7\xc2\
+\x95\xf9\x3f\xe1\xc0\xfb\x73\xb8\x5d\x6b\x92\x24\x25\xad\xaa\xba\
+\x01\x0e\x9e\x23\x8a\x32\x91\x65\x1f\x01\xc0\x42\xd0\xae\x27\x2f\
+\x6c\x21\x41\x6d\xd8\x03\x59\xaa\x33\xaa\x63\xe8\xa7\x07\x36\x20\
+\x2f\xa2\xba\xa6\xe9\x20\x1f\x4d\x0b\x40\x5f\xc6\x42\xc7\xcf\xa5\
+\x69\xeb\x23\x7a\x7a\xb3\xbe\xbc\xef\xa7\xd3\xf6\x80\x60\x88\xf1\
+\x3a\xc7\xe2\xfb\xe5\x0b\xcf\x3f\x5d\x03\xdb\x0d\xf0\x80\x31\x78\
+\x5a\x82\x89\xe5\x19\x9e\xf7\xb0\x9e\x0f\x8c\xbd\x79\x97\x84\xb2\
+\x5f\x81\x01\x7d\x02\x34\x0b\x0c\x72\x36\xd0\x1c\x4a\x60\xd9\x9f\
+\x51\x82\xf4\x39\xb6\xed\xcc\x8e\x77\x77\xcf\x32\x4c\x73\x16\x1c\
+\xfc\xce\x96\x25\x69\x26\xc6\xf8\x53\x4d\xd3\xbf\x06\x30\xc8\xaf\
+\xa7\x89\xd5\xc9\x5c\x02\x7b\x8d\x41\xc2\x5a\xdb\x40\x68\xdb\x93\
+\xb3\xc7\xd8\x00\x60\x3c\xe3\x04\x00\x22\xe0\x29\x74\x83\x41\xbe\
+\x0e\xed\x3f\x67\xdb\xd6\x73\x8a\xe2\x7b\xce\x30\xf4\x67\x31\xc6\
+\xcf\x12\x82\x9e\x85\x76\x5f\x02\xef\xe0\x1f\xa6\x69\x7c\x04\x1e\
+\x41\x23\x18\xb4\x01\x5b\x1a\x0a\x8e\x9e\x77\x01\x75\x3d\x0f\x03\
+\x78\x79\x80\x44\x3d\x20\x30\x62\x10\x01\xf5\x05\x0f\x65\x3c\x44\
+\x2e\x6d\xcb\x66\x8b\x21\xfc\x49\xef\xd2\xd2\xd2\xe5\x70\x48\xfd\
+\xcf\x58\x2c\x72\x73\x36\x6b\x5f\x68\x18\xe6\xe5\x20\xcf\x2d\x00\
+\x44\x8f\x5a\x96\x49\xff\x76\xcf\x1c\x90\xad\xc1\xb6\xed\x76\x18\
+\x97\x24\x9c\x11\x69\xd0\xae\x03\xf2\xc0\xb9\xbd\xe3\xf5\x1b\xe2\
+\x5e\x7f\xa9\x1e\x2c\xcb\xf2\x00\x09\xfa\xeb\xdd\xc8\x29\x8a\xe2\
+\x6d\xbd\x0c\xc3\x00\xac\xf7\x9d\x0a\xfd\x1b\xfa\x63\x82\x82\x5e\
+\xe0\xc8\xb8\x47\xcd\x3f\x56\x12\x79\x6d\x43\x9b\x9e\xae\x7e\xbc\
+\x64\x21\xf7\xe7\x68\x60\xbb\x01\x1e\x58\xfd\x37\x7a\x32\xd1\x89\
+\x07\x06\x51\x07\x86\x71\x07\x4c\xfa\x8b\xc0\xe8\x27\x43\x38\x11\
+\x26\xfa\x04\x30\xea\xf1\x90\xee\x11\xc4\x27\x38\x96\x75\x61\x38\
+\x14\xbe\x88\x45\x78\x22\xcf\xf1\x13\x73\xd9\xdc\x44\x43\xd3\xcf\
+\xb5\x4d\xf3\xda\xda\xda\xda\xe6\x0d\x0e\x8e\xf7\xf7\xdb\xd6\x1e\
+\x06\x68\x7f\x75\x35\x68\xcb\x03\x0b\x6a\x88\x34\x1d\xda\x44\xa1\
+\x50\x78\x45\x26\x93\xba\xb2\xb4\xb4\xf8\xbc\x92\x92\xe2\x73\xc2\
+\xe1\xc0\x39\xb1\x58\xf4\xdc\xe2\xe2\xd8\xb9\x34\x9e\x4c\x46\xce\
+\x74\x1c\xeb\x2c\x8e\x63\xcf\x02\xe0\xba\x0c\xce\x55\xde\x80\x7a\
+\xdd\x00\x2e\x04\xfa\xe1\x6d\x77\x28\xf8\x50\x43\x06\xa3\xf4\xb6\
+\x70\xa0\x1f\xaf\x1d\x68\x23\x06\xe5\xc6\x99\xa9\x04\x05\xa0\xd5\
+\x72\xfc\xd4\x48\xef\xde\xc5\x6d\x55\x55\xe5\x33\x2a\x2a\xca\x1e\
+\x8f\x46\x83\x57\xb1\x2c\x73\xae\xae\xdb\xe3\x6d\xc3\xbd\xcc\xb2\
+\xec\x3b\x41\xb7\xcf\x02\x48\xbd\x0b\xe7\x63\x4b\xa0\xed\x14\xf4\
+\x93\xfe\xd1\x34\xef\xfb\x46\xb4\xef\x14\x14\xa9\x57\x44\x43\xea\
+\xbd\x51\xd0\x01\xe0\xf5\x00\x02\xd2\x78\x18\x93\x3e\x80\x2a\x87\
+\xfc\x88\x7c\x74\xdc\x29\xfd\x48\x11\xe4\xf1\xeb\x29\x00\x63\xdf\
+\x13\x2d\x84\x5b\x48\x03\x6b\xcf\xf8\x2d\xd4\xc8\x56\xc2\x16\xe6\
+\x35\xf9\xc1\xb2\x07\x89\xab\xc5\xa3\x46\x48\x09\x12\xa8\xf7\x91\
+\x02\x63\xfd\x7a\xd4\xa8\x51\x5f\xec\xb4\xd3\x4e\xb3\x20\x9c\xb3\
+\xe3\x8e\x3b\xce\x1d\x31\x62\xc4\xbc\xe1\xc3\x87\xcf\xed\xa1\x41\
+\x83\x06\xcd\xed\xd5\xab\xd7\xbc\xfe\xfd\xfb\xcf\xeb\xdd\xbb\xf7\
+\xe7\x03\x07\x0e\xfc\x0a\xe2\xf3\xfb\xf5\xeb\xb7\x14\xf8\x6c\xf8\
+\x1d\x5f\x5d\xc4\x93\xad\x47\x1e\x1a\x52\xa2\xc6\x46\x4b\xf4\x00\
+\x06\x3c\xe3\xae\xae\x4e\x07\xc0\x61\xbd\x37\x50\xf4\xc7\xa3\x15\
+\x15\x15\xdd\x70\x0e\x52\x07\x67\x3f\x7f\x05\x3e\x97\x81\x11\xbf\
+\x05\x06\x9b\xa5\xdb\x2e\x08\x11\x35\x2e\x30\x72\x0f\x84\x28\x6f\
+\xf0\x48\xe8\x9f\xb0\xf0\x3c\x0a\xe0\x5d\xae\x28\xbe\x43\x57\xb4\
+\xb4\x6c\xf0\xef\xdd\x50\xd9\xbe\x4f\xd0\x1e\x0b\xe4\xcf\xb4\x66\
+\x7e\x70\x5e\x14\x8b\xc5\x32\x55\x55\x25\x5f\x96\x56\x14\xbd\x51\
+\x52\x12\xbb\x1f\x40\xe7\x12\x38\xe7\x39\x0f\xf4\x7e\x39\xe8\xfb\
+\x29\x90\x73\x21\xf4\x51\xa7\x32\xd1\xed\x95\x02\xde\x0d\xbd\xe1\
+\xa2\x71\xc8\xf7\x3c\x34\x1a\x67\x61\xfb\x49\xfb\x00\xf5\x58\xc7\
+\xb6\x46\x7f\x5f\x86\xd5\xcf\xab\xf6\x5a\x1b\x04\x9e\xd5\xe5\x21\
+\x02\x20\xbc\x49\xe5\xa1\xca\xea\x77\x21\xb2\x71\x1a\xd8\x6e\x80\
+\x07\x26\x2a\x5c\x1e\xb9\x9e\xcb\x0e\x46\xe1\x69\x07\x26\xad\xe7\
+\xce\xd3\x09\x4c\xd3\x7a\x08\x26\x1e\x35\x48\x7a\xad\xea\x7a\x05\
+\xb7\xf8\x87\xeb\x01\x01\x6d\x86\xca\xd4\x43\xf4\x19\x56\x74\x7a\
+\xa6\xb3\x5a\x4e\x2a\x1b\x00\x03\x0b\xa0\xb1\xca\xa4\x68\xa1\x0d\
+\x10\x18\x6f\x0b\xd4\x7b\x0d\xa8\x8d\x1a\x34\xd4\xf5\xce\x51\x28\
+\x6f\x5a\x95\xf6\x1f\xb6\x62\xde\xaa\x4f\xe3\xd4\x13\x62\x59\xae\
+\x4a\xe4\xb8\x5d\x69\xfe\x9a\xd4\x45\x48\x20\xa3\xeb\x03\xa0\xee\
+\xe0\x44\x36\x3b\x2c\x95\xca\xef\x94\x48\x64\x76\x4f\x75\xe7\xf6\
+\xcb\x64\xf2\x63\x73\x69\xf5\x84\x6c\x56\x3f\x25\x97\x33\x4e\xe5\
+\x82\xc2\xa9\xcd\xcd\x9d\xa3\xd6\xac\xbf\xae\x78\x49\x49\x49\x3b\
+\xd0\xdb\x00\x42\x97\x83\x8c\x53\x40\xc6\xb9\x7e\xbf\xdf\x82\x36\
+\xbc\xe2\x00\x44\x9e\x37\x06\x63\xe8\xc9\x4d\xc7\x89\x82\x10\xcd\
+\x84\x32\x98\x17\xf8\x12\x1a\x5f\x37\x71\x88\x65\xe9\x97\xa7\x89\
+\x37\xf6\x54\xb7\xb4\x3e\xb4\xe3\x15\xa7\x71\x9a\xd6\xf3\x0c\xba\
+\xf1\xb6\x7b\x5e\x66\xe1\x63\x8b\x69\x60\xbb\x01\x9e\x75\x69\x90\
+\x4e\xba\x75\xa5\xd3\x34\xc8\xb3\x05\x41\x30\x69\xfc\x17\x20\xb2\
+\xbe\x36\xe8\xea\x0e\x5e\x80\x67\x34\x14\x10\xc0\x28\x11\x9c\xeb\
+\x80\xdd\x39\xce\xfa\xea\xac\x2b\x1d\x0c\x2a\x09\xc6\xa5\x51\x60\
+\x81\xca\xc0\xc3\x46\xd4\x90\x29\x3f\x00\x26\xcf\xb0\x21\xdf\xdb\
+\x76\xd1\x76\x44\x81\xf7\x63\x4c\xd6\xfa\x02\x24\xe8\x44\x10\x55\
+\x75\x5f\xcb\x34\xa6\xe5\x0d\xed\xd5\xb0\xdf\xff\xaa\x24\xf1\xaf\
+\xc2\xb9\xd6\x4b\xa2\x22\xbe\x20\x08\xe2\x33\x80\x88\x4f\xf0\x1c\
+\xf7\x28\xd0\x43\x1c\x2f\xdc\x19\x89\x84\x8e\x69\x6a\x6a\x92\xd7\
+\x25\xd3\xba\xd2\x22\x91\x08\xfd\x42\xe2\x73\xb0\x05\x4b\x50\xc0\
+\xa1\xb2\x52\x39\x29\xd1\xb8\x69\x9a\x1e\x48\xf7\x80\x05\xc8\xcc\
+\xa8\x79\x6d\xbd\x20\x0c\x8a\x25\x8c\xe7\x4b\xae\xab\x35\xe4\xe9\
+\x15\xfa\xe5\xf5\x9f\x86\xd0\xae\x2b\x8a\xe2\x2f\xb4\xe0\xa0\xed\
+\xf6\xb5\xdd\x00\x0f\x4c\x54\x98\x83\xdf\x8d\x33\x9d\x64\xf4\xa9\
+\x27\xa4\xf1\x35\x09\x26\xf4\x5a\xe5\xd7\xcc\xdb\xac\x71\xef\x8c\
+\x67\x15\xc7\x75\xc9\x42\x81\x81\x1a\x1c\x35\x3c\x90\x09\xf1\x3c\
+\x4f\xff\x84\x27\x3d\x07\xf9\x11\x73\x5a\xc5\x6f\xcd\x4f\x30\x62\
+\xfa\x87\xd2\xa3\x94\x07\x05\x1f\x9a\x47\x79\xd2\x38\xdc\x86\x79\
+\x37\x4b\x60\x74\x88\x6e\xb9\xc0\xdb\x80\x33\x16\x8b\x55\x14\xff\
+\x5a\xf3\x03\x74\x68\x06\x14\x45\x8f\x04\x82\x83\xc3\x81\xd0\x70\
+\xdb\xb1\x87\x00\x8f\x7e\x2c\xc7\x54\x33\x2c\x2a\x03\xa0\x8a\x20\
+\xec\xfa\x5c\x62\x8b\x40\x98\x20\x87\x83\xb3\xa6\x3d\x64\x39\xd4\
+\x8b\xb6\xb7\x31\x04\x6d\x58\x40\xcb\x59\x96\x4d\xc0\xd9\xd4\x5a\
+\x20\x43\xe0\xe4\x9c\x12\xe4\x7b\x80\x41\x65\x07\x50\xc6\xb2\x2c\
+\xad\xf7\x10\x9f\x87\x46\x09\xf8\x72\x10\xac\xf3\x0d\xed\xf4\x6c\
+\x2f\x3d\xaf\x92\x1e\x72\x43\x9a\xb5\xce\xc2\x85\xc4\xcd\xa6\x81\
+\xb5\x26\xd6\x66\xe3\xba\x95\x32\x82\x09\x4b\x80\xbc\x49\xfb\x63\
+\x22\xf6\x94\x01\x83\x67\x7f\xac\xdc\xa6\xe6\xad\xbf\x3c\xb3\x5a\
+\x26\x6a\x58\x6b\x96\x03\x19\x3c\x2f\x04\xb6\x14\x1e\xe8\x00\x38\
+\xb8\x10\xb7\xc1\x33\xd0\xd6\x2c\xb7\xbe\x38\xf0\x63\xe1\xe0\x76\
+\x14\xf0\x39\x0e\x8c\xb4\x1c\x42\xef\x2c\x07\xe2\x60\x8e\xc4\xbb\
+\xa2\x16\x04\xc1\xfb\xee\x0c\xac\xf4\x08\x00\x0a\x40\xc7\x44\x00\
+\x2a\x96\x6d\x9b\xeb\x3a\x47\xfa\x12\xda\xfa\xca\x71\x1d\x1b\x64\
+\x41\x94\x0f\x25\x0a\x02\x94\x37\x25\xfa\xdc\x43\xb2\x2c\x8f\xe4\
+\x38\x74\x78\x57\x57\x57\x00\xea\x6d\xf0\x0d\xf2\x4a\x00\x8e\x7d\
+\x81\x62\xf4\xda\x1c\x42\x4f\x4e\xca\x9f\x8e\x0b\x95\x8f\xa6\x51\
+\x46\x34\x0d\xb6\x9d\x8e\x61\x5b\xf4\x6f\x36\xd3\xa4\x1f\x10\xf0\
+\x03\xdc\xa1\xbf\x95\x58\xfb\x00\x99\x16\x84\x3c\xaf\xaf\x54\x66\
+\xd0\xa9\x07\x3c\xf4\xfc\x0b\xf4\x51\xb9\x7c\xf9\xf2\x01\x8d\x8d\
+\x8d\x43\xea\xea\xea\x86\x2c\x59\xb2\x64\xd0\xe2\xc5\x8b\x07\x36\
+\x34\x34\x0c\xfa\x3e\x2d\x5d\xb1\x74\x30\xa5\x25\x90\xb7\xb8\xbe\
+\x7e\xe0\xe2\xfa\xc5\x03\x69\xd9\x45\x8b\x16\x0d\xa0\xe1\xd7\x5f\
+\x7f\x4d\xeb\x6e\x54\xdf\xa9\x4c\xdb\x0b\x31\xdb\x4b\x47\xd7\xd7\
+\x4f\x3a\xf9\xd6\x91\xe7\x01\x14\x4c\xf0\x2d\xae\x9f\x35\x1d\x9e\
+\x75\xc8\xe1\x81\x0d\xf5\x42\xc0\x18\xbc\xed\x00\x1c\x16\x5b\xb2\
+\xac\xc8\xed\xed\xed\x15\xad\xad\xad\xf4\x17\xe8\xfe\xa6\x26\x22\
+\x43\x3f\x28\xd1\x3f\x49\x2a\x83\x07\x53\x04\x37\x3e\x7d\x60\x5b\
+\xb2\x0b\x18\xe7\x04\xc8\x7b\x1a\xfa\xb2\x0f\x18\x2d\x4f\x8d\x8c\
+\x7a\x51\xb0\xaa\x7b\x46\x67\x39\x36\x72\x11\x38\x77\x74\x3f\x02\
+\x64\xda\x16\x62\x38\x16\x09\xbc\x90\xc4\x0c\xd7\x82\x7e\xf8\xea\
+\x02\x57\xeb\x43\xc7\xb2\x09\xcf\x72\xe0\x2d\x58\xe0\x95\x00\x0f\
+\xd7\x86\x92\x74\x87\xb2\x8a\x08\x71\xbc\x74\xc3\xd0\xfc\xa1\x50\
+\x60\x02\x6c\xe7\x4e\x81\x43\xe2\x20\x14\xfa\xd1\x37\x80\xd9\xef\
+\x01\xb4\x4e\x03\x10\x8c\x30\x0c\x43\x3d\x3b\xe0\xe3\x7a\x44\x81\
+\x07\xfa\xe3\x81\x1d\x65\x02\xa0\x63\x49\x92\xd8\xc5\x30\xdc\xdb\
+\xf4\x79\x9d\xc4\xd1\xce\x51\xec\x82\x3e\x42\x01\xd0\x05\x7c\x7e\
+\xf7\x06\x60\xf4\xc0\x17\xda\xf3\xbc\x3d\xd0\x2f\xfd\x79\xcc\xe9\
+\xa0\x9f\xd7\x41\x57\xaf\x82\x87\x39\x1d\x74\x3f\x1d\xda\x9a\x0e\
+\xf2\xbc\xfc\x2d\xbd\x04\xf9\xd3\x28\xf1\x58\x78\x91\xc3\xc2\x0b\
+\x22\x83\x5f\x10\x58\x66\x9a\xc0\x48\x2f\x72\x02\x4f\xe9\x25\x86\
+\x63\x5f\x92\x14\xe9\x55\xcd\xd0\x8e\x9a\x39\x73\xe6\x46\x6f\x37\
+\xbf\x93\x6e\xdb\x8d\x6d\x71\xc3\xda\x5a\x54\x07\x13\x86\x82\xc9\
+\xaa\xd9\xf7\xad\x50\x6b\x4e\x42\x3a\xa9\xbf\x4d\xa6\x81\x57\x0e\
+\xea\xfc\x22\xfa\xc1\xcc\xda\xcd\x50\xb9\x28\x51\x41\x28\x81\xd1\
+\x7a\xb7\x39\x54\x46\xf0\x5e\xe8\x77\x58\x86\x89\xa2\x3c\xc3\xe7\
+\x0b\xcc\x15\x04\x71\x8e\xdf\x9f\x9d\x9b\xc9\xe4\xe6\x66\xb3\xf9\
+\xcf\x81\xe6\x22\xc4\xcc\xb1\x6d\xf7\x43\xcb\x72\xff\x0f\x0c\xf9\
+\x5e\xd8\x3a\xed\x00\xf5\x78\x6a\x5c\x94\x2f\xe5\x43\x43\x16\x6e\
+\x86\x28\x08\x81\x81\x51\xcb\xf4\x80\x4d\x10\x04\x02\xa0\x05\x80\
+\x62\xd7\x2b\xa2\x08\xbc\xa8\x04\xdf\x11\xd4\x75\x00\x08\x5f\x01\
+\x5e\x2d\x10\xa7\x68\xe3\xd5\xa5\xfc\x28\x41\x9a\xe7\x39\xd0\x90\
+\x3e\x03\x50\x30\x00\x80\x95\x00\x7a\x37\x81\x11\x3f\x08\x72\x1c\
+\x00\xe9\xa1\xef\x38\xae\x8a\x81\x9c\xb5\x40\x93\xd3\xe9\xf4\xbd\
+\xb0\xc5\xda\x09\x42\x1b\x8c\x9d\x81\xb2\x5e\x81\x1e\x7e\x00\x4a\
+\x1e\xf0\x80\xec\xf4\xbf\x78\x98\xa6\x61\x7d\x14\x0d\x06\x3f\xf2\
+\x0a\xad\xe7\x03\x7f\xab\xde\x1e\x5e\x3d\xc5\xe8\x33\xb4\xe9\xc9\
+\x4f\xfb\x0c\x32\x52\xcf\x0f\x8e\xb1\xd4\x6a\x68\x6f\x18\xe8\x86\
+\xd2\x50\x68\x73\x38\xc4\x47\x80\x57\x34\x8a\x12\xd4\xd9\x01\xca\
+\xef\x00\xde\xd1\x0e\x10\x1f\x65\xe8\xfa\x0e\x1a\x90\xae\x69\xf0\
+\xac\xed\x08\x65\x76\x80\x3e\x8f\xa0\x75\x6c\xdb\xe9\x1b\x08\x04\
+\x8a\xa0\x4f\xdf\x4a\xd1\xd3\xfa\xf6\x1d\x6e\x6f\xca\xa0\xe0\xb3\
+\xd6\x88\xd3\xc9\xb7\x56\xc2\xaa\x07\xfa\x6f\x69\xd0\x2f\x05\x3c\
+\xd0\x24\x05\x3a\xea\x2a\x40\x74\xed\x37\x4c\x60\x6f\xb5\xa7\x46\
+\x01\xc6\x40\x65\x12\xc1\x20\x65\x30\xe2\xde\x90\x36\x58\x92\xe4\
+\xc1\xb2\x2c\x0d\x01\x20\x18\x02\x69\x83\x81\x68\xd8\x07\xf2\xaa\
+\x30\x46\x11\x30\x50\x06\x0e\x77\xe9\xb9\x10\xca\x66\xb3\x1e\x2f\
+\x8c\xb1\xe7\x49\x61\x8c\xbd\x6d\x1c\x28\x05\x19\x96\x85\x44\x49\
+\xb6\xa1\x3d\x02\x75\xba\x78\x91\x7f\x43\x14\xc5\xf9\x6b\x4b\xb3\
+\xea\x09\x80\xec\x2b\x88\xfd\x19\xf2\x09\xb4\xb3\x96\x57\xd2\xa3\
+\x4f\x1a\x52\x82\x72\xb4\x5d\x7a\xbd\x1e\x96\x65\xf9\x64\x30\xc0\
+\x57\x00\x54\x3e\xce\x64\x32\x6f\x83\xf1\xbe\x0c\x40\xf4\x2a\xd0\
+\x87\x00\x66\x1f\x43\xf9\x3b\x25\x49\x1a\x06\x5b\x2c\x1e\xca\x49\
+\x50\x0e\xd3\xfa\x18\x7b\x81\x07\x10\x20\x1b\xdd\x2a\x82\xd7\x27\
+\xd3\x2f\x45\xd6\x71\x2c\x7b\x25\x2d\xb3\x3e\xe2\x56\xfd\x1d\x26\
+\xaa\xdf\x75\x16\x81\x36\xbd\x43\x76\xe8\x93\x07\x68\x00\xc2\x70\
+\xb6\xa5\x30\xe0\x4d\x7a\x3a\x02\x60\xf1\x40\x1f\x64\xa5\xa0\x84\
+\x00\x6c\x3c\x02\x79\x31\xc4\x29\xd1\x1f\xb2\x52\x62\xe1\x99\xa1\
+\x04\x65\x59\x20\x1e\xc8\xf1\x07\xfc\xd0\x3d\xd5\x80\xc5\xc3\x03\
+\xe9\x75\x0a\xf1\x6b\x26\xfe\x4a\x6d\x6f\x37\xc0\x03\x13\xec\x7b\
+\x93\x8f\xda\x39\x25\xd8\xfb\xc3\xbc\x26\xdf\x92\x0b\x9e\x39\xc4\
+\x1d\x84\x21\xf2\x0b\x0c\xca\x2a\xb9\x30\x71\x31\xe3\xc9\xe7\x12\
+\x10\x64\x8d\x76\xc1\xb0\xbd\x2d\x11\x8b\x19\xf0\x42\x1c\xcf\x2b\
+\x01\x63\xa0\x93\x9c\x7a\x3e\x60\xd4\xe9\xd5\x94\xcf\x67\x3d\xe3\
+\xd0\x75\xd5\x33\x16\xd8\xe6\x78\xdb\x87\xa2\xa2\x22\x2f\x1d\x31\
+\x18\x09\x92\xe8\x6d\xad\x72\x6a\x1e\xd1\xa6\xb2\x79\x0d\xd2\x64\
+\x24\x08\x92\xa5\xe9\x06\xf1\x29\x81\x7c\x2e\xa7\xfd\x4d\xcf\xfb\
+\x9f\x5d\x43\x8c\x1f\x44\x31\xc6\x0f\x83\x37\xf3\x1c\x95\x0f\xc0\
+\xc0\xa0\xbc\x1d\x10\x9d\x12\xe5\x0b\xf9\x5e\x1d\xc8\xf3\x42\x30\
+\x42\x36\x9d\xcd\xe0\x54\x26\x1d\x80\xb4\x61\x8a\x24\x1f\xc4\xb3\
+\xdc\xf1\x02\xc7\x1f\xcb\x62\x66\x0f\xa0\x12\x00\x23\x1e\xfa\x86\
+\x41\x27\x7c\x5e\x53\xb1\xa4\xc8\x08\x61\x16\x79\xbc\x09\x8c\x0c\
+\x46\x8e\x28\x4b\x6a\x20\x14\x34\x20\x6f\x25\x80\xc4\x64\x00\xb3\
+\x1f\xfd\x33\xad\x70\x4a\x0c\x35\x31\xf4\x99\xf1\x06\x1b\x13\x06\
+\xc1\xa9\x37\x10\x83\xe8\x0b\x64\xf9\x56\x57\x06\xe8\x40\xf0\x74\
+\x0d\x1e\x0b\x0a\x85\x42\x08\x10\x03\x61\x8c\x3d\x82\x45\x08\xf5\
+\x10\xad\xd3\x43\x1c\xc3\x22\x4a\x20\x3f\x62\x10\xf6\x08\xc1\x0b\
+\x63\x8c\x08\xc6\x2c\xe8\x14\xcb\xa2\x48\x6a\x6b\x6b\x0d\x48\x2e\
+\xbc\xbf\xd5\x00\xf3\x6d\xb8\xcd\x07\x8e\xe3\x12\xd8\x73\x3b\xb4\
+\xa3\xf4\xfc\x81\x81\xd9\x47\xe8\xb9\x04\xd8\x3b\x4c\x10\xa4\xc3\
+\xd9\x06\x07\x46\xa9\x59\x36\xc2\xbc\xe0\x58\x08\x23\x1b\x63\x4c\
+\xcb\x6f\x49\x72\x5d\x97\x18\xa6\x45\x78\x41\x74\x30\xc7\x7b\x13\
+\xdf\x76\x08\x02\x6f\xc2\x5b\xe1\x09\x72\x10\xc7\x33\xc8\x25\x36\
+\xe2\x58\x8c\x38\x06\x83\xd1\xb8\x5e\x88\x5c\x07\x8c\x01\xad\x26\
+\xb8\x55\x02\x51\x5d\x8f\x68\x9c\x12\xdd\xc5\x39\xd0\x1b\x16\x78\
+\xd0\x3f\x39\xed\x00\x3f\x4a\x2e\xf4\xdb\x22\xae\xcb\x8a\x92\x69\
+\xbb\x90\x88\x59\x0e\xce\x4b\x32\xa6\xe5\xbc\x20\xf2\xec\x9d\xc5\
+\xc5\x78\x83\x7f\x97\x07\x0c\xf1\x7c\x8c\xf1\x74\x51\x92\x38\x87\
+\x63\x1c\x87\xc3\x8e\x06\xb7\xfc\x0e\x66\x10\x01\x13\x44\x2e\x46\
+\xa6\x6e\x21\xbf\x12\x40\xba\x69\x20\x02\x85\x81\x58\xf0\xaa\x50\
+\x26\x11\x47\x99\xae\x2e\x94\x4f\xa4\x90\x9a\xc9\x22\xdb\xb0\xa1\
+\x4f\x3c\xc8\xce\x20\xda\x7f\x86\x13\x90\x45\x10\xa2\xd6\x6a\x62\
+\xec\xc8\x81\x60\x9e\xb0\x9c\x29\x48\x0a\xc6\x2c\xbf\x2c\x9b\x57\
+\x2f\x04\xd0\xf9\x1f\x54\xf8\xd1\x37\xe1\x38\xe2\xb0\x0c\xe1\x65\
+\xc5\xd1\x4d\x1b\xf1\xac\x80\x5c\x03\xf4\x86\x58\x2f\x4e\x1c\x17\
+\xb1\x60\x05\x94\x10\x71\x90\x2c\x4a\x10\xb8\x08\xa6\x07\xe4\x73\
+\x88\x01\x05\x82\xd8\xab\xdb\x20\x18\x21\x4a\x08\xb3\x5e\x1a\x46\
+\x2e\x62\x5c\x07\x6c\xbb\x6e\x05\x00\x00\x10\x00\x49\x44\x41\x54\
+\xb1\xc4\x45\x1c\x22\x10\x22\xaf\x2e\x81\x7c\x18\x53\x9b\x13\x44\
+\xec\x50\x5d\xa0\xc2\x6b\x4d\x0d\x80\xca\xd7\x7c\xdc\x76\xe3\x36\
+\xa1\xc0\x23\xd8\x70\x98\xea\x80\x3b\xec\x75\x94\xe1\x58\xf0\x22\
+\x08\x78\x11\x0e\x18\x39\x46\xaa\xaa\x23\x51\x90\x91\x24\x2a\xc4\
+\xd0\x2d\x97\x10\x9e\x78\x05\xb7\xe0\x87\xeb\xba\x84\x17\x45\x02\
+\xe7\x01\x8e\xed\x38\x96\xe4\x53\x10\xf5\x22\x52\xa9\x14\xc8\xe6\
+\x80\x11\x3a\x5e\xe8\x50\x83\xfe\x96\x6c\x98\xe8\xf4\x99\x86\x04\
+\xac\x60\x6d\x22\x5e\x5f\x08\x59\x15\x82\x95\x22\x55\x37\x10\x80\
+\x0b\xe1\x58\xc1\x31\x4c\xdb\x21\x88\xa1\x3f\xd2\x04\xef\xc1\xc7\
+\xc0\xd6\x0c\x76\x2b\x8c\xad\xeb\xc6\x62\xd3\x72\xaf\xd7\xf2\xec\
+\xd5\x70\xc0\xda\xb0\x31\x5d\xc6\x18\x3b\x60\x98\xa7\x81\x92\x6e\
+\xf3\x89\x4a\xb7\x24\xca\x04\xb6\x4a\x2e\xc3\x73\x96\xae\xeb\x04\
+\xf2\xa9\xec\x04\x0e\xac\x89\xec\xf3\x21\xcc\x32\xc8\xb6\x6d\x0f\
+\x5c\x59\x96\x45\x3d\x84\x31\x46\x20\x07\x72\x5d\x17\x61\x30\x74\
+\x17\x8c\xdb\xb2\x5d\x30\x65\xc6\x86\x2d\x8a\x09\xdd\xb5\x31\xbc\
+\x4a\x8b\x8b\x53\xd0\xb9\x7f\xe6\xf2\xb9\x33\x8b\xc2\xe1\xf7\x37\
+\x46\x46\x28\x43\x6c\xd7\x75\x1c\xe2\x5a\x1c\x2f\x12\x3a\xf6\x0c\
+\xc3\x21\xc3\x34\x3d\x4f\x07\xc1\x0a\x04\xf2\xbb\x04\xe0\x03\x08\
+\x30\x02\xaf\x45\x04\x23\xef\x99\x61\x79\x87\x13\x78\x07\xe6\x87\
+\x2d\x48\x8a\x25\x2a\xb2\xa9\xf8\x02\x7a\x30\x14\xd1\x02\x40\xc1\
+\x60\x58\x0f\x04\x42\xe0\x89\xf9\x0d\x51\x52\x4c\x46\x10\x35\xc2\
+\xf1\x79\xcd\xb0\xa0\x75\x40\x24\x10\xa4\xf0\xfe\x4e\x03\xcc\x77\
+\xd1\x6d\x3b\xc6\x0a\xb2\x08\x53\x59\x08\x17\x15\xe3\xaa\x5e\xbd\
+\x6d\x4e\x54\x2c\x59\x09\x9a\xb1\x70\x89\x19\x0b\x46\xcd\xd2\x70\
+\x89\x15\x51\xc2\x96\x4f\x94\x1d\xc7\xb0\x14\x8e\x70\x01\xc6\x01\
+\x2b\xd8\xc2\x6a\xc9\x8b\x22\x87\x58\x2c\x73\xa2\xa0\x80\xd1\x02\
+\x08\xb0\x0e\x18\xae\x5b\x59\x5d\x45\x82\xe1\x10\xf1\x07\x81\x02\
+\xab\x09\xf9\x02\x7e\xe4\x0f\x06\x80\x42\xc8\xe7\x0f\x22\xc5\x17\
+\x02\x0a\x23\x59\x09\xad\x87\x82\x28\x56\x54\x8c\x14\x25\x80\x39\
+\x4e\xc2\xa1\x40\xd8\x95\x45\x9f\x25\x0b\x52\xc6\xd4\xcc\x06\x62\
+\x3b\xef\x99\xb9\xfc\x0d\x2c\xcb\x9f\xe0\x13\xd8\xbf\xc4\x62\xf8\
+\xbb\x2b\xf4\x8d\xe8\x3b\xe0\x81\x05\x93\xe8\x06\x00\x94\xa3\xc1\
+\xe7\x79\x4a\xc0\x78\x99\xcc\x71\x06\x5c\xf7\x3b\x81\x90\xdf\x0d\
+\x47\x23\x2e\xb0\xb1\x01\x4c\x0d\x86\x61\x0c\x9f\x5f\x36\x7c\x01\
+\xc5\x00\x77\x42\x17\xfd\x8a\x81\x05\xce\xe0\x65\xf0\xba\xb0\x63\
+\x3a\xd8\xa1\x67\x37\x0e\x78\x32\x44\x10\x39\xec\x93\x45\x46\xe0\
+\x18\xab\xac\xa4\xa8\xd9\xb5\x9c\x69\x9a\x6a\x5e\x90\xb4\xba\xce\
+\x2b\x89\x44\xbe\x00\x9e\x1b\xf5\xc6\x80\xbc\x98\xb8\x7e\x41\xe0\
+\x84\x58\x59\x91\x15\x8a\x86\xec\x48\x49\xd4\x2a\x2a\x89\x99\x81\
+\x48\xd8\x08\x44\xa2\x46\x30\x1a\x33\x81\x68\xb8\x9a\x42\xb1\x22\
+\x03\x48\x0f\x86\xa3\x1a\x90\x1a\x08\x47\x54\x25\x14\x56\x7d\x40\
+\xfe\x40\x28\x0f\x94\x53\x02\x21\x15\xcb\x3e\x8d\x55\xfc\x2a\xe7\
+\x0b\x69\xbc\x3f\xac\x4b\xa1\xa8\x21\x05\xa3\xd0\x47\x98\x4b\xfe\
+\x90\x14\x0c\x45\x25\x51\x94\x85\x8d\x12\x76\x3b\x2a\x04\x73\x66\
+\xfb\xe8\xad\x63\x39\x0b\x79\x4e\xfa\x5f\x6b\x4b\xfb\x7f\x13\xa9\
+\xdc\x0c\x96\x17\x3f\x50\x0d\xeb\x03\xc3\x54\x3f\x80\x83\xc2\x0f\
+\x10\x22\x1f\xd8\x96\xf5\xa1\x63\xda\x1f\xe6\x73\xb9\x8f\xe1\x9c\
+\xe4\x73\xc7\x31\x37\xb8\xdd\xf8\xb9\xda\x0b\x39\x8e\x9b\xd7\xf2\
+\x0b\xe3\xa9\xf8\xc7\x99\x7c\xf6\x03\x96\x13\xfe\x87\x58\xe6\x7f\
+\x6d\x1d\x9d\x33\x4c\xdb\xfe\xaf\x66\xd8\x33\x74\xd3\xfc\x2f\x6c\
+\x01\xff\xab\x9a\xd6\xfb\x10\xbe\x0f\xab\xe8\xfb\xaa\x69\xce\xd0\
+\x4c\xeb\x03\x58\x52\x3f\xcc\xa9\xc6\xc7\x79\xcd\x02\x32\x3f\xce\
+\xa9\x94\xf4\x8f\xb3\x2a\x90\xae\x7f\x9c\xce\xa9\x33\x32\x39\xed\
+\x1f\xb0\x83\x7c\xde\x30\xad\x07\x75\xd5\xbe\xde\xb1\xd1\x59\xa9\
+\x74\xfe\x18\x47\xb7\xc6\xe6\x92\xdd\xa7\x84\x02\xbe\x3f\x47\xfc\
+\x02\x3d\x30\xfe\x49\xdd\x01\xe3\x26\x0a\xcf\x7f\x2c\xb1\xfc\x25\
+\xe9\x4c\xf6\x48\x82\xc9\xd9\xb6\x63\xdf\x9d\x83\x76\xf3\x79\xf5\
+\x1b\xd1\xa7\xb4\x88\xa2\x94\x01\x60\x55\x19\x96\x37\x14\x9f\xdf\
+\x0a\x84\x42\x2e\xa7\x48\x84\xf3\x2b\xae\x1c\x0c\x58\xfe\x70\x48\
+\x0b\x46\x23\x29\x87\x41\x6d\xe0\x65\x2c\x03\x6f\xe8\x53\x9e\xe7\
+\x9f\x32\x0d\xe3\xd2\xae\x8e\xc4\x89\xd1\x50\xe0\x82\xa0\x4f\x7c\
+\xb3\x57\xb8\x57\x72\x53\x84\x54\xb3\xd9\x14\x80\xe2\x4c\xcb\x32\
+\xdf\x03\x2f\xf2\xbf\x06\x43\xde\x8b\x67\xd3\xef\x9a\xae\xfd\x2e\
+\x2f\x0a\xef\x5a\x2e\x7a\xdf\x24\xf8\x3d\x93\x10\x4a\x10\x27\xef\
+\xc3\x16\xef\x3d\xa0\x77\x81\xde\x43\x9c\xf0\x9e\xc3\x09\xef\x13\
+\x8e\x7b\x9f\x30\xdc\xbb\x0e\x83\xdf\x73\x30\x7e\xcf\x46\xb4\x9e\
+\xfb\x1e\x62\xd8\x77\x09\xcb\xbd\x67\x21\xfc\xae\x49\xd0\xbb\x3a\
+\x00\xb9\x6a\xdb\xef\x65\x4d\xf3\xbf\x29\x55\x9b\xd1\x9d\x49\x7e\
+\x94\x51\xf3\x8d\x9b\x22\xf3\xf6\x50\x76\xbb\x01\x1e\x62\xa9\x2f\
+\x76\x67\xf4\x73\x64\xce\x77\xaa\x6b\xa0\xd3\x1a\xdb\x52\xa7\x21\
+\x8b\x3d\x23\x9d\x4e\x9d\x25\xc9\xdc\x99\x2d\xad\x8d\xa7\x77\x27\
+\xda\x4f\x6d\x6d\x6f\x3c\xc5\x30\x72\xc7\x66\xb3\xf1\x9b\x77\xd8\
+\x61\xf0\x8f\x1e\x5c\x6e\x8e\x09\x52\x52\x52\x92\x93\x6c\xdf\x34\
+\x5d\x43\x67\xc2\xe6\xe8\xb4\xb6\xae\xf4\x19\x5d\x71\xf5\x0c\x98\
+\xdc\x67\x66\x54\xed\xac\x7c\x5a\x3b\x33\x6b\x18\x67\x65\x35\xf5\
+\xac\x6e\x5d\x3b\xbb\x4b\x53\xbf\xa5\xfc\x99\x5d\x5a\xee\xf4\xee\
+\x74\xf6\xb4\x7c\x26\x73\x4a\x3c\x93\x06\x5a\x15\x76\xa7\x33\xa7\
+\x74\xa7\xd2\xa7\x74\xab\xe9\x53\xe2\xe9\xec\x99\x9a\xa9\x5d\xd8\
+\xdc\xd1\x74\x75\x3c\x67\xdd\x16\xef\xca\x3d\xda\xb2\x12\xbd\x5e\
+\x14\xf6\xbf\x1f\x8d\xfa\xbf\x29\x2b\x2b\xeb\x04\xe0\x70\x36\x47\
+\x5f\x80\x8f\x5a\x1e\x8b\x2d\x14\x10\xfb\x77\x53\xd7\xee\x4c\xea\
+\xf9\x09\x89\xbc\x7e\x42\x32\x95\x3d\x61\x45\x53\xeb\x39\x9a\x6e\
+\x5e\x9a\x48\xa6\xa7\x34\x77\x76\xde\xb4\xa2\xbb\xf3\x8e\xce\x74\
+\xea\xae\x44\x2e\x7f\x57\x73\x47\xc7\x6d\xed\xf1\xc4\x0d\xdd\x89\
+\xd4\x45\xe9\x8c\x7a\x6a\x2e\xab\x1f\xa7\x6a\xda\x69\x1d\x4d\xc9\
+\x29\xb9\x64\xf2\xb9\xea\xf2\xa2\x39\xc0\xfb\x27\xc9\xd8\xaf\xaa\
+\x6a\x29\x80\xf5\x0d\x04\x31\xa7\x5b\xb6\x73\x06\xec\xa9\x4e\x17\
+\x7c\xbe\xb3\xb3\xba\x7e\x5e\x56\x55\x2f\x48\xd9\xc6\xf9\xba\xa1\
+\x9f\x9f\x34\xf4\x0b\x28\xa5\x4c\x63\x7c\xca\x32\x26\x00\x5d\x48\
+\x29\x61\xa8\x17\xa5\x81\x92\x40\x69\x53\xbf\xd8\x23\x4b\x9f\x0c\
+\xe7\xf0\x93\x0c\x13\x4d\xd6\x34\xe7\x92\xbc\xea\x4c\xd6\x0c\x77\
+\x92\x6e\x92\x89\x8e\xab\x5d\x48\x1c\xf6\x7c\x64\x6b\xe7\xe8\xc8\
+\x3a\x33\xa1\xe6\xce\xc9\x74\xb7\xbe\xb5\x39\xf4\xbb\x2d\xf1\xd8\
+\x6e\x80\x67\xc4\x88\x11\xc9\xdd\x77\x1c\xd4\x3a\x7a\xf4\x90\x36\
+\x4a\x7f\xdc\x7d\xc7\xd6\x51\xa3\x06\xb6\xec\xb2\xcb\x2e\x4d\x70\
+\xe3\xd0\x3c\x66\xcc\x98\x96\xdd\x77\xdf\xbd\x75\xdf\x7d\xf7\x6d\
+\x19\x3d\x7a\x74\xdb\xde\x7b\xef\x9d\xfa\xa5\x06\xba\x57\xaf\x70\
+\x72\x64\x6d\x55\x73\xbf\x8a\x8a\x95\xc3\xfb\x57\x36\x0d\xeb\x57\
+\xb1\xb2\x6f\x45\x45\xa3\x47\x7d\xbf\x0d\xe1\x79\x70\x79\xf9\x8a\
+\x1f\x50\x9f\xf2\x15\x7d\x80\x06\xaf\x8b\x68\x79\x48\xaf\x8c\xc5\
+\x9a\x06\xd5\xd4\xb4\xf6\x2f\x0b\x74\xf6\xe9\x13\x49\xd1\x5f\xaf\
+\x6f\xc9\xbe\x01\x48\x18\xe1\x70\x38\x59\x53\x5c\xdc\xda\xa7\xa2\
+\x68\x71\x59\x2c\x34\xab\xb6\xa6\xf2\xcd\x98\xdf\xff\x4c\x65\x51\
+\xd1\x43\xbd\x4b\xcb\xef\xea\x5b\x5c\x7e\x73\x45\xa4\xf8\xfa\x8a\
+\x70\x78\x6a\xef\xb2\xb2\xdb\x7a\x95\x94\xdc\x5f\x53\x52\xf2\x6a\
+\xef\xf2\xe2\x19\xbd\x2b\x4b\xbe\xa8\x2e\x29\xa9\xab\xad\x2d\xef\
+\xea\xd3\xa7\x8f\x8e\x7e\xe6\x6b\x68\x75\x75\xa2\x6f\x69\x69\xc7\
+\xb0\x3e\x7d\xda\x69\xd8\xbb\xb8\xb8\x6d\x60\x75\x75\x4b\x6d\x55\
+\x55\xf3\x48\x20\x1a\x1f\x05\xcf\x94\xe8\xf3\xc6\xd0\xa0\x9a\xe2\
+\xd6\x1e\x1a\xd2\xbb\xb8\xed\x3b\xea\xdd\x36\xb2\x7f\x59\xe7\xe8\
+\x81\x03\xbb\xf7\xac\xad\xed\xda\x6f\xf8\xf0\x0e\x98\x4b\xe0\x20\
+\xfd\xcc\x4e\x6c\x63\xd5\x7f\x3a\xf0\xfc\xc6\x14\x41\x08\x38\xf0\
+\xdf\xca\x4c\xe3\xd3\x09\x61\x1f\x9b\x3b\x97\x9f\x3e\x7f\xbe\x40\
+\x69\x06\x21\xdc\x54\x42\xe8\x17\xd6\x30\xcd\xa3\x71\x5a\x9c\x86\
+\x34\xff\xed\xba\x3a\x71\x4d\x9a\xd1\xd0\x20\x4d\x6f\x6a\x92\xdf\
+\x6a\x6d\x55\xd6\x47\x34\xff\x19\x5a\x8e\x10\xe1\xb1\xb9\x84\xa7\
+\x6d\x50\xde\x94\x28\xef\x1e\xea\x91\x87\xe6\xcf\x25\x84\x7f\xbb\
+\x8e\x88\x33\x9b\x08\xf0\x26\xca\x3b\xed\xed\x3e\x4a\x33\x3a\x3b\
+\xfd\x94\xde\xec\xea\x0a\x6c\x2c\xd1\xf2\x54\x36\x4f\x56\x90\x81\
+\xf2\x87\xb6\x36\x69\xcc\xa1\x3c\xee\xa1\x1e\x79\x37\x14\x42\x79\
+\x16\xda\x92\xde\x21\xc4\x47\x75\x30\x93\x10\x79\x26\xe8\x8a\xf6\
+\x89\xca\x42\xf3\xa8\x2e\x41\x0f\xc2\x6b\x0b\x16\xf0\x34\x5c\x93\
+\xa8\x0e\xe0\x99\x05\x3e\x9b\x24\xeb\x46\xc8\xe5\x8d\x2d\xe5\x4f\
+\xe5\xa0\xf2\x50\xa2\x3a\xfa\x3e\x51\x9d\xf7\x10\xd5\xe3\x8c\x4e\
+\x02\xfa\xff\x8e\xde\x69\x27\x30\x2e\xc4\xf7\x56\x2b\x51\x40\x56\
+\x79\x3a\x8c\xd7\x6a\x02\x5d\x43\x1a\x0b\xfd\xe4\x68\x3f\x37\x24\
+\xd7\xf6\x98\xbf\x59\x07\x76\x6b\x55\xe0\x27\xf5\xad\xbd\x5e\xfe\
+\xf2\x9b\x67\x9e\xfe\xfc\xeb\xf7\x9f\x98\xbf\xe8\xdf\xcf\x36\xac\
+\xfc\xbf\xf8\xb2\xba\x7f\x3b\xe1\xf0\x5b\x5d\x92\xfc\xf7\x54\x20\
+\xfa\xc6\x82\xba\x15\x6f\x96\x37\xb6\xfc\xf3\x91\xe5\xcd\xff\x5e\
+\xb9\x70\xd9\xbf\x8b\x1b\x5a\xfe\xf3\xc0\xf2\x95\xef\x46\x96\x35\
+\xfd\x5f\x8b\x1c\x7a\x6b\x39\xab\xbc\xb9\x9c\xf7\xbd\xd1\x20\x05\
+\x5e\x5f\x21\x85\xfe\xba\x44\xf0\x4f\x4f\x30\xd2\xcb\x6d\xac\x32\
+\xad\x8d\x53\x5e\x6c\x11\x94\x17\x5b\x05\xe5\x85\x16\x71\x15\xad\
+\x14\xe5\x17\x3a\x64\xe5\x45\x23\x18\x99\x96\x8c\xa7\x5f\x16\x07\
+\xa8\x2f\x2f\xeb\x4a\xbd\x9a\xef\x4a\x4d\xcf\x77\xa7\xfe\xfa\x54\
+\x4b\xd7\x1b\x2f\x74\xa6\xfe\xf6\x5c\x47\xf2\xb5\x69\x5d\xe9\x57\
+\x51\x4a\x7d\x79\x65\x7b\xe2\xa5\xa5\xf1\xf4\x4b\x9d\xbe\xae\x17\
+\x97\x8b\xe9\x17\xe2\x38\xf1\x7c\x07\x11\x9f\xeb\xc0\xe2\x73\x4d\
+\x84\x7f\xb6\x11\x28\xed\x72\xcf\x24\x3d\xe2\xbd\x30\xed\x32\xcf\
+\x64\x5c\xfc\x4c\xda\x26\xcf\x24\x5c\x8f\x9e\x8d\x13\xf2\x6c\x82\
+\xd8\xcf\xd4\x33\xe4\xd9\x4e\x16\x3f\xdf\x18\x50\x5e\x30\xe3\x9d\
+\xd3\xda\x53\xf1\x97\xa6\x75\x74\xbc\x3c\xad\xb3\xf3\x95\xe9\x40\
+\x7f\xeb\xea\x7a\x75\x7a\x6b\xc7\xf4\xb7\x92\x99\xbf\x3e\xbd\xac\
+\xe1\x6f\xaf\x76\x74\xbd\xf1\xec\x8a\xa6\x37\x9e\x5e\xd9\xf4\xf7\
+\x67\x5a\x5b\xff\xfe\x42\x47\xfb\x1b\x2f\xc7\xe3\xaf\xbf\xd0\xde\
+\xf6\xd7\x17\x5a\xda\x5e\x7b\x35\xde\xfd\xda\xf4\xce\xee\xe9\xaf\
+\x76\x75\xbe\xfa\x66\x2a\xfd\xea\x6b\x9d\x5d\xaf\xbe\x1a\x4f\xbc\
+\xfa\x72\x57\xd7\x2b\x6f\x74\x25\x5e\x79\x3b\x95\x7b\xf9\xf5\xf6\
+\xc4\xcb\x6f\x24\x73\x2f\x24\x75\xeb\xe9\xd6\x44\xfa\x49\x38\x65\
+\x7e\xba\x3e\x9d\x7b\x76\x19\x2b\x83\x6e\xd2\xd3\x1a\x11\xf7\x72\
+\x53\x73\xdb\x2b\xdd\xc1\xf0\xab\xa9\xd6\xd6\xe9\xb9\xa2\xd8\x6b\
+\x9d\x0d\xcb\x5f\x53\xdb\x3b\x5f\x4b\xae\x68\x7a\x4d\x6b\xeb\x7a\
+\x65\x49\x7b\xe2\x15\xb3\xa5\x6b\xfa\x4b\x6d\xf1\xe9\xd3\x3b\x52\
+\x7f\x7d\x6e\x45\xdb\xeb\xaf\xb4\x26\xde\x78\xae\xb1\xfd\xcd\xe7\
+\x56\xb4\xbc\xf5\xcc\xf2\xa6\x7f\x3e\xdf\xd8\xf4\x4f\x90\xf5\xad\
+\x67\x9b\x1a\xdf\x7a\xa1\x71\xe5\x3f\x5e\x6b\x6c\xfa\xfb\xeb\x2b\
+\x5b\xdf\x78\xad\xa5\xe3\x6f\x2f\xb7\x77\xfc\xed\xf9\xf6\xf6\x37\
+\x9e\x83\x3e\xbc\xd8\xd4\xfe\xf7\x57\x5a\xbb\xde\x78\x8e\xa6\x25\
+\x12\x7f\xd5\xd2\xa9\xe9\x5f\xc7\xe3\xaf\xb4\x05\x82\x2f\x2d\x63\
+\x3b\x81\xe2\x2f\xc3\x38\xbe\x14\xc7\xd2\xcb\x5d\x58\x78\xb9\x83\
+\xf0\x2f\x51\x6a\x72\xb8\x69\x2b\x5d\x76\x5a\x93\x2b\x4c\x5b\x6e\
+\x33\x2f\x2e\x77\x93\x2f\xd4\x03\xad\x70\x53\x2f\x34\x92\xf4\xf3\
+\x6d\x38\xfd\x42\x0b\x93\x7b\xbe\x85\xcb\xbe\x90\x8c\x67\x5f\xc8\
+\xc8\x40\x42\xf6\xc5\x14\x9f\x7c\x29\xd9\x11\xff\x6b\x57\x4b\xc7\
+\x3f\x16\x35\xac\x78\x6b\x59\x46\xfd\xf4\xa5\x2f\x17\x5c\xf4\xe6\
+\xe2\xc5\x81\xad\xd5\x3e\x7e\x0d\xb9\xb6\x0b\xe0\x69\xd2\x53\xb1\
+\x38\x72\x8e\x65\x2b\x4b\xf6\x11\xfa\x56\x1d\xa8\x15\xf9\xff\x88\
+\x6b\xca\xf6\x37\x4a\x22\x07\xb8\xb1\xc8\x41\x5c\x69\xec\x60\x5c\
+\x1c\x39\x18\x17\x45\x0e\xe2\xcb\x63\x07\x08\x65\xb1\xfd\xb9\x92\
+\xd8\xbe\x42\x79\xc9\x7e\x72\x75\xd9\xfe\x6c\x51\xf8\x8f\x5c\x49\
+\xd1\x01\x24\x12\x3a\x88\x89\x45\x0f\x41\xd1\xd0\xa1\x4e\x34\x74\
+\x98\x1d\xf4\x8f\x35\x44\x71\x2c\xf1\x07\xc6\x62\x7f\xf0\x70\x4b\
+\x94\xc7\xb2\xe1\xd0\xe1\xae\xcf\x77\x38\x52\x7c\x87\x89\xe1\xe8\
+\x61\xae\x24\x1f\x86\x03\x81\x43\x4d\x5e\x3c\xdc\x55\x94\xb1\x3a\
+\xcf\x1d\x65\x4b\xd2\x11\x44\x51\x8e\xb0\x64\xe9\x48\xb8\x46\x3b\
+\x3a\x27\xb1\xc7\xa4\x58\x72\x8c\xaa\xf0\xc7\x68\xb2\x78\xb4\x15\
+\xf2\x1f\x0d\xe1\x38\xc3\x27\x8f\x33\x83\xca\x38\x55\x12\xc6\x99\
+\x7e\x1a\xf2\x5e\x5a\x5e\xe4\xc6\x39\x21\xdf\x38\x5d\xe1\xc7\xa9\
+\x32\x3f\x2e\x2f\x73\xe3\xd4\x80\x38\x4e\xf3\x7b\x74\x94\xee\x97\
+\x8e\xd2\xfc\xbe\x71\x86\x22\x8f\xd3\x03\xd2\x38\xd5\x27\x1e\x9d\
+\x15\xf9\xa3\x33\x02\x77\x4c\x5e\x11\x8e\x55\x15\xe1\xb8\x8c\xc8\
+\x1c\x97\x57\xa4\x63\xf3\xb2\x78\x4c\x1c\xe1\x71\x5c\x69\xe9\x91\
+\x19\x41\x38\xc2\x08\x05\x8e\x20\xb1\xd8\xd8\xbc\x24\x8d\xd5\x83\
+\xfe\x23\x32\x92\x78\x64\xde\xaf\x1c\x95\x05\x59\xb2\xb2\x74\x74\
+\x46\x91\x8f\x49\xf3\xfc\xb1\x1d\x08\x1d\x9b\x96\x84\x63\x33\x12\
+\x7f\x6c\x52\xc0\xc7\xa5\x65\xe1\xb8\x66\xd7\x3c\x3e\x21\xb2\xc7\
+\x77\xb1\xe4\x84\x26\x53\x3d\x21\xa7\xf0\xc7\x27\x30\x39\x3e\x2b\
+\xb2\xb4\xcd\x71\x39\x49\x38\x92\x29\x8a\x1d\x61\x06\x40\x6f\x7e\
+\x65\xac\x13\x0c\x8c\xb5\x7c\xca\xe1\x52\x59\xd9\xe1\x86\x5f\x39\
+\x1c\x45\xc3\x87\x9b\x01\xe5\x48\xdd\x2f\x1e\xa5\xfa\xa4\xa3\x34\
+\x9f\x34\x2e\xc9\xe3\x71\x6e\x51\xf8\xa8\x8c\xc2\x82\x6c\xf2\xe1\
+\xb8\xac\xe8\x50\x2d\xa4\x1c\x62\x84\x03\x87\x98\xb1\xe0\xa1\x56\
+\x34\x7a\xa8\x1e\x0b\x1f\xa6\x86\x43\x63\xb3\x7e\xe5\x88\x9c\x4f\
+\x3a\x32\x27\x8b\xc0\x43\x39\x42\xf3\x2b\x63\x73\x32\x37\xd6\x2d\
+\x0a\x1d\x91\xe1\xf0\x91\x39\x91\x05\x9e\xf2\x51\x9a\x2c\x1e\x95\
+\x62\x98\x23\x49\x28\x78\x84\x1b\xf6\x8d\xcd\x0b\xcc\x58\x37\xa4\
+\x1c\x6e\xca\xc2\xe1\x96\x5f\x1c\x4b\xd3\xec\xa0\x02\xb2\x89\x63\
+\x4d\x9f\x30\xd6\x0e\x2b\x63\x21\xef\x08\x27\xa0\x1c\x61\xfa\xa5\
+\x23\x74\x45\x38\x12\xe2\x47\x9a\x32\x7b\x94\xab\x30\x47\x59\x02\
+\x19\xc7\x05\xa5\x71\x8e\x84\x8e\x72\x65\x7c\x84\x14\x92\x0e\x03\
+\x3a\x58\x0c\x4a\x07\x56\xf6\xad\xd8\x21\x63\xe7\x76\x45\xaa\x5a\
+\x00\x9e\x35\x10\x6e\xbb\x00\x1e\xc7\x75\x39\x39\x10\x70\xe0\xfa\
+\x14\x89\x92\x84\xe4\x40\x10\xb9\x0c\x8b\x82\x81\x08\x0a\x87\x23\
+\x08\xf3\x02\x0a\x84\x43\x88\x97\x15\xc4\x8a\x12\x0a\x45\x23\xc8\
+\xe7\x93\x90\x20\x8a\x40\x3c\x92\xfd\x3e\xc0\x11\x01\x42\x05\x71\
+\x32\x8f\x04\x45\x40\x9c\xc4\x13\xd9\x2f\x91\x70\x48\x42\x8a\xcc\
+\x20\xc3\xb1\xb1\xcf\x2f\x60\xb8\x80\x67\x04\x91\x63\x7c\x12\xcf\
+\xc2\xe6\x8e\x95\x15\x81\x11\x05\x68\x8c\xc1\xac\x20\x09\x38\x18\
+\xf6\xbb\x01\xa8\x27\xf9\x15\x84\x38\x16\xf1\x92\x0c\xbc\x64\xe4\
+\x0b\x40\x1b\x81\x00\x72\x18\x7e\x55\x9a\x22\x41\x9a\x8c\x18\x49\
+\x40\x02\x94\xe5\xa0\xcd\x60\xd0\x87\x08\xcf\xa3\x48\xc8\x8f\x6c\
+\x17\x21\x2a\x97\xe8\x0f\x20\x11\xfa\xc3\xfb\x82\x48\x54\x20\xae\
+\x04\x11\x2f\xfb\x80\x02\x88\x85\x50\x94\x43\x48\x96\x42\xc0\xc7\
+\x8f\x38\xc8\xf3\x41\x9f\xfd\xbe\x10\xe2\xfd\x61\xa4\x02\x0f\x21\
+\x08\xf1\xa0\x1f\x19\x98\x21\xfe\x70\x10\x28\x44\x18\x59\x26\x72\
+\x24\x42\x58\xc9\x47\x18\x49\x81\x7e\x86\x20\x3d\xec\x3d\x0b\x3e\
+\xc5\x15\x43\x61\xd7\x1f\x0a\x12\x3e\x10\x24\x44\x12\x49\x30\x18\
+\x23\x06\xcb\xa0\x50\x24\x82\xa4\x70\x10\x11\x59\x46\xc1\x20\xf0\
+\x95\x14\xd0\x95\x1f\xb1\xd0\x47\x56\xf1\x83\x0c\x12\x42\xa2\x04\
+\xcf\x0a\xe8\x55\x41\x22\xe8\x9b\x07\x19\x39\x5e\x82\x67\x09\xf9\
+\x83\x01\xc4\x89\x32\x12\x41\xdf\x72\x28\x80\x78\xe8\xaf\x10\x0c\
+\x22\x16\xc6\x02\xda\x43\x48\x12\x91\xcd\xf1\x48\x0c\x05\x91\x02\
+\xfc\x05\x7f\x10\x61\xc5\xe7\x11\xe3\xf7\x23\x36\x10\xa0\x79\x84\
+\xf5\xf9\x89\xe8\x0b\x20\xde\xe7\x47\x52\x28\x8c\x74\x82\x50\x24\
+\x56\x8c\x64\x5f\x08\xb9\x84\x41\x3e\x90\x25\x10\x0e\x23\xc2\x09\
+\x30\x06\x1c\x92\xa1\x3d\x86\xe7\x50\x00\xda\xa4\x32\x38\x98\x81\
+\x34\xd9\x93\x47\x09\xfa\x10\x82\x36\x69\xc8\x8a\x02\xe2\x65\x09\
+\x09\xd0\x1f\x5a\x26\xe0\x87\x32\x3e\x1f\x0a\x04\x82\xc8\x21\x2e\
+\x0a\x80\xfc\xb4\xdf\x34\x8f\x15\x78\x14\x08\x05\x11\x0f\x32\x8b\
+\xb2\x84\x55\x54\x78\xad\xa9\x01\x66\xcd\x87\x6d\x35\xae\xa7\x52\
+\x69\x94\xce\x7f\x91\xac\x6f\x6e\xea\x5e\xba\x62\xb9\xdb\x99\xa8\
+\xe3\x53\xf9\xa5\x6a\x4b\xdb\xe2\x74\x6b\xd7\x22\x2b\x91\x5a\xa8\
+\x75\x26\x17\x9a\x89\xe4\x02\x26\xaf\x2d\x70\x92\xd9\x05\x99\xf6\
+\xee\x05\x24\x9d\x9d\x6f\x25\xd2\xdf\x90\x74\xee\x2b\x2b\xa5\x7e\
+\x89\xb2\xea\x17\xb2\x8b\x3e\xd7\xbb\x53\xf3\x44\x9d\xcc\x63\x74\
+\xe7\x33\x5d\xb3\x3f\x33\x2d\xf4\x59\x44\xe1\x3f\xb3\x4d\x67\x0e\
+\x47\xd0\x6c\x4a\x8e\xee\xcc\xf2\x31\x68\x16\x63\xa1\xd9\xd8\x46\
+\x73\xfc\x3c\x33\x9b\x77\xc8\x1c\xd6\x41\x73\x32\xf1\xf4\x67\xae\
+\x69\xcf\x51\x38\xee\x33\x57\xb7\x3f\x13\x11\x3b\x57\xcb\x3a\x73\
+\xad\x9c\x33\x57\x62\xd8\x79\x56\xde\x9e\x67\x65\xcd\xcf\xf3\x69\
+\xf3\x0b\xa8\xff\xb9\x1a\xcf\xce\x63\x34\x34\xcf\xc8\xd8\x73\x25\
+\x87\xf9\xcc\xd6\xd0\x9c\x88\xc0\xcd\x76\x73\x36\xe5\x3f\x8b\x31\
+\xf1\x2c\xce\x44\x40\x78\x16\xab\xd3\x90\x99\xc5\x6a\x10\xea\xcc\
+\x6c\x40\x97\x39\x44\x47\x9f\x89\x2e\x3f\xd7\xca\x58\xf3\x2c\x0d\
+\x7d\x1e\xef\xce\x7f\x4e\x74\xf6\x73\x1f\xef\x9f\xa7\x67\xf5\xb9\
+\x3c\x41\x73\x64\x56\x9c\xa3\xe5\xac\xd9\x20\xdf\x6c\x68\x7b\x8e\
+\x08\x72\x12\x0d\xe4\xb5\x98\x39\x0c\xc4\x6d\x1d\xcd\x21\x06\x9a\
+\x63\x43\x1a\xf0\x9b\xed\x5a\x68\x16\x94\x9d\xa5\x60\x7e\x96\x69\
+\x5a\xb3\x02\xa2\xfc\x69\x5e\x35\x67\x81\x0e\x66\x05\x78\x6e\x96\
+\x65\x3a\xb3\x10\x94\xe1\x1d\x34\x1b\x99\x68\xb6\xcc\xe0\xd9\x8c\
+\x03\x64\xe1\xd9\x0a\x66\xe7\x10\xdd\x9e\xc3\x9b\xcc\x67\xa2\x81\
+\x3e\xe3\x4d\x90\xcf\xc6\x73\xa1\xdd\x79\x44\xb3\xbf\xc8\x27\xd5\
+\x2f\xb5\xb4\xf6\x95\x9e\xd2\xbe\xd6\x33\xda\xd7\x89\xf6\xe4\xd7\
+\xb9\xac\xf1\x15\xe7\x32\x5f\x58\x39\xf3\x0b\xec\xa0\x2f\xd2\xc9\
+\xcc\x17\x5a\x2a\xf7\xb9\x95\xb7\xe6\x39\xba\x3b\x97\x38\xe8\x33\
+\xc5\x0f\x7f\xdb\x00\x00\x10\x00\x49\x44\x41\x54\xdb\xb0\xe7\xa8\
+\x19\x6d\x8e\x80\xd8\x39\xae\xe9\xcc\x16\x5c\x76\xb6\xcc\xb2\x73\
+\xb0\x45\x3e\x73\x2d\x32\x17\x69\xd6\x3c\xc1\xc2\xf3\xcc\xac\x39\
+\xcf\xcc\x18\x9f\xb3\x16\xfa\xc2\xce\x1a\x5f\x42\xfb\x5f\xea\xf1\
+\xec\x57\x76\xde\xfa\x2a\xdb\x9d\xfd\x8a\xb7\xd1\x57\xc8\x40\x5f\
+\x65\xba\x33\x5f\xaa\x89\xfc\x97\xb2\xcb\x7d\xe9\x64\xcc\x2f\x04\
+\x1b\x7f\x8e\x35\x1b\x78\xa0\x79\x92\xc3\xce\xd5\xb3\xe6\x5c\xd7\
+\x72\xe6\x66\x53\xd9\xb9\x2c\xe2\xe6\x6a\xaa\x39\x57\xcd\xeb\xf3\
+\x14\x4e\x9e\x87\x1c\xf6\x8b\x64\x22\x3f\x3f\x9f\x33\xeb\x2c\x0b\
+\xd7\x07\xb8\x98\xb6\xad\xda\xd7\x4f\xe9\xd7\x76\x01\x3c\x67\xfe\
+\xfe\xf7\x4b\xfd\x96\x7d\x05\x9f\xce\x9f\x1e\xb1\x9d\x73\x70\x4b\
+\xe2\x1c\xae\x35\x79\x76\x89\x83\xce\x2e\xb6\xad\x73\x02\x79\xf5\
+\x9c\x60\x56\x3b\xc7\x97\xce\x9e\xe7\x34\x35\x9f\xcf\xc5\x3b\x26\
+\x44\x74\xfd\x42\xa6\xa3\xe3\xa2\x60\x3a\x73\x61\x89\xae\x5f\x14\
+\xd5\x8c\x8b\x62\xa6\x31\x51\xe8\xe8\xba\xb8\x9f\x28\x4e\x92\x13\
+\x5d\x93\x82\x9a\x7a\x89\x9c\xcd\x5e\x12\xd4\xb3\x97\x88\xd9\xec\
+\xe4\x68\x2e\x3f\x59\x4c\x66\x2e\x51\x92\x89\x4b\x4b\x08\xb9\x4c\
+\x48\x64\x2f\x0b\x64\xb3\x97\x45\x34\xed\x52\x31\x99\xb8\x24\x92\
+\xcd\x4e\xe2\xba\x3b\x26\x95\x20\x3c\x91\x4f\xc4\x27\x72\xf1\xf8\
+\x45\x61\xc7\xba\x90\x8f\xc7\xc7\x47\xcc\xfc\xf8\x12\xd6\x1d\x2f\
+\x24\xe2\x17\x14\x11\x6b\x7c\xc4\xd6\x2f\x00\xbe\x17\x88\xa9\xf8\
+\xf8\x5e\x0c\x37\x3e\xa0\x6a\xe3\xa3\x96\x3a\x21\x66\x69\x17\x95\
+\x5a\xd6\x44\x29\x9d\x99\xd4\x5b\xe4\x26\x57\x38\xd6\xe4\x62\x1d\
+\x7d\x4b\xd6\xe4\x52\xcb\xbe\xa4\xc8\xb0\x2f\x29\xb6\xed\x4b\x4a\
+\x2c\x7b\x72\x54\x37\x27\x15\x99\xd6\x44\x90\xeb\xc2\x60\x36\x77\
+\x11\x69\x6d\xa5\xfd\xb8\xc8\x6d\xeb\xbc\x08\x75\x27\x2e\x0c\x68\
+\xe6\x04\x26\x99\x9e\x10\x36\xd4\x09\x45\x86\x36\x51\xcc\x6b\x17\
+\x57\xf2\xf8\xe2\x60\x5e\x9b\x04\x32\x4c\x0e\xaa\xd9\x4b\xf8\x78\
+\xe2\x92\x98\xaa\x5d\xe2\xcf\x24\x26\x17\x23\xe7\x92\x12\x62\x5d\
+\xc2\x25\x32\x97\x04\x4d\x0d\xfa\xa4\x4d\x2e\x75\xec\xc9\x72\x36\
+\x33\xa9\x9c\xc7\x13\xc3\xba\x79\x31\x1f\xcf\x5c\x1c\xd4\xf3\x13\
+\x8b\x41\x4e\x7f\x5e\x05\xdd\xa9\x17\x4a\x39\xf5\x42\x7f\x4e\x9d\
+\xe0\x53\xd5\x09\x42\x26\x3d\xbe\x48\x33\xc7\x07\xf3\x99\xf1\x61\
+\x35\x37\x3e\xa0\xe5\x27\xc8\xf1\xd4\x04\xbf\x9a\x9d\xc0\x27\xbb\
+\xa1\x5c\xfa\x62\x0c\x7a\xe2\xe2\x9d\x93\x94\x4c\x62\x92\x92\x4b\
+\x83\xfc\x89\x0b\xa5\x44\x72\x42\x30\x9b\xba\x20\x98\x4a\x5f\xd0\
+\x8b\xe5\x2f\x28\x71\xcd\x09\x25\x8e\x73\x61\x11\xb2\x2e\x62\x12\
+\x9d\x13\x63\x8e\x73\x71\x35\xcf\x5d\xec\x4f\x65\x2e\xae\xc0\xee\
+\xc5\x7e\x35\x33\x51\xc8\x66\x40\xc7\xfa\x85\x2c\x1d\x53\x55\x1b\
+\x5f\x85\xc9\xf8\x62\xe2\x8c\x2f\xc3\xee\xf8\x40\x2e\x79\x41\x89\
+\x65\x5c\x10\x32\x32\xe3\x2b\x79\xf6\x02\x25\x9f\x84\x71\xd0\xc6\
+\x07\xb2\xe9\x09\xa8\xa5\xed\x42\x9f\x96\x9e\xa8\xa4\x13\x17\x6b\
+\x2b\xeb\x2e\x16\xd2\xf1\x8b\xdd\x96\x95\x17\xe3\xf6\xd6\x8b\xc5\
+\x6c\x62\xa2\x94\x4a\x4c\x54\xb2\xa9\x8b\x85\xa4\x3a\xb1\xc4\x44\
+\x13\xc5\xee\xf4\xc5\x62\x2a\x3f\x09\x77\xa4\x26\xa5\xea\x1b\x2e\
+\x51\x1b\x9b\x26\x33\x99\xfc\x45\x76\x32\x33\x21\xc0\xe2\xc7\x0f\
+\x1d\xd1\x2b\xf9\x53\x0c\x74\x5b\xad\xb3\x5d\x00\x0f\xc6\x70\xd0\
+\xb0\xdb\x4e\xb3\x4e\xdd\x75\xe4\x7f\x4f\x1a\x36\x68\xc6\x99\x3b\
+\x0e\xfe\xe0\x8c\x91\x03\x3f\x3a\xae\x57\xe5\x27\x94\x4e\xe8\x5d\
+\x39\xf3\x84\xfe\x95\x33\x4f\xee\xdf\xeb\x93\xb3\x86\x0d\xfc\xf8\
+\xd4\xda\xda\x0f\x4e\xe8\x53\xfd\xbf\x33\x06\xd7\xfe\xef\xb8\xbe\
+\x35\x1f\x1e\x51\x51\xf2\xd1\x51\x15\xd1\x8f\x8f\x2a\x89\x7e\x7c\
+\x6c\x45\xc9\xc7\x07\x05\x95\x8f\x8f\xab\x2c\xfd\x64\x5c\x34\xf8\
+\xc9\xc9\xa5\xd1\x4f\x8e\x09\x06\x67\x1e\x1b\x0c\x7e\x3a\x2e\x16\
+\x9a\x75\x3c\xd0\xb1\xb1\xd8\xa7\x87\x29\xfc\xa7\xc7\xc6\x82\x9f\
+\x1e\x05\x74\x58\x50\x81\xbc\xd8\xac\x43\x8a\x42\xb3\x8f\x2e\x2b\
+\x9b\x7d\x04\x84\x27\x54\x97\x41\xbc\x68\xf6\x91\x21\x65\xce\xf1\
+\xe5\x45\x9f\x8d\x2b\x0a\x7d\x76\xb8\x4f\xf8\x8c\xc6\x69\xda\xb1\
+\x45\xa1\x39\x27\x94\x15\xcd\xa6\x74\x58\x91\x32\xe7\x48\x8f\x42\
+\x73\x0e\x09\x29\xb3\x0f\x08\x09\xb3\x0f\x87\x76\xf6\x16\xf0\xac\
+\xfd\x15\x61\xd6\xc1\x21\xfc\x2d\x09\xb3\x0e\x0a\xf2\x9f\x1e\xb6\
+\x06\x1d\x15\x53\x3e\x3d\x3c\x24\xcc\x3a\xa1\x2c\x34\xfb\xc4\xaa\
+\xd8\xa7\x67\x42\x3f\x4f\xa8\x8c\xcd\x3c\xb3\x7f\xe9\xcc\x93\xab\
+\x62\xb3\x8e\x2d\x0f\xcd\x39\xba\x38\x3c\xf7\xd0\xb0\x6f\xde\xe1\
+\x45\xa1\xcf\x68\xdb\x87\x28\xc0\x3f\xa4\xcc\x3a\x0a\xe4\x3e\x26\
+\x16\x9c\x79\x42\x69\x6c\xe6\x11\x31\x65\xe6\xb1\xa5\xab\xfa\x75\
+\xb0\x22\xcc\x3a\xbe\x2c\x34\xeb\x70\x45\x99\x45\xe5\x39\x44\x51\
+\xa0\x1f\xa1\x39\x07\x09\x82\x57\x9f\xca\x7e\x7c\x28\xf4\xd9\x38\
+\x1f\xf4\x27\xe4\xfb\xec\xe8\xb0\x6f\x2e\xa5\x23\x8b\x7d\xf3\x56\
+\x51\x78\xde\xa1\x10\x1f\x0b\xed\x1e\x02\xe4\xb5\x5b\x5d\x34\xe7\
+\x68\xe8\xef\x29\x30\x16\x27\xd5\x54\x7c\x78\x4e\x6d\x9f\xff\x9d\
+\xd5\xbf\xf7\x8c\xd3\x7a\x57\xcd\x38\xb7\xb6\xcf\x07\xa7\xf5\xaa\
+\xf8\xf8\xc4\xaa\xd2\x4f\x7b\xf4\x46\xdb\x1d\x17\x8b\xcd\x1a\x07\
+\x72\x8e\x53\x94\x59\x27\x97\x95\xcd\x3a\x1c\xe2\x07\x28\x82\xa7\
+\xdf\x03\x04\xc1\x93\xe9\xc8\x50\x68\x0e\xa5\x93\xca\xcb\x41\x87\
+\xa1\x39\x07\x2a\x02\x3c\x2b\x9e\x1e\x8f\x80\xf6\x0e\x2f\x8b\xcd\
+\x3a\x8c\x8e\x57\x2c\xf8\xe9\x31\xa5\xa5\x33\x4f\xa8\x2c\x9d\x49\
+\xc7\xf6\xb4\x7e\x15\x1f\x9f\x51\x53\xf3\xd1\xe9\x30\xfe\xe7\x0f\
+\x18\xf0\xe1\x29\x35\x15\x1f\x9d\xd6\xaf\xd7\xc7\xa7\xc3\x1c\x39\
+\xa6\x34\x36\xf3\x58\xd0\x25\x2d\x7b\x62\x69\xf0\xd3\x63\x81\x4e\
+\xa8\x8c\xcd\x3c\xb9\x32\xfa\xc9\x59\x50\xef\xfc\x01\x7d\x3f\x1c\
+\x3f\xb8\xf6\x03\xda\x87\x53\x06\xf4\x7d\xf7\x84\xe1\xc3\x9b\xb6\
+\x55\x00\xf9\xa9\xfd\xda\x2e\x80\x67\x95\x72\x0a\x9f\x05\x0d\x14\
+\x34\xb0\xb5\x68\x60\xbb\x01\x9e\x0f\xbe\xf8\xa2\x76\xee\xf2\x15\
+\x27\xce\xad\x5f\x79\xe9\x9c\xfa\xa6\x73\xe6\x36\xb6\xee\x3e\xb7\
+\xb5\x55\x59\x73\x20\xe6\xcf\x9f\x2f\x7c\x5e\xd7\xb4\xd7\x9c\x45\
+\xf5\xe7\xcc\x6f\x6c\x3b\x6d\x41\x53\xeb\x89\x5f\x40\x9d\x39\x4b\
+\x97\x9e\x31\x6f\x79\xc3\x19\x8b\x3a\x3a\x7e\xb7\x66\x79\xa8\x5f\
+\xf4\x55\x47\x6a\xdc\xdc\xb6\xb6\xd3\xbe\x6c\xeb\x3c\x63\x41\x67\
+\xfc\x8c\x25\xdd\x99\xd3\x3e\x6f\x6c\x3e\xf5\xcb\xba\x96\x1d\xd6\
+\x2c\x4b\xe3\xdf\x2c\x6b\xa9\x5e\xd0\xde\x3d\xb6\x3e\x9d\x3e\x65\
+\x76\x43\xe3\x69\x4b\xba\x93\xa7\x7e\xd1\xd8\x7c\xda\x97\x8d\x4d\
+\x27\x7f\xb6\x6c\xe5\x30\x5a\x66\x4d\x9a\xbd\xa4\x7e\xe4\xbc\xc5\
+\x0d\x07\x36\x74\x76\x96\xad\x99\xfe\x53\xe3\x73\x97\x2c\x29\xfa\
+\x7a\xc5\x8a\x83\x16\x77\x74\x9c\xf4\xc9\xe2\xc5\x27\xcf\x6f\x6f\
+\x3f\x61\x71\x77\xf7\x3e\x0b\x9a\x9a\xa2\xeb\xe2\xb9\x78\x65\x57\
+\xc5\xe7\x0b\x97\xee\xb7\x78\x45\x7b\x9f\x35\xf3\x97\xb5\xc4\xab\
+\x1b\xe2\xe9\xdd\xd6\x4c\xeb\x89\xd3\xef\xde\x2c\x6a\xee\x1a\x30\
+\x83\x10\xae\x27\x8d\x86\x90\x8e\x17\xc6\xe3\xbb\x7d\xd3\xd5\x35\
+\x1a\xe2\x2c\x4d\x5b\x17\xcd\x27\x44\xf8\x66\x65\xeb\xe8\xaf\x41\
+\xf7\x5f\x36\xb5\x9e\xfc\x55\x73\xf3\xa9\xf3\x96\x35\x1c\x37\x7f\
+\x65\xdb\xce\xeb\x2a\x4f\xd3\x28\xbf\xa5\x9d\xc9\x3d\xbf\xdf\x26\
+\xcd\x6b\x4c\xa5\x22\x5f\xb7\xb5\x1d\x34\x3f\x91\x58\xeb\x0f\xd7\
+\xd7\xc5\xe3\xc1\xb9\xcb\x1b\x77\x5f\xb8\xa2\xab\x9c\x96\xfb\x3e\
+\xcd\x6c\x6a\x92\xbf\x6a\x6a\xdf\x75\x76\xdd\x8a\xb3\xbe\x5a\xd9\
+\x76\xd9\x97\x8d\xcd\xe7\x7d\xb9\x8e\x39\xb3\x66\xbd\x2f\x1b\xdb\
+\x86\x7e\xd9\x08\x32\x43\xf9\xd9\x2b\x9b\xcf\xff\x60\xe9\xd2\x3d\
+\xdf\xae\xab\x13\xd7\x2c\x53\x88\xaf\xd2\xc0\x76\x01\x3c\x9f\x2d\
+\x5c\x38\x2c\x16\x8b\xdd\xe8\x53\xc4\x4b\x25\x89\x3b\xd9\xe7\x13\
+\x26\x39\xb6\x7e\x1b\x31\xec\xc3\xbf\x68\x68\x08\xaf\x52\x05\x42\
+\x69\x49\x0a\x3b\x2c\xde\xdd\x1f\x89\x9c\xad\x39\xd6\x04\x4e\x96\
+\xa7\x04\xa3\x45\x53\x42\xd1\xd8\xb9\xa2\xec\x3b\x43\x55\x4d\xfa\
+\xd7\xf3\x70\x4f\x79\x9f\x14\x2c\x8f\x95\x84\x2e\x93\x64\xf9\x52\
+\x97\xc5\x67\xc1\xed\xc7\xb9\xaa\x6d\x9c\xa3\x04\x42\x17\x63\x99\
+\x3f\x78\x71\x57\x57\xa0\xa7\x2c\x0d\x1d\x81\x1d\x23\x29\xf2\x15\
+\x39\xc3\x9a\xec\x8f\x84\xce\xcf\x59\xc6\x05\x9c\x20\x8d\xe7\x04\
+\xe5\x3c\x5e\x10\x76\x99\x4e\xc8\x6a\x83\x9c\xdf\xd9\xe9\x8f\x16\
+\x95\xec\x13\x8c\x46\x27\x6a\x26\xdb\x9b\xd6\xff\xb9\x24\x73\xd2\
+\xc8\x40\x30\x7c\x05\x26\xcc\xe5\xa5\x25\x65\xe3\x1d\x87\x5c\x94\
+\xc9\xa8\x53\x39\xc9\x7f\xd1\xc2\xd6\xd6\x5e\xdf\xe7\xcf\x0b\xfc\
+\x90\x70\xac\xe8\x72\x1b\xbb\xfb\xaf\x95\xa7\x48\x3b\xc9\xc1\xe0\
+\x8d\x4d\x69\xbd\x76\xad\x74\x78\x58\xd2\x95\xbc\x9a\x15\xc4\x3b\
+\xaa\x13\xda\x5a\x06\xbd\x22\x8f\x4a\x6d\x87\x39\xdf\x75\x98\x93\
+\xeb\xd2\xc6\x0f\xda\x82\xaa\xde\x9b\x6b\xec\xa8\x44\x2c\x7b\x9c\
+\x28\xfb\xaf\xe7\x45\x71\x02\x46\xc2\x85\xbe\x40\xf0\x2a\x90\xf9\
+\xd6\xfa\xf6\xf8\xd9\x5e\xa1\xef\x7d\x2c\xef\xc8\xc5\xa2\x45\xe1\
+\xa9\xe5\xed\xe9\xa3\xbe\x97\x85\x30\x23\x8e\xf5\xf9\x82\x53\x15\
+\xde\x77\x5a\x5d\x5b\xb6\xb8\x27\xdf\x30\xd0\x99\x81\x50\xf4\x52\
+\x2c\x30\x23\x7a\xd2\x7a\x42\x0a\x4a\x01\xd6\x7f\x74\x26\xaf\xdd\
+\x28\xfb\x02\xe7\x61\x5e\x38\x8a\x60\xee\x6c\x86\xe1\x6f\x14\x4c\
+\xf6\x48\x00\x3a\xa6\xa7\x6c\x4f\xf8\x45\x53\x53\x2d\x41\xf6\x55\
+\xc1\x88\x7f\x92\x8b\xdd\xe3\x43\x41\xff\x05\x7e\x9f\xef\x4f\x45\
+\x04\x9f\x30\x6b\xd6\xac\x60\x4f\xb9\x42\xb8\x4a\x03\x3f\x50\xe0\
+\xaa\xe4\x6d\xeb\x53\x12\xf8\xd3\x15\x41\xdc\x99\xb1\xed\x99\x66\
+\x36\x7b\x6f\xa6\xbb\x7b\x5a\xd4\xef\x2f\x43\x96\x75\x96\x4d\xc8\
+\x00\xf4\xed\xab\x0c\x63\xc3\x8f\xc9\xc7\x66\x26\xf5\x8c\xc8\xe2\
+\x7f\x9b\x86\x91\x31\x4d\x0d\xd9\xa6\xf1\x0f\x19\xa3\x67\xa2\x3e\
+\x65\x16\x14\xfd\x0e\x78\x58\x47\x02\xd4\xaa\xe4\x75\xb5\x5d\xb0\
+\xf5\xe7\xd5\x44\xe7\x34\x33\x93\x7e\x15\x99\xda\xf3\x9c\xe3\xce\
+\x12\x73\x39\x0b\xca\xaf\x7e\x07\x79\xa6\x88\x73\xed\x98\x9d\xcb\
+\x2c\x75\xb3\xd9\x97\xed\x6c\xf2\xa5\x7c\xba\xfb\x25\x62\x69\xd3\
+\x58\xcb\xfc\x1a\xac\x62\x35\x6f\x57\x13\x78\x8e\xb8\x65\x0c\x76\
+\x2a\x05\x8e\xac\xe5\x99\xad\x66\xb8\x89\x11\x06\xd9\x21\x01\x39\
+\x25\xae\xa5\x36\xeb\xe9\xf8\x74\xce\x36\x5f\xf1\xf3\xb8\x4b\xe6\
+\xf1\xe1\xb6\x65\x1d\xf0\x7d\x76\xc4\x55\x03\xa2\xc0\x94\xf2\x2c\
+\x2a\xea\xc9\x03\xa3\xc3\xb2\xc4\x44\x15\x0e\x0d\xe4\x79\xf7\x07\
+\x9e\x92\x8f\xc7\xe5\x0c\x32\xfa\x21\x27\xb7\xd6\x4a\xef\x18\x1a\
+\x1f\x0b\x48\xd5\x8c\xa1\x55\x61\x27\x2f\xf7\xf0\xfb\x7e\x28\xf9\
+\x39\x49\x86\x36\xb1\xab\x5b\xa6\x96\x79\xc3\x75\xb4\x17\xb4\x7c\
+\xfa\x6d\x09\xae\xfe\x78\x81\x99\xdc\xda\x19\x3f\xf0\xfb\x75\xe4\
+\x20\x2b\xfa\x30\xea\xaf\x30\xee\x6a\x39\x7b\xca\x48\x84\x84\xc2\
+\x22\x57\xa6\xb0\xee\x89\x96\x95\xd9\x97\xca\xef\xe5\x59\x6a\x99\
+\xc2\x93\x4a\x6c\x69\x6b\x81\x02\xe4\xb3\x96\x66\xee\xc1\xb8\xda\
+\xa5\x7e\x01\x87\xf5\x6c\xf2\x55\x3d\x15\xff\x33\xb1\xf5\x57\xb0\
+\x6b\x08\x45\x61\xff\x55\x5f\x2d\x5b\x39\xd8\xe3\xb1\xc6\x87\x0f\
+\x73\xc7\x57\x46\xa3\x7b\x65\xda\x3b\x67\xea\xc9\xf8\x43\x7a\x3c\
+\xfe\x2c\x0c\x5a\x88\xc3\x64\x02\xf6\xf9\x56\xcf\xb1\x35\xaa\xd0\
+\xe8\x76\x4b\xdb\x05\xf0\x44\xc2\x91\xde\x2c\x66\x72\x0c\x61\xff\
+\xb9\xe3\xc0\x81\xcf\xff\x6e\xe8\xd0\xdb\x88\x65\xdf\x23\x72\xec\
+\x92\x10\xaf\xac\x36\xf6\x7e\xfd\xfa\xa5\x07\xf7\xa9\xfe\x60\xd4\
+\x80\x3e\x8f\x32\xae\xfd\x08\xc6\xee\xd7\x88\x38\x0d\x1c\x42\x4f\
+\xf4\x2b\x2f\x79\xa6\x4f\x49\xec\xff\x30\x24\xf6\xcc\x96\x80\x2c\
+\x9b\x2c\x42\x66\x2c\x10\xf8\x60\x58\x45\xf5\xe3\x3b\xf7\xef\xff\
+\xd0\xae\x03\xfa\x3f\x38\xa8\xac\xe4\xfe\xa1\xbd\xca\xde\xff\xfe\
+\xef\x8c\x38\x86\x71\x83\xa2\x94\x2e\x0a\x07\xfe\x3e\xbc\xba\xfa\
+\x81\x5d\x07\x0c\x7e\x70\xb7\x41\x83\xee\x1f\x5e\x53\xf5\xe8\xf0\
+\x7e\x35\x73\xf7\xc6\x78\xad\xdf\xf4\x70\x1c\x43\x24\x9e\xb3\x58\
+\x96\xb8\x3d\x6d\xfe\x9c\x90\xe7\x19\x17\xfa\x9c\x93\x10\x7a\x77\
+\x58\x9f\x7e\xf7\x0d\xed\xd5\xeb\x01\xe0\xfd\x02\x72\x2d\x55\x11\
+\xf9\x1a\x30\xba\xd5\xba\xa0\xed\x38\xb6\x4d\x14\x49\x30\x05\x96\
+\x38\xf4\x99\x12\xf4\x9f\x20\xb8\x27\x77\x90\x63\xcb\x32\x68\x86\
+\x26\xae\x41\x2c\x72\x1d\x1e\x13\x87\x73\xdd\xd5\x75\x68\x76\x04\
+\xa0\xc6\xc8\xe7\xad\x50\x40\xb1\x05\x9a\xb0\x1e\x12\x44\x11\x31\
+\x8e\x65\x70\xc8\x59\x32\xaa\xa6\xf7\x9f\x47\xf5\xea\xf5\xe0\x0e\
+\x7d\xfb\x4e\x61\x11\xb9\x95\x38\x96\x65\xb9\xd6\x49\xdf\xaf\x0a\
+\xfd\x21\x20\xb8\xc9\xa3\x1f\xaa\xc9\xb5\x35\x06\xb9\x76\x1a\xba\
+\x10\x0e\x04\xa4\x63\x16\x36\x36\xae\xfa\x07\x83\xae\x89\x88\x65\
+\xb8\x86\x96\x83\xfe\x7c\xc7\xb1\x35\x91\xa8\x00\xc4\xfb\x63\xd8\
+\x1f\x60\x74\x2d\x7f\xe3\x2e\x03\xfb\xdf\xbd\xcb\xe0\x01\x7f\xdb\
+\xb1\x6f\xef\xbb\x59\xe4\xdc\x64\x59\x5a\xbb\x4b\x8c\xf2\xef\x6a\
+\xac\x8a\x61\xcb\x19\x8a\x6c\x57\x37\xb5\xfc\x9b\xbf\x1b\x31\xe2\
+\xd9\x51\xfd\xfa\xdd\x8b\x5d\xf7\xcf\xae\x6d\xae\x70\x1c\x67\xbb\
+\xb0\xb3\x55\x9a\xd8\xb8\xcf\xed\x42\x21\x8e\x65\xcd\x81\xed\x90\
+\xc0\x30\xe8\xac\x15\x1d\x5d\x97\x2c\x6b\xed\x3c\x10\x63\x32\x3b\
+\x10\x09\xfd\xb9\xb6\xaa\x74\xde\xba\x54\x25\x87\x42\x42\x2c\x12\
+\x71\x14\x59\x46\x8c\xeb\x4a\xeb\x2a\x63\x98\xa6\x4b\x15\x88\x31\
+\x1a\xd6\x95\x4f\x1f\x52\xd7\xd6\x7c\xec\x92\x95\x2d\xc7\xb5\xa4\
+\x52\xc7\xb5\xc4\xe3\xd5\xdf\xaf\x83\x09\xb1\x30\xc6\x9c\x6b\x3b\
+\x63\xe2\x86\x7a\x6c\x6b\x36\x35\x6e\x79\x4b\xfb\x09\x2b\xda\x3a\
+\x0f\x5a\xd6\xde\x5e\xb2\x66\xf9\xaa\x9a\x10\xcc\x59\x9d\x30\x50\
+\x01\xad\x05\x47\x6b\x96\xda\xb4\xb8\x2c\xcb\xae\x69\x9a\xac\xe2\
+\x0f\xec\xd8\x91\xe8\x3a\xa9\x3d\x15\x3f\x2e\xa0\x04\xff\x88\x11\
+\xa3\xb2\x88\x99\x0f\x4d\xad\x65\x84\x22\xc7\x31\xc4\x76\x58\x86\
+\x61\xd6\x4a\xf7\x49\x0a\xc3\xc3\x7e\xc8\x52\xad\x1f\x58\x3a\x94\
+\x45\x0c\x66\x90\x0b\x2f\xf4\xbd\x57\x28\x10\xc0\xb9\x6c\x0e\x23\
+\xb0\xf9\xef\x65\xad\x7e\x14\x00\xfd\x44\x51\xc6\x91\x48\x04\xb5\
+\xb5\xb5\xad\xd6\x3b\xa7\x28\x5f\x85\x42\xa1\x2f\xc2\xa1\xd0\xa0\
+\xb9\x73\xe7\xf2\xab\x2b\x40\x04\x84\xa3\xc0\xc3\x22\x16\x31\xf0\
+\xb8\xd6\x5b\x60\x79\x01\xe4\x49\x64\xb3\xd9\x39\xae\xe5\x0c\xe0\
+\x78\xf6\xb0\x19\x33\x66\x70\xa2\x28\xba\xb6\xed\x70\x96\xe3\x00\
+\x66\x7d\x57\xc5\x71\xdd\xd2\x68\x38\x3c\x28\x93\xcd\x2c\x83\x05\
+\xea\xdf\x34\x87\x9e\xfd\x35\x67\x32\x31\x5e\x10\xbe\xb4\x74\xf3\
+\x6e\x45\x92\x16\xd2\xf4\x35\x09\xe6\xd7\xa7\x2c\xcb\xba\xc5\x25\
+\x65\xe3\x1b\xdb\x3a\xaf\x5c\x54\xdf\x78\x98\xa6\xaa\x5f\x3b\xc8\
+\x9a\x22\xd8\xf6\x17\x6b\x96\x2d\xc4\xd1\x0f\x07\x6a\x5b\x54\x8a\
+\xe0\xf7\x3f\xe3\x98\xc6\xdf\x04\x41\xe8\x0f\x93\xe1\x52\xe2\xda\
+\x0f\xdb\x96\x7d\xb5\xa3\xeb\xd4\x65\x86\x79\xfb\xc3\x5e\xcb\x58\
+\xc6\x9a\x61\x10\xdb\xb4\xdc\x68\x34\xfa\xc3\x02\x90\x02\x7b\x78\
+\x06\x23\x44\x5c\xcb\xfe\xbd\x9a\xd3\xae\x67\x31\x7b\x9d\xed\x58\
+\x53\xbb\xbb\x13\x37\x18\xba\xbb\x6a\x65\x85\x72\x3d\x6f\x51\x12\
+\x89\x4b\x6c\x45\xe0\x85\x83\x53\xa9\xe4\x95\xdd\x5d\xdd\xd7\x5b\
+\x8e\x75\x73\x36\x9f\xbb\x98\xe3\xa4\xb5\x0e\x97\xf5\xb6\x36\xcb\
+\xe7\xf3\x81\x41\x61\x46\x92\xb8\x75\xca\xd8\xc3\x77\x63\xc3\x64\
+\xbc\x1b\x01\x30\x88\xb6\x6d\xef\x9d\xc9\xe5\x2e\xb7\x0c\xf3\x3a\
+\x81\xe7\x8e\x80\x3e\xf8\x4c\xc3\xe8\xfa\x3e\x1f\xdb\x34\x89\xeb\
+\xba\x70\x0c\xb2\x76\xfb\xaa\xaa\x62\xa8\x43\x40\x28\x78\xaf\x5d\
+\x8b\x61\x38\xc2\x71\xac\x0b\x9e\xcb\x5a\x1e\x8f\x4b\x88\x03\xed\
+\x12\x00\x0f\xc4\xf3\xeb\xf7\xe0\x60\x8c\x08\xf8\x35\x28\x93\xce\
+\x50\x59\xa1\x99\x55\xfc\x85\x40\xc0\x00\x00\x49\xdb\x96\xc5\xd7\
+\xd4\xd4\xac\xb5\x8d\x23\xf0\x02\xcf\x93\x96\x77\x57\x95\xfe\xee\
+\x93\x02\x6d\x26\x93\xc1\xad\x4d\xcd\xef\xb2\x1c\x3b\xdf\x76\xec\
+\x83\x4a\xfb\xf7\x39\x8c\xe5\x79\x01\xc3\x4b\x60\x69\xcd\xef\xca\
+\xf3\x9c\xe4\xb3\x2d\xdb\xcf\x62\xdc\x49\x53\x81\x35\x96\x63\xa5\
+\xfb\x67\xe2\xf1\xcb\x6d\xdd\x9c\xe0\xb8\xee\x0e\x9c\xcb\x0c\xa2\
+\x79\x6b\x92\x99\x4f\x3d\xab\x69\xda\x74\xe4\x90\xbe\xba\xa1\x4f\
+\x26\x88\xdc\x1f\xf4\x05\x6f\x14\xb1\x34\x6a\xa7\x9d\x76\x5a\x4b\
+\x17\x6b\xd6\xdb\x5e\xe3\x3f\x58\x21\xb6\x45\x45\xe4\x72\x39\xd4\
+\x1a\x8b\xde\xa4\x9b\xb9\x09\x60\x60\x7f\x02\xac\xf8\x40\x12\xe5\
+\xdd\x58\x86\xbd\x7e\x45\x77\xf7\x1e\xeb\xea\xb3\x28\x12\xc7\x2f\
+\x49\xae\x02\x60\x01\x46\xba\x4e\x9f\xc3\xca\x5b\x18\x26\x22\x18\
+\x07\x5e\xe0\xb8\xce\xf3\x9a\xae\x3d\x67\xd9\xce\x73\x3e\x9f\xfc\
+\x0c\x16\x71\xdd\xf7\xf9\x1a\xba\x8e\xc0\x68\x6d\x90\x67\x36\xcf\
+\xb1\x2f\xf2\x1c\xf7\x3c\x71\xc9\xd3\x92\x2c\xbe\xe6\x9a\xea\xf2\
+\x35\xcb\x97\x97\x97\xdb\x30\x38\xae\xeb\xd8\x08\xac\x1b\xde\x6b\
+\xe6\xfe\xb4\x78\x30\x18\x65\x6c\xd3\x22\xd9\x74\x7a\xbe\x4f\x92\
+\x5f\xd5\x74\xfd\x89\x74\x2a\xf5\x06\x72\x89\x22\x0a\xc2\x11\x4d\
+\x4d\x6b\xdf\x6e\x61\x96\x35\x5c\xdb\x75\x39\x8e\x5b\xcb\xa0\x15\
+\x51\xa2\x02\x10\x8e\xe7\x7f\x60\x50\x0c\xd5\x06\xb8\x93\x50\x6d\
+\xad\x3c\x49\xa1\x9c\x6c\xe4\x98\x26\xca\x64\x8c\xf5\xf6\xc7\x40\
+\x26\x01\xc0\x05\xfe\x0c\x02\x2f\x65\xb5\xde\xe1\xfc\xcb\x70\x1c\
+\x8b\xf7\x07\x02\x4e\x3a\x9d\x5e\xeb\xec\x0c\x0a\x7b\x6f\x16\xad\
+\x0d\x22\x34\xd1\x76\x6d\x02\xe3\x1c\x28\x2f\x2f\x5f\x94\x48\xa6\
+\x9e\xc2\x84\x61\x90\x83\x8e\x22\xb6\xd3\xc7\xb6\x0c\x04\xdb\x20\
+\x5a\x6c\x35\x65\x32\x09\x07\x3c\x43\x0b\xb3\xb8\xc7\xab\x02\x77\
+\xcf\x1e\x5c\x56\x56\x7e\x88\x2c\x4b\xc7\x04\xfd\xf2\x35\xc0\x61\
+\xdc\xea\x0a\xdf\x46\x78\x3e\xe8\x6b\x6f\x6a\xb8\x39\x93\xce\x9c\
+\xaf\xab\xea\xed\xa6\xa9\x7f\x4c\xb0\x33\x38\xe8\xf7\x5f\xb7\xa8\
+\xae\x6e\xf7\x6f\x8b\x15\x82\x6f\x35\xc0\x7c\x1b\x6e\xb3\x41\x57\
+\x57\x57\xb9\x9f\xe3\xae\xaa\x88\xc7\x0f\xad\xad\xea\xfd\xe9\xc8\
+\x41\x03\xee\xaf\xad\xaa\x3c\x13\x5c\x89\xbb\xc0\xe0\xa2\xac\x8b\
+\xa9\xd7\xf3\x83\xfe\xbb\x84\xb8\x96\xa6\xb9\x00\x54\xc4\xa7\xc0\
+\x31\xe1\x0f\x4a\x20\x44\x60\xe5\xe6\x61\x16\xca\xa2\xf0\x7e\xdf\
+\xf2\xca\x87\x87\xf6\xee\xfb\xe7\x51\xb5\xfd\xee\xe8\x5f\x5e\x7e\
+\x57\x9f\xa2\xa2\xc5\xdf\xaf\xc2\xc2\x4b\x16\x25\x3d\x1a\x8d\x4d\
+\xaf\x89\x95\xdd\x3b\xb8\xa6\xf7\xdd\x83\x7b\xd7\xdc\x56\x5b\x59\
+\xf9\x54\xdf\x8a\x8a\xc6\x35\xcb\xc3\xfe\x8f\x38\xe0\x6e\x08\x82\
+\xe0\xfd\xc9\xd0\x35\xf3\x7e\x6a\xdc\x30\x0c\x02\x38\x10\xe2\xf7\
+\x00\x00\x07\x66\x49\x44\x41\x54\x22\x58\xbc\x20\xbe\x55\x51\x52\
+\x76\xfb\x80\x5e\x7d\xee\x67\x4c\x6b\x0a\x78\x11\x4b\x58\x86\x19\
+\x2d\x07\x83\xfd\xd6\xe4\xcd\xb1\x62\x06\x56\x6e\x93\x83\x6b\xb7\
+\x35\xd3\x41\x35\x01\x35\x9f\xb7\x41\x3f\xb9\x35\xd3\xbd\x38\x40\
+\x0a\x21\x50\x8b\x7e\x78\x09\xab\x3e\x08\xf2\xbb\xa0\x6f\x27\x10\
+\x08\x59\xe1\xa8\xcf\x5c\x95\xfa\xc3\x4f\x01\x09\x2e\x71\x2c\xa2\
+\x48\xa2\x51\x5b\x5b\x6b\xf4\x94\x48\x1b\x46\x8d\xae\xea\xbd\xb5\
+\xbc\xda\xb1\x66\x3a\xcd\xc7\xf0\x82\x90\x38\xe0\x6e\x40\xb8\xd6\
+\xdb\xef\xf7\x93\x6c\x3a\xed\xe6\xf2\x79\x73\x44\xbf\x7e\xef\x89\
+\x22\xff\xf7\x40\x20\x30\x1c\xfa\x3b\x86\x45\x0c\x2f\x49\xd2\x5a\
+\x00\x09\x63\xdd\x99\xcf\xe7\xdb\x64\x5e\xea\xb7\xa8\xa1\xa1\x37\
+\xb0\x76\xc4\xb2\xb2\x87\xbb\x3b\xda\x8f\x35\x75\xeb\x0a\xd8\x7a\
+\x37\x33\x78\x35\x28\x79\x6d\x11\x42\x38\xcb\x35\xa6\x44\x4b\xcb\
+\x4f\x1d\x39\x74\xc0\xec\x91\x43\x06\xdd\x3f\x6a\xd0\xa0\x53\x19\
+\x84\x6f\x95\x15\x45\xe2\x05\x61\xb8\x57\xb0\xf0\xb1\x5a\x03\xcc\
+\xea\xd8\x36\x1a\xe1\xf9\x22\xdd\xb6\x9d\x3d\xf3\x99\xdc\x94\xce\
+\x74\xfa\x20\x7a\x55\xda\xd8\xd8\x18\xf1\xcb\x62\x88\xc5\x24\x23\
+\xf0\x4c\x7a\x7d\x5d\x17\x45\x81\x11\x78\x96\xd3\x35\x6d\x9d\x7a\
+\xa2\xbe\xba\x4b\x5c\xc6\xb4\xed\x92\xce\xce\xce\xb2\x15\xed\xed\
+\x7d\xea\x3a\x56\xf6\xeb\x48\xa5\xfa\xd5\xd7\xd7\x97\x7e\x9f\xaf\
+\xe3\x58\x08\xf6\x1b\xa2\xa6\xe5\x6b\x9a\xd2\x9d\xb5\xed\xa9\xf6\
+\xbe\x8d\xed\xed\x7d\x17\x43\x3d\xfa\x7d\x93\x35\xcb\x87\x10\x62\
+\x58\x84\x30\x87\x19\xce\xc7\x4b\x35\x4d\xdd\xdd\x95\xa9\x54\xaa\
+\x4f\x22\x91\xa8\x69\x68\x68\xf0\x5c\x0e\xb4\x89\x2f\x51\x14\x31\
+\x6c\x07\x04\x59\x12\x2a\x1b\xdb\xda\x86\xd6\x35\x37\x57\x71\x92\
+\x6f\x0c\x76\x49\x84\x38\x4e\x87\xa3\xeb\x89\x35\x59\x0a\xd8\x49\
+\x88\x2c\x97\xcc\xe7\xb3\xbb\xe9\x84\x0c\x68\x20\x44\x4a\xe4\x72\
+\xc3\x41\xa6\x9d\x82\x3e\x5f\x62\x41\x30\xd8\xb0\x66\x79\x1a\xb7\
+\x6d\x9b\x75\x6c\x87\x05\x83\xc5\xf4\xb9\x87\x32\xd9\x2c\x00\xb8\
+\x4c\x74\x35\x2b\x9b\x86\x51\x0b\x9e\x5f\x65\x53\x67\x67\xff\x66\
+\x90\xa1\xa7\x0c\x0d\xc1\x9b\x21\x2c\xec\xc5\x18\x86\x91\x9b\xda\
+\xdb\x87\xc7\x55\xb5\xaa\x33\x97\x1b\xe5\x3a\xce\xf1\xd1\x48\xa4\
+\x37\x41\xf8\x5d\x5a\x6e\x4d\x32\x60\x7c\x00\x3d\x30\x5a\xcb\x2f\
+\x5b\x55\x02\x74\xc6\xc6\x62\x31\xc2\xc9\xbc\x97\x80\x31\xfb\x34\
+\x6c\xe5\xa8\xc7\x17\x66\x30\x96\x19\x40\x0d\x2f\xe3\xdb\x8f\xaa\
+\xe2\xe2\xa5\xae\xae\x7d\x08\xfd\x2b\x92\x15\xff\x44\x7a\x56\x27\
+\x75\x77\x73\xbe\x40\x20\x17\x0c\x2a\x21\x8c\x30\xc3\xb1\xec\x5a\
+\x80\xbb\x60\x01\x62\x2c\xcb\x1c\xe3\xba\xee\x0d\x4b\x96\x2f\xdf\
+\xf7\xab\xaf\xbe\xaa\x5a\xda\xd8\xd8\xd7\xd2\xf5\x20\xe8\xd5\x80\
+\x26\xf2\xdf\xb2\x2f\x04\xdf\x6a\x60\x9d\x06\xf5\x6d\xde\x36\x11\
+\x84\xc3\x38\xe9\x57\xfc\x0f\x14\x97\x16\x87\xda\x9a\x5b\xee\xc7\
+\xd9\xfc\x33\x8c\x28\xbe\xc8\x32\xcc\x49\xb2\x28\x2e\x32\x2d\x6b\
+\xf6\xba\x3a\x6a\xea\x3a\xab\xeb\x1a\x93\xcb\xe6\x19\xc5\x07\x97\
+\xb5\xeb\x28\x04\xe7\x45\x70\xe3\xed\x20\x38\xb1\x3d\xca\x22\xe8\
+\x59\xe0\xf9\xb4\x93\xb7\x9f\xec\xec\xee\x7a\x45\x0c\x86\xae\xa9\
+\xab\xab\x5b\xeb\x2c\x42\x84\xad\x89\xa9\x1b\x8a\x63\xda\xe7\xbb\
+\xaa\xf5\x48\x3a\xab\x3f\x69\x9b\xe6\x33\x48\xd3\xa6\x99\xe9\xdc\
+\xf9\xad\xad\x99\xd5\xd7\xc1\x80\x2c\x0c\xf5\x78\x30\xc6\xc5\xaa\
+\xae\x4f\x12\x19\xee\x49\xd5\xb2\x1e\x57\x0d\xfd\x51\xd9\xe7\x3b\
+\x71\x1d\xe2\x6c\x30\xc9\x54\x55\x28\x43\x84\x6c\x36\x77\x9a\x63\
+\x99\x8f\x12\xd3\x98\x66\xd9\xc6\xdd\xc1\x60\xb0\x9c\xe5\xb8\xf7\
+\x4b\x4b\x4b\xd7\xda\xee\x41\xdb\x8d\x0c\xa4\x87\x03\xa1\x21\xa9\
+\xce\xae\x67\x03\xa9\xcc\x93\x5a\x5e\xbd\x9b\xc3\xec\x88\x64\x32\
+\xf9\xd6\xf7\x6f\xe1\x80\x39\xc2\x0e\xdc\xe0\xb8\x2e\xc3\x19\x06\
+\xe0\x26\x4d\x59\x45\x21\x8c\x19\x3d\xa7\xba\xa2\x24\x8d\xe0\x38\
+\xee\x5a\x00\x95\xe7\x1c\xd3\x7a\x9e\x10\xf6\x46\xd8\xe2\xed\xba\
+\xaa\x14\x42\x00\x8e\xc8\xd2\x4d\x56\x12\xc4\x11\x0e\x46\xf7\x66\
+\x32\xe9\xe7\x2c\x43\x7f\x42\x96\xa4\x93\xe0\x20\x78\x56\xd8\x27\
+\xdf\xdf\x53\xb6\x27\xc4\x0c\xc3\xb8\x16\x94\x76\x7e\x88\x3c\x8a\
+\x20\xe1\x54\x22\x49\x64\xc4\x79\xc5\xe9\x5f\x20\x24\x86\xf1\x8a\
+\x65\xdb\x4b\x88\x4b\x6c\x91\x5b\x95\xee\x65\x7e\xfb\x21\xb2\xec\
+\x9b\xd9\x74\x66\x46\x40\x51\xc6\x39\xa6\xf3\xf7\xac\x66\xbe\x00\
+\xb2\xbf\x12\xf4\x07\xa6\x42\x3b\x49\xe2\x90\xb5\xc0\x6f\xd8\x30\
+\x6c\x86\xa2\xd1\x5b\x03\xfe\x00\x61\x59\xf6\x2f\xa1\xa2\xe2\x07\
+\x5d\xcb\x7e\x28\x14\x89\x5c\x64\xa8\x7a\xa3\x6e\x59\x1f\x7e\xcb\
+\xfa\x37\x1f\x6c\xae\x0e\x6c\xf3\xc0\x43\x15\x15\x09\xf9\x5f\xd0\
+\xf2\xf9\x8b\x8b\x4b\x8a\x3f\x14\x45\x21\xe6\x3a\x2e\x6f\xea\xfa\
+\x74\xc6\x75\xa7\xd4\x7c\xcf\xd8\x68\x79\x4a\x82\xeb\xa6\x78\x81\
+\x9f\xc5\x8b\xec\xfb\xb6\x2c\xa7\x68\xda\xf7\x89\x11\x84\x4e\x5d\
+\x33\xfe\xc5\x32\xec\xe7\x2c\x8b\x4d\x96\x45\xf9\x50\x30\x98\x8d\
+\x45\xa2\x49\x86\x65\x6c\xd4\xbf\xff\x5a\x55\x88\x6d\x2f\x96\x45\
+\xe1\x5f\x40\x8b\xc0\xf8\x72\x41\x59\xc9\xc9\x82\x94\x0d\xf9\x83\
+\x69\x59\xe2\x0d\x4b\x71\x61\xe1\x5e\x55\xa5\x0a\x21\x9d\xc5\xcc\
+\xe7\xc8\x75\x67\xc0\x20\x35\xc9\x8a\xa4\x49\xa2\x94\x97\x65\x59\
+\x03\x00\xb3\x57\x95\xda\xb4\x4f\x87\x71\x1a\x38\x86\xfb\xa7\x2c\
+\x0a\x5f\x30\x88\xe4\xc0\x98\x13\x7e\x59\xf9\x4f\x36\x9b\xb9\xa1\
+\xa2\xb8\xf8\x91\xef\x73\x2b\x2b\x2b\xcb\x07\x7c\xf2\xa3\x60\xce\
+\xb7\xf0\x9c\xd0\x0e\x1b\xa8\x6a\x00\x0e\x1d\xb6\x2e\x8f\x95\x45\
+\xa3\xb7\x7d\xbf\xbc\xf7\xcc\xb2\xb3\xe1\xba\xe8\x6d\x90\x33\xe3\
+\x3d\x7f\xfb\xd1\xdd\xed\xcf\x62\x84\xfe\xeb\x9a\xe6\x2c\xbf\x24\
+\x75\x86\x82\x81\xac\xdf\x2f\x67\x44\x1f\xaf\xc2\xd6\x67\x75\xbf\
+\x79\xd7\xed\x46\xd8\x9d\x69\xe8\xda\x1c\x45\x16\xd3\x12\xcf\xa6\
+\x58\x44\xe6\xa9\xd9\xec\xdd\x0a\xcb\x9e\x0f\x60\x08\xe2\x7c\xcb\
+\xf4\xdb\x00\xf6\x63\xe9\x54\x26\xf3\x81\x69\x6a\x8b\xbe\x4d\x5a\
+\x1d\x68\x96\xf1\x95\xdf\xef\x7b\xc7\xc5\xb8\xad\x27\xb1\x5f\xaf\
+\x5e\xff\x74\x0c\xe3\x61\x62\xb9\xff\x02\x9d\x34\xf7\xa4\xf7\x84\
+\x70\x78\xdd\xaa\x66\xf1\x94\x7c\x36\x7d\x3b\x8b\xdc\x66\x16\xa3\
+\x12\x81\x63\x33\x99\x54\x7a\x7a\x36\x93\x3c\xa5\xba\xba\xdc\xbb\
+\xed\xea\x29\x4f\xc3\xf2\x58\xf8\xaf\xa6\x9a\xbd\x20\xe8\x0f\xcc\
+\xb4\x4d\x2b\xc6\xf3\x9c\xcf\x50\xd5\xbf\xdb\xa6\x3e\x71\xc4\x80\
+\x01\xf5\xb4\x4c\x81\xbe\xd3\x00\xf3\x5d\x74\xdb\x8e\x95\x97\x94\
+\xbc\x0d\xc6\x75\x76\x75\x79\xd9\x1f\x7a\x55\x56\xfc\xb1\xbc\xb8\
+\xf8\x06\x70\xc1\xd7\xfb\xe3\xbd\xe2\xe2\xe2\x6c\xa9\x3f\xf4\x42\
+\xef\xe2\xf2\xbb\xcb\x30\x5e\xa7\xab\x1c\x53\x94\x26\xb8\x22\xbe\
+\x28\x12\x8e\x1c\x5b\x56\x54\x7c\x78\x45\xac\xe4\xd0\xf2\xa2\x22\
+\x08\x63\x7f\x2c\x8f\x44\x2e\xad\xc5\x18\x6c\xe2\x3b\xbd\x82\x47\
+\xf1\x09\x5c\xd1\x5f\x5c\x1a\x2b\x3a\xba\xb2\xb8\xf4\x88\xf2\xa2\
+\x92\xc3\x2b\xca\xa0\x4e\x71\xec\xa0\xaa\xd2\xd2\x7b\x7a\x85\xc3\
+\xab\x7f\xc1\x0c\x06\x46\x8a\x82\xbe\x37\x43\x7e\xf9\xf4\xe2\x68\
+\xe8\xf8\x80\x24\x1d\x15\x0d\x06\x8e\x88\x85\x23\xe3\x22\x91\xc8\
+\xf3\xdf\x71\xdd\xf8\xd8\xc0\xbe\x03\xbf\xaa\xa9\xaa\xba\xb4\xa6\
+\xaa\xe6\xf0\xde\x35\xbd\x0f\xaa\xae\xa8\x3c\xb2\xa4\x28\x76\x71\
+\x4d\x45\xc5\xdf\xa1\xbd\x75\x82\x19\xa4\xab\x41\x9f\xfc\x54\x2c\
+\x16\x3e\xaa\x38\x12\xde\xab\x28\x14\x3c\xbc\x24\x1a\x7d\x68\x7d\
+\xad\x96\x82\x6c\xc0\xef\x1a\xd0\xed\x5a\xc0\xd3\xa7\x0f\xd6\x8b\
+\x23\x91\xfb\x8a\x22\x91\x53\x82\x3e\xdf\xd1\x65\x45\xc5\x47\x16\
+\x85\xa3\x07\x96\x44\x8b\x2e\x0a\x87\xc3\x73\x7b\xf8\x45\xa3\xd1\
+\x74\x59\x38\xf6\x54\xd4\x1f\x38\xb1\x24\x18\x19\x57\x1e\x2b\x19\
+\x57\x16\x2b\x3e\x3f\x16\x0e\x3f\x05\xb2\x58\x3d\xe5\xd6\x0c\xfb\
+\x44\x22\xa9\xf2\xa2\xe8\x69\xd5\xd5\xd5\xff\x5b\x33\x9d\xc6\x7b\
+\x55\x56\xc2\x79\x56\xc9\x75\xfd\xab\xab\x97\xd1\xe7\x1e\xaa\xae\
+\xa8\x78\xa2\x6f\xdf\x9a\xcb\xfa\xd5\xf4\xfb\xac\x27\x6d\xcd\xb0\
+\xb6\x36\x96\x81\x7e\x3c\x5a\x59\x5e\x36\xb6\x57\x75\xe5\x98\xea\
+\xca\x8a\x83\xca\x4a\x8a\xae\x85\x36\x7e\x70\x69\xd0\x53\x0f\xf2\
+\xde\x06\x7d\x9e\xd1\xbf\x4f\xaf\x3d\x01\xdc\xf6\xea\x55\x55\x35\
+\x19\xce\xa3\xd6\xf2\x22\x7b\xca\x6e\xef\xe1\x76\x03\x3c\xdb\xfb\
+\x40\x17\xfa\x5f\xd0\xc0\xd6\xa4\x81\x02\xf0\x6c\x4d\xa3\xf1\x1b\
+\x97\xa5\x20\x7e\x41\x03\x1b\xab\x81\x02\xf0\x6c\xac\xa6\x0a\xe5\
+\x0a\x1a\x28\x68\x60\xb3\x69\xe0\xff\x01\x00\x00\xff\xff\xf2\xb3\
+\xba\x98\x00\x00\x00\x06\x49\x44\x41\x54\x03\x00\x8f\x2f\x6c\x35\
+\xaf\xb2\x2c\x56\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x06\x8a\x9c\xb3\
+\x00\x61\
+\x00\x73\x00\x73\x00\x65\x00\x74\x00\x73\
+\x00\x0d\
+\x0d\x16\x1a\x87\
+\x00\x66\
+\x00\x62\x00\x73\x00\x6c\x00\x5f\x00\x6c\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9c\x2c\x9d\x05\x70\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
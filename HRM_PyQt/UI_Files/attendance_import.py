@@ -0,0 +1,152 @@
+import csv
+import hashlib
+import os
+from collections import namedtuple
+from datetime import datetime
+from attendance_rollups import update_rollups
+
+
+BATCH_SIZE = 50000
+
+# Accepted header names for each field of a punch export
+EMP_NO_COLUMNS = ("emp_no", "employee_no", "employee", "empno", "badge")
+TIME_COLUMNS = ("punch_time", "timestamp", "datetime", "time")
+SITE_COLUMNS = ("site", "device", "terminal")
+
+SQL_EMPLOYEE_NUMBERS = "SELECT emp_no, id FROM employees WHERE emp_no IS NOT NULL"
+SQL_INSERT_PUNCH = "INSERT OR IGNORE INTO punches (employee_id, punch_time, site) VALUES (?, ?, ?)"
+SQL_UPSERT_ATTENDANCE = """
+    INSERT INTO attendance (employee_id, work_date, check_in, check_out)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(employee_id, work_date) DO UPDATE SET
+        check_in = min(check_in, excluded.check_in),
+        check_out = max(check_out, excluded.check_out)
+"""
+SQL_GET_PROGRESS = "SELECT fingerprint, byte_offset, rows_read FROM import_progress WHERE source = ?"
+SQL_SAVE_PROGRESS = """
+    INSERT INTO import_progress (source, fingerprint, byte_offset, rows_read, updated_at)
+    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(source) DO UPDATE SET
+        fingerprint = excluded.fingerprint,
+        byte_offset = excluded.byte_offset,
+        rows_read = excluded.rows_read,
+        updated_at = excluded.updated_at
+"""
+
+ImportResult = namedtuple(
+    "ImportResult",
+    "path rows_read inserted duplicates rejected resumed_from bytes_total"
+)
+
+
+class PunchImportError(Exception):
+    """Raised when a punch file cannot be imported at all"""
+
+
+def file_fingerprint(path, size=4096):
+    """Hash of the first bytes of a file, so a replaced file is not resumed mid-way"""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read(size)).hexdigest()
+
+
+def _find_column(header, names, required=True):
+    for i, column in enumerate(header):
+        if column.strip().lower() in names:
+            return i
+    if required:
+        raise PunchImportError(f"Missing column; expected one of: {', '.join(names)}")
+    return None
+
+
+def import_punch_file(repository, path, batch_size=BATCH_SIZE, progress=None, cancelled=None):
+    """Stream a punch CSV into punches/attendance with bounded memory
+
+    Rows are committed in transactions of `batch_size` together with the byte
+    offset reached, so a crashed or cancelled import picks up where it left off
+    and an export that has grown since the last run only imports the new tail.
+    `progress(bytes_done, bytes_total, rows_read)` is called after each commit.
+    """
+    source = os.path.abspath(path)
+    bytes_total = os.path.getsize(source)
+    fingerprint = file_fingerprint(source)
+    pool = repository.pool
+    conn = pool.connection()
+
+    row = conn.execute(SQL_GET_PROGRESS, (source,)).fetchone()
+    offset, rows_read = 0, 0
+    if row is not None and row[0] == fingerprint and row[1] <= bytes_total:
+        offset, rows_read = row[1], row[2]
+    resumed_from = offset
+
+    employee_ids = dict(conn.execute(SQL_EMPLOYEE_NUMBERS).fetchall())
+    inserted = duplicates = rejected = 0
+
+    with open(source, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8-sig")]))
+        emp_col = _find_column(header, EMP_NO_COLUMNS)
+        time_col = _find_column(header, TIME_COLUMNS)
+        site_col = _find_column(header, SITE_COLUMNS, required=False)
+        offset = max(offset, len(header_line))
+        f.seek(offset)
+
+        position = [offset]
+
+        def lines():
+            for raw in f:
+                position[0] += len(raw)
+                yield raw.decode("utf-8", "replace")
+
+        reader = csv.reader(lines())
+        while True:
+            punches = []
+            days = {}
+            for fields in reader:
+                rows_read += 1
+                try:
+                    employee_id = employee_ids[fields[emp_col].strip()]
+                    stamp = datetime.fromisoformat(fields[time_col].strip())
+                except (KeyError, IndexError, ValueError):
+                    rejected += 1
+                    continue
+                punch_time = stamp.isoformat(sep=" ", timespec="seconds")
+                site = fields[site_col].strip() if site_col is not None and site_col < len(fields) else None
+                punches.append((employee_id, punch_time, site))
+
+                # First/last punch per employee-day within this batch
+                key = (employee_id, punch_time[:10])
+                clock = punch_time[11:]
+                span = days.get(key)
+                if span is None:
+                    days[key] = [clock, clock]
+                elif clock < span[0]:
+                    span[0] = clock
+                elif clock > span[1]:
+                    span[1] = clock
+
+                if len(punches) >= batch_size:
+                    break
+
+            if not punches and position[0] == offset:
+                break
+
+            with pool.transaction():
+                before = conn.total_changes
+                conn.executemany(SQL_INSERT_PUNCH, punches)
+                new_punches = conn.total_changes - before
+                conn.executemany(SQL_UPSERT_ATTENDANCE, (
+                    (employee_id, work_date, span[0], span[1])
+                    for (employee_id, work_date), span in days.items()
+                ))
+                update_rollups(conn, {work_date for _, work_date in days})
+                conn.execute(SQL_SAVE_PROGRESS, (source, fingerprint, position[0], rows_read))
+            offset = position[0]
+            inserted += new_punches
+            duplicates += len(punches) - new_punches
+
+            if progress is not None:
+                progress(offset, bytes_total, rows_read)
+            if cancelled is not None and cancelled():
+                break
+
+    return ImportResult(source, rows_read, inserted, duplicates, rejected, resumed_from, bytes_total)
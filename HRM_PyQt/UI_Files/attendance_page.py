@@ -0,0 +1,187 @@
+import os
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QPushButton, QProgressBar, QFileDialog, QComboBox,
+    QVBoxLayout, QHBoxLayout
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal
+from attendance_import import import_punch_file
+from workers import run_in_background
+from jobs import job_manager, CANCELLED
+from trend_chart import TrendChart, dates_to_msecs
+from theme import set_role, set_variant
+from permissions import IMPORT_ATTENDANCE, unrestricted_session
+
+
+class AttendancePage(QWidget):
+    """Attendance sidebar page: biometric punch log import and daily trend"""
+    # Emitted after every committed import batch so the dashboard can refresh
+    data_changed = pyqtSignal()
+
+    def __init__(self, repository, session=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session or unrestricted_session()
+        self._imports = 0   # import jobs submitted from this page and not yet ended
+        # Trend loads run one at a time; a scope change bumps the generation
+        # so a load for the previous scope is dropped when it lands.
+        self._trend_loading = False
+        self._trend_pending = None
+        self._trend_generation = 0
+        self._trend_last_day = None
+        self.setup_ui()
+        run_in_background(self.repository.departments, on_result=self._set_departments)
+        self.refresh_trend(full=True)
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header = QLabel("Attendance")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+        layout.addWidget(header)
+
+        row = QHBoxLayout()
+        desc = QLabel("Import daily punch exports (CSV) from the biometric terminals.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+
+        self.import_btn = QPushButton("Import Punch Logs...")
+        self.import_btn.setFixedHeight(36)
+        self.import_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.import_btn, "primary")
+        self.import_btn.clicked.connect(self.choose_files)
+        self.import_btn.setVisible(self.session.can(IMPORT_ATTENDANCE))
+
+        row.addWidget(desc)
+        row.addStretch()
+        row.addWidget(self.import_btn)
+        layout.addLayout(row)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedHeight(8)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximum(1000)
+        self.progress_bar.setVisible(False)
+
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "body")
+        self.status_label.setWordWrap(True)
+
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+
+        # ================= Trend =================
+        scope_row = QHBoxLayout()
+        scope_label = QLabel("Show")
+        scope_label.setFont(QFont("Segoe UI", 10))
+        set_role(scope_label, "muted")
+        self.scope_combo = QComboBox()
+        self.scope_combo.setMinimumWidth(200)
+        self.scope_combo.addItem("All departments", "")
+        self.scope_combo.currentIndexChanged.connect(lambda _: self.refresh_trend(full=True))
+        scope_row.addStretch()
+        scope_row.addWidget(scope_label)
+        scope_row.addWidget(self.scope_combo)
+        layout.addLayout(scope_row)
+
+        self.trend = TrendChart("Daily Attendance")
+        self.trend.setMinimumHeight(300)
+        layout.addWidget(self.trend, 1)
+
+    def choose_files(self):
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select punch exports", "", "CSV files (*.csv *.txt);;All files (*)"
+        )
+        self.import_files(paths)
+
+    def import_files(self, paths):
+        """Submit punch files as import jobs; the job manager runs them one after another"""
+        if not self.session.can(IMPORT_ATTENDANCE):
+            return
+        for path in paths:
+            job_manager().submit(
+                "import", f"Import {os.path.basename(path)}", import_punch_file, self.repository, path,
+                on_progress=self._on_progress,
+                on_result=self._on_finished,
+                on_error=lambda message, path=path: self._on_failed(path, message),
+                on_finished=self._on_job_ended
+            )
+            self._imports += 1
+        if paths:
+            self.progress_bar.setVisible(True)
+            self.status_label.setText(f"Queued {len(paths)} file(s) for import...")
+
+    def _on_progress(self, values):
+        done, total, rows = values
+        self.progress_bar.setValue(int(1000 * done / total) if total else 1000)
+        self.status_label.setText(f"Processed {rows:,} punches...")
+        self.data_changed.emit()
+        self.refresh_trend()
+
+    def _on_finished(self, result):
+        resumed = f" (resumed at byte {result.resumed_from:,})" if result.resumed_from else ""
+        self.status_label.setText(
+            f"{os.path.basename(result.path)}: {result.inserted:,} new punches, "
+            f"{result.duplicates:,} duplicates, {result.rejected:,} rejected{resumed}"
+        )
+        self.progress_bar.setValue(1000)
+        self.data_changed.emit()
+        # Files may cover earlier dates too, so reload the whole range once done
+        self.refresh_trend(full=True)
+
+    def _on_failed(self, path, message):
+        last_line = message.strip().splitlines()[-1]
+        self.status_label.setText(f"{os.path.basename(path)}: import failed - {last_line}")
+
+    def _on_job_ended(self, job):
+        self._imports -= 1
+        if job.state == CANCELLED and job.started_at is not None:
+            # Committed batches stay; importing the file again resumes after them
+            self.status_label.setText(f"{job.title} cancelled - import the file again to resume")
+            self.data_changed.emit()
+            self.refresh_trend(full=True)
+        if not self._imports:
+            self.progress_bar.setVisible(False)
+
+    # -------- Trend --------
+    def _set_departments(self, departments):
+        for department in departments:
+            self.scope_combo.addItem(department, department)
+
+    def refresh_trend(self, full=False):
+        """Load the trend for the selected scope; without `full` only from the last day shown on"""
+        if full:
+            self._trend_generation += 1
+        if self._trend_loading:
+            self._trend_pending = "full" if full or self._trend_pending == "full" else "tail"
+            return
+        full = full or self._trend_last_day is None
+        generation = self._trend_generation
+        self._trend_loading = True
+        run_in_background(
+            self.repository.daily_attendance,
+            None if full else self._trend_last_day,
+            self.scope_combo.currentData(),
+            on_result=lambda result: self._on_trend_loaded(result, full, generation),
+            on_error=lambda message: self._on_trend_loaded(None, full, generation)
+        )
+
+    def _on_trend_loaded(self, result, full, generation):
+        self._trend_loading = False
+        if result is not None and generation == self._trend_generation:
+            dates, counts = result
+            if full:
+                self.trend.set_data(dates_to_msecs(dates), counts)
+                self._trend_last_day = dates[-1] if dates else None
+            elif dates:
+                self.trend.append(dates_to_msecs(dates), counts)
+                self._trend_last_day = dates[-1]
+        pending, self._trend_pending = self._trend_pending, None
+        if generation != self._trend_generation:
+            self.refresh_trend(full=True)
+        elif pending:
+            self.refresh_trend(full=pending == "full")
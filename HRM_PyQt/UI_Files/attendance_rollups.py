@@ -0,0 +1,86 @@
+"""Daily and monthly attendance rollups
+
+attendance_daily holds the head count per day and attendance_monthly the
+per-month totals the dashboard chart reads. Writers call update_rollups() for
+the dates they touched inside their own transaction; rebuild_rollups()
+recomputes a whole range from raw attendance after backfills or repairs.
+
+    python attendance_rollups.py --rebuild [--from 2024-01-01] [--to 2024-12-31]
+"""
+import argparse
+import time
+
+SQL_COUNT_DAY = "SELECT COUNT(*) FROM attendance WHERE work_date = ?"
+SQL_SET_DAY = "INSERT OR REPLACE INTO attendance_daily (work_date, present) VALUES (?, ?)"
+SQL_DELETE_DAY = "DELETE FROM attendance_daily WHERE work_date = ?"
+# 'YYYY-MM-32' sorts after every real date of the month, so a month is a plain range
+SQL_SET_MONTH = """
+    INSERT OR REPLACE INTO attendance_monthly (month, present_total, days)
+    SELECT ?, IFNULL(SUM(present), 0), COUNT(*)
+    FROM attendance_daily
+    WHERE work_date >= ? || '-01' AND work_date <= ? || '-32'
+"""
+SQL_DELETE_EMPTY_MONTH = "DELETE FROM attendance_monthly WHERE month = ? AND days = 0"
+
+
+def update_rollups(conn, dates):
+    """Recompute rollups for the given ISO dates (call inside the writer's transaction)
+
+    Each day is a count over the attendance date index and each month a sum of
+    at most 31 daily rows, so the cost depends on the dates touched, not on the
+    size of the attendance table.
+    """
+    months = set()
+    for day in sorted(set(dates)):
+        present = conn.execute(SQL_COUNT_DAY, (day,)).fetchone()[0]
+        if present:
+            conn.execute(SQL_SET_DAY, (day, present))
+        else:
+            conn.execute(SQL_DELETE_DAY, (day,))
+        months.add(day[:7])
+    for month in sorted(months):
+        conn.execute(SQL_SET_MONTH, (month, month, month))
+        conn.execute(SQL_DELETE_EMPTY_MONTH, (month,))
+
+
+def rebuild_rollups(pool, start=None, end=None):
+    """Rebuild rollups from raw attendance for whole months covering start..end"""
+    start = (start or "0000-01")[:7] + "-01"
+    end = (end or "9999-12")[:7] + "-32"
+    with pool.transaction() as conn:
+        conn.execute("DELETE FROM attendance_daily WHERE work_date >= ? AND work_date <= ?", (start, end))
+        conn.execute("""
+            INSERT INTO attendance_daily (work_date, present)
+            SELECT work_date, COUNT(*) FROM attendance
+            WHERE work_date >= ? AND work_date <= ?
+            GROUP BY work_date
+        """, (start, end))
+        conn.execute("DELETE FROM attendance_monthly WHERE month >= ? AND month <= ?", (start[:7], end[:7]))
+        conn.execute("""
+            INSERT INTO attendance_monthly (month, present_total, days)
+            SELECT substr(work_date, 1, 7), SUM(present), COUNT(*)
+            FROM attendance_daily
+            WHERE work_date >= ? AND work_date <= ?
+            GROUP BY substr(work_date, 1, 7)
+        """, (start, end))
+        days = conn.execute(
+            "SELECT COUNT(*) FROM attendance_daily WHERE work_date >= ? AND work_date <= ?", (start, end)
+        ).fetchone()[0]
+    return days
+
+
+if __name__ == "__main__":
+    from database import get_repository
+
+    parser = argparse.ArgumentParser(description="Maintain attendance rollup tables")
+    parser.add_argument("--rebuild", action="store_true", help="recompute rollups from raw attendance")
+    parser.add_argument("--from", dest="start", help="first date or month to rebuild (YYYY-MM[-DD])")
+    parser.add_argument("--to", dest="end", help="last date or month to rebuild (YYYY-MM[-DD])")
+    parser.add_argument("--db", help="database file (default: HRM_DB_PATH or hrm.db)")
+    args = parser.parse_args()
+
+    if not args.rebuild:
+        parser.error("nothing to do; pass --rebuild")
+    started = time.perf_counter()
+    days = rebuild_rollups(get_repository(args.db).pool, args.start, args.end)
+    print(f"Rebuilt rollups for {days} days in {time.perf_counter() - started:.2f}s")
@@ -0,0 +1,399 @@
+"""Append-only audit log
+
+record() only puts the event on a queue, so it costs a few microseconds on
+the calling thread. One writer thread per log takes whatever has queued up,
+waiting up to COMMIT_WINDOW_S for more, and commits the batch with a single
+write and fsync (group commit). Entries are JSON lines in numbered segment
+files; a segment is closed and the next one started once it passes
+SEGMENT_BYTES, so old segments never change and can be archived.
+
+Every segment has a fixed-width index beside it (INDEX_DTYPE: time, user,
+event and event-family hashes, offset and length of each line). The reader memory-maps
+index and segment: a filter over millions of entries is a few numpy
+comparisons over the index, and only the lines actually shown are read and
+parsed. Segments whose time span misses the filter are skipped entirely.
+
+The index is written after its lines. When a log is opened for writing,
+lines that were written without their index entry (a crash between the
+two writes) are indexed again, and a torn index record is cut off.
+
+The desktop app and the command line may write the same log at once: each
+commit, recovery and segment roll holds an exclusive lock on LOCK_NAME in
+the audit directory, and offsets come from the segment's size on disk at
+that moment, never from what this process last wrote.
+"""
+import atexit
+import contextlib
+import functools
+import getpass
+import hashlib
+import json
+import mmap
+import os
+import queue
+import re
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:         # Windows
+    fcntl = None
+    import msvcrt
+
+SEGMENT_BYTES = 64 * 1024 * 1024
+COMMIT_WINDOW_S = 0.05          # how long a batch waits for more events before committing
+MAX_BATCH = 5000
+EXIT_FLUSH_S = 5.0              # queued events get this long to reach disk at interpreter exit
+
+SEGMENT_NAME = "audit-{:06d}.log"
+SEGMENT_RE = re.compile(r"audit-(\d{6})\.log$")
+INDEX_SUFFIX = ".idx"
+LOCK_NAME = "audit.lock"
+INDEX_DTYPE = np.dtype([
+    ("ts", "<i8"),          # epoch milliseconds, never decreasing within a log
+    ("user", "<u8"),        # name_hash of the user name
+    ("event", "<u8"),       # name_hash of the event name
+    ("family", "<u8"),      # name_hash of the event family ("loan." for "loan.settle")
+    ("offset", "<u8"),
+    ("length", "<u4"),
+])
+
+AuditEntry = namedtuple("AuditEntry", "ts user event details")
+
+# Who record() attributes events to when no user is given: the signed-in user
+# in the desktop app, the operating system account for the command line
+_actor = None
+
+
+def set_actor(user):
+    global _actor
+    _actor = user
+
+
+def current_actor():
+    return _actor or getpass.getuser()
+
+
+@functools.lru_cache(maxsize=4096)
+def name_hash(text):
+    """64-bit hash used in the index; a collision is about as likely as a disk error"""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@functools.lru_cache(maxsize=1024)
+def event_family(event):
+    """'loan.settle' -> 'loan.'; events without a dot are their own family"""
+    head, dot, _ = event.partition(".")
+    return head + dot
+
+
+def audit_directory(db_path):
+    """Where the audit log of the database at `db_path` lives (HRM_AUDIT_DIR overrides)"""
+    return os.environ.get("HRM_AUDIT_DIR") or os.path.splitext(os.path.abspath(db_path))[0] + "_audit"
+
+
+def _segments(directory):
+    """[(number, log path)] in order"""
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = SEGMENT_RE.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(found)
+
+
+@contextlib.contextmanager
+def _exclusive(lock_file):
+    """Hold the writers' lock on `lock_file`, waiting for other processes as long as needed"""
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        return
+    lock_file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)   # gives up after ~10 s
+            break
+        except OSError:
+            continue
+    try:
+        yield
+    finally:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# ================= Writer =================
+class AuditLog:
+    """Background writer for one audit directory"""
+
+    def __init__(self, directory, segment_bytes=SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._queue = queue.Queue()
+        self._last_ts = 0
+        self._log = self._index = self._lock_file = None
+        self._number = 0
+        self._size = 0
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def record(self, event, user=None, **details):
+        """Queue one event; returns immediately"""
+        self._queue.put((int(time.time() * 1000), user or current_actor(), event, details))
+        if self._thread is None:
+            self._start()
+
+    def flush(self, timeout=None):
+        """Block until every event queued so far is on disk"""
+        done = threading.Event()
+        self._queue.put(done)
+        if self._thread is None:
+            self._start()
+        return done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self._thread.start()
+
+    # -------- Writer thread --------
+    def _run(self):
+        self._open()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + COMMIT_WINDOW_S
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            events = [item for item in batch if not isinstance(item, threading.Event)]
+            if events:
+                self._commit(events)
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _commit(self, events):
+        with _exclusive(self._lock_file):
+            self._catch_up()
+            self._append(events)
+
+    def _catch_up(self):
+        """Follow whatever other processes wrote since this one last held the lock"""
+        segments = _segments(self.directory)
+        if segments and segments[-1][0] > self._number:
+            self._roll(segments[-1][0])
+        self._size = os.fstat(self._log.fileno()).st_size
+        entries = os.fstat(self._index.fileno()).st_size // INDEX_DTYPE.itemsize
+        if entries:
+            last = np.fromfile(self._index.name, dtype=INDEX_DTYPE, count=1,
+                               offset=(entries - 1) * INDEX_DTYPE.itemsize)
+            self._last_ts = max(self._last_ts, int(last["ts"][0]))
+
+    def _append(self, events):
+        encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
+        last_ts = self._last_ts
+        stamps, lines = [], []
+        for ts, user, event, details in events:
+            last_ts = max(ts, last_ts)
+            stamps.append(last_ts)
+            lines.append(encode({"ts": last_ts, "user": user, "event": event, "details": details}).encode("utf-8")
+                         + b"\n")
+        self._last_ts = last_ts
+
+        index = np.zeros(len(events), dtype=INDEX_DTYPE)
+        index["ts"] = stamps
+        index["user"] = [name_hash(user) for _, user, _, _ in events]
+        index["event"] = [name_hash(event) for _, _, event, _ in events]
+        index["family"] = [name_hash(event_family(event)) for _, _, event, _ in events]
+        lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+        index["length"] = lengths
+        index["offset"] = self._size + np.cumsum(lengths) - lengths
+        offset = self._size + int(lengths.sum())
+
+        self._log.write(b"".join(lines))
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._index.write(index.tobytes())
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        self._size = offset
+        if self._size >= self.segment_bytes:
+            self._roll(self._number + 1)
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock_file = open(os.path.join(self.directory, LOCK_NAME), "a+b")
+        with _exclusive(self._lock_file):
+            segments = _segments(self.directory)
+            number = segments[-1][0] if segments else 1
+            self._roll(number)
+            self._recover()
+
+    def _roll(self, number):
+        if self._log is not None:
+            self._log.close()
+            self._index.close()
+        self._number = number
+        path = os.path.join(self.directory, SEGMENT_NAME.format(number))
+        self._log = open(path, "ab")
+        self._index = open(path + INDEX_SUFFIX, "ab")
+        self._size = self._log.tell()
+
+    def _recover(self):
+        """Make the open segment's index match its lines after a crash"""
+        entries = self._index.tell() // INDEX_DTYPE.itemsize
+        if self._index.tell() % INDEX_DTYPE.itemsize:
+            self._index.truncate(entries * INDEX_DTYPE.itemsize)
+            self._index.seek(0, os.SEEK_END)
+        indexed = 0
+        if entries:
+            index = np.fromfile(self._index.name, dtype=INDEX_DTYPE, count=entries)
+            last = index[-1]
+            indexed = int(last["offset"] + last["length"])
+            self._last_ts = int(index["ts"].max())
+        if indexed >= self._size:
+            return
+        with open(self._log.name, "rb") as f:
+            f.seek(indexed)
+            tail = f.read()
+        complete = tail.rfind(b"\n") + 1
+        events = []
+        for line in tail[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+                events.append((entry["ts"], entry["user"], entry["event"], entry["details"]))
+            except (ValueError, KeyError):
+                continue
+        # Rewrite the unindexed tail (minus any torn last line) through the normal path
+        self._log.truncate(indexed)
+        self._log.seek(0, os.SEEK_END)
+        self._size = indexed
+        if events:
+            self._append(events)
+
+
+_logs = {}
+_logs_lock = threading.Lock()
+
+
+def get_audit_log(repository):
+    """The shared audit log of `repository`'s database"""
+    directory = audit_directory(repository.pool.path)
+    with _logs_lock:
+        log = _logs.get(directory)
+        if log is None:
+            log = _logs[directory] = AuditLog(directory)
+        return log
+
+
+@atexit.register
+def _flush_all():
+    # The writer threads are daemons; commit what is still queued before they stop
+    for log in list(_logs.values()):
+        if log._thread is not None:
+            log.flush(EXIT_FLUSH_S)
+
+
+def record(repository, event, user=None, **details):
+    """Queue an audit event for `repository`'s database (see AuditLog.record)"""
+    get_audit_log(repository).record(event, user, **details)
+
+
+# ================= Reader =================
+class AuditMatches:
+    """Entries matching a query, newest first, decoded only when asked for
+
+    Holds (segment, offset, length) per match over the memory-mapped
+    segments; indexing decodes one line. Close it to unmap the segments.
+    """
+
+    def __init__(self, maps, segment, offset, length):
+        self._maps = maps
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+
+    def __len__(self):
+        return len(self.offset)
+
+    def __getitem__(self, i):
+        start = int(self.offset[i])
+        entry = json.loads(self._maps[self.segment[i]][start:start + int(self.length[i])])
+        return AuditEntry(entry["ts"], entry["user"], entry["event"], entry["details"])
+
+    def close(self):
+        for data in self._maps:
+            data.close()
+        self._maps = []
+
+
+class AuditReader:
+    """Queries over an audit directory; safe to use while the log is written"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def query(self, start=None, end=None, user=None, event=None):
+        """AuditMatches with start <= ts < end (epoch ms) for `user` and `event`
+
+        `event` ending in '.' matches a family ("loan." is every loan event).
+        Everything is decided on the index; no line is read until it is shown.
+        """
+        wanted = {}
+        if user:
+            wanted["user"] = name_hash(user)
+        if event:
+            wanted["family" if event.endswith(".") else "event"] = name_hash(event)
+
+        maps, segments, offsets, lengths = [], [], [], []
+        for _, path in _segments(self.directory):
+            index = _read_index(path)
+            if not len(index):
+                continue
+            ts = index["ts"]
+            if (start is not None and ts[-1] < start) or (end is not None and ts[0] >= end):
+                continue
+            lo = 0 if start is None else int(np.searchsorted(ts, start, "left"))
+            hi = len(ts) if end is None else int(np.searchsorted(ts, end, "left"))
+            rows = index[lo:hi]
+            for field, value in wanted.items():
+                rows = rows[rows[field] == value]
+            if not len(rows):
+                continue
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            segments.append(np.full(len(rows), len(maps), dtype=np.int32))
+            offsets.append(rows["offset"])
+            lengths.append(rows["length"])
+            maps.append(data)
+
+        if not maps:
+            empty = np.zeros(0, dtype=np.int64)
+            return AuditMatches(maps, empty, empty, empty)
+        return AuditMatches(maps, np.concatenate(segments)[::-1], np.concatenate(offsets)[::-1],
+                            np.concatenate(lengths)[::-1])
+
+
+def _read_index(path):
+    """The index of the segment at `path`, memory-mapped (whole records only)"""
+    try:
+        count = os.path.getsize(path + INDEX_SUFFIX) // INDEX_DTYPE.itemsize
+    except OSError:
+        count = 0
+    if not count:
+        return np.zeros(0, dtype=INDEX_DTYPE)
+    return np.memmap(path + INDEX_SUFFIX, dtype=INDEX_DTYPE, mode="r", shape=(count,))
+
@@ -0,0 +1,208 @@
+from datetime import datetime, time as day_time, timedelta
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QLineEdit, QPushButton, QComboBox, QDateEdit, QTableView,
+    QHeaderView, QVBoxLayout, QHBoxLayout, QAbstractItemView
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QDate, QModelIndex, QAbstractTableModel
+from audit import AuditReader, get_audit_log
+from workers import run_in_background
+from theme import set_role, set_variant
+
+# Event filter choices: label -> event name or family
+EVENT_FILTERS = {
+    "All events": None,
+    "Sign-ins": "login.",
+    "Failed sign-ins": "login.failure",
+    "Employees": "employee.",
+    "Loans": "loan.",
+    "Payroll": "payroll.",
+    "Salaries": "salary.",
+}
+DEFAULT_DAYS = 30
+
+
+def load_audit(repository, start, end, user, event):
+    """Worker-thread query: commit what is queued, then match on the index"""
+    log = get_audit_log(repository)
+    log.flush(1.0)
+    return AuditReader(log.directory).query(start, end, user or None, event)
+
+
+def format_details(details):
+    return ", ".join(f"{key}={value}" for key, value in details.items())
+
+
+class AuditTableModel(QAbstractTableModel):
+    """Matching entries, newest first; a row's line is only read when the view paints it"""
+    COLUMNS = ["Time", "User", "Event", "Details"]
+    CACHE_ROWS = 512
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matches = None
+        self._cache = {}
+
+    def set_matches(self, matches):
+        self.beginResetModel()
+        if self._matches is not None:
+            self._matches.close()
+        self._matches = matches
+        self._cache = {}
+        self.endResetModel()
+
+    # -------- Qt model interface --------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self._matches is None else len(self._matches)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        entry = self._entry(index.row())
+        column = index.column()
+        if column == 0:
+            return datetime.fromtimestamp(entry.ts / 1000).strftime("%Y-%m-%d %H:%M:%S")
+        if column == 1:
+            return entry.user
+        if column == 2:
+            return entry.event
+        return format_details(entry.details)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def _entry(self, row):
+        # Every column of a visible row asks for the same line; decode it once
+        entry = self._cache.get(row)
+        if entry is None:
+            if len(self._cache) >= self.CACHE_ROWS:
+                self._cache.clear()
+            entry = self._cache[row] = self._matches[row]
+        return entry
+
+
+class AuditPage(QWidget):
+    """The "Audit" page: sign-ins, registrations, loan, salary and payroll changes"""
+    ROW_HEIGHT = 32
+
+    def __init__(self, repository, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self._generation = 0
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header = QLabel("Audit Log")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+        layout.addWidget(header)
+
+        desc = QLabel("Who signed in, registered employees, and changed loans, salaries or payroll, and when.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+        layout.addWidget(desc)
+
+        # ----- Filters -----
+        filters = QHBoxLayout()
+        filters.setSpacing(10)
+
+        self.user_input = QLineEdit()
+        self.user_input.setPlaceholderText("User")
+        self.user_input.setFixedHeight(36)
+        self.user_input.setFixedWidth(200)
+        set_role(self.user_input, "input")
+        self.user_input.returnPressed.connect(self.refresh)
+
+        self.event_combo = QComboBox()
+        self.event_combo.addItems(EVENT_FILTERS)
+        self.event_combo.setFixedHeight(36)
+        self.event_combo.currentIndexChanged.connect(self.refresh)
+
+        today = QDate.currentDate()
+        self.from_date = self._date_edit(today.addDays(-DEFAULT_DAYS))
+        self.to_date = self._date_edit(today)
+
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.setFixedHeight(36)
+        self.refresh_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.refresh_btn, "secondary")
+        self.refresh_btn.clicked.connect(self.refresh)
+
+        filters.addWidget(self.user_input)
+        filters.addWidget(self.event_combo)
+        filters.addWidget(QLabel("From"))
+        filters.addWidget(self.from_date)
+        filters.addWidget(QLabel("To"))
+        filters.addWidget(self.to_date)
+        filters.addStretch()
+        filters.addWidget(self.refresh_btn)
+        layout.addLayout(filters)
+
+        # ----- Table -----
+        self.model = AuditTableModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("auditTable")
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setAlternatingRowColors(True)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(False)
+
+        # Fixed sizes keep the view from measuring every row of a million-entry result
+        rows = self.table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.setVisible(False)
+
+        columns = self.table.horizontalHeader()
+        columns.resizeSection(0, 180)
+        columns.resizeSection(1, 160)
+        columns.resizeSection(2, 160)
+        columns.setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("")
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "muted")
+        layout.addWidget(self.status_label)
+
+        self.refresh()
+
+    def _date_edit(self, date):
+        edit = QDateEdit(date)
+        edit.setCalendarPopup(True)
+        edit.setDisplayFormat("yyyy-MM-dd")
+        edit.setFixedHeight(36)
+        edit.dateChanged.connect(self.refresh)
+        return edit
+
+    def refresh(self):
+        """Query the log with the current filters on a worker"""
+        start = datetime.combine(self.from_date.date().toPyDate(), day_time.min)
+        end = datetime.combine(self.to_date.date().toPyDate(), day_time.min) + timedelta(days=1)
+        self._generation += 1
+        generation = self._generation
+        self.status_label.setText("Searching...")
+        run_in_background(
+            load_audit, self.repository,
+            int(start.timestamp() * 1000), int(end.timestamp() * 1000),
+            self.user_input.text().strip(), EVENT_FILTERS[self.event_combo.currentText()],
+            on_result=lambda matches: self._show(generation, matches),
+            on_error=lambda message: self.status_label.setText(f"Could not read the audit log: {message}")
+        )
+
+    def _show(self, generation, matches):
+        if generation != self._generation:
+            matches.close()     # a newer filter is already on its way
+            return
+        self.model.set_matches(matches)
+        self.status_label.setText(f"{len(matches):,} entries")
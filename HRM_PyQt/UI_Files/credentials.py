@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+
+# scrypt cost: r and p stay fixed, n is calibrated per machine
+SCRYPT_R = 8
+SCRYPT_P = 1
+MIN_N = 2 ** 14
+MAX_N = 2 ** 20
+TARGET_MS = 250
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+SETTINGS_KEY = "scrypt_params"
+# The same message for an unknown user and a wrong password, so neither is revealed
+INVALID_LOGIN = "Invalid username or password"
+
+SQL_GET_SETTING = "SELECT value FROM app_settings WHERE key = ?"
+SQL_SET_SETTING = "INSERT OR REPLACE INTO app_settings (key, value) VALUES (?, ?)"
+SQL_FIND_ACCOUNT = """
+    SELECT u.username, u.password_hash FROM user_accounts u
+    LEFT JOIN employees e ON e.id = u.employee_id
+    WHERE u.username = ? OR e.email = ?
+    LIMIT 1
+"""
+SQL_ACCOUNT_EXISTS = "SELECT 1 FROM user_accounts WHERE username = ?"
+# New accounts never overwrite an existing one (the username is the primary key)
+SQL_CREATE_ACCOUNT = """
+    INSERT INTO user_accounts (username, employee_id, password_hash, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+"""
+# Password changes: the one write allowed to replace a hash
+SQL_SET_PASSWORD = """
+    INSERT INTO user_accounts (username, employee_id, password_hash, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(username) DO UPDATE SET
+        password_hash = excluded.password_hash,
+        employee_id = IFNULL(excluded.employee_id, employee_id),
+        updated_at = excluded.updated_at
+"""
+SQL_UPDATE_HASH = "UPDATE user_accounts SET password_hash = ?, updated_at = CURRENT_TIMESTAMP WHERE username = ?"
+SQL_ACCOUNT_COUNT = "SELECT COUNT(*) FROM user_accounts"
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _scrypt(password, salt, n, r, p):
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+        maxmem=128 * r * (n + p + 2) + 1024 * 1024, dklen=KEY_BYTES
+    )
+
+
+def hash_password(password, params):
+    """Encode as scrypt$n$r$p$salt$key"""
+    n, r, p = params["n"], params["r"], params["p"]
+    salt = os.urandom(SALT_BYTES)
+    return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(_scrypt(password, salt, n, r, p))}"
+
+
+def parse_hash(encoded):
+    scheme, n, r, p, salt, key = encoded.split("$")
+    if scheme != "scrypt":
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    return {"n": int(n), "r": int(r), "p": int(p)}, base64.b64decode(salt), base64.b64decode(key)
+
+
+def calibrate(target_ms=TARGET_MS):
+    """Largest power-of-two n (MIN_N..MAX_N) whose hash stays near target_ms on this machine"""
+    n = MIN_N
+    salt = os.urandom(SALT_BYTES)
+    while n < MAX_N:
+        start = time.perf_counter()
+        _scrypt("calibration", salt, n, SCRYPT_R, SCRYPT_P)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # Doubling n roughly doubles the cost; stop before overshooting the target
+        if elapsed_ms * 2 > target_ms:
+            break
+        n *= 2
+    return {"n": n, "r": SCRYPT_R, "p": SCRYPT_P}
+
+
+class CredentialStore:
+    """Salted scrypt password hashes in user_accounts
+
+    verify() and set_password() take hundreds of milliseconds by design and
+    are meant to run on a worker thread. Hashes made with older parameters
+    are upgraded on the next successful login.
+    """
+
+    def __init__(self, repository):
+        self.repository = repository
+        self._params = None
+        self._lock = threading.Lock()
+        self._seed_lock = threading.Lock()
+
+    def parameters(self):
+        """Current scrypt parameters; calibrated and saved on first use"""
+        with self._lock:
+            if self._params is None:
+                conn = self.repository.pool.connection()
+                row = conn.execute(SQL_GET_SETTING, (SETTINGS_KEY,)).fetchone()
+                if row is not None:
+                    self._params = json.loads(row[0])
+                else:
+                    self._params = calibrate()
+                    with self.repository.pool.transaction() as conn:
+                        conn.execute(SQL_SET_SETTING, (SETTINGS_KEY, json.dumps(self._params)))
+            return self._params
+
+    def recalibrate(self, target_ms=TARGET_MS):
+        """Re-measure the work factor; existing hashes upgrade on their next login"""
+        params = calibrate(target_ms)
+        with self.repository.pool.transaction() as conn:
+            conn.execute(SQL_SET_SETTING, (SETTINGS_KEY, json.dumps(params)))
+        with self._lock:
+            self._params = params
+        return params
+
+    def create_account(self, username, password, employee_id=None):
+        """Add a login account (raises sqlite3.IntegrityError if the username is taken)"""
+        encoded = hash_password(password, self.parameters())
+        with self.repository.pool.transaction() as conn:
+            conn.execute(SQL_CREATE_ACCOUNT, (username.strip(), employee_id, encoded))
+
+    def account_exists(self, username):
+        return self.repository.pool.connection().execute(
+            SQL_ACCOUNT_EXISTS, (username.strip(),)).fetchone() is not None
+
+    def set_password(self, username, password, employee_id=None):
+        """Change the password of `username`, creating the account if there is none"""
+        encoded = hash_password(password, self.parameters())
+        with self.repository.pool.transaction() as conn:
+            conn.execute(SQL_SET_PASSWORD, (username.strip(), employee_id, encoded))
+
+    def has_accounts(self):
+        return self.repository.pool.connection().execute(SQL_ACCOUNT_COUNT).fetchone()[0] > 0
+
+    def seed(self, accounts):
+        """Create accounts from {username: password} when the store is empty"""
+        with self._seed_lock:
+            if not self.has_accounts():
+                for username, password in accounts.items():
+                    self.create_account(username, password)
+
+    def verify(self, login, password):
+        """Return (username, None) on success or (None, reason) on failure"""
+        login = login.strip()
+        params = self.parameters()
+        row = self.repository.pool.connection().execute(SQL_FIND_ACCOUNT, (login, login)).fetchone()
+        if row is None:
+            # Spend the same time as a real check so unknown names are not revealed by timing
+            hash_password(password, params)
+            return None, INVALID_LOGIN
+
+        username, encoded = row
+        stored_params, salt, expected = parse_hash(encoded)
+        actual = _scrypt(password, salt, stored_params["n"], stored_params["r"], stored_params["p"])
+        if not hmac.compare_digest(actual, expected):
+            return None, INVALID_LOGIN
+
+        if stored_params != params:
+            with self.repository.pool.transaction() as conn:
+                conn.execute(SQL_UPDATE_HASH, (hash_password(password, params), username))
+        return username, None
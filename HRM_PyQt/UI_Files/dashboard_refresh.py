@@ -0,0 +1,87 @@
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, pyqtSignal
+from workers import run_in_background
+
+
+def load_dashboard(repository, months=6):
+    """Collect every dashboard figure in one go (runs on a worker thread)"""
+    headcount = repository.headcount()
+    return {
+        "total": headcount["total"],
+        "present": repository.present_on(),
+        "staff": headcount["Staff"],
+        "labour": headcount["Labour"],
+        "monthly": tuple(repository.monthly_attendance(months)),
+    }
+
+
+class DashboardRefresher(QObject):
+    """Refreshes dashboard figures off the GUI thread
+
+    Any number of request_refresh() calls collapse into at most one query per
+    MIN_INTERVAL_MS, only one query is ever in flight, and `changed` carries
+    just the figures that differ from the previous snapshot.
+    """
+    changed = pyqtSignal(object)
+
+    MIN_INTERVAL_MS = 400
+    POLL_INTERVAL_MS = 30000
+
+    def __init__(self, repository, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.snapshot = {}
+        self._in_flight = False
+        self._pending = False
+
+        self._since_last = QElapsedTimer()
+
+        self._coalesce = QTimer(self)
+        self._coalesce.setSingleShot(True)
+        self._coalesce.timeout.connect(self._start)
+
+        self._poll = QTimer(self)
+        self._poll.setInterval(self.POLL_INTERVAL_MS)
+        self._poll.timeout.connect(self.request_refresh)
+
+    @property
+    def running(self):
+        return self._poll.isActive()
+
+    def start(self):
+        """Load immediately, then keep polling"""
+        self._poll.start()
+        self.request_refresh()
+
+    def stop(self):
+        self._poll.stop()
+        self._coalesce.stop()
+
+    def request_refresh(self):
+        self._pending = True
+        if self._in_flight or self._coalesce.isActive():
+            return
+        delay = 0
+        if self._since_last.isValid():
+            delay = max(0, self.MIN_INTERVAL_MS - self._since_last.elapsed())
+        self._coalesce.start(delay)
+
+    def _start(self):
+        self._pending = False
+        self._in_flight = True
+        self._since_last.restart()
+        run_in_background(
+            load_dashboard, self.repository,
+            on_result=self._finished,
+            on_error=lambda message: self._finished(None)
+        )
+
+    def _finished(self, snapshot):
+        self._in_flight = False
+        if snapshot is not None:
+            diff = {key: value for key, value in snapshot.items()
+                    if self.snapshot.get(key) != value}
+            self.snapshot = snapshot
+            if diff:
+                self.changed.emit(diff)
+        if self._pending:
+            self.request_refresh()
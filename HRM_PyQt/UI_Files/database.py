@@ -0,0 +1,518 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from attendance_rollups import update_rollups
+
+
+DEFAULT_DB_PATH = os.environ.get(
+    "HRM_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "hrm.db")
+)
+
+# ================= Schema =================
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id          INTEGER PRIMARY KEY,
+    emp_no      TEXT UNIQUE,
+    name        TEXT NOT NULL,
+    email       TEXT NOT NULL COLLATE NOCASE,
+    nic         TEXT,
+    position    TEXT,
+    department  TEXT,
+    category    TEXT NOT NULL DEFAULT 'Staff',
+    joined_on   TEXT,
+    active      INTEGER NOT NULL DEFAULT 1
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_employees_email ON employees(email);
+CREATE INDEX IF NOT EXISTS idx_employees_department ON employees(department);
+CREATE INDEX IF NOT EXISTS idx_employees_name ON employees(name);
+CREATE INDEX IF NOT EXISTS idx_employees_category ON employees(active, category);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    employee_id INTEGER NOT NULL REFERENCES employees(id),
+    work_date   TEXT NOT NULL,
+    check_in    TEXT,
+    check_out   TEXT,
+    PRIMARY KEY (employee_id, work_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_attendance_date ON attendance(work_date);
+
+-- Attendance rollups, maintained by attendance_rollups.update_rollups() for
+-- the dates each write touches, so the dashboard never counts raw attendance.
+CREATE TABLE IF NOT EXISTS attendance_daily (
+    work_date   TEXT PRIMARY KEY,
+    present     INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS attendance_monthly (
+    month           TEXT PRIMARY KEY,
+    present_total   INTEGER NOT NULL DEFAULT 0,
+    days            INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Raw biometric punches; the primary key drops re-exported duplicates.
+CREATE TABLE IF NOT EXISTS punches (
+    employee_id INTEGER NOT NULL,
+    punch_time  TEXT NOT NULL,
+    site        TEXT,
+    PRIMARY KEY (employee_id, punch_time)
+) WITHOUT ROWID;
+
+-- Last committed byte offset per imported punch file, for crash-safe resume.
+CREATE TABLE IF NOT EXISTS import_progress (
+    source      TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    byte_offset INTEGER NOT NULL DEFAULT 0,
+    rows_read   INTEGER NOT NULL DEFAULT 0,
+    updated_at  TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ================= Accounts =================
+CREATE TABLE IF NOT EXISTS user_accounts (
+    username        TEXT PRIMARY KEY COLLATE NOCASE,
+    employee_id     INTEGER REFERENCES employees(id),
+    password_hash   TEXT NOT NULL,
+    updated_at      TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_user_accounts_employee ON user_accounts(employee_id);
+
+-- Roles: what each may do, and whose rows it sees (compiled per session by permissions.py)
+CREATE TABLE IF NOT EXISTS roles (
+    name        TEXT PRIMARY KEY COLLATE NOCASE,
+    scope       TEXT NOT NULL DEFAULT 'self'
+);
+
+CREATE TABLE IF NOT EXISTS role_permissions (
+    role        TEXT NOT NULL COLLATE NOCASE REFERENCES roles(name),
+    permission  TEXT NOT NULL,
+    PRIMARY KEY (role, permission)
+) WITHOUT ROWID;
+
+-- Role of an account when it differs from its employee's position
+CREATE TABLE IF NOT EXISTS user_roles (
+    username    TEXT PRIMARY KEY COLLATE NOCASE,
+    role        TEXT NOT NULL
+);
+
+-- Who reports to whom, for managers whose scope is their reports
+CREATE TABLE IF NOT EXISTS reporting_lines (
+    employee_id INTEGER PRIMARY KEY REFERENCES employees(id),
+    manager_id  INTEGER NOT NULL REFERENCES employees(id)
+);
+CREATE INDEX IF NOT EXISTS idx_reporting_lines_manager ON reporting_lines(manager_id);
+
+CREATE TABLE IF NOT EXISTS app_settings (
+    key     TEXT PRIMARY KEY,
+    value   TEXT NOT NULL
+);
+
+-- ================= Calendar =================
+-- Working weeks (Monday first, e.g. '1111100') per shift pattern; site '' is company-wide
+CREATE TABLE IF NOT EXISTS work_patterns (
+    site        TEXT NOT NULL DEFAULT '',
+    pattern     TEXT NOT NULL,
+    week        TEXT NOT NULL,
+    PRIMARY KEY (site, pattern)
+) WITHOUT ROWID;
+
+-- Days a site (or, for site '', every site) is closed
+CREATE TABLE IF NOT EXISTS holidays (
+    holiday_date TEXT NOT NULL,
+    site         TEXT NOT NULL DEFAULT '',
+    name         TEXT,
+    PRIMARY KEY (holiday_date, site)
+) WITHOUT ROWID;
+
+-- Site and shift pattern of employees who do not work the standard week
+CREATE TABLE IF NOT EXISTS work_assignments (
+    employee_id INTEGER PRIMARY KEY REFERENCES employees(id),
+    site        TEXT NOT NULL DEFAULT '',
+    pattern     TEXT NOT NULL DEFAULT 'standard'
+);
+
+-- ================= Payroll =================
+CREATE TABLE IF NOT EXISTS salary_structures (
+    employee_id     INTEGER PRIMARY KEY REFERENCES employees(id),
+    basic_salary    REAL NOT NULL,
+    fixed_allowance REAL NOT NULL DEFAULT 0,
+    effective_from  TEXT
+);
+
+CREATE TABLE IF NOT EXISTS payroll_runs (
+    id          INTEGER PRIMARY KEY,
+    period      TEXT NOT NULL,
+    created_at  TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    employees   INTEGER NOT NULL,
+    total_gross REAL NOT NULL,
+    total_net   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_payroll_runs_period ON payroll_runs(period);
+
+CREATE TABLE IF NOT EXISTS payslips (
+    run_id          INTEGER NOT NULL REFERENCES payroll_runs(id),
+    employee_id     INTEGER NOT NULL,
+    basic           REAL NOT NULL,
+    overtime_hours  REAL NOT NULL,
+    overtime_pay    REAL NOT NULL,
+    allowances      REAL NOT NULL,
+    gross           REAL NOT NULL,
+    epf_employee    REAL NOT NULL,
+    epf_employer    REAL NOT NULL,
+    etf             REAL NOT NULL,
+    apit            REAL NOT NULL,
+    other_deductions REAL NOT NULL,
+    net             REAL NOT NULL,
+    PRIMARY KEY (run_id, employee_id)
+) WITHOUT ROWID;
+
+-- ================= Leave =================
+CREATE TABLE IF NOT EXISTS leave_requests (
+    id          INTEGER PRIMARY KEY,
+    employee_id INTEGER NOT NULL REFERENCES employees(id),
+    leave_type  TEXT NOT NULL,
+    start_date  TEXT NOT NULL,
+    end_date    TEXT NOT NULL,
+    days        REAL NOT NULL,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    created_at  TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_leave_requests_employee ON leave_requests(employee_id, start_date);
+
+-- Materialized balances, recomputed per employee-year when requests change
+CREATE TABLE IF NOT EXISTS leave_balances (
+    employee_id INTEGER NOT NULL,
+    year        INTEGER NOT NULL,
+    leave_type  TEXT NOT NULL,
+    entitled    REAL NOT NULL DEFAULT 0,
+    carried     REAL NOT NULL DEFAULT 0,
+    taken       REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (employee_id, year, leave_type)
+) WITHOUT ROWID;
+
+-- ================= Loans =================
+CREATE TABLE IF NOT EXISTS loans (
+    id              INTEGER PRIMARY KEY,
+    employee_id     INTEGER NOT NULL REFERENCES employees(id),
+    principal       REAL NOT NULL,
+    annual_rate     REAL NOT NULL,
+    months          INTEGER NOT NULL,
+    method          TEXT NOT NULL DEFAULT 'reducing',
+    start_month     TEXT NOT NULL,
+    status          TEXT NOT NULL DEFAULT 'active',
+    terms_version   INTEGER NOT NULL DEFAULT 1,
+    created_at      TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_loans_employee ON loans(employee_id);
+
+-- Stored amortization schedule per loan; only rewritten when the terms change
+CREATE TABLE IF NOT EXISTS loan_instalments (
+    loan_id     INTEGER NOT NULL REFERENCES loans(id),
+    seq         INTEGER NOT NULL,
+    due_month   TEXT NOT NULL,
+    principal   REAL NOT NULL,
+    interest    REAL NOT NULL,
+    payment     REAL NOT NULL,
+    balance     REAL NOT NULL,
+    PRIMARY KEY (loan_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_loan_instalments_due ON loan_instalments(due_month, loan_id, payment);
+"""
+
+# ================= Statements =================
+# SQL text is kept in module constants so every call hands sqlite3 the exact
+# same string and hits the per-connection prepared statement cache.
+SQL_INSERT_EMPLOYEE = """
+    INSERT INTO employees (emp_no, name, email, nic, position, department, category, joined_on)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_ASSIGN_EMP_NO = "UPDATE employees SET emp_no = printf('EMP%06d', id) WHERE id = ? AND emp_no IS NULL"
+SQL_EMAIL_EXISTS = "SELECT 1 FROM employees WHERE email = ? LIMIT 1"
+SQL_GET_EMPLOYEE = "SELECT * FROM employees WHERE id = ?"
+# Columns update_employee() may change
+EMPLOYEE_EDITABLE = ("name", "email", "nic", "position", "department", "category", "active")
+SQL_HEADCOUNT = """
+    SELECT category, COUNT(*) FROM employees
+    WHERE active = 1 GROUP BY category
+"""
+SQL_PRESENT_ON = "SELECT present FROM attendance_daily WHERE work_date = ?"
+SQL_MONTHLY_PRESENT = """
+    SELECT month, CAST(present_total AS REAL) / days
+    FROM attendance_monthly
+    WHERE month >= ? AND month < ?
+"""
+SQL_DAILY_PRESENT = """
+    SELECT work_date, present FROM attendance_daily
+    WHERE work_date >= ? ORDER BY work_date
+"""
+SQL_DEPARTMENT_DAILY_PRESENT = """
+    SELECT a.work_date, COUNT(*)
+    FROM employees e JOIN attendance a ON a.employee_id = e.id
+    WHERE e.department = ? AND a.work_date >= ?
+    GROUP BY a.work_date ORDER BY a.work_date
+"""
+SQL_SET_MANAGER = "INSERT OR REPLACE INTO reporting_lines (employee_id, manager_id) VALUES (?, ?)"
+SQL_CLEAR_MANAGER = "DELETE FROM reporting_lines WHERE employee_id = ?"
+SQL_DEPARTMENTS = """
+    SELECT DISTINCT department FROM employees
+    WHERE active = 1 AND department IS NOT NULL AND department != ''
+    ORDER BY department
+"""
+SQL_RECORD_ATTENDANCE = """
+    INSERT OR IGNORE INTO attendance (employee_id, work_date, check_in, check_out)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Sortable employee list columns -> ORDER BY expression. Nullable columns are
+# wrapped so keyset comparisons never see NULL.
+EMPLOYEE_SORT_KEYS = {
+    "emp_no": "emp_no",
+    "name": "name",
+    "email": "email",
+    "position": "IFNULL(position, '')",
+    "department": "IFNULL(department, '')",
+    "category": "category",
+}
+EMPLOYEE_LIST_COLUMNS = "id, emp_no, name, email, IFNULL(position, ''), IFNULL(department, ''), category"
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+class ConnectionPool:
+    """Hands out one SQLite connection per thread"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._schema_ready = False
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self):
+        # isolation_level=None: transactions are opened explicitly via transaction()
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None,
+            check_same_thread=False, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")       # 64 MB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")     # 256 MB memory map
+        with self._lock:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                self._schema_ready = True
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a block inside BEGIN IMMEDIATE ... COMMIT on this thread's connection"""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def close_all(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class HRMRepository:
+    """Data access used by every window"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._employee_listeners = []
+
+    # -------- Change notification --------
+    def on_employees_changed(self, callback):
+        """Call `callback(employee_ids)` after each committed insert or edit
+
+        The callback runs on the thread that made the change, so it must be
+        thread-safe (or hand the work over to the GUI thread itself).
+        """
+        self._employee_listeners.append(callback)
+
+    def notify_employees_changed(self, employee_ids):
+        """Call every listener with `employee_ids`; bulk writers call it after each commit"""
+        for callback in list(self._employee_listeners):
+            callback(employee_ids)
+
+    # -------- Employees --------
+    def add_employee(self, name, email, position=None, department=None,
+                     category="Staff", emp_no=None, nic=None, joined_on=None):
+        """Insert an employee and return its id (raises sqlite3.IntegrityError on duplicate email)"""
+        joined_on = joined_on or date.today().isoformat()
+        with self.pool.transaction() as conn:
+            cur = conn.execute(SQL_INSERT_EMPLOYEE, (
+                emp_no, name.strip(), email.strip(), nic, position,
+                department, category, joined_on
+            ))
+            employee_id = cur.lastrowid
+            conn.execute(SQL_ASSIGN_EMP_NO, (employee_id,))
+        self.notify_employees_changed([employee_id])
+        return employee_id
+
+    def update_employee(self, employee_id, **fields):
+        """Change the given columns of one employee (see EMPLOYEE_EDITABLE)"""
+        unknown = set(fields) - set(EMPLOYEE_EDITABLE)
+        if unknown:
+            raise ValueError(f"cannot update employee column(s): {', '.join(sorted(unknown))}")
+        if not fields:
+            return
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self.pool.transaction() as conn:
+            conn.execute(f"UPDATE employees SET {assignments} WHERE id = ?", (*fields.values(), employee_id))
+        self.notify_employees_changed([employee_id])
+
+    def get_employee(self, employee_id):
+        return self.pool.connection().execute(SQL_GET_EMPLOYEE, (employee_id,)).fetchone()
+
+    def set_manager(self, employee_id, manager_id):
+        """Record who `employee_id` reports to (None clears it)"""
+        with self.pool.transaction() as conn:
+            if manager_id is None:
+                conn.execute(SQL_CLEAR_MANAGER, (employee_id,))
+            else:
+                conn.execute(SQL_SET_MANAGER, (employee_id, manager_id))
+
+    def employee_page(self, limit, after=None, sort="emp_no", descending=False, search="", scope=None):
+        """Fetch one page of active employees using keyset pagination
+
+        `after` is the (sort value, id) of the last row already shown, so each
+        page is an index seek instead of an OFFSET scan over earlier rows.
+        `scope` is a session's (SQL condition, params) limiting the rows seen.
+        Returns (id, emp_no, name, email, position, department, category) tuples.
+        """
+        key = EMPLOYEE_SORT_KEYS[sort]
+        where = ["active = 1"]
+        params = []
+        if scope is not None:
+            where.append(scope[0])
+            params += list(scope[1])
+        if search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            where.append(
+                "(name LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\' "
+                "OR emp_no LIKE ? ESCAPE '\\' OR department LIKE ? ESCAPE '\\')"
+            )
+            params += [pattern] * 4
+        if after is not None:
+            where.append(f"({key}, id) {'<' if descending else '>'} (?, ?)")
+            params += list(after)
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT {EMPLOYEE_LIST_COLUMNS} FROM employees WHERE {' AND '.join(where)} "
+            f"ORDER BY {key} {direction}, id {direction} LIMIT ?"
+        )
+        params.append(limit)
+        cur = self.pool.connection().cursor()
+        cur.row_factory = None  # plain tuples are cheaper to hold for large grids
+        return cur.execute(sql, params).fetchall()
+
+    def departments(self):
+        return [row[0] for row in self.pool.connection().execute(SQL_DEPARTMENTS)]
+
+    def email_exists(self, email):
+        row = self.pool.connection().execute(SQL_EMAIL_EXISTS, (email.strip(),)).fetchone()
+        return row is not None
+
+    # -------- Attendance --------
+    def record_attendance(self, employee_id, work_date, check_in=None, check_out=None):
+        with self.pool.transaction() as conn:
+            conn.execute(SQL_RECORD_ATTENDANCE, (employee_id, work_date, check_in, check_out))
+            update_rollups(conn, [work_date])
+
+    # -------- Dashboard --------
+    def headcount(self):
+        """Active employees split by category: {'total': n, 'Staff': n, 'Labour': n}"""
+        counts = {"total": 0, "Staff": 0, "Labour": 0}
+        for category, count in self.pool.connection().execute(SQL_HEADCOUNT):
+            counts[category] = count
+            counts["total"] += count
+        return counts
+
+    def present_on(self, day=None):
+        """Number of employees with an attendance record for the given day"""
+        day = (day or date.today()).isoformat()
+        row = self.pool.connection().execute(SQL_PRESENT_ON, (day,)).fetchone()
+        return row[0] if row else 0
+
+    def monthly_attendance(self, months=6, today=None):
+        """Average daily attendance (% of active headcount) for the last N months
+
+        Returns a list of (month label, percentage) pairs, oldest first.
+        """
+        today = today or date.today()
+        first = _add_months(date(today.year, today.month, 1), -(months - 1))
+        end = _add_months(date(today.year, today.month, 1), 1)
+        total = self.headcount()["total"] or 1
+
+        averages = dict(self.pool.connection().execute(
+            SQL_MONTHLY_PRESENT, (first.isoformat()[:7], end.isoformat()[:7])
+        ).fetchall())
+
+        series = []
+        for i in range(months):
+            month = _add_months(first, i)
+            avg = averages.get(month.isoformat()[:7]) or 0
+            series.append((MONTH_NAMES[month.month - 1], round(100.0 * avg / total, 1)))
+        return series
+
+    def daily_attendance(self, since=None, department=None):
+        """Head count per day from `since` (ISO date) on, oldest first
+
+        The whole company reads the attendance_daily rollup; a department is
+        counted from raw attendance through its employees. Returns parallel
+        (dates, counts) lists.
+        """
+        since = since or ""
+        cur = self.pool.connection().cursor()
+        cur.row_factory = None
+        if department:
+            rows = cur.execute(SQL_DEPARTMENT_DAILY_PRESENT, (department, since)).fetchall()
+        else:
+            rows = cur.execute(SQL_DAILY_PRESENT, (since,)).fetchall()
+        return [day for day, _ in rows], [count for _, count in rows]
+
+
+def _add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+
+def get_repository(path=None):
+    """Return the shared repository for a database file (one pool per path)"""
+    path = path or DEFAULT_DB_PATH
+    with _repositories_lock:
+        repo = _repositories.get(path)
+        if repo is None:
+            repo = HRMRepository(ConnectionPool(path))
+            _repositories[path] = repo
+        return repo
@@ -0,0 +1,148 @@
+"""In-memory pre-check for registered emails
+
+The registration form asks "is this email taken?" on every pause in typing.
+A Bloom filter over every email in the employees table answers "certainly
+not" without touching SQLite for almost every new address; only a possible
+hit (a registered email, or about one in a hundred others) is confirmed
+against the email index on a worker.
+
+One registry per repository (get_email_registry) is built from the table on
+a worker and follows new and edited employees through the repository's
+change notifications. A Bloom filter cannot forget, so an email freed by an
+edit stays a possible hit until the next rebuild and is simply confirmed as
+free. The filter is sized for twice the emails in the table and rebuilt
+on a worker once more than that have been added; the full filter keeps
+answering (with more false positives) until the new one is swapped in.
+"""
+import hashlib
+import math
+import threading
+
+from workers import run_in_background
+
+FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 1024
+
+SQL_ALL_EMAILS = "SELECT email FROM employees"
+# Ids per query when reading changed employees (SQLite's bound parameter limit)
+REFRESH_CHUNK = 500
+
+
+def normalize(email):
+    """The form the filter stores; coarser than the column's NOCASE, so never a false negative"""
+    return email.strip().lower()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` items at `error_rate` false positives"""
+
+    def __init__(self, capacity, error_rate=FALSE_POSITIVE_RATE):
+        self.capacity = max(1, capacity)
+        self.size = max(64, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, text):
+        # Double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, text):
+        bits = self.bits
+        for position in self._positions(text):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, text):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(text))
+
+
+class EmailRegistry:
+    def __init__(self, repository):
+        self.repository = repository
+        self._filter = None     # None until built: every email is a possible hit
+        self._pending = None    # ids changed while a build reads the table (a list while building)
+        self._rebuild_queued = False
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self):
+        return self._filter is not None
+
+    def build(self):
+        """(Re)build the filter from the employees table (call on a worker)"""
+        with self._lock:
+            if self._pending is not None:
+                return self
+            self._pending = []
+        try:
+            emails = [normalize(row[0]) for row in self.repository.pool.connection().execute(SQL_ALL_EMAILS)]
+            bloom = BloomFilter(max(MIN_CAPACITY, 2 * len(emails)))
+            for email in emails:
+                bloom.add(email)
+        except Exception:
+            with self._lock:
+                self._pending = None
+                self._rebuild_queued = False
+            raise
+        with self._lock:
+            self._filter = bloom
+            self._rebuild_queued = False
+            pending, self._pending = self._pending, None
+        if pending:
+            self.refresh(pending)
+        return self
+
+    def might_exist(self, email):
+        """False only when `email` is certainly not registered (no database access)"""
+        bloom = self._filter
+        return bloom is None or normalize(email) in bloom
+
+    def exists(self, email):
+        """Authoritative check against the email index"""
+        return self.repository.email_exists(email)
+
+    def refresh(self, ids):
+        """Add the emails of inserted or edited employees"""
+        with self._lock:
+            bloom = self._filter
+            # A build in progress adds them to its new filter once it is swapped in
+            if self._pending is not None:
+                self._pending.extend(ids)
+        # Before the first build every email is a possible hit anyway
+        if bloom is None:
+            return
+        ids = list(ids)
+        conn = self.repository.pool.connection()
+        emails = []
+        for start in range(0, len(ids), REFRESH_CHUNK):
+            chunk = ids[start:start + REFRESH_CHUNK]
+            emails += [normalize(row[0]) for row in conn.execute(
+                f"{SQL_ALL_EMAILS} WHERE id IN ({', '.join('?' * len(chunk))})", chunk)]
+        with self._lock:
+            for email in emails:
+                bloom.add(email)
+            rebuild = bloom.count > bloom.capacity and not self._rebuild_queued
+            if rebuild:
+                self._rebuild_queued = True
+        if rebuild:
+            run_in_background(self.build)
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_email_registry(repository):
+    """The shared registry for `repository`; follows its employee changes from the first call"""
+    with _registries_lock:
+        registry = _registries.get(id(repository))
+        if registry is None or registry.repository is not repository:
+            registry = _registries[id(repository)] = EmailRegistry(repository)
+            repository.on_employees_changed(registry.refresh)
+        return registry
@@ -0,0 +1,277 @@
+import os
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QLineEdit, QPushButton, QTableView, QHeaderView, QFileDialog,
+    QVBoxLayout, QHBoxLayout, QAbstractItemView
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QAbstractTableModel
+from workers import run_in_background
+from jobs import job_manager
+from onboarding import onboard_employees, write_error_report
+from permissions import ONBOARD_EMPLOYEES, unrestricted_session
+from theme import set_role, set_variant
+
+
+class EmployeeTableModel(QAbstractTableModel):
+    """Employee list that pulls rows from the repository one page at a time
+
+    Sorting and filtering are pushed down to SQL and run on the thread pool;
+    results from a superseded sort/filter are dropped by generation number.
+    """
+    PAGE_SIZE = 200
+
+    # (sort key, header) -> column N shows tuple field N + 1 (field 0 is the id)
+    COLUMNS = [
+        ("emp_no", "Emp No"),
+        ("name", "Name"),
+        ("email", "Email"),
+        ("position", "Position"),
+        ("department", "Department"),
+        ("category", "Category"),
+    ]
+
+    def __init__(self, repository, parent=None, scope=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.scope = scope      # a session's row filter, applied to every page fetched
+        self._rows = []
+        self._exhausted = False
+        self._loading = False
+        self._generation = 0
+        self._sort_column = 0
+        self._descending = False
+        self._search = ""
+
+    # -------- Qt model interface --------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column() + 1]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._loading or self._exhausted:
+            return
+        self._request_page()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        descending = order == Qt.DescendingOrder
+        if (column, descending) == (self._sort_column, self._descending):
+            return
+        self._sort_column = column
+        self._descending = descending
+        self._reload()
+
+    # -------- Public API --------
+    def set_search(self, text):
+        text = text.strip()
+        if text != self._search:
+            self._search = text
+            self._reload()
+
+    def employee_id(self, row):
+        return self._rows[row][0]
+
+    def reload(self):
+        """Drop the loaded rows and fetch the first page again (after bulk changes)"""
+        self._reload()
+
+    # -------- Paging --------
+    def _request_page(self):
+        self._loading = True
+        generation = self._generation
+        sort_key = self.COLUMNS[self._sort_column][0]
+        after = None
+        if self._rows:
+            last = self._rows[-1]
+            after = (last[self._sort_column + 1], last[0])
+
+        run_in_background(
+            self.repository.employee_page, self.PAGE_SIZE, after,
+            sort_key, self._descending, self._search, self.scope,
+            on_result=lambda rows: self._page_loaded(generation, rows),
+            on_error=lambda message: self._page_failed(generation)
+        )
+
+    def _page_loaded(self, generation, rows):
+        if generation != self._generation:
+            return
+        self._loading = False
+        if len(rows) < self.PAGE_SIZE:
+            self._exhausted = True
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def _page_failed(self, generation):
+        if generation == self._generation:
+            self._loading = False
+            self._exhausted = True
+
+    def _reload(self):
+        self._generation += 1
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self._loading = False
+        self.endResetModel()
+        self._request_page()
+
+
+class EmployeePage(QWidget):
+    """Searchable, sortable employee list for the "Employee" sidebar entry"""
+    ROW_HEIGHT = 30
+    SEARCH_DELAY_MS = 300
+
+    def __init__(self, repository, session=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session or unrestricted_session()
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header_row = QHBoxLayout()
+        header = QLabel("Employees")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("employeeSearch")
+        set_role(self.search_input, "input")
+        self.search_input.setPlaceholderText("Filter by name, email, employee no or department")
+        self.search_input.setFixedHeight(36)
+        self.search_input.setFixedWidth(360)
+
+        self.import_btn = QPushButton("Import CSV...")
+        self.import_btn.setFixedHeight(36)
+        self.import_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.import_btn, "primary")
+        self.import_btn.clicked.connect(self.choose_file)
+        self.import_btn.setVisible(self.session.can(ONBOARD_EMPLOYEES))
+
+        header_row.addWidget(header)
+        header_row.addStretch()
+        header_row.addWidget(self.search_input)
+        header_row.addWidget(self.import_btn)
+        layout.addLayout(header_row)
+
+        # ----- Bulk onboarding outcome -----
+        status_row = QHBoxLayout()
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "body")
+        self.status_label.setVisible(False)
+
+        self.errors_btn = QPushButton("Save Error Report...")
+        self.errors_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.errors_btn, "link")
+        self.errors_btn.setVisible(False)
+        self.errors_btn.clicked.connect(self.save_error_report)
+        self._errors = []
+
+        status_row.addWidget(self.status_label)
+        status_row.addWidget(self.errors_btn)
+        status_row.addStretch()
+        layout.addLayout(status_row)
+
+        # ----- Table -----
+        self.model = EmployeeTableModel(self.repository, self, self.session.row_filter)
+
+        self.table = QTableView()
+        self.table.setObjectName("employeeTable")
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        self.table.setShowGrid(False)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Fixed row heights: the view never measures rows, so scrolling cost
+        # does not grow with the number of rows loaded.
+        rows = self.table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.setVisible(False)
+
+        columns = self.table.horizontalHeader()
+        columns.setSectionResizeMode(QHeaderView.Interactive)
+        columns.setStretchLastSection(True)
+        columns.setDefaultSectionSize(180)
+        columns.setSortIndicator(0, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+
+        layout.addWidget(self.table)
+
+        # ----- Debounced filter -----
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(lambda: self.model.set_search(self.search_input.text()))
+        self.search_input.textChanged.connect(self.search_timer.start)
+
+    def filter_to(self, text):
+        """Show only rows matching `text` straight away (used by the header search)"""
+        self.search_input.setText(text)
+        self.search_timer.stop()
+        self.model.set_search(text)
+
+    # -------- Bulk onboarding --------
+    def choose_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Select new employees", "", "CSV files (*.csv);;All files (*)"
+        )
+        if path:
+            self.onboard(path)
+
+    def onboard(self, path):
+        """Add the employees in a CSV as a background job; returns the job (None if not allowed)"""
+        if not self.session.can(ONBOARD_EMPLOYEES):
+            return None
+        self.import_btn.setEnabled(False)
+        self.errors_btn.setVisible(False)
+        self._show_status(f"Checking {os.path.basename(path)}...")
+        return job_manager().submit(
+            "onboarding", f"Onboard {os.path.basename(path)}", onboard_employees, self.repository, path,
+            on_progress=lambda values: self._show_status(f"Added {values[0]:,} of {values[1]:,} employees..."),
+            on_result=self._on_onboarded,
+            on_error=lambda message: self._show_status(
+                f"{os.path.basename(path)}: import failed - {message.strip().splitlines()[-1]}"),
+            on_finished=lambda job: self.import_btn.setEnabled(True)
+        )
+
+    def _on_onboarded(self, result):
+        self._errors = result.errors
+        rejected = f", {len(result.errors):,} row(s) rejected" if result.errors else ""
+        self._show_status(f"Added {result.inserted:,} of {result.rows:,} employees{rejected}")
+        self.errors_btn.setVisible(bool(result.errors))
+        if result.inserted:
+            self.model.reload()
+
+    def save_error_report(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save error report", "rejected_rows.csv", "CSV files (*.csv)")
+        if path:
+            with open(path, "w", newline="", encoding="utf-8") as out:
+                write_error_report(self._errors, out)
+
+    def _show_status(self, text):
+        self.status_label.setText(text)
+        self.status_label.setVisible(True)
@@ -0,0 +1,116 @@
+from PyQt5.QtWidgets import QWidget, QLineEdit, QComboBox, QHBoxLayout
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QAbstractTableModel, pyqtSignal
+from workers import run_in_background
+from theme import set_role
+
+
+class EmployeePicker(QWidget):
+    """A filter box and the matching employees a session may see
+
+    Matches are fetched with Repository.employee_page on a worker, at most
+    MATCHES at a time; the session's own record is picked when it matches.
+    employee_changed carries the picked id, or None when nothing matches.
+    """
+    employee_changed = pyqtSignal(object)
+    MATCHES = 50
+    SEARCH_DELAY_MS = 250
+
+    def __init__(self, repository, session, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session
+        self._generation = 0
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Find employee")
+        self.search_input.setFixedHeight(36)
+        self.search_input.setFixedWidth(220)
+        set_role(self.search_input, "input")
+
+        self.combo = QComboBox()
+        self.combo.setFixedHeight(36)
+        self.combo.setMinimumWidth(260)
+        self.combo.currentIndexChanged.connect(self._on_picked)
+
+        layout.addWidget(self.search_input)
+        layout.addWidget(self.combo)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search()
+
+    def employee_id(self):
+        return self.combo.currentData()
+
+    def search(self):
+        self._generation += 1
+        generation = self._generation
+        run_in_background(
+            self.repository.employee_page, self.MATCHES,
+            search=self.search_input.text().strip(), scope=self.session.row_filter,
+            on_result=lambda rows: self._show(generation, rows)
+        )
+
+    def _show(self, generation, rows):
+        if generation != self._generation:
+            return
+        previous = self.employee_id()
+        self.combo.blockSignals(True)
+        self.combo.clear()
+        for employee_id, emp_no, name, *_ in rows:
+            self.combo.addItem(f"{emp_no}  {name}", employee_id)
+        index = max(self.combo.findData(previous), self.combo.findData(self.session.employee_id), 0)
+        self.combo.setCurrentIndex(index if rows else -1)
+        self.combo.blockSignals(False)
+        if self.employee_id() != previous:
+            self.employee_changed.emit(self.employee_id())
+
+    def _on_picked(self, index):
+        if index >= 0:
+            self.employee_changed.emit(self.combo.itemData(index))
+
+
+class RowTableModel(QAbstractTableModel):
+    """A short read-only list of tuples; `formats` turns each column's value into text"""
+
+    def __init__(self, columns, formats, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.formats = formats
+        self._rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def row(self, row):
+        return self._rows[row]
+
+    # -------- Qt model interface --------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.formats[index.column()](self._rows[index.row()][index.column()])
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return None
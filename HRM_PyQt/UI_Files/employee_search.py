@@ -0,0 +1,321 @@
+"""In-memory employee search index for search-as-you-type
+
+One index per repository (get_search_index) is built once, on a worker,
+and then kept current by the repository's employee change notifications,
+so typing never waits on SQLite. Matches are tiered:
+
+  0  exact employee number, NIC or email
+  1  every query word is the start of a word in the name, email, employee
+     number, NIC or department ("jo sil" finds "Joanne Silva")
+  2  the query appears anywhere in those fields (3+ characters)
+
+Records are kept in name order and joined into two long strings: one of
+each record's words (" joanne silva emp000042 ...") and one of its full
+text. A lookup is str.find over those strings, which runs in C; because the
+strings are in name order the first matches found are also the first to
+show, so the scan stops as soon as the popup is full. A record's words are
+sorted, so several query words become one regular expression (" jo.* sil")
+that checks each record in C as well. A vocabulary of every word (sorted,
+for prefix bisects) and of the trigrams in them rules out queries that
+cannot match before any scan. Employees added or edited since the strings
+were last joined are checked one by one and merged in, and the strings are
+rejoined once enough changes pile up. All methods are thread-safe: changes
+may arrive on whichever thread committed them. Searches only wait for
+small changes; a bulk change or a rejoin is applied to a copy of the index
+and swapped in.
+"""
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, namedtuple
+from itertools import accumulate
+
+SearchHit = namedtuple("SearchHit", "employee_id emp_no name email department")
+
+# Fields of SearchHit (after the id) plus NIC, which is matched but not shown
+SQL_SEARCH_ROWS = """
+    SELECT id, IFNULL(emp_no, ''), name, email, IFNULL(department, ''), IFNULL(nic, '')
+    FROM employees WHERE active = 1
+"""
+
+WORD = re.compile(r"[^\W_]+")
+# Changed employees searched one by one before the joined strings are rebuilt
+REJOIN_AFTER = 1000
+# Ids per query when re-reading changed employees (SQLite's bound parameter limit)
+REFRESH_CHUNK = 500
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _distinct_prefixes(terms):
+    """Sorted terms without those that are a prefix of another (already implied by it)"""
+    terms = sorted(set(terms))
+    return [term for i, term in enumerate(terms)
+            if not (i + 1 < len(terms) and terms[i + 1].startswith(term))]
+
+
+def _join(parts):
+    """Concatenate `parts` (newline-terminated) and return (text, start offset of each part)"""
+    starts = [0]
+    starts += accumulate(len(part) + 1 for part in parts)
+    starts.pop()
+    return "\n".join(parts) + "\n", starts
+
+
+class EmployeeSearchIndex:
+    def __init__(self, repository=None):
+        self.repository = repository
+        self.ready = False
+        self._loading = False
+        self._pending = set()   # ids changed while a build was reading the table
+        self._lock = threading.Lock()           # held by searches and by swaps
+        self._write_lock = threading.Lock()     # one change at a time
+
+        self._records = {}      # id -> SearchHit
+        self._entries = {}      # id -> (name sort key, " word word ...", full text, exact keys)
+        self._exact = {}        # emp_no / nic / email -> id
+        self._vocabulary = {}   # word -> number of employees using it
+        self._sorted_words = []
+        self._trigrams = set()  # every trigram of every word ever indexed
+        # Name-ordered snapshot of every record, joined for str.find
+        self._ids = []
+        self._words, self._word_starts = "", []
+        self._texts, self._text_starts = "", []
+        self._recent = {}       # ids added or changed since the snapshot (ordered set)
+        self._stale = set()     # ids whose snapshot copy is out of date
+
+    def __len__(self):
+        return len(self._records)
+
+    # -------- Building --------
+    def build(self):
+        """Load every active employee from the repository (slow; call on a worker)"""
+        with self._lock:
+            if self._loading:
+                return self
+            self._loading = True
+        try:
+            self.load(self.repository.pool.connection().execute(SQL_SEARCH_ROWS))
+        finally:
+            with self._lock:
+                self._loading = False
+                pending, self._pending = self._pending, set()
+        if pending:
+            self.refresh(pending)
+        return self
+
+    def load(self, rows):
+        """Replace the contents with `rows` of (id, emp_no, name, email, department, nic)"""
+        fresh = EmployeeSearchIndex()
+        for row in rows:
+            fresh._add(row, bulk=True)
+        fresh._rejoin()
+        fresh._vocabulary = Counter(fresh._words.split())
+        fresh._sorted_words = sorted(fresh._vocabulary)
+        fresh._trigrams = {word[i:i + 3] for word in fresh._sorted_words for i in range(len(word) - 2)}
+        with self._write_lock, self._lock:
+            self._take(fresh)
+            self.ready = True
+
+    def refresh(self, ids):
+        """Re-read the given employees after an insert or edit; inactive ones drop out"""
+        with self._lock:
+            if self._loading:
+                self._pending.update(ids)
+                return
+        ids = list(ids)
+        conn = self.repository.pool.connection()
+        rows = []
+        for start in range(0, len(ids), REFRESH_CHUNK):
+            chunk = ids[start:start + REFRESH_CHUNK]
+            rows += conn.execute(
+                f"{SQL_SEARCH_ROWS} AND id IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall()
+        # Large batches (bulk onboarding) count their words in one pass and
+        # re-sort the vocabulary once instead of inserting word by word
+        bulk = len(rows) > REJOIN_AFTER
+        with self._write_lock:
+            if bulk or len(self._recent) + len(self._stale) + 2 * len(ids) > REJOIN_AFTER:
+                # Too long for a search to wait on: change a copy and swap it in
+                fresh = self._copy()
+                fresh._apply(ids, rows, bulk)
+                with self._lock:
+                    self._take(fresh)
+            else:
+                with self._lock:
+                    self._apply(ids, rows, bulk)
+
+    # -------- Lookup --------
+    def search(self, text, limit=10, visible=None):
+        """Best matches for `text`, most specific first, then by name
+
+        `visible(hit)` narrows the matches to the employees a session may see.
+        """
+        query = " ".join(text.lower().split())
+        terms = WORD.findall(query)
+        if not terms:
+            return []
+        with self._lock:
+            exact = self._exact.get(query)
+            if exact is not None:
+                hit = self._records[exact]
+                return [hit] if visible is None or visible(hit) else []
+
+            entries = self._entries
+            found = []
+            if all(self._has_prefix(term) for term in terms):
+                needles = [" " + term for term in _distinct_prefixes(terms)]
+                found = self._first_matches(
+                    self._words, self._word_starts,
+                    re.compile("[^\n]*".join(re.escape(needle) for needle in needles)),
+                    limit, set(), lambda i: all(needle in entries[i][1] for needle in needles), visible
+                )
+            if len(query) >= 3 and len(found) < limit and self._may_contain(terms):
+                found += self._first_matches(
+                    self._texts, self._text_starts, re.compile(re.escape(query)),
+                    limit - len(found), set(found), lambda i: query in entries[i][2], visible
+                )
+            return [self._records[i] for i in found]
+
+    def _has_prefix(self, term):
+        words = self._sorted_words
+        i = bisect_left(words, term)
+        return i < len(words) and words[i].startswith(term)
+
+    def _may_contain(self, terms):
+        return all(gram in self._trigrams for term in terms for gram in _trigrams(term))
+
+    def _first_matches(self, joined, starts, pattern, limit, seen, accept, visible=None):
+        """The first `limit` ids in name order whose line matches `pattern`, skipping `seen`
+
+        Lines of the joined snapshot are matched in C; employees changed since
+        it was joined are checked with `accept` and merged in by name. Ids
+        `visible` rejects are skipped without counting towards `limit`.
+        """
+        ids, stale, records = self._ids, self._stale, self._records
+        found = []
+        end = len(joined)
+        match = pattern.search(joined)
+        while match:
+            k = bisect_right(starts, match.start()) - 1
+            employee_id = ids[k]
+            if (employee_id not in stale and employee_id not in seen
+                    and (visible is None or visible(records[employee_id]))):
+                found.append(employee_id)
+                if len(found) == limit:
+                    break
+            # Continue at the next line: each employee is reported once
+            match = pattern.search(joined, starts[k + 1] if k + 1 < len(starts) else end)
+
+        recent = [i for i in self._recent
+                  if i not in seen and accept(i) and (visible is None or visible(records[i]))]
+        if recent:
+            entries = self._entries
+            found = sorted(found + recent, key=lambda i: (entries[i][0], i))[:limit]
+        return found
+
+    # -------- Maintenance (lock held) --------
+    def _apply(self, ids, rows, bulk):
+        for employee_id in ids:
+            self._remove(employee_id)
+        for row in rows:
+            self._add(row, bulk)
+        if bulk:
+            self._count_words(row[0] for row in rows)
+        if len(self._recent) + len(self._stale) > REJOIN_AFTER:
+            self._rejoin()
+
+    def _copy(self):
+        """A private copy to change while searches carry on (write lock held)"""
+        fresh = EmployeeSearchIndex()
+        fresh._records, fresh._entries = dict(self._records), dict(self._entries)
+        fresh._exact, fresh._vocabulary = dict(self._exact), self._vocabulary.copy()
+        fresh._sorted_words, fresh._trigrams = list(self._sorted_words), set(self._trigrams)
+        fresh._recent, fresh._stale = dict(self._recent), set(self._stale)
+        # Replaced, never changed in place, so they can be shared
+        fresh._ids = self._ids
+        fresh._words, fresh._word_starts = self._words, self._word_starts
+        fresh._texts, fresh._text_starts = self._texts, self._text_starts
+        return fresh
+
+    def _take(self, fresh):
+        self._records, self._entries, self._exact = fresh._records, fresh._entries, fresh._exact
+        self._vocabulary, self._sorted_words = fresh._vocabulary, fresh._sorted_words
+        self._trigrams = fresh._trigrams
+        self._ids, self._recent, self._stale = fresh._ids, fresh._recent, fresh._stale
+        self._words, self._word_starts = fresh._words, fresh._word_starts
+        self._texts, self._text_starts = fresh._texts, fresh._text_starts
+
+    def _add(self, row, bulk=False):
+        """Index one row; with bulk=True the caller counts the vocabulary once at the end"""
+        employee_id, emp_no, name, email, department, nic = row
+        self._records[employee_id] = SearchHit(employee_id, emp_no, name, email, department)
+        text = "\t".join(value.lower() for value in (name, email, emp_no, department, nic) if value)
+        keys = [key.lower() for key in (emp_no, nic, email) if key]
+        words = sorted(set(WORD.findall(text)))
+        self._entries[employee_id] = (name.lower(), " " + " ".join(words), text, keys)
+        for key in keys:
+            self._exact[key] = employee_id
+        self._recent[employee_id] = None
+        if bulk:
+            return
+        for word in words:
+            count = self._vocabulary.get(word, 0)
+            self._vocabulary[word] = count + 1
+            if not count:
+                insort(self._sorted_words, word)
+                self._trigrams.update(_trigrams(word))
+
+    def _count_words(self, ids):
+        """Add the words of employees indexed with bulk=True to the vocabulary"""
+        fresh = []
+        for employee_id in ids:
+            for word in self._entries[employee_id][1].split():
+                count = self._vocabulary.get(word, 0)
+                self._vocabulary[word] = count + 1
+                if not count:
+                    fresh.append(word)
+        if fresh:
+            self._sorted_words = sorted(self._vocabulary)
+            self._trigrams.update(gram for word in fresh for gram in _trigrams(word))
+
+    def _remove(self, employee_id):
+        self._recent.pop(employee_id, None)
+        if self._records.pop(employee_id, None) is None:
+            return
+        _, words, _, keys = self._entries.pop(employee_id)
+        for key in keys:
+            if self._exact.get(key) == employee_id:
+                del self._exact[key]
+        for word in words.split():
+            count = self._vocabulary.pop(word) - 1
+            if count:
+                self._vocabulary[word] = count
+            else:
+                i = bisect_left(self._sorted_words, word)
+                del self._sorted_words[i]
+        self._stale.add(employee_id)
+
+    def _rejoin(self):
+        entries = self._entries
+        self._ids = sorted(entries, key=lambda i: (entries[i][0], i))
+        self._words, self._word_starts = _join([entries[i][1] for i in self._ids])
+        self._texts, self._text_starts = _join([entries[i][2] for i in self._ids])
+        self._recent = {}
+        self._stale = set()
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(repository):
+    """The shared index for `repository`; follows its employee changes from the first call"""
+    with _indexes_lock:
+        index = _indexes.get(id(repository))
+        if index is None or index.repository is not repository:
+            index = _indexes[id(repository)] = EmployeeSearchIndex(repository)
+            repository.on_employees_changed(index.refresh)
+        return index
@@ -0,0 +1,121 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from validation_rules import NEUTRAL, ValidationResult
+from workers import run_in_background, thread_pool
+
+DEBOUNCE_MS = 120
+
+
+def repolish(widget):
+    """Re-apply stylesheet rules after a dynamic property changed"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class FieldValidator(QObject):
+    """Debounced validation of one QLineEdit against a check from validation_rules
+
+    Keystrokes only restart a timer; the check runs once typing pauses. The
+    field is restyled only when its state flips and the error label only
+    changes when the message does. `changed` fires with the new
+    ValidationResult whenever anything about it differs from the last one.
+
+    A `confirm(text)` check (e.g. a database lookup) runs on a worker after
+    the rules pass, and only when the cheap `prefilter(text)` says it could
+    fail. It returns a ValidationResult to show, or None to keep the rules'
+    verdict. A lookup that has not started yet is dropped once the text
+    changes again, and the results of stale lookups are ignored.
+    """
+    changed = pyqtSignal(object)
+
+    def __init__(self, field, check, error_label=None, error_prefix="",
+                 style_field=True, hide_empty_label=True, delay_ms=DEBOUNCE_MS,
+                 confirm=None, prefilter=None, parent=None):
+        super().__init__(parent or field)
+        self.field = field
+        self.check = check
+        self.error_label = error_label
+        self.error_prefix = error_prefix
+        self.style_field = style_field
+        self.hide_empty_label = hide_empty_label
+        self.result = NEUTRAL
+        self.confirm = confirm
+        self.prefilter = prefilter
+        self._lookup = None
+        self._generation = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+        field.textChanged.connect(self.timer.start)
+        if confirm is not None:
+            field.textChanged.connect(self._cancel_lookup)
+
+    @property
+    def valid(self):
+        return self.result.valid
+
+    def flush(self):
+        """Validate now (cancels a pending debounced check)"""
+        self.timer.stop()
+        text = self.field.text()
+        result = self.apply(self.check(text))
+        if result.valid and self.confirm is not None and (self.prefilter is None or self.prefilter(text)):
+            self._start_lookup(text)
+        return result
+
+    def reset(self):
+        """Back to the untouched state, e.g. after the form was cleared for the next entry"""
+        self.timer.stop()
+        if self.confirm is not None:
+            self._cancel_lookup()
+        return self.apply(NEUTRAL)
+
+    def show_error(self, message):
+        """Mark the field invalid with a message from outside the rules (e.g. a server-side check)"""
+        self.timer.stop()
+        return self.apply(ValidationResult("false", message, 0))
+
+    def apply(self, result):
+        previous = self.result
+        if result == previous:
+            return result
+        self.result = result
+
+        if self.style_field and result.state != previous.state:
+            self.field.setProperty("valid", result.state)
+            repolish(self.field)
+
+        if self.error_label is not None and result.message != previous.message:
+            self.error_label.setText(self.error_prefix + result.message if result.message else "")
+            if self.hide_empty_label:
+                self.error_label.setVisible(bool(result.message))
+
+        self.changed.emit(result)
+        return result
+
+    # -------- Confirmation lookups --------
+    def _start_lookup(self, text):
+        self._cancel_lookup()
+        generation = self._generation
+        self._lookup = run_in_background(
+            self.confirm, text,
+            on_result=lambda result: self._lookup_done(generation, result)
+        )
+
+    def _cancel_lookup(self):
+        self._generation += 1
+        if self._lookup is not None:
+            try:
+                thread_pool().tryTake(self._lookup)
+            except RuntimeError:
+                pass    # already ran and deleted by the pool; its result is ignored
+            self._lookup = None
+
+    def _lookup_done(self, generation, result):
+        if generation != self._generation:
+            return
+        self._lookup = None
+        if result is not None:
+            self.apply(result)
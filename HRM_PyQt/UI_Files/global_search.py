@@ -0,0 +1,81 @@
+from PyQt5.QtWidgets import QLineEdit, QCompleter
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtCore import Qt, QModelIndex, pyqtSignal
+from employee_search import get_search_index
+from permissions import SCOPE_ALL
+from workers import run_in_background
+from theme import set_role
+
+
+class GlobalSearchBox(QLineEdit):
+    """Header search box: employee suggestions from the in-memory index as you type
+
+    Every keystroke is answered synchronously from EmployeeSearchIndex (well
+    under a frame), so the popup never lags the text. The index itself is
+    built on a worker the first time the box is started.
+    """
+    employee_chosen = pyqtSignal(object)   # SearchHit
+
+    MAX_SUGGESTIONS = 10
+
+    def __init__(self, repository, parent=None):
+        super().__init__(parent)
+        self.index = get_search_index(repository)
+        self.setObjectName("globalSearch")
+        set_role(self, "input")
+        self.setPlaceholderText("Search employees by name, email, emp no, NIC or department")
+        self.setClearButtonEnabled(True)
+        self._hits = []
+        self._visible = None    # session row check; None shows every employee
+
+        self.suggestions = QStandardItemModel(self)
+        # The index ranks and filters; the completer only shows the popup
+        self.suggestion_popup = QCompleter(self.suggestions, self)
+        self.suggestion_popup.setWidget(self)
+        self.suggestion_popup.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.suggestion_popup.setMaxVisibleItems(self.MAX_SUGGESTIONS)
+        self.suggestion_popup.activated[QModelIndex].connect(self._on_activated)
+
+        self.textEdited.connect(self.update_suggestions)
+        self.returnPressed.connect(self._choose_first)
+
+    def start(self):
+        """Build the index in the background unless it is already built or building"""
+        if not self.index.ready:
+            run_in_background(self.index.build, on_result=lambda _: self.update_suggestions(self.text()))
+
+    def set_session(self, session):
+        """Suggest only employees `session` may see"""
+        self._visible = None if session.scope == SCOPE_ALL else (
+            lambda hit: session.can_see(hit.employee_id, hit.department)
+        )
+
+    def update_suggestions(self, text):
+        self._hits = self.index.search(text, self.MAX_SUGGESTIONS, self._visible) if text.strip() else []
+        self.suggestions.clear()
+        for row, hit in enumerate(self._hits):
+            detail = hit.department or hit.email
+            item = QStandardItem(f"{hit.name}   {hit.emp_no}  ·  {detail}")
+            item.setData(row, Qt.UserRole)
+            self.suggestions.appendRow(item)
+        popup = self.suggestion_popup.popup()
+        if self._hits and self.hasFocus():
+            self.suggestion_popup.complete()
+        elif popup.isVisible():
+            popup.hide()
+
+    def _on_activated(self, index):
+        self._choose(self._hits[index.data(Qt.UserRole)])
+
+    def _choose_first(self):
+        # Return reaches the line edit before the completer reports a
+        # highlighted row; only pick the top hit when nothing is highlighted
+        popup = self.suggestion_popup.popup()
+        if self._hits and not (popup.isVisible() and popup.currentIndex().isValid()):
+            self._choose(self._hits[0])
+
+    def _choose(self, hit):
+        self.suggestion_popup.popup().hide()
+        self.clear()
+        self._hits = []
+        self.employee_chosen.emit(hit)
@@ -0,0 +1,323 @@
+"""Headless command line for batch HR operations (cron, servers without a display)
+
+Shares the data and engine modules with the GUI but never imports PyQt, so
+it runs anywhere Python and SQLite do:
+
+    python hrm.py employees onboard new_site.csv --errors rejected.csv
+    python hrm.py payroll run 2026-09 --workers 8
+    python hrm.py payroll salary 42 185000 --allowance 12500 --from 2026-10-01
+    python hrm.py attendance import exports/*.csv --workers 4
+    python hrm.py report export payslips --period 2026-09 -o payslips.csv
+    python hrm.py leave rollover 2026
+    python hrm.py calendar holiday 2026-12-25 "Christmas Day"
+    python hrm.py calendar days 2026-09-01 2026-09-30 --site Kandy --pattern six-day
+    python hrm.py audit show --user admin --event loan. --since 2026-09-01
+
+--workers 0 uses every core. The database is --db, else HRM_DB_PATH, else
+hrm.db next to this file.
+"""
+import getpass
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import click
+
+from datetime import datetime, timedelta
+
+from audit import AuditReader, get_audit_log, set_actor
+from database import get_repository
+from attendance_import import BATCH_SIZE, PunchImportError, import_punch_file
+from leave import LeaveEngine
+from onboarding import OnboardingError, onboard_employees, write_error_report
+from payroll import run_payroll, set_salary_structure
+from work_calendar import (
+    DEFAULT_PATTERN, CalendarError, add_holiday, remove_holiday, set_work_pattern, work_calendar
+)
+from reports import REPORTS, ReportError, export_report
+
+
+# Rejected rows printed when no --errors file is given
+ERRORS_SHOWN = 20
+
+
+def _workers(value):
+    return value if value > 0 else os.cpu_count() or 1
+
+
+def _period(ctx, param, value):
+    """Click callback: accept only YYYY-MM"""
+    if value is not None and not re.fullmatch(r"\d{4}-(0[1-9]|1[0-2])", value):
+        raise click.BadParameter("expected YYYY-MM, e.g. 2026-09")
+    return value
+
+
+def _import_file(db_path, path, batch_size):
+    """Process pool entry point: import one punch file into its own connection"""
+    return import_punch_file(get_repository(db_path), path, batch_size)
+
+
+@click.group()
+@click.option("--db", "db_path", type=click.Path(dir_okay=False),
+              help="Database file (default: HRM_DB_PATH or hrm.db).")
+@click.pass_context
+def cli(ctx, db_path):
+    """FBSL HRM batch operations."""
+    ctx.obj = get_repository(db_path)
+    # Changes made here are audited as the operating system account running the command
+    set_actor(f"cli:{getpass.getuser()}")
+
+
+# ================= Employees =================
+@cli.group()
+def employees():
+    """Employee records."""
+
+
+@employees.command("onboard")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--errors", "errors_path", type=click.Path(dir_okay=False, writable=True),
+              help="Write rejected rows (line, field, value, message) to this CSV.")
+@click.option("--dry-run", is_flag=True, help="Validate only; insert nothing.")
+@click.pass_obj
+def employees_onboard(repository, path, errors_path, dry_run):
+    """Add every valid employee in the CSV at PATH, using the registration rules."""
+    try:
+        result = onboard_employees(repository, path, dry_run=dry_run)
+    except OnboardingError as e:
+        raise click.ClickException(str(e))
+    if errors_path:
+        with open(errors_path, "w", newline="", encoding="utf-8") as out:
+            write_error_report(result.errors, out)
+    else:
+        for error in result.errors[:ERRORS_SHOWN]:
+            click.echo(f"line {error.line}: {error.field} {error.value!r} - {error.message}", err=True)
+        if len(result.errors) > ERRORS_SHOWN:
+            click.echo(f"... and {len(result.errors) - ERRORS_SHOWN:,} more (use --errors FILE)", err=True)
+    valid = result.rows - len(result.errors)
+    done = f"{valid:,} valid" if dry_run else f"{result.inserted:,} added"
+    click.echo(f"{result.rows:,} rows: {done}, {len(result.errors):,} rejected in {result.elapsed:.2f}s")
+    if result.errors:
+        sys.exit(1)
+
+
+# ================= Payroll =================
+@cli.group()
+def payroll():
+    """Payroll runs and salary structures."""
+
+
+@payroll.command("run")
+@click.argument("period", callback=_period)
+@click.option("--workers", "-w", default=1, show_default=True,
+              help="Processes to split departments across (0 = every core).")
+@click.pass_obj
+def payroll_run(repository, period, workers):
+    """Compute and store the payroll of PERIOD (YYYY-MM)."""
+    result = run_payroll(repository, period, workers=_workers(workers))
+    click.echo(
+        f"Payroll {result.period}: run {result.run_id}, {result.employees:,} payslips, "
+        f"gross {result.total_gross:,.2f}, net {result.total_net:,.2f} in {result.elapsed:.2f}s"
+    )
+
+
+@payroll.command("salary")
+@click.argument("employee_id", type=int)
+@click.argument("basic", type=float)
+@click.option("--allowance", type=float, help="Fixed monthly allowance (default: unchanged).")
+@click.option("--from", "effective_from", type=click.DateTime(["%Y-%m-%d"]), help="Effective date (YYYY-MM-DD).")
+@click.pass_obj
+def payroll_salary(repository, employee_id, basic, allowance, effective_from):
+    """Set EMPLOYEE_ID's monthly BASIC salary (recorded in the audit log)."""
+    if repository.get_employee(employee_id) is None:
+        raise click.BadParameter(f"No employee {employee_id}", param_hint="EMPLOYEE_ID")
+    try:
+        set_salary_structure(repository, employee_id, basic, allowance,
+                             effective_from and f"{effective_from:%Y-%m-%d}")
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    click.echo(f"Employee {employee_id}: basic salary set to {basic:,.2f}")
+
+
+# ================= Attendance =================
+@cli.group()
+def attendance():
+    """Biometric punch imports."""
+
+
+@attendance.command("import")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", "-w", default=1, show_default=True,
+              help="Files imported at the same time (0 = every core).")
+@click.option("--batch-size", default=BATCH_SIZE, show_default=True, help="Rows per commit.")
+@click.pass_obj
+def attendance_import(repository, paths, workers, batch_size):
+    """Import punch exports; interrupted or grown files resume where they stopped.
+
+    With several workers each file is parsed in its own process; SQLite
+    still commits one batch at a time.
+    """
+    started = time.perf_counter()
+    workers = min(_workers(workers), len(paths))
+    if workers == 1:
+        failed = _report_imports((path, _attempt(import_punch_file, repository, path, batch_size))
+                                 for path in paths)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_import_file, repository.pool.path, path, batch_size): path
+                       for path in paths}
+            failed = _report_imports((futures[future], _attempt(future.result))
+                                     for future in as_completed(futures))
+    click.echo(f"Imported {len(paths) - failed} of {len(paths)} file(s) in {time.perf_counter() - started:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+def _report_imports(outcomes):
+    """Print each (path, (result, error)) as it arrives; returns the number that failed"""
+    failed = 0
+    for path, (result, error) in outcomes:
+        if error is not None:
+            failed += 1
+            click.echo(f"{path}: import failed - {error}", err=True)
+            continue
+        resumed = f" (resumed at byte {result.resumed_from:,})" if result.resumed_from else ""
+        click.echo(
+            f"{path}: {result.inserted:,} new punches, {result.duplicates:,} duplicates, "
+            f"{result.rejected:,} rejected{resumed}"
+        )
+    return failed
+
+
+def _attempt(fn, *args):
+    """(result, None) or (None, message) for expected import failures"""
+    try:
+        return fn(*args), None
+    except (PunchImportError, OSError, UnicodeDecodeError) as e:
+        return None, str(e)
+
+
+# ================= Reports =================
+@cli.group()
+def report():
+    """CSV report exports."""
+
+
+@report.command("export")
+@click.argument("name", type=click.Choice(sorted(REPORTS)))
+@click.option("--period", "-p", callback=_period, help="Month the report covers (YYYY-MM).")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, writable=True),
+              help="CSV file to write (default: standard output).")
+@click.pass_obj
+def report_export(repository, name, period, output):
+    """Export report NAME as CSV."""
+    try:
+        if output is None:
+            export_report(repository, name, sys.stdout, period)
+            return
+        with open(output, "w", newline="", encoding="utf-8") as out:
+            rows = export_report(repository, name, out, period)
+    except ReportError as e:
+        raise click.UsageError(str(e))
+    click.echo(f"{REPORTS[name].title}: {rows:,} rows written to {output}", err=True)
+
+
+# ================= Leave =================
+@cli.group()
+def leave():
+    """Leave balances."""
+
+
+@leave.command("rollover")
+@click.argument("year", type=int)
+@click.pass_obj
+def leave_rollover(repository, year):
+    """Carry YEAR's unused leave forward and open the next year's balances."""
+    opened = LeaveEngine(repository).year_end_rollover(year)
+    click.echo(f"Opened {year + 1} leave balances for {opened:,} employees")
+
+
+# ================= Calendar =================
+@cli.group()
+def calendar():
+    """Working weeks and holidays."""
+
+
+@calendar.command("holiday")
+@click.argument("day", type=click.DateTime(["%Y-%m-%d"]))
+@click.argument("name", required=False, default="")
+@click.option("--site", default="", help="Close only this site (default: every site).")
+@click.option("--remove", is_flag=True, help="Reopen DAY instead.")
+@click.pass_obj
+def calendar_holiday(repository, day, name, site, remove):
+    """Mark DAY (YYYY-MM-DD) as the holiday NAME, or reopen it with --remove."""
+    if remove:
+        remove_holiday(repository, day.date(), site)
+        click.echo(f"{day:%Y-%m-%d} is a working day again{f' at {site}' if site else ''}")
+        return
+    add_holiday(repository, day.date(), name, site)
+    click.echo(f"{day:%Y-%m-%d} {name}: closed{f' at {site}' if site else ' at every site'}")
+
+
+@calendar.command("pattern")
+@click.argument("name")
+@click.argument("week")
+@click.option("--site", default="", help="Only at this site (default: company-wide).")
+@click.pass_obj
+def calendar_pattern(repository, name, week, site):
+    """Set the working WEEK of shift pattern NAME, seven 0/1 flags from Monday (1111110)."""
+    try:
+        set_work_pattern(repository, name, week, site)
+    except CalendarError as e:
+        raise click.BadParameter(str(e), param_hint="WEEK")
+    click.echo(f"{name}{f' at {site}' if site else ''}: {week}")
+
+
+@calendar.command("days")
+@click.argument("start", type=click.DateTime(["%Y-%m-%d"]))
+@click.argument("end", type=click.DateTime(["%Y-%m-%d"]))
+@click.option("--site", default="", help="Site whose holidays apply.")
+@click.option("--pattern", default=DEFAULT_PATTERN, show_default=True, help="Shift pattern.")
+@click.pass_obj
+def calendar_days(repository, start, end, site, pattern):
+    """Count the working days from START to END inclusive."""
+    try:
+        days = work_calendar(repository, (start.year, end.year)).working_days(
+            start.date(), end.date(), site, pattern)
+    except CalendarError as e:
+        raise click.ClickException(str(e))
+    click.echo(days)
+
+
+# ================= Audit =================
+@cli.group()
+def audit():
+    """Audit trail of sign-ins and changes."""
+
+
+@audit.command("show")
+@click.option("--user", "-u", help="Only this user's entries.")
+@click.option("--event", "-e", help="Event name, or a family ending in '.' (e.g. loan.).")
+@click.option("--since", type=click.DateTime(["%Y-%m-%d"]), help="First day (YYYY-MM-DD).")
+@click.option("--until", type=click.DateTime(["%Y-%m-%d"]), help="Last day (YYYY-MM-DD).")
+@click.option("--limit", "-n", default=50, show_default=True, help="Newest entries to print (0 = all).")
+@click.pass_obj
+def audit_show(repository, user, event, since, until, limit):
+    """Print matching audit entries, newest first."""
+    start = int(since.timestamp() * 1000) if since else None
+    end = int((until + timedelta(days=1)).timestamp() * 1000) if until else None
+    matches = AuditReader(get_audit_log(repository).directory).query(start, end, user, event)
+    shown = len(matches) if limit <= 0 else min(limit, len(matches))
+    for i in range(shown):
+        entry = matches[i]
+        details = " ".join(f"{key}={value}" for key, value in entry.details.items())
+        stamp = datetime.fromtimestamp(entry.ts / 1000).strftime("%Y-%m-%d %H:%M:%S")
+        click.echo(f"{stamp}  {entry.user:<20} {entry.event:<18} {details}")
+    matches.close()
+    click.echo(f"{len(matches):,} matching entries", err=True)
+
+
+if __name__ == "__main__":
+    cli()
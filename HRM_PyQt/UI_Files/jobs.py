@@ -0,0 +1,279 @@
+"""Background jobs: queued, prioritised, limited per kind and cancellable
+
+Long operations (attendance imports, payroll runs, report exports, leave
+roll-overs) are submitted to the shared JobManager instead of being started
+directly. The manager keeps a priority queue, starts a job only while fewer
+than KIND_LIMITS[kind] jobs of its kind are running, and runs it on its own
+QThreadPool, so short run_in_background() tasks (validation, dashboard
+refreshes) never wait behind an import.
+
+A job function that takes a `progress` argument is handed a callback whose
+values are reported to the GUI thread; `progress(done, total, ...)` also
+sets the job's completion fraction. One that takes `cancelled` gets the
+job's CancelToken, a callable that turns True once the user cancels; the
+function stops at its next check and returns normally. Jobs still queued
+are cancelled outright.
+
+CPU-heavy steps go to process_pool(), which leaves one core (and scheduling
+priority) to the GUI process.
+"""
+import heapq
+import inspect
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from PyQt5.QtCore import QObject, QThread, QThreadPool, pyqtSignal
+from workers import Worker
+
+# Priorities: higher runs first, submission order breaks ties
+HIGH, NORMAL, LOW = 2, 1, 0
+
+# Jobs of one kind allowed to run at the same time; the rest wait their turn
+KIND_LIMITS = {
+    "import": 1,
+    "payroll": 1,
+    "export": 2,
+    "rollover": 1,
+    "onboarding": 1,
+}
+DEFAULT_KIND_LIMIT = 1
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+# Process pool size: one core is left to the GUI process
+PROCESS_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+# Niceness added to process pool workers so the GUI process wins the CPU
+PROCESS_NICENESS = 5
+
+
+class CancelToken:
+    """Thread-safe cancel flag; calling the token returns True once cancelled"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def __call__(self):
+        return self._event.is_set()
+
+
+class Job:
+    """One submitted operation; its fields are only changed on the GUI thread"""
+    _ids = itertools.count(1)
+
+    def __init__(self, kind, title, fn, args, kwargs, priority):
+        self.id = next(Job._ids)
+        self.kind = kind
+        self.title = title
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.state = QUEUED
+        self.progress = None        # completion fraction once the job reports progress
+        self.result = None
+        self.error = None
+        self.token = CancelToken()
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.ended_at = None
+        self.callbacks = {}
+        self._worker = None
+
+        params = inspect.signature(fn).parameters
+        self.reports_progress = "progress" in params
+        self.cancellable = "cancelled" in params
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.ended_at or time.time()) - self.started_at
+
+
+class JobManager(QObject):
+    """Runs submitted jobs by priority within per-kind concurrency limits"""
+    job_added = pyqtSignal(object)
+    job_changed = pyqtSignal(object)      # state or progress changed
+    job_finished = pyqtSignal(object)
+
+    def __init__(self, max_running=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_running or max(2, QThread.idealThreadCount()))
+        self.jobs = []              # every job of this session, oldest first
+        self._queue = []            # heap of (-priority, id, job)
+        self._running = Counter()   # kind -> jobs running
+
+    # -------- Public API --------
+    def submit(self, kind, title, fn, *args, priority=NORMAL,
+               on_result=None, on_error=None, on_progress=None, on_finished=None, **kwargs):
+        """Queue fn(*args, **kwargs) and return its Job
+
+        on_result(result), on_error(message) and on_progress(values) mirror
+        run_in_background(); on_finished(job) runs whatever the outcome,
+        including a cancel while still queued.
+        """
+        job = Job(kind, title, fn, args, kwargs, priority)
+        job.callbacks = {
+            "result": on_result, "error": on_error,
+            "progress": on_progress, "finished": on_finished,
+        }
+        self.jobs.append(job)
+        heapq.heappush(self._queue, (-priority, job.id, job))
+        self.job_added.emit(job)
+        self._dispatch()
+        return job
+
+    def cancel(self, job):
+        """Drop a queued job, or ask a running one to stop at its next check"""
+        if job.state == QUEUED:
+            job.token.cancel()
+            self._finish(job, CANCELLED)
+        elif job.state == RUNNING and job.cancellable:
+            job.token.cancel()
+            self.job_changed.emit(job)
+
+    def active(self):
+        return [job for job in self.jobs if not job.finished]
+
+    def summary(self):
+        """Short text for the unfinished jobs, e.g. 'Jobs: 1 running, 2 queued' ('' if none)"""
+        active = self.active()
+        if not active:
+            return ""
+        running = sum(job.state == RUNNING for job in active)
+        parts = [f"{running} running"] if running else []
+        if len(active) > running:
+            parts.append(f"{len(active) - running} queued")
+        return "Jobs: " + ", ".join(parts)
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if not job.finished]
+
+    def wait(self, msecs=-1):
+        """Block until every running job has returned (for scripts and benchmarks)"""
+        return self.pool.waitForDone(msecs)
+
+    # -------- Scheduling --------
+    def _dispatch(self):
+        waiting = []
+        while self._queue and sum(self._running.values()) < self.pool.maxThreadCount():
+            entry = heapq.heappop(self._queue)
+            job = entry[2]
+            if job.state != QUEUED:
+                continue
+            if self._running[job.kind] >= KIND_LIMITS.get(job.kind, DEFAULT_KIND_LIMIT):
+                waiting.append(entry)
+                continue
+            self._start(job)
+        for entry in waiting:
+            heapq.heappush(self._queue, entry)
+
+    def _start(self, job):
+        job.state = RUNNING
+        job.started_at = time.time()
+        self._running[job.kind] += 1
+
+        worker = Worker(job.fn, *job.args, **job.kwargs)
+        signals = worker.signals
+        if job.reports_progress:
+            worker.kwargs["progress"] = lambda *values: signals.progress.emit(values)
+            signals.progress.connect(lambda values: self._on_progress(job, values))
+        if job.cancellable:
+            worker.kwargs["cancelled"] = job.token
+        signals.result.connect(lambda result: self._on_result(job, result))
+        signals.error.connect(lambda message: self._on_error(job, message))
+        job._worker = worker
+        self.pool.start(worker)
+        self.job_changed.emit(job)
+
+    def _on_progress(self, job, values):
+        if len(values) >= 2 and values[1]:
+            job.progress = min(1.0, values[0] / values[1])
+        self._call(job, "progress", values)
+        self.job_changed.emit(job)
+
+    def _on_result(self, job, result):
+        job.result = result
+        if not job.token.cancelled:
+            job.progress = 1.0
+            self._call(job, "result", result)
+        self._finish(job, CANCELLED if job.token.cancelled else DONE)
+
+    def _on_error(self, job, message):
+        job.error = message
+        self._call(job, "error", message)
+        self._finish(job, FAILED)
+
+    def _finish(self, job, state):
+        if job.state == RUNNING:
+            self._running[job.kind] -= 1
+        job.state = state
+        job.ended_at = time.time()
+        job._worker = None
+        self._call(job, "finished", job)
+        self.job_changed.emit(job)
+        self.job_finished.emit(job)
+        self._dispatch()
+
+    @staticmethod
+    def _call(job, name, value):
+        callback = job.callbacks.get(name)
+        if callback is not None:
+            callback(value)
+
+
+_manager = None
+
+
+def job_manager():
+    """The application's JobManager (created on first use, on the GUI thread)"""
+    global _manager
+    if _manager is None:
+        _manager = JobManager()
+    return _manager
+
+
+# ================= Process pool =================
+def _lower_priority():
+    if hasattr(os, "nice"):
+        os.nice(PROCESS_NICENESS)
+
+
+_processes = None
+_processes_lock = threading.Lock()
+
+
+def process_pool():
+    """Shared process pool for CPU-heavy job steps
+
+    PROCESS_WORKERS workers, each at a lower scheduling priority, so the GUI
+    stays responsive while they are all busy. Workers are spawned rather
+    than forked: forking a process that runs Qt threads can copy locks held
+    by those threads.
+    """
+    global _processes
+    with _processes_lock:
+        if _processes is None:
+            _processes = ProcessPoolExecutor(
+                max_workers=PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_lower_priority,
+            )
+        return _processes
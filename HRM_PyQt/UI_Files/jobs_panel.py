@@ -0,0 +1,204 @@
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QPushButton, QTableView, QHeaderView, QApplication,
+    QVBoxLayout, QHBoxLayout, QAbstractItemView, QStyle, QStyledItemDelegate,
+    QStyleOptionProgressBar
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QAbstractTableModel
+from jobs import job_manager, QUEUED, RUNNING
+from theme import set_role, set_variant
+
+
+class JobTableModel(QAbstractTableModel):
+    """Every job of the session, newest first, updated from the manager's signals"""
+    COLUMNS = ["Job", "Status", "Progress", "Time"]
+    PROGRESS_COLUMN = 2
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self._jobs = list(reversed(manager.jobs))
+        manager.job_added.connect(self._on_added)
+        manager.job_changed.connect(self._on_changed)
+
+    # -------- Qt model interface --------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return job.title
+            if column == 1:
+                if job.state == RUNNING and job.token.cancelled:
+                    return "cancelling"
+                return job.state
+            if column == 3:
+                return f"{job.elapsed:.1f} s" if job.started_at else ""
+        elif role == Qt.UserRole and column == self.PROGRESS_COLUMN:
+            return job.progress
+        elif role == Qt.ToolTipRole and job.error:
+            return job.error.strip().splitlines()[-1]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    # -------- Public API --------
+    def job(self, row):
+        return self._jobs[row]
+
+    def clear_finished(self):
+        self.beginResetModel()
+        self.manager.clear_finished()
+        self._jobs = list(reversed(self.manager.jobs))
+        self.endResetModel()
+
+    def refresh_running(self):
+        """Repaint the time column of running jobs (their elapsed time moves on its own)"""
+        for row, job in enumerate(self._jobs):
+            if job.state == RUNNING:
+                index = self.index(row, 3)
+                self.dataChanged.emit(index, index)
+
+    # -------- Manager signals --------
+    def _on_added(self, job):
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._jobs.insert(0, job)
+        self.endInsertRows()
+
+    def _on_changed(self, job):
+        # Recent jobs sit at the top, so this scan is short in practice
+        for row, listed in enumerate(self._jobs):
+            if listed is job:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+                return
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Draws a job's completion fraction as a progress bar"""
+
+    def paint(self, painter, option, index):
+        fraction = index.data(Qt.UserRole)
+        if fraction is None:
+            super().paint(painter, option, index)
+            return
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(6, 8, -6, -8)
+        bar.minimum, bar.maximum = 0, 1000
+        bar.progress = int(1000 * fraction)
+        bar.text = f"{fraction:.0%}"
+        bar.textVisible = True
+        QApplication.style().drawControl(QStyle.CE_ProgressBar, bar, painter)
+
+
+class JobsPanel(QWidget):
+    """The "Jobs" page: queued, running and finished background jobs"""
+    ROW_HEIGHT = 34
+    TICK_MS = 1000
+
+    def __init__(self, manager=None, parent=None):
+        super().__init__(parent)
+        self.manager = manager or job_manager()
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header_row = QHBoxLayout()
+        header = QLabel("Jobs")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setFixedHeight(36)
+        self.cancel_btn.setCursor(Qt.PointingHandCursor)
+        self.cancel_btn.setEnabled(False)
+        set_variant(self.cancel_btn, "secondary")
+        self.cancel_btn.clicked.connect(self.cancel_selected)
+
+        self.clear_btn = QPushButton("Clear Finished")
+        self.clear_btn.setFixedHeight(36)
+        self.clear_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.clear_btn, "secondary")
+
+        header_row.addWidget(header)
+        header_row.addStretch()
+        header_row.addWidget(self.cancel_btn)
+        header_row.addWidget(self.clear_btn)
+        layout.addLayout(header_row)
+
+        desc = QLabel("Imports, payroll runs and other long operations run here in the background.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+        layout.addWidget(desc)
+
+        # ----- Table -----
+        self.model = JobTableModel(self.manager, self)
+        self.clear_btn.clicked.connect(self.model.clear_finished)
+
+        self.table = QTableView()
+        self.table.setObjectName("jobsTable")
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(JobTableModel.PROGRESS_COLUMN, ProgressDelegate(self.table))
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setAlternatingRowColors(True)
+        self.table.setShowGrid(False)
+
+        rows = self.table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.setVisible(False)
+
+        columns = self.table.horizontalHeader()
+        columns.setSectionResizeMode(0, QHeaderView.Stretch)
+        columns.resizeSection(1, 120)
+        columns.resizeSection(2, 220)
+        columns.resizeSection(3, 90)
+
+        layout.addWidget(self.table)
+
+        self.table.selectionModel().selectionChanged.connect(self._update_buttons)
+        self.manager.job_changed.connect(self._update_buttons)
+
+        # Running jobs' times only need a tick while the page is on screen
+        self.tick = QTimer(self)
+        self.tick.setInterval(self.TICK_MS)
+        self.tick.timeout.connect(self.model.refresh_running)
+
+    def cancel_selected(self):
+        for index in self.table.selectionModel().selectedRows():
+            self.manager.cancel(self.model.job(index.row()))
+
+    def _update_buttons(self, *_):
+        self.cancel_btn.setEnabled(any(
+            self._can_cancel(self.model.job(index.row()))
+            for index in self.table.selectionModel().selectedRows()
+        ))
+
+    @staticmethod
+    def _can_cancel(job):
+        if job.state == QUEUED:
+            return True
+        return job.state == RUNNING and job.cancellable and not job.token.cancelled
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.tick.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.tick.stop()
+
@@ -0,0 +1,174 @@
+"""Self-painted dashboard figure cards
+
+A KPICard draws its rounded surface, accent strip and title once into a
+pixmap at the screen's device pixel ratio and blits that on every paint;
+only the value is drawn each time. A new value repaints just the value's
+strip of the card, and the style engine never sees the card at all, so a
+wallboard of dozens of cards refreshing continuously costs little more
+than the text it changes.
+
+Resizing does not re-render either. The cached pixmap is flat on its right
+and rendered RESIZE_SLACK wider than the card, so a card of any width up
+to that is a slice of it plus the right-hand corners, which every card of
+the same height shares. The cache is rebuilt when the card outgrows it,
+when the title has to be elided differently, or when the card moves to a
+screen with a different pixel ratio or is given another title or accent.
+"""
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPixmap
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize
+from theme import ACCENTS, SURFACE, TEXT, TEXT_MUTED
+
+RADIUS = 15
+ACCENT_WIDTH = 8
+PADDING = 22
+TITLE_FONT = ("Segoe UI", 11)
+VALUE_FONT = ("Segoe UI", 28)
+
+# Extra width rendered into the cached background, so growing cards reuse it
+RESIZE_SLACK = 64
+_right_edges = {}
+
+
+def right_edge(height, ratio):
+    """The card's right-hand corners, shared by every card of a height and pixel ratio"""
+    key = (height, ratio)
+    edge = _right_edges.get(key)
+    if edge is None:
+        edge = _right_edges[key] = QPixmap(QSize(RADIUS, height) * ratio)
+        edge.setDevicePixelRatio(ratio)
+        edge.fill(Qt.transparent)
+        painter = QPainter(edge)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Only the right half of a rounded rect as wide as its corners falls inside the pixmap
+        surface = QPainterPath()
+        surface.addRoundedRect(QRectF(-RADIUS, 0, 2 * RADIUS, height), RADIUS, RADIUS)
+        painter.fillPath(surface, QColor(SURFACE))
+        painter.end()
+    return edge
+
+
+class KPICard(QWidget):
+    """A title and one large figure on a card with a coloured left edge
+
+    `accent` is a key of theme.ACCENTS; `fmt` formats values for display.
+    """
+
+    def __init__(self, title, accent="blue", fmt="{:,}", parent=None):
+        super().__init__(parent)
+        self._title = title
+        self._accent = accent
+        self.fmt = fmt
+        self._value = None
+        self._text = "–"
+        self._elided = None
+        self._background = None
+        self.title_font = QFont(*TITLE_FONT)
+        self.value_font = QFont(*VALUE_FONT, QFont.Bold)
+        self._title_width = QFontMetrics(self.title_font).horizontalAdvance(title)
+        self._title_height = QFontMetrics(self.title_font).height()
+        self._value_height = QFontMetrics(self.value_font).height()
+        self.setMinimumWidth(200)
+        self.setMaximumWidth(300)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.setAccessibleName(title)
+
+    # -------- Content --------
+    def value(self):
+        return self._value
+
+    def set_value(self, value):
+        """Show `value`; only the value strip is repainted, and only if its text changed"""
+        self._value = value
+        text = "–" if value is None else self.fmt.format(value)
+        if text != self._text:
+            self._text = text
+            self.setAccessibleDescription(text)
+            self.update(self.value_rect())
+
+    def text(self):
+        return self._text
+
+    def set_title(self, title):
+        self._title = title
+        self._title_width = QFontMetrics(self.title_font).horizontalAdvance(title)
+        self.setAccessibleName(title)
+        self._elided = None
+        self._invalidate()
+
+    def set_accent(self, accent):
+        self._accent = accent
+        self._invalidate()
+
+    # -------- Geometry --------
+    def sizeHint(self):
+        return QSize(240, 2 * PADDING + self._title_height + 12 + self._value_height)
+
+    def value_rect(self):
+        return QRect(ACCENT_WIDTH + PADDING, self.height() - PADDING - self._value_height,
+                     self.width() - ACCENT_WIDTH - 2 * PADDING, self._value_height)
+
+    def _title_rect(self):
+        return QRect(ACCENT_WIDTH + PADDING, PADDING,
+                     self.width() - ACCENT_WIDTH - 2 * PADDING, self._title_height)
+
+    # -------- Painting --------
+    def _invalidate(self):
+        self._background = None
+        self.update()
+
+    def _title_text(self, width):
+        """The title as it fits in `width`; eliding is only measured when it does not fit"""
+        if self._title_width <= width:
+            return self._title
+        if self._elided is None or self._elided[0] != width:
+            self._elided = (width, QFontMetrics(self.title_font).elidedText(self._title, Qt.ElideRight, width))
+        return self._elided[1]
+
+    def _render_background(self, width, title):
+        """Surface, accent strip and title, `width` wide and flat on the right"""
+        ratio = self.devicePixelRatioF()
+        height = self.height()
+        pixmap = QPixmap(QSize(width, height) * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # The shapes run RADIUS past the pixmap so their right-hand corners fall outside it
+        card = QPainterPath()
+        card.addRoundedRect(QRectF(0, 0, width + RADIUS, height), RADIUS, RADIUS)
+        # The accent only fills the left edge (so it cannot fringe the right-hand corners);
+        # the surface is the same rounded shape shifted right, leaving a strip of it showing
+        painter.setClipRect(QRectF(0, 0, ACCENT_WIDTH + RADIUS, height))
+        painter.fillPath(card, QColor(ACCENTS.get(self._accent, ACCENTS["blue"])))
+        painter.setClipping(False)
+        surface = QPainterPath()
+        surface.addRoundedRect(QRectF(ACCENT_WIDTH, 0, width + RADIUS - ACCENT_WIDTH, height), RADIUS, RADIUS)
+        painter.fillPath(surface, QColor(SURFACE))
+
+        rect = self._title_rect()
+        painter.setFont(self.title_font)
+        painter.setPen(QColor(TEXT_MUTED))
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+        painter.end()
+        return pixmap, title
+
+    def paintEvent(self, event):
+        ratio = self.devicePixelRatioF()
+        # Everything left of the shared right-hand corners comes from the cached background
+        body, height = self.width() - RADIUS, self.height()
+        title = self._title_text(self._title_rect().width())
+        background = self._background
+        if (background is None or background[1] != title or background[0].devicePixelRatioF() != ratio
+                or background[0].height() != round(height * ratio)
+                or background[0].width() < round(body * ratio)):
+            background = self._background = self._render_background(body + RESIZE_SLACK, title)
+        painter = QPainter(self)
+        painter.drawPixmap(QRectF(0, 0, body, height), background[0], QRectF(0, 0, body * ratio, height * ratio))
+        painter.drawPixmap(body, 0, right_edge(height, ratio))
+        rect = self.value_rect()
+        if event.rect().intersects(rect):
+            painter.setFont(self.value_font)
+            painter.setPen(QColor(TEXT))
+            painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, self._text)
@@ -0,0 +1,294 @@
+import math
+import threading
+from collections import OrderedDict
+
+from work_calendar import CalendarError, employee_work_pattern, work_calendar
+
+
+# ================= Rules =================
+# Yearly entitlement in days and the most unused days that carry into next year
+LEAVE_TYPES = {
+    "annual": {"entitlement": 14.0, "carry_forward": 7.0},
+    "casual": {"entitlement": 7.0, "carry_forward": 0.0},
+    "medical": {"entitlement": 7.0, "carry_forward": 0.0},
+}
+
+SQL_EMPLOYEE_JOINED = "SELECT joined_on FROM employees WHERE id = ?"
+SQL_INSERT_REQUEST = """
+    INSERT INTO leave_requests (employee_id, leave_type, start_date, end_date, days)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_GET_REQUEST = "SELECT employee_id, start_date, days, leave_type, status FROM leave_requests WHERE id = ?"
+SQL_SET_STATUS = "UPDATE leave_requests SET status = ? WHERE id = ?"
+SQL_TAKEN = """
+    SELECT leave_type, SUM(days) FROM leave_requests
+    WHERE employee_id = ? AND status = 'approved'
+      AND start_date >= ? AND start_date <= ?
+    GROUP BY leave_type
+"""
+SQL_UPSERT_BALANCE = """
+    INSERT INTO leave_balances (employee_id, year, leave_type, entitled, taken)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(employee_id, year, leave_type) DO UPDATE SET
+        entitled = excluded.entitled,
+        taken = excluded.taken
+"""
+# Carry-forward from the previous year's remaining days, capped per leave type
+SQL_CARRY_FORWARD = """
+    UPDATE leave_balances SET carried = (
+        SELECT MIN(?, MAX(0, p.entitled + p.carried - p.taken)) FROM leave_balances p
+        WHERE p.employee_id = leave_balances.employee_id
+          AND p.year = leave_balances.year - 1
+          AND p.leave_type = leave_balances.leave_type
+    )
+    WHERE employee_id = ? AND year = ? AND leave_type = ?
+      AND EXISTS (
+          SELECT 1 FROM leave_balances p
+          WHERE p.employee_id = ? AND p.year = ? AND p.leave_type = ?
+      )
+"""
+SQL_AVAILABLE = """
+    SELECT entitled + carried - taken FROM leave_balances
+    WHERE employee_id = ? AND year = ? AND leave_type = ?
+"""
+# Days already asked for: pending requests reserve their days until decided
+SQL_PENDING_DAYS = """
+    SELECT IFNULL(SUM(days), 0) FROM leave_requests
+    WHERE employee_id = ? AND leave_type = ? AND status = 'pending'
+      AND start_date >= ? AND start_date <= ?
+"""
+SQL_LATER_YEARS = """
+    SELECT DISTINCT year FROM leave_balances WHERE employee_id = ? AND year > ? ORDER BY year
+"""
+SQL_BALANCES = """
+    SELECT leave_type, entitled, carried, taken FROM leave_balances
+    WHERE employee_id = ? AND year = ?
+"""
+
+
+class LeaveError(Exception):
+    """Raised when a leave request cannot be booked or changed"""
+
+
+def prorated_entitlement(entitlement, joined_on, year):
+    """Entitlement for `year`, pro-rated by whole months for mid-year joiners (to half days)"""
+    if not joined_on or int(joined_on[:4]) < year:
+        return entitlement
+    if int(joined_on[:4]) > year:
+        return 0.0
+    months = 13 - int(joined_on[5:7])
+    return math.floor(entitlement * months / 12 * 2 + 0.5) / 2
+
+
+class LeaveEngine:
+    """Leave requests and balances with per employee-year recomputation
+
+    Balances live in leave_balances and in a small in-process LRU cache. A
+    status change recomputes only the affected employee-year and invalidates
+    it with every later year its carry-forward reaches.
+    """
+    CACHE_SIZE = 4096
+
+    def __init__(self, repository):
+        self.repository = repository
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a read that raced one is not cached
+        self._generation = 0
+
+    # -------- Queries --------
+    def balances(self, employee_id, year):
+        """{leave type: {entitled, carried, taken, available}} for one employee-year"""
+        key = (employee_id, year)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+            generation = self._generation
+
+        conn = self.repository.pool.connection()
+        rows = conn.execute(SQL_BALANCES, key).fetchall()
+        if len(rows) < len(LEAVE_TYPES):
+            with self.repository.pool.transaction():
+                self._recompute(conn, employee_id, year)
+            rows = conn.execute(SQL_BALANCES, key).fetchall()
+
+        result = {}
+        for leave_type, entitled, carried, taken in rows:
+            result[leave_type] = {
+                "entitled": entitled,
+                "carried": carried,
+                "taken": taken,
+                "available": entitled + carried - taken,
+            }
+        with self._lock:
+            if generation == self._generation:
+                self._cache[key] = result
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return result
+
+    def count_leave_days(self, employee_id, start, end):
+        """Working days from start to end inclusive on the employee's own site calendar"""
+        site, pattern = employee_work_pattern(self.repository, employee_id)
+        try:
+            return float(work_calendar(self.repository, (start.year, end.year)).working_days(
+                start, end, site, pattern))
+        except CalendarError as e:
+            raise LeaveError(str(e))
+
+    # -------- Requests --------
+    def request_leave(self, employee_id, leave_type, start, end):
+        """Book a pending request after checking the available balance"""
+        if leave_type not in LEAVE_TYPES:
+            raise LeaveError(f"Unknown leave type: {leave_type}")
+        if end < start:
+            raise LeaveError("Leave cannot end before it starts")
+        if start.year != end.year:
+            raise LeaveError("Split leave that crosses the year end into two requests")
+        days = self.count_leave_days(employee_id, start, end)
+        if not days:
+            raise LeaveError("The selected dates contain no working days")
+
+        # Opens the year's balances if needed; the check itself runs in the booking transaction
+        self.balances(employee_id, start.year)
+        year = start.year
+        with self.repository.pool.transaction() as conn:
+            available = self._available(conn, employee_id, year, leave_type)
+            pending = conn.execute(SQL_PENDING_DAYS, (
+                employee_id, leave_type, f"{year}-01-01", f"{year}-12-31")).fetchone()[0]
+            if days > available - pending:
+                raise LeaveError(f"Only {max(0.0, available - pending):g} {leave_type} leave days available"
+                                 + (f" ({pending:g} more are awaiting approval)" if pending else ""))
+            return conn.execute(SQL_INSERT_REQUEST, (
+                employee_id, leave_type, start.isoformat(), end.isoformat(), days
+            )).lastrowid
+
+    def approve(self, request_id):
+        self._set_status(request_id, "approved")
+
+    def reject(self, request_id):
+        self._set_status(request_id, "rejected")
+
+    def cancel(self, request_id):
+        self._set_status(request_id, "cancelled")
+
+    def _set_status(self, request_id, status):
+        with self.repository.pool.transaction() as conn:
+            row = conn.execute(SQL_GET_REQUEST, (request_id,)).fetchone()
+            if row is None:
+                raise LeaveError(f"No leave request {request_id}")
+            employee_id, start_date, days, leave_type, previous = row
+            year = int(start_date[:4])
+            if status == "approved" and previous != "approved":
+                # The balance may have moved since the request was booked
+                self._recompute(conn, employee_id, year)
+                available = self._available(conn, employee_id, year, leave_type)
+                if days > available:
+                    raise LeaveError(f"Only {available:g} {leave_type} leave days left; "
+                                     f"request {request_id} needs {days:g}")
+            conn.execute(SQL_SET_STATUS, (status, request_id))
+            # Only approved requests count towards `taken`
+            if "approved" not in (status, previous):
+                return
+            years = self._recompute(conn, employee_id, year)
+        # The change can move the carry-forward of every later year
+        for changed in years:
+            self.invalidate(employee_id, changed)
+
+    def _available(self, conn, employee_id, year, leave_type):
+        row = conn.execute(SQL_AVAILABLE, (employee_id, year, leave_type)).fetchone()
+        return row[0] if row else 0.0
+
+    # -------- Maintenance --------
+    def _recompute(self, conn, employee_id, year):
+        """Rewrite one employee-year's balances and re-derive carry-forward from it onwards
+
+        Carry-forward cascades: each later year with balances is re-derived
+        in turn from the one before. Returns the years that were rewritten.
+        """
+        joined = conn.execute(SQL_EMPLOYEE_JOINED, (employee_id,)).fetchone()
+        joined_on = joined[0] if joined else None
+        taken = dict(conn.execute(SQL_TAKEN, (employee_id, f"{year}-01-01", f"{year}-12-31")).fetchall())
+        conn.executemany(SQL_UPSERT_BALANCE, (
+            (employee_id, year, leave_type,
+             prorated_entitlement(rule["entitlement"], joined_on, year),
+             taken.get(leave_type) or 0.0)
+            for leave_type, rule in LEAVE_TYPES.items()
+        ))
+        years = [year] + [row[0] for row in conn.execute(SQL_LATER_YEARS, (employee_id, year))]
+        conn.executemany(SQL_CARRY_FORWARD, (
+            (rule["carry_forward"], employee_id, target, leave_type, employee_id, target - 1, leave_type)
+            for target in years
+            for leave_type, rule in LEAVE_TYPES.items()
+        ))
+        return years
+
+    def invalidate(self, employee_id, year):
+        with self._lock:
+            self._generation += 1
+            self._cache.pop((employee_id, year), None)
+
+    def year_end_rollover(self, year):
+        """Open balances for year + 1 for every active employee in one set-based pass
+
+        Unused days of `year` carry forward up to each type's cap; requests
+        already approved for the new year are counted as taken.
+        """
+        with self.repository.pool.transaction() as conn:
+            # Employees with no activity this year have no rows yet; open them first
+            self._open_year(conn, year, "INSERT OR IGNORE")
+            self._open_year(conn, year + 1, "INSERT OR REPLACE")
+            opened = conn.execute(
+                "SELECT COUNT(DISTINCT employee_id) FROM leave_balances WHERE year = ?", (year + 1,)
+            ).fetchone()[0]
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._cache if key[1] in (year, year + 1)]:
+                del self._cache[key]
+        return opened
+
+    def _open_year(self, conn, year, insert):
+        types = ", ".join(
+            f"('{name}', {rule['entitlement']}, {rule['carry_forward']})" for name, rule in LEAVE_TYPES.items()
+        )
+        conn.execute(f"""
+            WITH types(leave_type, entitlement, cap) AS (VALUES {types}),
+            taken AS (
+                SELECT employee_id, leave_type, SUM(days) AS days FROM leave_requests
+                WHERE status = 'approved' AND start_date >= :first AND start_date <= :last
+                GROUP BY employee_id, leave_type
+            )
+            {insert} INTO leave_balances (employee_id, year, leave_type, entitled, carried, taken)
+            SELECT e.id, :year, t.leave_type,
+                   CASE
+                       WHEN e.joined_on IS NULL OR CAST(substr(e.joined_on, 1, 4) AS INTEGER) < :year
+                           THEN t.entitlement
+                       WHEN CAST(substr(e.joined_on, 1, 4) AS INTEGER) > :year THEN 0
+                       ELSE CAST(t.entitlement * (13 - CAST(substr(e.joined_on, 6, 2) AS INTEGER))
+                                 / 12.0 * 2 + 0.5 AS INTEGER) / 2.0
+                   END,
+                   MIN(t.cap, MAX(0, IFNULL(p.entitled + p.carried - p.taken, 0))),
+                   IFNULL(k.days, 0)
+            FROM employees e
+            CROSS JOIN types t
+            LEFT JOIN leave_balances p
+                ON p.employee_id = e.id AND p.year = :previous AND p.leave_type = t.leave_type
+            LEFT JOIN taken k ON k.employee_id = e.id AND k.leave_type = t.leave_type
+            WHERE e.active = 1
+        """, {"year": year, "previous": year - 1,
+              "first": f"{year}-01-01", "last": f"{year}-12-31"})
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_leave_engine(repository):
+    """The shared LeaveEngine of `repository`, so every reader sees one balance cache"""
+    with _engines_lock:
+        engine = _engines.get(repository.pool.path)
+        if engine is None:
+            engine = _engines[repository.pool.path] = LeaveEngine(repository)
+        return engine
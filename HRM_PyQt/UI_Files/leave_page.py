@@ -0,0 +1,109 @@
+from datetime import date
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QComboBox, QTableView, QHeaderView, QVBoxLayout, QHBoxLayout, QAbstractItemView
+)
+from PyQt5.QtGui import QFont
+from leave import LEAVE_TYPES, get_leave_engine
+from employee_records import EmployeePicker, RowTableModel
+from workers import run_in_background
+from theme import set_role
+from permissions import unrestricted_session
+
+# Years offered, counting back from the current one
+YEAR_CHOICES = 3
+
+
+def format_days(days):
+    return f"{days:g}"
+
+
+class LeavePage(QWidget):
+    """Leave sidebar page: an employee's leave balances for a year (read-only)"""
+    ROW_HEIGHT = 32
+
+    def __init__(self, repository, session=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session or unrestricted_session()
+        self._generation = 0
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header = QLabel("Leave")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+        layout.addWidget(header)
+
+        desc = QLabel("Entitlement, carry-forward, days taken and days left for each type of leave.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+        layout.addWidget(desc)
+
+        row = QHBoxLayout()
+        row.setSpacing(10)
+        self.picker = EmployeePicker(self.repository, self.session)
+        self.picker.employee_changed.connect(self.refresh)
+
+        this_year = date.today().year
+        self.year_combo = QComboBox()
+        self.year_combo.setFixedHeight(36)
+        for year in range(this_year, this_year - YEAR_CHOICES, -1):
+            self.year_combo.addItem(str(year), year)
+        self.year_combo.currentIndexChanged.connect(self.refresh)
+
+        row.addWidget(self.picker)
+        row.addWidget(self.year_combo)
+        row.addStretch()
+        layout.addLayout(row)
+
+        self.model = RowTableModel(
+            ["Leave type", "Entitled", "Carried", "Taken", "Available"],
+            [str.capitalize, format_days, format_days, format_days, format_days], self
+        )
+        self.table = QTableView()
+        self.table.setObjectName("leaveTable")
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setShowGrid(False)
+        rows = self.table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "muted")
+        layout.addWidget(self.status_label)
+        layout.addStretch()
+
+    def refresh(self, *_):
+        """Load the picked employee's balances for the picked year on a worker"""
+        self._generation += 1
+        generation = self._generation
+        employee_id = self.picker.employee_id()
+        if employee_id is None:
+            self.model.set_rows([])
+            return
+        run_in_background(
+            get_leave_engine(self.repository).balances, employee_id, self.year_combo.currentData(),
+            on_result=lambda balances: self._show(generation, balances),
+            on_error=lambda message: self.status_label.setText(f"Could not load leave balances: {message}")
+        )
+
+    def _show(self, generation, balances):
+        if generation != self._generation:
+            return
+        rows = []
+        for leave_type in LEAVE_TYPES:
+            balance = balances.get(leave_type)
+            if balance is not None:
+                rows.append((leave_type, balance["entitled"], balance["carried"], balance["taken"],
+                             balance["available"]))
+        self.model.set_rows(rows)
+        self.status_label.setText("")
@@ -0,0 +1,134 @@
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QTableView, QHeaderView, QVBoxLayout, QHBoxLayout, QAbstractItemView
+)
+from PyQt5.QtGui import QFont
+from loans import LoanBook
+from employee_records import EmployeePicker, RowTableModel
+from workers import run_in_background
+from theme import set_role
+from permissions import unrestricted_session
+
+
+def format_amount(amount):
+    return f"{amount:,.2f}"
+
+
+def format_rate(rate):
+    return f"{rate * 100:g}%"
+
+
+class LoanPage(QWidget):
+    """Loan sidebar page: an employee's loans and the stored schedule of the selected one (read-only)"""
+    ROW_HEIGHT = 32
+
+    def __init__(self, repository, session=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session or unrestricted_session()
+        self.book = LoanBook(repository)
+        self._generation = 0
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header = QLabel("Loans")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+        layout.addWidget(header)
+
+        desc = QLabel("Staff loans and their repayment schedules; select a loan to see its instalments.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+        layout.addWidget(desc)
+
+        row = QHBoxLayout()
+        self.picker = EmployeePicker(self.repository, self.session)
+        self.picker.employee_changed.connect(self.refresh)
+        row.addWidget(self.picker)
+        row.addStretch()
+        layout.addLayout(row)
+
+        # ----- Loans -----
+        self.loans = RowTableModel(
+            ["Loan", "Start", "Principal", "Rate", "Months", "Method", "Status"],
+            [str, str, format_amount, format_rate, str, str, str], self
+        )
+        self.loan_table = self._table("loanTable", self.loans)
+        self.loan_table.setMaximumHeight(6 * self.ROW_HEIGHT)
+        self.loan_table.selectionModel().currentRowChanged.connect(self._on_loan_selected)
+        layout.addWidget(self.loan_table)
+
+        # ----- Schedule -----
+        self.schedule = RowTableModel(
+            ["#", "Due", "Principal", "Interest", "Payment", "Balance"],
+            [str, str, format_amount, format_amount, format_amount, format_amount], self
+        )
+        self.schedule_table = self._table("scheduleTable", self.schedule)
+        layout.addWidget(self.schedule_table)
+
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "muted")
+        layout.addWidget(self.status_label)
+
+        self.refresh()
+
+    def _table(self, name, model):
+        table = QTableView()
+        table.setObjectName(name)
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.setAlternatingRowColors(True)
+        table.setShowGrid(False)
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.ROW_HEIGHT)
+        rows.setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        return table
+
+    def refresh(self, *_):
+        """Load the picked employee's loans on a worker"""
+        self._generation += 1
+        generation = self._generation
+        self.schedule.set_rows([])
+        employee_id = self.picker.employee_id()
+        if employee_id is None:
+            self.loans.set_rows([])
+            self.status_label.setText("")
+            return
+        run_in_background(
+            self.book.loans_for, employee_id,
+            on_result=lambda loans: self._show_loans(generation, loans),
+            on_error=self._on_failed
+        )
+
+    def _show_loans(self, generation, loans):
+        if generation != self._generation:
+            return
+        self.loans.set_rows(loans)
+        self.status_label.setText(f"{len(loans):,} loans" if loans else "No loans")
+        if loans:
+            self.loan_table.selectRow(0)
+
+    def _on_loan_selected(self, current, _previous):
+        if not current.isValid():
+            return
+        self._generation += 1
+        generation = self._generation
+        run_in_background(
+            self.book.schedule, self.loans.row(current.row())[0],
+            on_result=lambda rows: self._show_schedule(generation, rows),
+            on_error=self._on_failed
+        )
+
+    def _show_schedule(self, generation, rows):
+        if generation == self._generation:
+            self.schedule.set_rows(rows)
+
+    def _on_failed(self, message):
+        self.status_label.setText(f"Could not load loans: {message}")
@@ -0,0 +1,184 @@
+import numpy as np
+
+from audit import record
+
+
+LOAN_METHODS = ("reducing", "flat")
+
+SQL_INSERT_LOAN = """
+    INSERT INTO loans (employee_id, principal, annual_rate, months, method, start_month)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SQL_GET_LOAN = "SELECT * FROM loans WHERE id = ?"
+SQL_EMPLOYEE_LOANS = """
+    SELECT id, start_month, principal, annual_rate, months, method, status
+    FROM loans WHERE employee_id = ? ORDER BY start_month DESC, id DESC
+"""
+SQL_INSERT_INSTALMENT = """
+    INSERT INTO loan_instalments (loan_id, seq, due_month, principal, interest, payment, balance)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_SCHEDULE = """
+    SELECT seq, due_month, principal, interest, payment, balance
+    FROM loan_instalments WHERE loan_id = ? ORDER BY seq
+"""
+SQL_BALANCE_BEFORE = """
+    SELECT seq, balance FROM loan_instalments
+    WHERE loan_id = ? AND due_month < ? ORDER BY seq DESC LIMIT 1
+"""
+SQL_DROP_FROM = "DELETE FROM loan_instalments WHERE loan_id = ? AND due_month >= ?"
+SQL_UPDATE_TERMS = """
+    UPDATE loans SET annual_rate = ?, method = ?, months = ?, status = ?, terms_version = terms_version + 1
+    WHERE id = ?
+"""
+# Every instalment due in a month, summed per employee (served by idx_loan_instalments_due)
+SQL_DEDUCTIONS = """
+    SELECT l.employee_id, SUM(i.payment)
+    FROM loan_instalments i JOIN loans l ON l.id = i.loan_id
+    WHERE i.due_month = ?
+    GROUP BY l.employee_id
+"""
+
+
+class LoanError(Exception):
+    """Raised when a loan cannot be created or changed"""
+
+
+def add_months(month, count):
+    """'YYYY-MM' shifted by `count` months"""
+    index = int(month[:4]) * 12 + int(month[5:7]) - 1 + count
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def amortization_schedule(principal, annual_rate, months, method="reducing"):
+    """Instalment columns (principal, interest, payment, balance) as arrays
+
+    Computed in closed form over the instalment index, so a schedule is a
+    handful of array operations rather than a month-by-month loop. Amounts
+    are rounded to cents and the last instalment absorbs the rounding.
+    """
+    if method not in LOAN_METHODS:
+        raise LoanError(f"Unknown repayment method: {method}")
+    if months < 1 or principal <= 0:
+        raise LoanError("A loan needs a positive principal and at least one instalment")
+
+    k = np.arange(1, months + 1, dtype=np.float64)
+    r = annual_rate / 12.0
+
+    if method == "flat":
+        principal_part = np.full(months, principal / months)
+        interest = np.full(months, principal * r)
+    elif r == 0:
+        principal_part = np.full(months, principal / months)
+        interest = np.zeros(months)
+    else:
+        growth = (1.0 + r) ** k
+        payment = principal * r / (1.0 - (1.0 + r) ** -months)
+        balance_after = principal * growth - payment * (growth - 1.0) / r
+        balance_before = np.concatenate(([principal], balance_after[:-1]))
+        interest = balance_before * r
+        principal_part = payment - interest
+
+    principal_part = np.round(principal_part, 2)
+    interest = np.round(interest, 2)
+    principal_part[-1] = round(principal - principal_part[:-1].sum(), 2)
+    balance = np.round(principal - np.cumsum(principal_part), 2)
+    return principal_part, interest, np.round(principal_part + interest, 2), balance
+
+
+class LoanBook:
+    """Staff loans and their stored repayment schedules"""
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    def create_loan(self, employee_id, principal, annual_rate, months, start_month, method="reducing"):
+        """Create a loan and store its schedule; returns the loan id"""
+        columns = amortization_schedule(principal, annual_rate, months, method)
+        with self.repository.pool.transaction() as conn:
+            loan_id = conn.execute(SQL_INSERT_LOAN, (
+                employee_id, principal, annual_rate, months, method, start_month
+            )).lastrowid
+            self._store(conn, loan_id, 1, start_month, columns)
+        record(self.repository, "loan.create", loan_id=loan_id, employee_id=employee_id, principal=principal,
+               annual_rate=annual_rate, months=months, start_month=start_month, method=method)
+        return loan_id
+
+    def loans_for(self, employee_id):
+        """(id, start_month, principal, annual_rate, months, method, status) per loan, newest first"""
+        cur = self.repository.pool.connection().cursor()
+        cur.row_factory = None
+        return cur.execute(SQL_EMPLOYEE_LOANS, (employee_id,)).fetchall()
+
+    def schedule(self, loan_id):
+        return self.repository.pool.connection().execute(SQL_SCHEDULE, (loan_id,)).fetchall()
+
+    def outstanding_before(self, loan_id, month):
+        """Principal still owed before the instalment due in `month`, and the last seq paid"""
+        conn = self.repository.pool.connection()
+        return self._outstanding(conn, self._loan(conn, loan_id), month)
+
+    def settlement_quote(self, loan_id, month):
+        """Amount that settles the loan in `month`: the outstanding principal"""
+        return self.outstanding_before(loan_id, month)[0]
+
+    def settle(self, loan_id, month, via_payroll=False):
+        """Settle early from `month`
+
+        The remaining schedule is dropped. With via_payroll the outstanding
+        principal becomes a single final instalment deducted in `month`.
+        """
+        with self.repository.pool.transaction() as conn:
+            loan = self._loan(conn, loan_id)
+            balance, last_seq = self._outstanding(conn, loan, month)
+            conn.execute(SQL_DROP_FROM, (loan_id, month))
+            if via_payroll and balance > 0:
+                conn.execute(SQL_INSERT_INSTALMENT, (loan_id, last_seq + 1, month, balance, 0.0, balance, 0.0))
+            conn.execute(SQL_UPDATE_TERMS, (loan["annual_rate"], loan["method"], loan["months"], "settled", loan_id))
+        record(self.repository, "loan.settle", loan_id=loan_id, month=month, balance=balance,
+               via_payroll=via_payroll)
+        return balance
+
+    def reschedule(self, loan_id, from_month, months, annual_rate=None, method=None):
+        """Re-amortize the outstanding principal over `months` instalments from `from_month`
+
+        The loan's stored terms follow: its rate, method and months (the
+        instalments already paid plus the new ones) describe the schedule.
+        """
+        with self.repository.pool.transaction() as conn:
+            loan = self._loan(conn, loan_id)
+            balance, last_seq = self._outstanding(conn, loan, from_month)
+            if balance <= 0:
+                raise LoanError("The loan is already repaid")
+            rate = loan["annual_rate"] if annual_rate is None else annual_rate
+            method = method or loan["method"]
+            columns = amortization_schedule(balance, rate, months, method)
+            conn.execute(SQL_DROP_FROM, (loan_id, from_month))
+            self._store(conn, loan_id, last_seq + 1, from_month, columns)
+            conn.execute(SQL_UPDATE_TERMS, (rate, method, last_seq + months, "active", loan_id))
+        record(self.repository, "loan.reschedule", loan_id=loan_id, from_month=from_month, months=months,
+               balance=balance, annual_rate=rate, previous_rate=loan["annual_rate"], method=method,
+               previous_method=loan["method"])
+
+    def deductions_for(self, period):
+        """{employee_id: total instalments due in period} for every loan, in one query"""
+        return dict(self.repository.pool.connection().execute(SQL_DEDUCTIONS, (period,)).fetchall())
+
+    def _loan(self, conn, loan_id):
+        loan = conn.execute(SQL_GET_LOAN, (loan_id,)).fetchone()
+        if loan is None:
+            raise LoanError(f"No loan {loan_id}")
+        return loan
+
+    def _outstanding(self, conn, loan, month):
+        row = conn.execute(SQL_BALANCE_BEFORE, (loan["id"], month)).fetchone()
+        if row is None:
+            return loan["principal"], 0
+        return row[1], row[0]
+
+    def _store(self, conn, loan_id, first_seq, first_month, columns):
+        principal, interest, payment, balance = (column.tolist() for column in columns)
+        conn.executemany(SQL_INSERT_INSTALMENT, (
+            (loan_id, first_seq + i, add_months(first_month, i), principal[i], interest[i], payment[i], balance[i])
+            for i in range(len(payment))
+        ))
@@ -4,33 +4,70 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QCheckBox, QDialog, QDesktopWidget,
     QMessageBox, QProgressBar
 )
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from database import get_repository
+from credentials import CredentialStore
+from permissions import AccessControl, AccessError
+from workers import run_in_background
+from form_validation import FieldValidator, repolish
+from theme import apply_theme, set_role, set_variant
+from assets import logo_pixmap, prewarm
+from tracing import install_from_environment
+from animations import shake, fade_out_window
+from validation_rules import check_username, check_login_password, strength_level
+
+# Demo accounts, hashed into the credential store the first time it is empty
+DEMO_ACCOUNTS = {
+    "admin": "Admin@123",
+    "hr.user": "Hr@2024",
+    "manager": "Manager#456",
+    "test.user@company.com": "Test@789"
+}
+# Their roles, written with the default roles the first time the role tables are empty
+DEMO_ROLES = {
+    "admin": "Administrator",
+    "hr.user": "HR",
+    "manager": "Project Manager",
+    "test.user@company.com": "Employee",
+}
+
+
+def preload_main_window(repository):
+    """Runs on the thread pool: import the dashboard's modules and load its first figures"""
+    from mainWindow import preload_dashboard
+    return preload_dashboard(repository)
 
 
 class DesktopLoginWindow(QWidget):
     # Custom signal for successful login
     login_success = pyqtSignal(str)
     
-    def __init__(self):
+    def __init__(self, repository=None):
         super().__init__()
         self.setWindowTitle("HRM System - Desktop Login")
         self.setFixedSize(1000, 800)
         
-        # Sample valid credentials (in real app, connect to database)
-        self.valid_credentials = {
-            "admin": "Admin@123",
-            "hr.user": "Hr@2024",
-            "manager": "Manager#456",
-            "test.user@company.com": "Test@789"
-        }
+        self.repository = repository or get_repository()
+        self.credentials = CredentialStore(self.repository)
+        self.access = AccessControl(self.repository)
+        # Permissions of the signed-in user, compiled with the credential check
+        self.session = None
         
         # Validation states
         self.username_valid = False
         self.password_valid = False
+        self.verifying = False
         
+        # Dashboard built behind the login screen (see prebuild_dashboard)
+        self.main_window = None
+        
+        apply_theme()
         self.setup_ui()
         self.center_window()
+        
+        # Calibrate the hash cost and seed demo accounts before the first sign-in
+        run_in_background(self.credentials.seed, DEMO_ACCOUNTS)
 
     def setup_ui(self):
         # ================= Main Layout =================
@@ -40,16 +77,9 @@ class DesktopLoginWindow(QWidget):
 
         # ================= LEFT PANEL =================
         left_panel = QWidget()
+        left_panel.setObjectName("brandPanel")
         left_panel.setMinimumWidth(400)
         left_panel.setMaximumWidth(450)
-        left_panel.setStyleSheet("""
-    background: qlineargradient(
-        x1:0, y1:0, x2:0, y2:1,
-        stop:0 #1e3a5f,
-        stop:1 #2b6cb0
-    );
-    border-radius: 0px;
-""")
 
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(40, 40, 40, 40)
@@ -62,25 +92,14 @@ class DesktopLoginWindow(QWidget):
 
         # Company Logo
         logo_label = QLabel()
-        try:
-            # Load the logo file
-            pixmap = QPixmap('fbsl_logo.png')
-            if not pixmap.isNull():
-                # Scale the logo if needed
-                pixmap = pixmap.scaled(600, 70, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                # Fallback if image is empty
-                logo_label.setText("FBSL")
-                logo_label.setFont(QFont("Segoe UI", 38, QFont.Bold))
-                logo_label.setStyleSheet("color: white;")
-                print("Warning: Logo image 'fbsl_logo.png' is empty. Using text fallback.")
-        except Exception as e:
-            # Fallback in case the image file is not found or can't be loaded
+        pixmap = logo_pixmap("login")
+        if not pixmap.isNull():
+            logo_label.setPixmap(pixmap)
+        else:
+            # Fallback if the image cannot be loaded
             logo_label.setText("FBSL")
             logo_label.setFont(QFont("Segoe UI", 38, QFont.Bold))
-            logo_label.setStyleSheet("color: white;")
-            print(f"Warning: Could not load logo. Error: {e}. Using text fallback.")
+            print("Warning: Could not load the logo image. Using text fallback.")
         
         logo_label.setAlignment(Qt.AlignCenter)
         logo_layout.addWidget(logo_label)
@@ -89,20 +108,19 @@ class DesktopLoginWindow(QWidget):
 
         brand = QLabel("Human Resource\nManagement System")
         brand.setFont(QFont("Segoe UI", 22, QFont.Bold))
-        brand.setStyleSheet("color: white; line-height: 1.3;")
         brand.setAlignment(Qt.AlignCenter)
         brand.setWordWrap(True)
 
         welcome = QLabel("Welcome to\nFBSL ")
         welcome.setFont(QFont("Segoe UI", 26, QFont.Bold))
-        welcome.setStyleSheet("color: white; margin-top: 10px;")
+        welcome.setContentsMargins(0, 10, 0, 0)
         welcome.setAlignment(Qt.AlignCenter)
 
         subtitle = QLabel(
             "Sign in to your HR dashboard to manage\nemployees, attendance, and payroll"
         )
         subtitle.setFont(QFont("Segoe UI", 12))
-        subtitle.setStyleSheet("color: #e2e8f0; line-height: 1.4;")
+        set_role(subtitle, "muted")
         subtitle.setWordWrap(True)
         subtitle.setAlignment(Qt.AlignCenter)
 
@@ -119,13 +137,13 @@ class DesktopLoginWindow(QWidget):
         for f in features:
             lbl = QLabel(f)
             lbl.setFont(QFont("Segoe UI", 10))
-            lbl.setStyleSheet("color: white; padding: 2px 0;")
+            lbl.setContentsMargins(0, 2, 0, 2)
             lbl.setAlignment(Qt.AlignCenter)
             feature_box.addWidget(lbl)
 
         version = QLabel("Version 3.2.1 • Professional Edition")
         version.setFont(QFont("Segoe UI", 9))
-        version.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        set_role(version, "hint")
         version.setAlignment(Qt.AlignCenter)
 
         left_layout.addSpacing(5)
@@ -141,14 +159,14 @@ class DesktopLoginWindow(QWidget):
 
         # ================= RIGHT PANEL =================
         right_panel = QWidget()
-        right_panel.setStyleSheet("background-color: white;")
+        right_panel.setObjectName("loginFormPanel")
 
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(80, 40, 80, 40)
 
         title = QLabel("Account Login")
         title.setFont(QFont("Segoe UI", 24, QFont.Bold))
-        title.setStyleSheet("color: #2d3748;")
+        set_role(title, "heading")
         title.setAlignment(Qt.AlignCenter)
 
         # Username Section
@@ -157,17 +175,16 @@ class DesktopLoginWindow(QWidget):
         
         user_label = QLabel("Username or Email")
         user_label.setFont(QFont("Segoe UI", 11, QFont.Medium))
-        user_label.setStyleSheet("color: #4a5568;")
+        set_role(user_label, "body")
         
         self.username = QLineEdit()
         self.username.setPlaceholderText("Enter your username or email")
         self.username.setFixedHeight(42)
-        self.username.setStyleSheet(self.input_style())
-        self.username.textChanged.connect(self.validate_username)
+        set_role(self.username, "input")
         
         self.username_error = QLabel()
         self.username_error.setFont(QFont("Segoe UI", 9))
-        self.username_error.setStyleSheet("color: #e53e3e; padding-left: 5px;")
+        set_role(self.username_error, "error")
         self.username_error.setVisible(False)
         
         user_container.addWidget(user_label)
@@ -180,7 +197,7 @@ class DesktopLoginWindow(QWidget):
         
         pass_label = QLabel("Password")
         pass_label.setFont(QFont("Segoe UI", 11, QFont.Medium))
-        pass_label.setStyleSheet("color: #4a5568;")
+        set_role(pass_label, "body")
         
         # Password field with show/hide toggle
         password_widget = QWidget()
@@ -191,27 +208,13 @@ class DesktopLoginWindow(QWidget):
         self.password.setPlaceholderText("Enter your password")
         self.password.setEchoMode(QLineEdit.Password)
         self.password.setFixedHeight(42)
-        self.password.setStyleSheet(self.input_style())
-        self.password.textChanged.connect(self.validate_password)
+        set_role(self.password, "input")
         
         self.toggle_password_btn = QPushButton()
         self.toggle_password_btn.setIcon(QIcon.fromTheme("view-refresh"))
         self.toggle_password_btn.setText("👁")
         self.toggle_password_btn.setFixedSize(42, 42)
-        self.toggle_password_btn.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #e2e8f0;
-                border-left: none;
-                border-radius: 0 8px 8px 0;
-                background-color: #f8fafc;
-                color: #718096;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #edf2f7;
-                color: #4a5568;
-            }
-        """)
+        self.toggle_password_btn.setObjectName("passwordToggle")
         self.toggle_password_btn.setCursor(Qt.PointingHandCursor)
         self.toggle_password_btn.clicked.connect(self.toggle_password_visibility)
         
@@ -220,7 +223,7 @@ class DesktopLoginWindow(QWidget):
         
         self.password_error = QLabel()
         self.password_error.setFont(QFont("Segoe UI", 9))
-        self.password_error.setStyleSheet("color: #e53e3e; padding-left: 5px;")
+        set_role(self.password_error, "error")
         self.password_error.setVisible(False)
         
         # Password strength indicator
@@ -228,16 +231,9 @@ class DesktopLoginWindow(QWidget):
         self.password_strength.setFixedHeight(4)
         self.password_strength.setTextVisible(False)
         self.password_strength.setMaximum(100)
-        self.password_strength.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                background-color: #e2e8f0;
-                border-radius: 2px;
-            }
-            QProgressBar::chunk {
-                border-radius: 2px;
-            }
-        """)
+        # Colour is picked by the theme from the `strength` property
+        self.password_strength.setObjectName("passwordStrength")
+        self.password_strength.setProperty("strength", "weak")
         self.password_strength.setVisible(False)
         
         pass_container.addWidget(pass_label)
@@ -245,18 +241,23 @@ class DesktopLoginWindow(QWidget):
         pass_container.addWidget(self.password_strength)
         pass_container.addWidget(self.password_error)
 
+        # Debounced validation shared with the registration form
+        self.username_check = FieldValidator(
+            self.username, check_username, self.username_error, error_prefix="⚠ "
+        )
+        self.username_check.changed.connect(self.on_username_checked)
+        self.password_check = FieldValidator(
+            self.password, check_login_password, self.password_error, error_prefix="⚠ "
+        )
+        self.password_check.changed.connect(self.on_password_checked)
+
         # Options
         options = QHBoxLayout()
         self.remember = QCheckBox("Remember me")
         self.remember.setFont(QFont("Segoe UI", 10))
-        self.remember.setStyleSheet("""
-            QCheckBox {
-                color: #4a5568;
-            }
-        """)
 
         forgot = QPushButton("Forgot Password?")
-        forgot.setStyleSheet(self.link_style())
+        set_variant(forgot, "link")
         forgot.clicked.connect(self.show_forgot_dialog)
 
         options.addWidget(self.remember)
@@ -267,22 +268,33 @@ class DesktopLoginWindow(QWidget):
         self.login_btn = QPushButton("Sign In")
         self.login_btn.setFixedHeight(46)
         self.login_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        self.login_btn.setStyleSheet(self.login_button_style(False))
+        self.login_btn.setObjectName("signInButton")
+        set_variant(self.login_btn, "primary")
         self.login_btn.clicked.connect(self.authenticate_user)
         self.login_btn.setEnabled(False)
         
         # Enable Enter key for login
         self.login_btn.setShortcut("Return")
 
+        # Why the last sign-in failed; hidden again as soon as either field is edited
+        self.login_error = QLabel()
+        self.login_error.setFont(QFont("Segoe UI", 10))
+        set_role(self.login_error, "error")
+        self.login_error.setAlignment(Qt.AlignCenter)
+        self.login_error.setWordWrap(True)
+        self.login_error.setVisible(False)
+        self.username.textEdited.connect(lambda _: self.login_error.setVisible(False))
+        self.password.textEdited.connect(lambda _: self.login_error.setVisible(False))
+
         # Demo credentials hint
         demo_label = QLabel("Demo credentials: admin / Admin@123")
-        demo_label.setFont(QFont("Segoe UI", 9))
-        demo_label.setStyleSheet("color: #a0aec0; font-style: italic;")
+        demo_label.setFont(QFont("Segoe UI", 9, QFont.Normal, True))
+        set_role(demo_label, "hint")
         demo_label.setAlignment(Qt.AlignCenter)
 
         footer = QLabel("© 2024 FBSL Steel Buildings • All rights reserved")
         footer.setFont(QFont("Segoe UI", 9))
-        footer.setStyleSheet("color: #a0aec0;")
+        set_role(footer, "hint")
         footer.setAlignment(Qt.AlignCenter)
 
         right_layout.addStretch()
@@ -295,6 +307,7 @@ class DesktopLoginWindow(QWidget):
         right_layout.addLayout(options)
         right_layout.addSpacing(15)
         right_layout.addWidget(self.login_btn)
+        right_layout.addWidget(self.login_error)
         right_layout.addSpacing(8)
         right_layout.addWidget(demo_label)
         right_layout.addStretch()
@@ -304,221 +317,30 @@ class DesktopLoginWindow(QWidget):
         main_layout.addWidget(left_panel)
         main_layout.addWidget(right_panel)
 
-    def input_style(self):
-        return """
-            QLineEdit {
-                padding: 10px 15px;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                font-size: 13px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #4299e1;
-                outline: none;
-            }
-            QLineEdit[valid="true"] {
-                border-color: #38a169;
-            }
-            QLineEdit[valid="false"] {
-                border-color: #e53e3e;
-            }
-        """
-
-    def link_style(self):
-        return """
-            QPushButton {
-                background: transparent;
-                color: #4299e1;
-                border: none;
-                font-weight: 600;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                text-decoration: underline;
-                color: #3182ce;
-            }
-        """
-
-    def login_button_style(self, enabled):
-        if enabled:
-            return """
-                QPushButton {
-                    background-color: #4299e1;
-                    color: white;
-                    border-radius: 8px;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: #3182ce;
-                }
-                QPushButton:pressed {
-                    background-color: #2c5282;
-                }
-            """
-        else:
-            return """
-                QPushButton {
-                    background-color: #cbd5e0;
-                    color: #a0aec0;
-                    border-radius: 8px;
-                    border: none;
-                }
-            """
-
-    def validate_username(self, text):
-        """Validate username/email"""
-        text = text.strip()
-        
-        # Clear previous error
-        self.username_error.clear()
-        self.username_error.setVisible(False)
-        self.username.setProperty("valid", "")
-        self.username.style().polish(self.username)
-        
-        # Check if empty
-        if not text:
-            self.username_valid = False
-            self.update_login_button()
-            return
-            
-        # Check minimum length
-        if len(text) < 3:
-            self.show_username_error("Username must be at least 3 characters")
-            self.username_valid = False
-            self.update_login_button()
-            return
-            
-        # Check for valid email format (if it looks like email)
-        if '@' in text:
-            if '.' not in text.split('@')[1] or len(text.split('@')[1].split('.')[-1]) < 2:
-                self.show_username_error("Please enter a valid email address")
-                self.username_valid = False
-                self.update_login_button()
-                return
-        
-        # Check for invalid characters
-        invalid_chars = ['<', '>', '"', "'", ';', '(', ')', '[', ']', '{', '}', '|', '\\', '/']
-        if any(char in text for char in invalid_chars):
-            self.show_username_error("Contains invalid characters")
-            self.username_valid = False
-            self.update_login_button()
-            return
-            
-        # Valid username
-        self.username.setProperty("valid", "true")
-        self.username.style().polish(self.username)
-        self.username_valid = True
+    def on_username_checked(self, result):
+        """Username validity changed (debounced)"""
+        self.username_valid = result.valid
         self.update_login_button()
 
-    def validate_password(self, text):
-        """Validate password and show strength"""
-        text = text.strip()
-        
-        # Clear previous error
-        self.password_error.clear()
-        self.password_error.setVisible(False)
-        self.password.setProperty("valid", "")
-        self.password.style().polish(self.password)
-        
-        # Check if empty
-        if not text:
-            self.password_strength.setVisible(False)
-            self.password_valid = False
-            self.update_login_button()
-            return
-            
-        # Calculate password strength
-        strength = 0
-        
-        # Length check
-        if len(text) >= 8:
-            strength += 25
-        elif len(text) >= 6:
-            strength += 15
-            
-        # Complexity checks
-        if any(c.isupper() for c in text):
-            strength += 20
-        if any(c.islower() for c in text):
-            strength += 20
-        if any(c.isdigit() for c in text):
-            strength += 20
-        if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?/" for c in text):
-            strength += 20
-            
-        # Set strength bar
-        self.password_strength.setValue(strength)
-        self.password_strength.setVisible(True)
-        
-        # Color based on strength
-        if strength >= 80:
-            color = "#38a169"  # Green
-        elif strength >= 60:
-            color = "#d69e2e"  # Yellow
-        elif strength >= 40:
-            color = "#ed8936"  # Orange
-        else:
-            color = "#e53e3e"  # Red
-            
-        self.password_strength.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                background-color: #e2e8f0;
-                border-radius: 2px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 2px;
-            }}
-        """)
-        
-        # Password requirements
-        errors = []
-        
-        if len(text) < 6:
-            errors.append("Minimum 6 characters")
-            
-        if not any(c.isupper() for c in text):
-            errors.append("At least one uppercase letter")
-            
-        if not any(c.isdigit() for c in text):
-            errors.append("At least one number")
-            
-        if errors:
-            self.show_password_error(" • ".join(errors[:2]))
-            self.password.setProperty("valid", "false")
-            self.password.style().polish(self.password)
-            self.password_valid = False
-        else:
-            self.password.setProperty("valid", "true")
-            self.password.style().polish(self.password)
-            self.password_valid = True
+    def on_password_checked(self, result):
+        """Password validity or strength changed (debounced)"""
+        self.password_valid = result.valid
+        
+        # Strength bar: value and colour level only change when they differ
+        self.password_strength.setVisible(bool(result.state))
+        if self.password_strength.value() != result.strength:
+            self.password_strength.setValue(result.strength)
+        level = strength_level(result.strength)
+        if self.password_strength.property("strength") != level:
+            self.password_strength.setProperty("strength", level)
+            repolish(self.password_strength)
             
         self.update_login_button()
 
-    def show_username_error(self, message):
-        """Display username validation error"""
-        self.username_error.setText(f"⚠ {message}")
-        self.username_error.setVisible(True)
-        self.username.setProperty("valid", "false")
-        self.username.style().polish(self.username)
-
-    def show_password_error(self, message):
-        """Display password validation error"""
-        self.password_error.setText(f"⚠ {message}")
-        self.password_error.setVisible(True)
-        self.password.setProperty("valid", "false")
-        self.password.style().polish(self.password)
-
     def update_login_button(self):
         """Enable/disable login button based on validation"""
-        if self.username_valid and self.password_valid:
-            self.login_btn.setEnabled(True)
-            self.login_btn.setStyleSheet(self.login_button_style(True))
-        else:
-            self.login_btn.setEnabled(False)
-            self.login_btn.setStyleSheet(self.login_button_style(False))
+        # The theme styles the disabled state, so this never touches a stylesheet
+        self.login_btn.setEnabled(self.username_valid and self.password_valid and not self.verifying)
 
     def toggle_password_visibility(self):
         """Toggle password visibility"""
@@ -530,80 +352,88 @@ class DesktopLoginWindow(QWidget):
             self.toggle_password_btn.setText("👁")
 
     def authenticate_user(self):
-        """Authenticate user credentials"""
+        """Verify credentials on a worker thread (hashing is deliberately slow)"""
         username = self.username.text().strip()
         password = self.password.text()
         
-        # Check if username exists in credentials
-        if username in self.valid_credentials:
-            # Check if password matches
-            if password == self.valid_credentials[username]:
-                self.show_login_success(username)
-            else:
-                self.show_login_error("Invalid password. Please try again.")
+        self.verifying = True
+        self.update_login_button()
+        self.set_login_button_text("Verifying...")
+        
+        run_in_background(
+            self.verify_credentials, username, password,
+            on_result=self.on_credentials_checked,
+            on_error=lambda message: self.on_credentials_checked(
+                (None, "Could not verify credentials. Please try again.")
+            )
+        )
+
+    def verify_credentials(self, username, password):
+        """Runs on the thread pool: (Session, None) or (None, reason)"""
+        # The audit log needs numpy; importing it here keeps it off the login screen's startup
+        from audit import record
+        self.credentials.seed(DEMO_ACCOUNTS)
+        self.access.seed(assignments=DEMO_ROLES)
+        account, error = self.credentials.verify(username, password)
+        session = None
+        if account:
+            try:
+                session = self.access.compile(account)
+            except AccessError as e:
+                error = f"{e}. Please contact HR."
+        if session is not None:
+            record(self.repository, "login.success", user=session.username, role=session.role)
         else:
-            self.show_login_error("Username not found. Please check your credentials.")
+            record(self.repository, "login.failure", user=account or username or "(blank)", reason=error)
+        return session, error
+
+    def on_credentials_checked(self, result):
+        """Back on the GUI thread with (session, error)"""
+        session, error = result
+        self.verifying = False
+        self.set_login_button_text("Sign In")
+        if session:
+            from audit import set_actor
+            set_actor(session.username)
+            self.session = session
+            self.show_login_success(session.username)
+        else:
+            self.update_login_button()
+            self.show_login_error(error)
+
+    def set_login_button_text(self, text):
+        # setText replaces the button shortcut with the text's mnemonic
+        self.login_btn.setText(text)
+        self.login_btn.setShortcut("Return")
 
     def show_login_success(self, username):
-        """Show success message and proceed to main app"""
+        """Greet the user and fade out; login_success is emitted once the fade ends"""
         # Disable inputs during transition
         self.username.setEnabled(False)
         self.password.setEnabled(False)
         self.login_btn.setEnabled(False)
-        self.login_btn.setText("Logging in...")
-        
-        # Show success message
-        QMessageBox.information(
-            self, 
-            "Login Successful",
-            f"Welcome back, {username}!\n\nRedirecting to dashboard..."
-        )
-        
-        # Emit signal for successful login (connect to main app)
-        self.login_success.emit(username)
+        self.set_login_button_text(f"Welcome back, {username}...")
         
-        # In a real app, you would close login window and open main window
-        # self.close()
-        # main_window.show()
+        # Emit signal for successful login (the app connects it to open_dashboard)
+        fade_out_window(self, lambda: self.login_success.emit(username))
 
     def show_login_error(self, message):
-        """Show login error message"""
-        QMessageBox.warning(
-            self,
-            "Login Failed",
-            message,
-            QMessageBox.Ok
-        )
+        """Show why sign-in failed under the button and shake the password field"""
+        self.login_error.setText(f"⚠ {message}")
+        self.login_error.setVisible(True)
         
         # Clear password field and refocus
         self.password.clear()
         self.password.setFocus()
         
-        # Shake animation effect
-        self.shake_widget(self.password)
-
-    def shake_widget(self, widget):
-        """Simple shake animation for error feedback"""
-        original_pos = widget.pos()
-        for i in range(0, 5):
-            if i % 2 == 0:
-                widget.move(original_pos.x() + 5, original_pos.y())
-            else:
-                widget.move(original_pos.x() - 5, original_pos.y())
-            QApplication.processEvents()
-            QTimer.singleShot(50 * i, lambda: None)
-        widget.move(original_pos)
+        shake(self.password)
 
     def show_forgot_dialog(self):
         """Show forgot password dialog with validation"""
         dlg = QDialog(self)
         dlg.setWindowTitle("Reset Password")
+        dlg.setObjectName("resetPasswordDialog")
         dlg.setFixedSize(780, 520)
-        dlg.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-        """)
         
         layout = QVBoxLayout(dlg)
         layout.setContentsMargins(25, 25, 25, 20)
@@ -611,27 +441,27 @@ class DesktopLoginWindow(QWidget):
         
         title = QLabel("Reset Your Password")
         title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title.setStyleSheet("color: #2d3748;")
+        set_role(title, "heading")
         title.setAlignment(Qt.AlignCenter)
         
         desc = QLabel("Enter your registered email address to receive a password reset link.")
         desc.setFont(QFont("Segoe UI", 10))
-        desc.setStyleSheet("color: #718096;")
+        set_role(desc, "muted")
         desc.setWordWrap(True)
         desc.setAlignment(Qt.AlignCenter)
         
         email_label = QLabel("Email Address")
         email_label.setFont(QFont("Segoe UI", 11, QFont.Medium))
-        email_label.setStyleSheet("color: #4a5568;")
+        set_role(email_label, "body")
         
         email_input = QLineEdit()
         email_input.setPlaceholderText("name@company.com")
         email_input.setFixedHeight(40)
-        email_input.setStyleSheet(self.input_style())
+        set_role(email_input, "input")
         
         error_label = QLabel()
         error_label.setFont(QFont("Segoe UI", 9))
-        error_label.setStyleSheet("color: #e53e3e;")
+        set_role(error_label, "error")
         error_label.setVisible(False)
         
         def validate_email():
@@ -649,17 +479,7 @@ class DesktopLoginWindow(QWidget):
         send_btn = QPushButton("Send Reset Link")
         send_btn.setFixedHeight(40)
         send_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        send_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #48bb78;
-                color: white;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #38a169;
-            }
-        """)
+        set_variant(send_btn, "success")
         
         def on_send():
             if validate_email():
@@ -676,17 +496,7 @@ class DesktopLoginWindow(QWidget):
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setFixedHeight(40)
         cancel_btn.setFont(QFont("Segoe UI", 11))
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e2e8f0;
-                color: #4a5568;
-                border-radius: 6px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #cbd5e0;
-            }
-        """)
+        set_variant(cancel_btn, "secondary")
         cancel_btn.clicked.connect(dlg.reject)
         
         button_layout.addWidget(send_btn)
@@ -703,6 +513,30 @@ class DesktopLoginWindow(QWidget):
         
         dlg.exec_()
 
+    def prebuild_dashboard(self):
+        """Get the dashboard ready while the user is still typing credentials
+
+        Imports, logo scaling and the first dashboard query run on workers; only the widget
+        construction, which Qt requires on the GUI thread, happens here.
+        """
+        prewarm()
+        run_in_background(preload_main_window, self.repository, on_result=self.on_dashboard_preloaded)
+
+    def on_dashboard_preloaded(self, snapshot):
+        if self.main_window is None:
+            from mainWindow import HRMMainWindow
+            self.main_window = HRMMainWindow(self.repository, snapshot=snapshot)
+
+    def open_dashboard(self):
+        """Replace the login screen with the dashboard, building it now if the pre-build has not finished"""
+        if self.main_window is None:
+            from mainWindow import HRMMainWindow
+            self.main_window = HRMMainWindow(self.repository)
+        if self.session is not None:
+            self.main_window.apply_session(self.session)
+        self.main_window.show()
+        self.close()
+
     def center_window(self):
         qr = self.frameGeometry()
         cp = QDesktopWidget().availableGeometry().center()
@@ -713,14 +547,18 @@ class DesktopLoginWindow(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 10))
+    apply_theme(app)
+    install_from_environment()
     window = DesktopLoginWindow()
     
     # Connect login success signal
     def on_login_success(username):
         print(f"Login successful for user: {username}")
-        # Here you would open the main application window
+        window.open_dashboard()
     
     window.login_success.connect(on_login_success)
     
     window.show()
+    # Start once the login screen has painted
+    QTimer.singleShot(0, window.prebuild_dashboard)
     sys.exit(app.exec_())
\ No newline at end of file
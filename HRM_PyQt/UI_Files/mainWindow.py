@@ -1,23 +1,70 @@
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
-    QVBoxLayout, QHBoxLayout, QFrame
+    QVBoxLayout, QHBoxLayout, QFrame, QStackedWidget, QShortcut
 )
-from PyQt5.QtGui import QFont, QPainter, QPixmap
+from PyQt5.QtGui import QFont, QPainter, QKeySequence
 from PyQt5.QtCore import Qt
-from PyQt5.QtChart import (
-    QChart, QChartView, QBarSet, QBarSeries,
-    QPieSeries, QBarCategoryAxis
+from database import get_repository
+from dashboard_refresh import DashboardRefresher, load_dashboard
+from theme import apply_theme, set_role, set_variant
+from assets import logo_pixmap
+from global_search import GlobalSearchBox
+from jobs import job_manager
+from tracing import install_from_environment
+from animations import fade_in, tween
+from kpi_card import KPICard
+from permissions import (
+    VIEW_DASHBOARD, VIEW_EMPLOYEES, VIEW_ATTENDANCE, VIEW_SALARY, VIEW_LEAVE, VIEW_LOANS,
+    VIEW_AUDIT, VIEW_JOBS, unrestricted_session
 )
 
+# Sidebar entries in display order; each page is built the first time it is opened
+PAGES = ["Home", "Employee", "Attendance", "Salary", "Leave", "Loan", "Audit", "Jobs"]
+
+# Permission a session needs to see each page
+PAGE_PERMISSIONS = {
+    "Home": VIEW_DASHBOARD,
+    "Employee": VIEW_EMPLOYEES,
+    "Attendance": VIEW_ATTENDANCE,
+    "Salary": VIEW_SALARY,
+    "Leave": VIEW_LEAVE,
+    "Loan": VIEW_LOANS,
+    "Audit": VIEW_AUDIT,
+    "Jobs": VIEW_JOBS,
+}
+
+
+def import_charts():
+    """QtChart is the slowest module the dashboard needs, so it is only loaded on demand"""
+    from PyQt5 import QtChart
+    return QtChart
+
+
+def preload_dashboard(repository):
+    """Worker-thread half of a dashboard pre-build: load QtChart and the first figures"""
+    import_charts()
+    return load_dashboard(repository)
+
 
 class HRMMainWindow(QWidget):
-    def __init__(self):
+    def __init__(self, repository=None, snapshot=None, session=None):
         super().__init__()
+        self.repository = repository or get_repository()
+        # Opened without signing in (development), everything is allowed
+        self.session = session or unrestricted_session()
         self.setWindowTitle("HRM System - Dashboard")
         self.setFixedSize(1200, 750)
-        self.setStyleSheet("background-color: #f4f6f9;")
+        self.setObjectName("mainWindow")
+        apply_theme()
         self.setup_ui()
+        self.apply_session(self.session)
+
+        # A snapshot loaded ahead of time (see preload_dashboard) fills the
+        # dashboard straight away; the first refresh then only sends changes.
+        if snapshot and self.dashboard_built():
+            self.refresher.snapshot = dict(snapshot)
+            self.apply_dashboard_changes(snapshot)
 
     def setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -25,29 +72,8 @@ class HRMMainWindow(QWidget):
 
         # ================= Sidebar =================
         sidebar = QFrame()
+        sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(260)
-        sidebar.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e3a5f,
-                    stop:1 #2b6cb0
-                );
-            }
-            QPushButton {
-                color: white;
-                background: transparent;
-                border: none;
-                padding: 14px 18px;
-                text-align: left;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: rgba(255,255,255,0.15);
-                border-left: 4px solid #fbbf24;
-            }
-        """)
 
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(0, 0, 0, 20)
@@ -59,77 +85,187 @@ class HRMMainWindow(QWidget):
         logo_layout.setContentsMargins(0, 10, 0, 20)
 
         logo_label = QLabel()
-        try:
-            pixmap = QPixmap('fbsl_logo.png')
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(200, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_label.setPixmap(pixmap)
-            else:
-                logo_label.setText("FBSL")
-                logo_label.setFont(QFont("Segoe UI", 28, QFont.Bold))
-                logo_label.setStyleSheet("color: white;")
-        except Exception as e:
+        pixmap = logo_pixmap("sidebar")
+        if not pixmap.isNull():
+            logo_label.setPixmap(pixmap)
+        else:
             logo_label.setText("FBSL")
             logo_label.setFont(QFont("Segoe UI", 28, QFont.Bold))
-            logo_label.setStyleSheet("color: white;")
 
         logo_label.setAlignment(Qt.AlignCenter)
         logo_layout.addWidget(logo_label)
         sidebar_layout.addWidget(logo_container)
 
         # Sidebar menu
-        for name in ["Home", "Employee", "Attendance", "Salary", "Leave", "Loan"]:
-            sidebar_layout.addWidget(QPushButton(name))
+        self.menu_buttons = {}
+        for name in PAGES:
+            button = QPushButton(name)
+            button.clicked.connect(lambda checked=False, name=name: self.show_page(name))
+            sidebar_layout.addWidget(button)
+            self.menu_buttons[name] = button
 
         sidebar_layout.addStretch()
 
-        # ================= Main Content =================
+        # ================= Header =================
+        header_bar = QFrame()
+        header_bar.setObjectName("headerBar")
+        header_bar.setFixedHeight(60)
+        header_layout = QHBoxLayout(header_bar)
+        header_layout.setContentsMargins(25, 0, 25, 0)
+
+        self.search_box = GlobalSearchBox(self.repository)
+        self.search_box.setFixedSize(420, 36)
+        self.search_box.employee_chosen.connect(self.show_employee)
+
+        # Unfinished background jobs; hidden while there are none
+        self.jobs_btn = QPushButton()
+        self.jobs_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.jobs_btn, "link")
+        self.jobs_btn.setVisible(False)
+        self.jobs_btn.clicked.connect(lambda: self.show_page("Jobs"))
+        job_manager().job_changed.connect(self.update_jobs_button)
+
+        header_layout.addWidget(self.jobs_btn)
+        header_layout.addStretch()
+        header_layout.addWidget(self.search_box)
+
+        # ================= Pages =================
+        # Built on first visit: a page that is never opened costs nothing
+        self.pages = QStackedWidget()
+        self.page_widgets = {}
+        self.page_builders = {
+            "Home": self.build_dashboard_page,
+            "Employee": self.build_employee_page,
+            "Attendance": self.build_attendance_page,
+            "Salary": self.build_salary_page,
+            "Leave": self.build_leave_page,
+            "Loan": self.build_loan_page,
+            "Audit": self.build_audit_page,
+            "Jobs": self.build_jobs_page,
+        }
+
+        # ================= Live Data =================
+        # Started once the window is shown with a dashboard, so a window pre-built
+        # behind the login screen (or signed in without the dashboard) stays idle
+        self.refresher = DashboardRefresher(self.repository, self)
+        self.refresher.changed.connect(self.apply_dashboard_changes)
+
+        # ================= Assemble =================
         content_layout = QVBoxLayout()
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(0)
+        content_layout.addWidget(header_bar)
+        content_layout.addWidget(self.pages)
+
+        main_layout.addWidget(sidebar)
+        main_layout.addLayout(content_layout)
+        self.show_page("Home")
+
+        # Event-loop lag and slot timings (see tracing.py), built on first use
+        self.trace_overlay = None
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.toggle_trace_overlay)
+
+    def apply_session(self, session):
+        """Show only the pages and actions `session` allows
+
+        A window pre-built behind the login screen gets the signed-in user's
+        session here; pages other than the dashboard are rebuilt for it, and
+        the dashboard itself is dropped if the session may not see it.
+        """
+        self.session = session
+        for name, button in self.menu_buttons.items():
+            button.setVisible(self.can_open(name))
+        self.search_box.set_session(session)
+        self.search_box.setVisible(session.can(VIEW_EMPLOYEES))
+        self.update_jobs_button()
+
+        for name, page in list(self.page_widgets.items()):
+            if name != "Home" or not self.can_open("Home"):
+                del self.page_widgets[name]
+                self.pages.removeWidget(page)
+                page.deleteLater()
+        if not self.can_open("Home"):
+            # Rebuilt from a full snapshot if a later session may see it again
+            self.refresher.stop()
+            self.refresher.snapshot = {}
+            allowed = [name for name in PAGES if self.can_open(name)]
+            if allowed:
+                self.show_page(allowed[0])
+
+    def toggle_trace_overlay(self):
+        if self.trace_overlay is None:
+            from trace_overlay import TraceOverlay
+            self.trace_overlay = TraceOverlay(self)
+        self.trace_overlay.toggle()
+
+    def can_open(self, name):
+        return self.session.can(PAGE_PERMISSIONS[name])
+
+    def dashboard_built(self):
+        return "Home" in self.page_widgets
+
+    def start_refresher(self):
+        if self.dashboard_built() and self.isVisible() and not self.refresher.running:
+            self.refresher.start()
+
+    def show_page(self, name):
+        """Switch to page `name`, building it on first visit; None if the session may not open it"""
+        if not self.can_open(name):
+            return None
+        page = self.page_widgets.get(name)
+        if page is None:
+            page = self.page_builders[name]()
+            self.page_widgets[name] = page
+            self.pages.addWidget(page)
+            if name == "Home":
+                self.start_refresher()
+        if self.pages.currentWidget() is not page:
+            self.pages.setCurrentWidget(page)
+            if self.isVisible():
+                fade_in(page)
+        return page
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.start_refresher()
+        self.search_box.start()
+
+    def show_employee(self, hit):
+        """Open the Employee page filtered to the employee picked in the header search"""
+        page = self.show_page("Employee")
+        if page is not None:
+            page.filter_to(hit.emp_no)
+
+    # -------- Pages --------
+    def build_dashboard_page(self):
+        QtChart = import_charts()
+
+        dashboard_page = QWidget()
+        content_layout = QVBoxLayout(dashboard_page)
         content_layout.setContentsMargins(25, 25, 25, 25)
         content_layout.setSpacing(20)
 
         header = QLabel("Dashboard Overview")
         header.setFont(QFont("Segoe UI", 22, QFont.Bold))
-        header.setStyleSheet("color: #2d3748;")
+        set_role(header, "heading")
         content_layout.addWidget(header)
 
         # ================= Cards =================
         card_layout = QHBoxLayout()
         card_layout.setSpacing(20)
 
-        def create_card(title, value, color):
-            card = QFrame()
-            card.setMinimumWidth(200)
-            card.setMaximumWidth(300)
-            card.setStyleSheet(f"""
-                QFrame {{
-                    background-color: white;
-                    border-radius: 15px;
-                    border-left: 8px solid {color};
-                    padding: 15px;
-                }}
-            """)
-            v = QVBoxLayout(card)
-            v.setContentsMargins(10, 10, 10, 10)
-
-            t = QLabel(title)
-            t.setFont(QFont("Segoe UI", 11))
-            t.setStyleSheet("color: #718096;")
-
-            val = QLabel(value)
-            val.setFont(QFont("Segoe UI", 28, QFont.Bold))
-            val.setStyleSheet("color: #2d3748;")
-
-            v.addWidget(t)
-            v.addStretch()
-            v.addWidget(val)
+        # Cards by dashboard key so refreshes can update them in place
+        self.card_values = {}
+
+        def create_card(key, title, accent):
+            card = self.card_values[key] = KPICard(title, accent)
             return card
 
         card_layout.addStretch()
-        card_layout.addWidget(create_card("Total Employees", "120", "#4299e1"))
-        card_layout.addWidget(create_card("Today Attendance", "98", "#48bb78"))
-        card_layout.addWidget(create_card("Total Staff", "80", "#ed8936"))
-        card_layout.addWidget(create_card("Total Labours", "40", "#9f7aea"))
+        card_layout.addWidget(create_card("total", "Total Employees", "blue"))
+        card_layout.addWidget(create_card("present", "Today Attendance", "green"))
+        card_layout.addWidget(create_card("staff", "Total Staff", "orange"))
+        card_layout.addWidget(create_card("labour", "Total Labours", "purple"))
         card_layout.addStretch()
 
         content_layout.addLayout(card_layout)
@@ -138,48 +274,45 @@ class HRMMainWindow(QWidget):
         chart_layout = QHBoxLayout()
         chart_layout.setSpacing(20)
 
-        # Attendance Bar Chart
-        bar_set = QBarSet("Attendance")
-        bar_set.append([75, 80, 78, 85, 90, 95])
+        # Attendance Bar Chart (filled in by the first refresh)
+        self.bar_set = bar_set = QtChart.QBarSet("Attendance")
         bar_set.setColor(Qt.darkBlue)
 
-        bar_series = QBarSeries()
+        bar_series = QtChart.QBarSeries()
         bar_series.append(bar_set)
 
-        bar_chart = QChart()
+        bar_chart = QtChart.QChart()
         bar_chart.addSeries(bar_series)
         bar_chart.setTitle("Monthly Attendance Overview")
         bar_chart.setTitleFont(QFont("Segoe UI", 12, QFont.Bold))
-        bar_chart.setAnimationOptions(QChart.SeriesAnimations)
+        bar_chart.setAnimationOptions(QtChart.QChart.SeriesAnimations)
         bar_chart.legend().setVisible(False)
         bar_chart.setBackgroundRoundness(12)
         bar_chart.setBackgroundBrush(Qt.white)
 
-        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun"]
-        axis_x = QBarCategoryAxis()
-        axis_x.append(months)
+        self.month_axis = axis_x = QtChart.QBarCategoryAxis()
         bar_chart.addAxis(axis_x, Qt.AlignBottom)
         bar_series.attachAxis(axis_x)
 
-        bar_view = QChartView(bar_chart)
+        bar_view = QtChart.QChartView(bar_chart)
         bar_view.setRenderHint(QPainter.Antialiasing)
 
         # Employee Distribution Pie Chart
-        pie_series = QPieSeries()
-        pie_series.append("Staff", 80)
-        pie_series.append("Labours", 40)
+        self.pie_series = pie_series = QtChart.QPieSeries()
+        pie_series.append("Staff", 0)
+        pie_series.append("Labours", 0)
 
         pie_series.slices()[0].setBrush(Qt.darkCyan)
         pie_series.slices()[1].setBrush(Qt.darkMagenta)
 
-        pie_chart = QChart()
+        pie_chart = QtChart.QChart()
         pie_chart.addSeries(pie_series)
         pie_chart.setTitle("Employee Distribution")
         pie_chart.setTitleFont(QFont("Segoe UI", 12, QFont.Bold))
         pie_chart.setBackgroundRoundness(12)
         pie_chart.setBackgroundBrush(Qt.white)
 
-        pie_view = QChartView(pie_chart)
+        pie_view = QtChart.QChartView(pie_chart)
         pie_view.setRenderHint(QPainter.Antialiasing)
 
         chart_layout.addWidget(bar_view, 2)
@@ -187,15 +320,77 @@ class HRMMainWindow(QWidget):
 
         content_layout.addLayout(chart_layout)
         content_layout.addStretch()
-
-        # ================= Assemble =================
-        main_layout.addWidget(sidebar)
-        main_layout.addLayout(content_layout)
+        return dashboard_page
+
+    def build_employee_page(self):
+        from employee_page import EmployeePage
+        return EmployeePage(self.repository, self.session)
+
+    def build_attendance_page(self):
+        from attendance_page import AttendancePage
+        page = AttendancePage(self.repository, self.session)
+        page.data_changed.connect(self.refresher.request_refresh)
+        return page
+
+    def build_salary_page(self):
+        from salary_page import SalaryPage
+        return SalaryPage(self.repository, self.session)
+
+    def build_leave_page(self):
+        from leave_page import LeavePage
+        return LeavePage(self.repository, self.session)
+
+    def build_loan_page(self):
+        from loan_page import LoanPage
+        return LoanPage(self.repository, self.session)
+
+    def build_audit_page(self):
+        from audit_page import AuditPage
+        return AuditPage(self.repository)
+
+    def build_jobs_page(self):
+        from jobs_panel import JobsPanel
+        return JobsPanel(job_manager())
+
+    def update_jobs_button(self, *_):
+        summary = job_manager().summary()
+        self.jobs_btn.setText(summary)
+        self.jobs_btn.setVisible(bool(summary) and self.can_open("Jobs"))
+
+    # -------- Live Data --------
+    def apply_dashboard_changes(self, changes):
+        """Apply only the figures that changed since the last refresh"""
+        if not self.dashboard_built():
+            return
+        for key, card in self.card_values.items():
+            if key in changes:
+                # Counts from the figure on screen; a change mid-count carries on from there
+                tween(card, card.value() or 0, changes[key], card.set_value)
+
+        if "staff" in changes:
+            self.pie_series.slices()[0].setValue(changes["staff"])
+        if "labour" in changes:
+            self.pie_series.slices()[1].setValue(changes["labour"])
+
+        if "monthly" in changes:
+            labels = [label for label, _ in changes["monthly"]]
+            values = [value for _, value in changes["monthly"]]
+            if self.month_axis.categories() != labels:
+                self.month_axis.setCategories(labels)
+            if self.bar_set.count() != len(values):
+                self.bar_set.remove(0, self.bar_set.count())
+                self.bar_set.append(values)
+            else:
+                for i, value in enumerate(values):
+                    if self.bar_set.at(i) != value:
+                        self.bar_set.replace(i, value)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 10))
+    apply_theme(app)
+    install_from_environment()
     window = HRMMainWindow()
     window.show()
     sys.exit(app.exec_())
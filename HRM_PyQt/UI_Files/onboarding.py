@@ -0,0 +1,219 @@
+"""Bulk employee onboarding from CSV
+
+Every row is checked with the registration form's rules (check_name,
+check_email, POSITIONS) in one pass over the file. Emails and employee
+numbers are then checked against the employees table in one indexed query
+each, instead of one lookup per row, and duplicates within the file are
+caught with a set. Valid rows are inserted BATCH_SIZE at a time, one
+transaction per batch. Every rejected row goes into the error report with
+its line number and reason; the other rows still go in.
+
+Login accounts are not created here. Hashing a password costs a few
+hundred milliseconds by design, so accounts for the few people who sign in
+to the HRM are still set up through the registration form.
+"""
+import csv
+import json
+import sqlite3
+import time
+from collections import namedtuple
+from datetime import date
+from audit import record
+from validation_rules import CATEGORIES, EMAIL_TAKEN, POSITIONS, check_email, check_name
+
+BATCH_SIZE = 5000
+
+# CSV header -> employees column; name and email are required
+COLUMNS = {
+    "name": "name",
+    "full_name": "name",
+    "email": "email",
+    "email_address": "email",
+    "position": "position",
+    "department": "department",
+    "category": "category",
+    "nic": "nic",
+    "emp_no": "emp_no",
+    "employee_no": "emp_no",
+    "joined_on": "joined_on",
+    "join_date": "joined_on",
+}
+REQUIRED = ("name", "email")
+FIELDS = ("emp_no", "name", "email", "nic", "position", "department", "category", "joined_on")
+
+# One query per check, whatever the number of rows: the values go in as a JSON array
+SQL_EXISTING_EMAILS = "SELECT email FROM employees WHERE email IN (SELECT value FROM json_each(?))"
+SQL_EXISTING_EMP_NOS = "SELECT emp_no FROM employees WHERE emp_no IN (SELECT value FROM json_each(?))"
+SQL_INSERT = f"INSERT INTO employees ({', '.join(FIELDS)}) VALUES ({', '.join('?' for _ in FIELDS)})"
+SQL_MAX_ID = "SELECT IFNULL(MAX(id), 0) FROM employees"
+SQL_NEW_IDS = "SELECT id FROM employees WHERE id > ? ORDER BY id"
+SQL_ASSIGN_EMP_NOS = "UPDATE employees SET emp_no = printf('EMP%06d', id) WHERE id > ? AND emp_no IS NULL"
+
+RowError = namedtuple("RowError", "line field value message")
+OnboardingResult = namedtuple("OnboardingResult", "rows inserted errors employee_ids elapsed")
+
+
+class OnboardingError(Exception):
+    """Raised when a file cannot be onboarded at all (e.g. required columns missing)"""
+
+
+# ================= Validation =================
+def _read(path):
+    """[(line number, {column: value})] for every non-blank row, values stripped"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise OnboardingError("The file is empty")
+        columns = [COLUMNS.get(name.strip().lower().replace(" ", "_")) for name in header]
+        missing = [name for name in REQUIRED if name not in columns]
+        if missing:
+            raise OnboardingError(f"Missing column(s): {', '.join(missing)}")
+        rows = []
+        for fields in reader:
+            if not any(field.strip() for field in fields):
+                continue
+            values = {}
+            for column, value in zip(columns, fields):
+                if column is not None and column not in values:
+                    values[column] = value.strip()
+            rows.append((reader.line_num, values))
+        return rows
+
+
+def check_row(values, today):
+    """(employees row tuple, None), or (None, (field, message)) for the first rule broken"""
+    name, email = values.get("name", ""), values.get("email", "")
+    for field, result in (("name", check_name(name)), ("email", check_email(email))):
+        if not result.valid:
+            return None, (field, result.message)
+
+    position = values.get("position", "")
+    if position:
+        position = _choice(position, POSITIONS)
+        if position is None:
+            return None, ("position", f"Position must be one of: {', '.join(POSITIONS)}")
+    category = _choice(values.get("category", "") or CATEGORIES[0], CATEGORIES)
+    if category is None:
+        return None, ("category", f"Category must be one of: {', '.join(CATEGORIES)}")
+    joined_on = values.get("joined_on", "") or today
+    try:
+        joined_on = date.fromisoformat(joined_on).isoformat()
+    except ValueError:
+        return None, ("joined_on", "Join date must be YYYY-MM-DD")
+
+    return (values.get("emp_no") or None, name, email, values.get("nic") or None,
+            position or None, values.get("department") or None, category, joined_on), None
+
+
+def _choice(value, choices):
+    """The canonical spelling of `value` in `choices` (case-insensitive), or None"""
+    folded = value.casefold()
+    for choice in choices:
+        if choice.casefold() == folded:
+            return choice
+    return None
+
+
+def validate(conn, rows, today=None):
+    """Split (line, values) rows into (valid [(line, row tuple)], [RowError])"""
+    today = today or date.today().isoformat()
+    valid, errors = [], []
+    emails, emp_nos = {}, {}     # value (casefolded for email) -> first line using it
+    for line, values in rows:
+        checked, failure = check_row(values, today)
+        if failure is not None:
+            field, message = failure
+            errors.append(RowError(line, field, values.get(field, ""), message))
+            continue
+        email = checked[2].casefold()
+        if email in emails:
+            errors.append(RowError(line, "email", checked[2], f"Duplicate of line {emails[email]}"))
+            continue
+        emp_no = checked[0]
+        if emp_no is not None and emp_no in emp_nos:
+            errors.append(RowError(line, "emp_no", emp_no, f"Duplicate of line {emp_nos[emp_no]}"))
+            continue
+        emails[email] = line
+        if emp_no is not None:
+            emp_nos[emp_no] = line
+        valid.append((line, checked))
+
+    taken_emails = {row[0].casefold() for row in conn.execute(
+        SQL_EXISTING_EMAILS, (json.dumps([row[2] for _, row in valid]),))}
+    taken_emp_nos = {row[0] for row in conn.execute(
+        SQL_EXISTING_EMP_NOS, (json.dumps(list(emp_nos)),))} if emp_nos else set()
+    if taken_emails or taken_emp_nos:
+        kept = []
+        for line, row in valid:
+            if row[2].casefold() in taken_emails:
+                errors.append(RowError(line, "email", row[2], EMAIL_TAKEN))
+            elif row[0] in taken_emp_nos:
+                errors.append(RowError(line, "emp_no", row[0], "Employee number is already in use"))
+            else:
+                kept.append((line, row))
+        valid = kept
+    return valid, errors
+
+
+# ================= Import =================
+def onboard_employees(repository, path, batch_size=BATCH_SIZE, dry_run=False, progress=None, cancelled=None):
+    """Validate and insert every employee in the CSV at `path`
+
+    `progress(rows_done, rows_total)` is called after each committed batch.
+    With dry_run nothing is written and the result reports what would be.
+    Cancelling stops after the current batch; committed batches stay.
+    """
+    started = time.perf_counter()
+    pool = repository.pool
+    conn = pool.connection()
+    rows = _read(path)
+    valid, errors = validate(conn, rows)
+    if dry_run:
+        return OnboardingResult(len(rows), 0, sorted(errors), [], time.perf_counter() - started)
+
+    employee_ids = []
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start:start + batch_size]
+        with pool.transaction():
+            first_id = conn.execute(SQL_MAX_ID).fetchone()[0]
+            conn.execute("SAVEPOINT onboard_batch")
+            try:
+                conn.executemany(SQL_INSERT, [row for _, row in batch])
+            except sqlite3.IntegrityError:
+                # Another writer took an email or number since validation; insert what still fits
+                conn.execute("ROLLBACK TO onboard_batch")
+                errors += _insert_one_by_one(conn, batch)
+            conn.execute("RELEASE onboard_batch")
+            conn.execute(SQL_ASSIGN_EMP_NOS, (first_id,))
+            ids = [row[0] for row in conn.execute(SQL_NEW_IDS, (first_id,))]
+        employee_ids += ids
+        repository.notify_employees_changed(ids)
+        if progress is not None:
+            progress(min(start + batch_size, len(valid)), len(valid))
+        if cancelled is not None and cancelled():
+            break
+
+    if employee_ids:
+        record(repository, "employee.onboard", file=path, inserted=len(employee_ids),
+               rejected=len(errors), employee_ids=employee_ids)
+    return OnboardingResult(len(rows), len(employee_ids), sorted(errors), employee_ids,
+                            time.perf_counter() - started)
+
+
+def _insert_one_by_one(conn, batch):
+    """Insert rows separately inside the open transaction; a failing row only undoes itself"""
+    errors = []
+    for line, row in batch:
+        try:
+            conn.execute(SQL_INSERT, row)
+        except sqlite3.IntegrityError:
+            errors.append(RowError(line, "email", row[2], "Email or employee number is already registered"))
+    return errors
+
+
+def write_error_report(errors, out):
+    """Write RowErrors to the text stream `out` as CSV (line, field, value, message)"""
+    writer = csv.writer(out)
+    writer.writerow(RowError._fields)
+    writer.writerows(errors)
@@ -0,0 +1,285 @@
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+import numpy as np
+
+from audit import record
+from work_calendar import load_calendar, work_calendar
+
+
+# ================= Rules =================
+STANDARD_DAY_HOURS = 9.0        # 8 working hours + 1 hour break
+OT_DIVISOR = 200.0              # hourly rate = basic / 200
+OT_MULTIPLIER = 1.5
+EPF_EMPLOYEE_RATE = 0.08
+EPF_EMPLOYER_RATE = 0.12
+ETF_RATE = 0.03
+
+# Monthly APIT brackets: (lower bound of band, rate applied within the band)
+APIT_BRACKETS = [
+    (150000.0, 0.06),
+    (233333.0, 0.18),
+    (275000.0, 0.24),
+    (316667.0, 0.30),
+    (358333.0, 0.36),
+]
+
+PAYSLIP_FIELDS = (
+    "basic", "overtime_hours", "overtime_pay", "allowances", "gross",
+    "epf_employee", "epf_employer", "etf", "apit", "other_deductions", "net"
+)
+
+# scheduled_days: working days in the period on the employee's site calendar;
+# payable_days: those from the day they joined on (fewer only for mid-period joiners)
+PayrollInputs = namedtuple(
+    "PayrollInputs",
+    "employee_id department basic allowances overtime_hours days_present other_deductions "
+    "scheduled_days payable_days"
+)
+PayrollResult = namedtuple("PayrollResult", "run_id period employees total_gross total_net elapsed")
+
+# How often a multi-process run checks for cancellation while waiting on a share
+CANCEL_POLL_SECONDS = 0.2
+
+# 'YYYY-MM-32' sorts after every real date of the month
+SQL_PAYROLL_INPUTS = """
+    SELECT e.id, IFNULL(e.department, ''), s.basic_salary, s.fixed_allowance,
+           IFNULL(a.ot_hours, 0), IFNULL(a.days, 0), IFNULL(d.amount, 0),
+           date(e.joined_on), IFNULL(w.site, ''), IFNULL(w.pattern, 'standard')
+    FROM employees e
+    JOIN salary_structures s ON s.employee_id = e.id
+    LEFT JOIN work_assignments w ON w.employee_id = e.id
+    LEFT JOIN (
+        SELECT employee_id,
+               SUM(MAX(0, (julianday(check_out) - julianday(check_in)) * 24 - ?)) AS ot_hours,
+               COUNT(*) AS days
+        FROM attendance
+        WHERE work_date >= ? || '-01' AND work_date <= ? || '-32' {attendance_filter}
+        GROUP BY employee_id
+    ) a ON a.employee_id = e.id
+    LEFT JOIN (
+        SELECT l.employee_id, SUM(i.payment) AS amount
+        FROM loan_instalments i JOIN loans l ON l.id = i.loan_id
+        WHERE i.due_month = ?
+        GROUP BY l.employee_id
+    ) d ON d.employee_id = e.id
+    WHERE e.active = 1 {department_filter}
+    ORDER BY e.id
+"""
+SQL_DEPARTMENT_HEADCOUNT = """
+    SELECT IFNULL(department, ''), COUNT(*) FROM employees
+    WHERE active = 1 GROUP BY IFNULL(department, '')
+"""
+SQL_INSERT_RUN = """
+    INSERT INTO payroll_runs (period, employees, total_gross, total_net) VALUES (?, ?, ?, ?)
+"""
+SQL_INSERT_PAYSLIP = f"""
+    INSERT INTO payslips (run_id, employee_id, {', '.join(PAYSLIP_FIELDS)})
+    VALUES (?, ?, {', '.join('?' for _ in PAYSLIP_FIELDS)})
+"""
+SQL_GET_STRUCTURE = "SELECT basic_salary, fixed_allowance FROM salary_structures WHERE employee_id = ?"
+SQL_SET_STRUCTURE = """
+    INSERT INTO salary_structures (employee_id, basic_salary, fixed_allowance, effective_from)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(employee_id) DO UPDATE SET
+        basic_salary = excluded.basic_salary,
+        fixed_allowance = excluded.fixed_allowance,
+        effective_from = excluded.effective_from
+"""
+
+
+# ================= Salary structures =================
+def set_salary_structure(repository, employee_id, basic_salary, fixed_allowance=None, effective_from=None):
+    """Set an employee's basic salary and fixed allowance; audited with the previous values
+
+    Without `fixed_allowance` the current allowance is kept (none for a new structure).
+    """
+    if basic_salary < 0 or (fixed_allowance or 0) < 0:
+        raise ValueError("Salary amounts cannot be negative")
+    with repository.pool.transaction() as conn:
+        previous = conn.execute(SQL_GET_STRUCTURE, (employee_id,)).fetchone()
+        if fixed_allowance is None:
+            fixed_allowance = previous[1] if previous else 0.0
+        conn.execute(SQL_SET_STRUCTURE, (employee_id, basic_salary, fixed_allowance, effective_from))
+    record(repository, "salary.update", employee_id=employee_id, basic_salary=basic_salary,
+           fixed_allowance=fixed_allowance, effective_from=effective_from,
+           previous_basic_salary=previous[0] if previous else None,
+           previous_fixed_allowance=previous[1] if previous else None)
+
+
+# ================= Engine =================
+def apit(taxable):
+    """Progressive monthly income tax over an array of taxable incomes"""
+    tax = np.zeros_like(taxable)
+    bounds = [lower for lower, _ in APIT_BRACKETS] + [np.inf]
+    for (lower, rate), upper in zip(APIT_BRACKETS, bounds[1:]):
+        tax += np.clip(taxable - lower, 0.0, upper - lower) * rate
+    return tax
+
+
+def compute_payroll(inputs):
+    """Compute every payslip figure for the whole input at once
+
+    All arithmetic is array-wide; there is no per-employee Python code, so a
+    40k-employee run costs a few dozen vector operations.
+    """
+    # Joiners are paid the share of the period's working days they were employed for;
+    # overtime stays at the full salary's hourly rate
+    share = np.divide(inputs.payable_days, inputs.scheduled_days,
+                      out=np.ones(len(inputs.basic)), where=inputs.scheduled_days > 0)
+    basic = np.round(inputs.basic * share, 2)
+    overtime_pay = inputs.overtime_hours * (inputs.basic / OT_DIVISOR) * OT_MULTIPLIER
+    gross = basic + inputs.allowances + overtime_pay
+
+    # EPF/ETF are charged on basic earnings only
+    epf_employee = basic * EPF_EMPLOYEE_RATE
+    epf_employer = basic * EPF_EMPLOYER_RATE
+    etf = basic * ETF_RATE
+    tax = apit(gross)
+
+    net = gross - epf_employee - tax - inputs.other_deductions
+    return {
+        "basic": basic,
+        "overtime_hours": inputs.overtime_hours,
+        "overtime_pay": np.round(overtime_pay, 2),
+        "allowances": inputs.allowances,
+        "gross": np.round(gross, 2),
+        "epf_employee": np.round(epf_employee, 2),
+        "epf_employer": np.round(epf_employer, 2),
+        "etf": np.round(etf, 2),
+        "apit": np.round(tax, 2),
+        "other_deductions": inputs.other_deductions,
+        "net": np.round(net, 2),
+    }
+
+
+def load_payroll_inputs(conn, period, departments=None, calendar=None):
+    """Read salary structures, the period's attendance and loan instalments into column arrays
+
+    Working days come from `calendar` (a WorkCalendar covering the period's
+    year; one is loaded when not given), in one bulk lookup for every employee.
+    """
+    department_filter = attendance_filter = ""
+    params = [STANDARD_DAY_HOURS, period, period, period]
+    if departments is not None:
+        # Filter both sides so each worker only aggregates its own attendance
+        in_list = f"IN ({', '.join('?' for _ in departments)})"
+        attendance_filter = f"AND employee_id IN (SELECT id FROM employees WHERE IFNULL(department, '') {in_list})"
+        department_filter = f"AND IFNULL(e.department, '') {in_list}"
+        params = [STANDARD_DAY_HOURS, period, period, *departments, period, *departments]
+    sql = SQL_PAYROLL_INPUTS.format(attendance_filter=attendance_filter, department_filter=department_filter)
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(sql, params).fetchall()
+
+    count = len(rows)
+    columns = list(zip(*rows)) if rows else [()] * 10
+    if calendar is None:
+        calendar = load_calendar(conn, int(period[:4]), int(period[:4]))
+    first_day = np.datetime64(f"{period}-01", "D")
+    last_day = (np.datetime64(period, "M") + 1).astype("datetime64[D]") - 1
+    joined = np.array(columns[7], dtype="datetime64[D]")   # NULL joined_on is NaT: employed all period
+    starts = np.where(np.isnat(joined), first_day, np.maximum(joined, first_day))
+    calendar_rows = calendar.rows_for(columns[8], columns[9])
+    period_end = np.full(count, last_day)
+    return PayrollInputs(
+        employee_id=np.fromiter(columns[0], dtype=np.int64, count=count),
+        department=np.array(columns[1], dtype=object),
+        basic=np.fromiter(columns[2], dtype=np.float64, count=count),
+        allowances=np.fromiter(columns[3], dtype=np.float64, count=count),
+        overtime_hours=np.round(np.fromiter(columns[4], dtype=np.float64, count=count), 2),
+        days_present=np.fromiter(columns[5], dtype=np.int64, count=count),
+        other_deductions=np.fromiter(columns[6], dtype=np.float64, count=count),
+        scheduled_days=calendar.working_days_bulk(np.full(count, first_day), period_end, calendar_rows),
+        payable_days=calendar.working_days_bulk(starts, period_end, calendar_rows),
+    )
+
+
+def split_departments(headcounts, parts):
+    """Greedily balance departments into `parts` groups by headcount"""
+    groups = [[] for _ in range(parts)]
+    loads = [0] * parts
+    for department, count in sorted(headcounts.items(), key=lambda item: -item[1]):
+        i = loads.index(min(loads))
+        groups[i].append(department)
+        loads[i] += count
+    return [group for group in groups if group]
+
+
+def _department_worker(db_path, period, departments):
+    """Process pool entry point: compute payslips for a group of departments"""
+    from database import get_repository
+    repository = get_repository(db_path)
+    calendar = work_calendar(repository, (int(period[:4]),))
+    inputs = load_payroll_inputs(repository.pool.connection(), period, departments, calendar)
+    return inputs.employee_id, compute_payroll(inputs)
+
+
+def run_payroll(repository, period, workers=1, progress=None, executor=None, cancelled=None):
+    """Compute and store a payroll run for `period` ('YYYY-MM')
+
+    With workers > 1 the departments are split across a process pool (the
+    given `executor`, else one created for this run); each process reads and
+    computes its share and the parent writes every payslip in a single
+    transaction. Once `cancelled()` returns True the remaining shares are
+    dropped and nothing is stored; the run then returns None.
+    """
+    started = time.perf_counter()
+    pool = repository.pool
+    conn = pool.connection()
+
+    groups = []
+    if workers > 1:
+        headcounts = dict(conn.execute(SQL_DEPARTMENT_HEADCOUNT).fetchall())
+        groups = split_departments(headcounts, workers)
+    # No departments to share out (no employees): the single-process path stores an empty run
+    if groups:
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=len(groups)) as own_executor:
+                parts = _run_departments(own_executor, pool.path, period, groups, progress, cancelled)
+        else:
+            parts = _run_departments(executor, pool.path, period, groups, progress, cancelled)
+        if parts is None:
+            return None
+        employee_ids = np.concatenate([ids for ids, _ in parts])
+        results = {field: np.concatenate([result[field] for _, result in parts]) for field in PAYSLIP_FIELDS}
+    else:
+        inputs = load_payroll_inputs(conn, period, calendar=work_calendar(repository, (int(period[:4]),)))
+        employee_ids, results = inputs.employee_id, compute_payroll(inputs)
+        if progress is not None:
+            progress(1, 1)
+
+    if cancelled is not None and cancelled():
+        return None
+    total_gross = float(results["gross"].sum())
+    total_net = float(results["net"].sum())
+    with pool.transaction():
+        run_id = conn.execute(SQL_INSERT_RUN, (period, len(employee_ids), total_gross, total_net)).lastrowid
+        columns = [employee_ids.tolist()] + [results[field].tolist() for field in PAYSLIP_FIELDS]
+        conn.executemany(SQL_INSERT_PAYSLIP, ((run_id,) + row for row in zip(*columns)))
+    record(repository, "payroll.run", period=period, run_id=run_id, employees=len(employee_ids),
+           total_gross=round(total_gross, 2), total_net=round(total_net, 2))
+
+    return PayrollResult(run_id, period, len(employee_ids), total_gross, total_net,
+                         time.perf_counter() - started)
+
+
+def _run_departments(executor, db_path, period, groups, progress, cancelled):
+    """Compute each department group on `executor`; None if cancelled part way"""
+    futures = [executor.submit(_department_worker, db_path, period, group) for group in groups]
+    parts = []
+    for done, future in enumerate(futures, 1):
+        while True:
+            if cancelled is not None and cancelled():
+                for pending in futures:
+                    pending.cancel()
+                return None
+            try:
+                parts.append(future.result(timeout=CANCEL_POLL_SECONDS))
+                break
+            except TimeoutError:
+                continue
+        if progress is not None:
+            progress(done, len(futures))
+    return parts
@@ -0,0 +1,201 @@
+"""Role-based access, compiled once per session
+
+The role tables (roles, role_permissions, user_roles, reporting_lines) are
+read once at sign-in and folded into a Session: one integer with a bit per
+permission, and the set of employee rows the user may see. Every sidebar
+entry, action and row check after that is a bit test or a set lookup; no
+role table is queried again until the next sign-in.
+
+An account's role is its user_roles entry, else DEFAULT_ROLE. Roles are
+never taken from the employee record: its position is free text anyone
+registering can choose. Row scope comes with the role:
+every employee, the user's own department, the user's reports (direct and
+indirect, from reporting_lines), or only the user's own record.
+"""
+import json
+import threading
+
+# Bit order is fixed by this tuple; names are what role_permissions stores
+PERMISSIONS = (
+    "dashboard.view",
+    "employees.view",
+    "employees.register",
+    "employees.onboard",
+    "attendance.view",
+    "attendance.import",
+    "salary.view",
+    "payroll.run",
+    "leave.view",
+    "leave.approve",
+    "loans.view",
+    "loans.manage",
+    "audit.view",
+    "jobs.view",
+)
+PERMISSION_BITS = {name: 1 << bit for bit, name in enumerate(PERMISSIONS)}
+ALL_PERMISSIONS = (1 << len(PERMISSIONS)) - 1
+
+VIEW_DASHBOARD = PERMISSION_BITS["dashboard.view"]
+VIEW_EMPLOYEES = PERMISSION_BITS["employees.view"]
+REGISTER_EMPLOYEES = PERMISSION_BITS["employees.register"]
+ONBOARD_EMPLOYEES = PERMISSION_BITS["employees.onboard"]
+VIEW_ATTENDANCE = PERMISSION_BITS["attendance.view"]
+IMPORT_ATTENDANCE = PERMISSION_BITS["attendance.import"]
+VIEW_SALARY = PERMISSION_BITS["salary.view"]
+RUN_PAYROLL = PERMISSION_BITS["payroll.run"]
+VIEW_LEAVE = PERMISSION_BITS["leave.view"]
+APPROVE_LEAVE = PERMISSION_BITS["leave.approve"]
+VIEW_LOANS = PERMISSION_BITS["loans.view"]
+MANAGE_LOANS = PERMISSION_BITS["loans.manage"]
+VIEW_AUDIT = PERMISSION_BITS["audit.view"]
+VIEW_JOBS = PERMISSION_BITS["jobs.view"]
+
+# Whose employee rows a role sees
+SCOPE_ALL = "all"
+SCOPE_DEPARTMENT = "department"
+SCOPE_REPORTS = "reports"
+SCOPE_SELF = "self"
+SCOPES = (SCOPE_ALL, SCOPE_DEPARTMENT, SCOPE_REPORTS, SCOPE_SELF)
+
+# Seeded into the role tables when they are empty; edit the tables afterwards
+DEFAULT_ROLE = "Employee"
+DEFAULT_ROLES = {
+    "Administrator": (SCOPE_ALL, PERMISSIONS),
+    "Director": (SCOPE_ALL, PERMISSIONS),
+    "HR": (SCOPE_ALL, tuple(name for name in PERMISSIONS if name != "audit.view")),
+    "Project Manager": (SCOPE_REPORTS, (
+        "dashboard.view", "employees.view", "attendance.view", "leave.view", "leave.approve", "jobs.view",
+    )),
+    "Employee": (SCOPE_SELF, ("dashboard.view", "employees.view", "leave.view", "loans.view")),
+}
+
+SQL_ROLE_COUNT = "SELECT COUNT(*) FROM roles"
+SQL_INSERT_ROLE = "INSERT OR IGNORE INTO roles (name, scope) VALUES (?, ?)"
+SQL_INSERT_ROLE_PERMISSION = "INSERT OR IGNORE INTO role_permissions (role, permission) VALUES (?, ?)"
+SQL_ASSIGN_ROLE = "INSERT OR REPLACE INTO user_roles (username, role) VALUES (?, ?)"
+SQL_ACCOUNT_PROFILE = """
+    SELECT u.username, u.employee_id, e.department,
+           IFNULL(r.role, ?) AS role
+    FROM user_accounts u
+    LEFT JOIN employees e ON e.id = u.employee_id
+    LEFT JOIN user_roles r ON r.username = u.username
+    WHERE u.username = ?
+"""
+SQL_ROLE = "SELECT name, scope FROM roles WHERE name = ?"
+SQL_ROLE_PERMISSIONS = "SELECT permission FROM role_permissions WHERE role = ?"
+SQL_REPORTS = """
+    WITH RECURSIVE team(id) AS (
+        SELECT employee_id FROM reporting_lines WHERE manager_id = ?
+        UNION
+        SELECT r.employee_id FROM reporting_lines r JOIN team t ON r.manager_id = t.id
+    )
+    SELECT id FROM team
+"""
+
+
+class AccessError(Exception):
+    """Raised when an account has no usable role"""
+
+
+def permission_mask(names):
+    """OR of the bits of permission `names`; names this version does not know are ignored"""
+    mask = 0
+    for name in names:
+        mask |= PERMISSION_BITS.get(name, 0)
+    return mask
+
+
+class Session:
+    """A signed-in user's compiled permissions and row scope
+
+    can() and can_see() are the only checks the windows make; both are
+    constant time and never touch the database.
+    """
+
+    def __init__(self, username, role, permissions, scope=SCOPE_SELF,
+                 employee_id=None, department=None, employee_ids=()):
+        self.username = username
+        self.role = role
+        self.permissions = permissions
+        self.scope = scope
+        self.employee_id = employee_id
+        self.department = department
+        # Rows visible beyond the scope's own rule: the user and, for managers, their reports
+        self.employee_ids = frozenset(employee_ids)
+        self.row_filter = self._compile_row_filter()
+
+    def can(self, permission):
+        """True when every bit of `permission` is granted"""
+        return self.permissions & permission == permission
+
+    def can_see(self, employee_id, department=None):
+        """Row-level check for one employee"""
+        if self.scope == SCOPE_ALL or employee_id in self.employee_ids:
+            return True
+        return self.scope == SCOPE_DEPARTMENT and department is not None and department == self.department
+
+    def _compile_row_filter(self):
+        # (SQL condition, params) for employee queries, built once; None means every row
+        if self.scope == SCOPE_ALL:
+            return None
+        ids = json.dumps(sorted(self.employee_ids))
+        if self.scope == SCOPE_DEPARTMENT and self.department:
+            return "(department = ? OR id IN (SELECT value FROM json_each(?)))", (self.department, ids)
+        return "id IN (SELECT value FROM json_each(?))", (ids,)
+
+    def __repr__(self):
+        return f"Session({self.username!r}, role={self.role!r}, scope={self.scope!r})"
+
+
+def unrestricted_session(username="system"):
+    """Everything allowed: for the command line and windows opened without signing in"""
+    return Session(username, "Administrator", ALL_PERMISSIONS, SCOPE_ALL)
+
+
+class AccessControl:
+    """Role tables of one repository"""
+
+    def __init__(self, repository):
+        self.repository = repository
+        self._seed_lock = threading.Lock()
+
+    def seed(self, roles=DEFAULT_ROLES, assignments=None):
+        """Create `roles` {name: (scope, permission names)} when no role exists yet
+
+        `assignments` {username: role} are written at the same time.
+        """
+        with self._seed_lock:
+            conn = self.repository.pool.connection()
+            if conn.execute(SQL_ROLE_COUNT).fetchone()[0]:
+                return
+            with self.repository.pool.transaction() as conn:
+                for name, (scope, permissions) in roles.items():
+                    conn.execute(SQL_INSERT_ROLE, (name, scope))
+                    conn.executemany(SQL_INSERT_ROLE_PERMISSION, ((name, permission) for permission in permissions))
+                for username, role in (assignments or {}).items():
+                    conn.execute(SQL_ASSIGN_ROLE, (username, role))
+
+    def assign(self, username, role):
+        with self.repository.pool.transaction() as conn:
+            conn.execute(SQL_ASSIGN_ROLE, (username, role))
+
+    def compile(self, username):
+        """Session for `username`: one pass over the role tables"""
+        conn = self.repository.pool.connection()
+        account = conn.execute(SQL_ACCOUNT_PROFILE, (DEFAULT_ROLE, username)).fetchone()
+        if account is None:
+            raise AccessError(f"No account {username!r}")
+        role = conn.execute(SQL_ROLE, (account["role"],)).fetchone()
+        if role is None:
+            raise AccessError(f"Role {account['role']!r} of {username!r} is not defined")
+        scope = role["scope"] if role["scope"] in SCOPES else SCOPE_SELF
+        permissions = permission_mask(row[0] for row in conn.execute(SQL_ROLE_PERMISSIONS, (role["name"],)))
+
+        employee_id = account["employee_id"]
+        employee_ids = set()
+        if employee_id is not None:
+            employee_ids.add(employee_id)
+            if scope == SCOPE_REPORTS:
+                employee_ids.update(row[0] for row in conn.execute(SQL_REPORTS, (employee_id,)))
+        return Session(account["username"], role["name"], permissions, scope,
+                       employee_id, account["department"], employee_ids)
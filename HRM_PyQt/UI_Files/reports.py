@@ -0,0 +1,79 @@
+"""CSV report exports shared by the GUI and the command line
+
+Each report is one SQL query streamed straight into csv.writer, so an
+export of every payslip of a 40k-employee run never holds more than one
+cursor batch in memory.
+"""
+import csv
+from collections import namedtuple
+from payroll import PAYSLIP_FIELDS
+
+Report = namedtuple("Report", "title header sql needs_period")
+
+
+class ReportError(Exception):
+    """Raised when a report cannot be produced with the given arguments"""
+
+
+# 'YYYY-MM-32' sorts after every real date of the month
+REPORTS = {
+    "employees": Report(
+        "Active employees",
+        ["emp_no", "name", "email", "nic", "position", "department", "category", "joined_on"],
+        """
+        SELECT emp_no, name, email, IFNULL(nic, ''), IFNULL(position, ''), IFNULL(department, ''),
+               category, IFNULL(joined_on, '')
+        FROM employees WHERE active = 1 ORDER BY emp_no
+        """,
+        False,
+    ),
+    "attendance": Report(
+        "Monthly attendance per employee",
+        ["emp_no", "name", "department", "days_present", "first_day", "last_day"],
+        """
+        SELECT e.emp_no, e.name, IFNULL(e.department, ''), COUNT(a.work_date),
+               IFNULL(MIN(a.work_date), ''), IFNULL(MAX(a.work_date), '')
+        FROM employees e
+        LEFT JOIN attendance a ON a.employee_id = e.id
+             AND a.work_date >= :period || '-01' AND a.work_date <= :period || '-32'
+        WHERE e.active = 1
+        GROUP BY e.id ORDER BY e.emp_no
+        """,
+        True,
+    ),
+    # The latest run of the period; earlier runs were superseded by it
+    "payslips": Report(
+        "Payslips of the latest payroll run",
+        ["emp_no", "name", "department", *PAYSLIP_FIELDS],
+        f"""
+        SELECT e.emp_no, e.name, IFNULL(e.department, ''), {', '.join('p.' + f for f in PAYSLIP_FIELDS)}
+        FROM payslips p JOIN employees e ON e.id = p.employee_id
+        WHERE p.run_id = (SELECT MAX(id) FROM payroll_runs WHERE period = :period)
+        ORDER BY e.emp_no
+        """,
+        True,
+    ),
+}
+
+
+def export_report(repository, name, out, period=None):
+    """Write report `name` as CSV to the text stream `out`; returns the number of data rows"""
+    report = REPORTS.get(name)
+    if report is None:
+        raise ReportError(f"Unknown report '{name}' (choose from {', '.join(sorted(REPORTS))})")
+    if report.needs_period and not period:
+        raise ReportError(f"The {name} report needs a period (YYYY-MM)")
+
+    cur = repository.pool.connection().cursor()
+    cur.row_factory = None
+    cur.arraysize = 1000
+    cur.execute(report.sql, {"period": period})
+    writer = csv.writer(out)
+    writer.writerow(report.header)
+    rows = 0
+    while True:
+        batch = cur.fetchmany()
+        if not batch:
+            return rows
+        writer.writerows(batch)
+        rows += len(batch)
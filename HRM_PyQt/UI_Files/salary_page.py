@@ -0,0 +1,103 @@
+from datetime import date
+from PyQt5.QtWidgets import (
+    QWidget, QLabel, QPushButton, QComboBox, QVBoxLayout, QHBoxLayout
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt
+from payroll import run_payroll
+from jobs import job_manager, process_pool, PROCESS_WORKERS, CANCELLED
+from theme import set_role, set_variant
+from permissions import RUN_PAYROLL, unrestricted_session
+
+# Payroll periods offered, counting back from the current month
+PERIOD_CHOICES = 12
+
+
+def recent_periods(count=PERIOD_CHOICES, today=None):
+    """'YYYY-MM' for the current month and the `count - 1` before it, newest first"""
+    today = today or date.today()
+    index = today.year * 12 + today.month - 1
+    return [f"{i // 12:04d}-{i % 12 + 1:02d}" for i in range(index, index - count, -1)]
+
+
+class SalaryPage(QWidget):
+    """Salary sidebar page: monthly payroll runs
+
+    A run is submitted as a "payroll" job; its departments are computed on
+    the shared process pool, so the window stays responsive during the run.
+    """
+
+    def __init__(self, repository, session=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository
+        self.session = session or unrestricted_session()
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(25, 25, 25, 25)
+        layout.setSpacing(15)
+
+        header = QLabel("Salary")
+        header.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        set_role(header, "heading")
+        layout.addWidget(header)
+
+        row = QHBoxLayout()
+        desc = QLabel("Compute and store the payslips of every active employee for a month.")
+        desc.setFont(QFont("Segoe UI", 11))
+        set_role(desc, "muted")
+
+        self.period_combo = QComboBox()
+        self.period_combo.setMinimumWidth(120)
+        self.period_combo.addItems(recent_periods())
+
+        self.run_btn = QPushButton("Run Payroll")
+        self.run_btn.setFixedHeight(36)
+        self.run_btn.setCursor(Qt.PointingHandCursor)
+        set_variant(self.run_btn, "primary")
+        self.run_btn.clicked.connect(lambda: self.run_payroll(self.period_combo.currentText()))
+        self.run_btn.setVisible(self.session.can(RUN_PAYROLL))
+        self.period_combo.setVisible(self.session.can(RUN_PAYROLL))
+
+        row.addWidget(desc)
+        row.addStretch()
+        row.addWidget(self.period_combo)
+        row.addWidget(self.run_btn)
+        layout.addLayout(row)
+
+        self.status_label = QLabel()
+        self.status_label.setFont(QFont("Segoe UI", 10))
+        set_role(self.status_label, "body")
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        layout.addStretch()
+
+    def run_payroll(self, period):
+        """Queue a payroll run for `period` ('YYYY-MM') and return its job (None if not allowed)"""
+        if not self.session.can(RUN_PAYROLL):
+            return None
+        self.status_label.setText(f"Payroll for {period} queued - follow it on the Jobs page.")
+        # At least two shares, so the computation always leaves this process
+        return job_manager().submit(
+            "payroll", f"Payroll {period}", run_payroll, self.repository, period,
+            workers=max(2, PROCESS_WORKERS), executor=process_pool(),
+            on_result=self._on_finished,
+            on_error=lambda message: self._on_failed(period, message),
+            on_finished=lambda job: self._on_job_ended(period, job)
+        )
+
+    def _on_finished(self, result):
+        self.status_label.setText(
+            f"Payroll for {result.period}: {result.employees:,} employees, "
+            f"gross {result.total_gross:,.2f}, net {result.total_net:,.2f} "
+            f"({result.elapsed:.1f} s)"
+        )
+
+    def _on_failed(self, period, message):
+        last_line = message.strip().splitlines()[-1]
+        self.status_label.setText(f"Payroll for {period} failed - {last_line}")
+
+    def _on_job_ended(self, period, job):
+        if job.state == CANCELLED:
+            self.status_label.setText(f"Payroll for {period} cancelled; nothing was stored.")
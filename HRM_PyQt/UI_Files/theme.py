@@ -0,0 +1,208 @@
+"""Application-wide stylesheet
+
+The whole look of the app lives in one sheet that is installed once on the
+QApplication, so Qt parses it a single time and every widget is polished
+against the same rules. Widgets opt in with an objectName or a `role` /
+`variant` property set at construction; state changes flip a dynamic
+property (`valid`, `strength`) or rely on pseudo-states such as
+:disabled and :hover instead of swapping stylesheets.
+"""
+from PyQt5.QtWidgets import QApplication
+
+# ================= Palette =================
+BRAND_TOP = "#1e3a5f"
+BRAND_BOTTOM = "#2b6cb0"
+PRIMARY = "#4299e1"
+PRIMARY_HOVER = "#3182ce"
+PRIMARY_PRESSED = "#2c5282"
+SUCCESS = "#48bb78"
+SUCCESS_HOVER = "#38a169"
+DANGER = "#e53e3e"
+WARNING = "#ed8936"
+CAUTION = "#d69e2e"
+ACCENT_PURPLE = "#9f7aea"
+HIGHLIGHT = "#fbbf24"
+TEXT = "#2d3748"
+TEXT_BODY = "#4a5568"
+TEXT_MUTED = "#718096"
+TEXT_FAINT = "#a0aec0"
+BORDER = "#e2e8f0"
+BORDER_STRONG = "#cbd5e0"
+SURFACE = "white"
+SURFACE_ALT = "#f7fafc"
+SURFACE_SUNKEN = "#edf2f7"
+BACKGROUND = "#f4f6f9"
+
+# Dashboard card accents by name (KPICard paints these itself)
+ACCENTS = {
+    "blue": PRIMARY,
+    "green": SUCCESS,
+    "orange": WARNING,
+    "purple": ACCENT_PURPLE,
+}
+
+BRAND_GRADIENT = (
+    f"qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {BRAND_TOP}, stop:1 {BRAND_BOTTOM})"
+)
+
+STYLESHEET = f"""
+/* ================= Text ================= */
+QLabel[role="heading"] {{ color: {TEXT}; }}
+QLabel[role="body"] {{ color: {TEXT_BODY}; }}
+QLabel[role="muted"] {{ color: {TEXT_MUTED}; }}
+QLabel[role="hint"] {{ color: {TEXT_FAINT}; }}
+QLabel[role="error"] {{ color: {DANGER}; padding-left: 5px; }}
+QLabel[role="success"] {{ color: {SUCCESS_HOVER}; }}
+QCheckBox {{ color: {TEXT_BODY}; }}
+
+/* ================= Inputs ================= */
+QLineEdit[role="input"] {{
+    padding: 10px 15px;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    font-size: 13px;
+    background-color: {SURFACE};
+}}
+QLineEdit[role="input"]:focus {{ border-color: {PRIMARY}; }}
+QLineEdit[valid="true"] {{ border-color: {SUCCESS_HOVER}; }}
+QLineEdit[valid="false"] {{ border-color: {DANGER}; }}
+
+/* ================= Buttons ================= */
+QPushButton[variant="primary"] {{
+    background-color: {PRIMARY};
+    color: white;
+    border-radius: 6px;
+    border: none;
+    padding: 0 16px;
+}}
+QPushButton[variant="primary"]:hover {{ background-color: {PRIMARY_HOVER}; }}
+QPushButton[variant="primary"]:pressed {{ background-color: {PRIMARY_PRESSED}; }}
+QPushButton[variant="primary"]:disabled {{ background-color: {BORDER_STRONG}; color: {TEXT_FAINT}; }}
+
+QPushButton[variant="success"] {{
+    background-color: {SUCCESS};
+    color: white;
+    border-radius: 6px;
+    border: none;
+}}
+QPushButton[variant="success"]:hover {{ background-color: {SUCCESS_HOVER}; }}
+
+QPushButton[variant="secondary"] {{
+    background-color: {BORDER};
+    color: {TEXT_BODY};
+    border-radius: 6px;
+    border: none;
+}}
+QPushButton[variant="secondary"]:hover {{ background-color: {BORDER_STRONG}; }}
+
+QPushButton[variant="link"] {{
+    background: transparent;
+    color: {PRIMARY};
+    border: none;
+    font-weight: 600;
+    padding: 5px;
+}}
+QPushButton[variant="link"]:hover {{ text-decoration: underline; color: {PRIMARY_HOVER}; }}
+
+/* ================= Brand panels (login, registration, sidebar) ================= */
+#brandPanel, #sidebar {{ background: {BRAND_GRADIENT}; }}
+#brandPanel QLabel, #sidebar QLabel {{ color: white; background: transparent; }}
+#brandPanel QLabel[role="muted"] {{ color: {BORDER}; }}
+#brandPanel QLabel[role="hint"] {{ color: rgba(255, 255, 255, 0.7); }}
+
+#sidebar QPushButton {{
+    color: white;
+    background: transparent;
+    border: none;
+    padding: 14px 18px;
+    text-align: left;
+    font-size: 14px;
+    font-weight: 500;
+}}
+#sidebar QPushButton:hover {{
+    background-color: rgba(255,255,255,0.15);
+    border-left: 4px solid {HIGHLIGHT};
+}}
+
+/* ================= Login ================= */
+#loginFormPanel, QDialog#resetPasswordDialog {{ background-color: {SURFACE}; }}
+QPushButton#signInButton {{ border-radius: 8px; padding: 0; }}
+QPushButton#passwordToggle {{
+    border: 2px solid {BORDER};
+    border-left: none;
+    border-radius: 0 8px 8px 0;
+    background-color: #f8fafc;
+    color: {TEXT_MUTED};
+    font-size: 14px;
+}}
+QPushButton#passwordToggle:hover {{ background-color: {SURFACE_SUNKEN}; color: {TEXT_BODY}; }}
+
+QProgressBar#passwordStrength {{
+    border: none;
+    background-color: {BORDER};
+    border-radius: 2px;
+}}
+QProgressBar#passwordStrength::chunk {{ border-radius: 2px; }}
+QProgressBar#passwordStrength[strength="weak"]::chunk {{ background-color: {DANGER}; }}
+QProgressBar#passwordStrength[strength="fair"]::chunk {{ background-color: {WARNING}; }}
+QProgressBar#passwordStrength[strength="good"]::chunk {{ background-color: {CAUTION}; }}
+QProgressBar#passwordStrength[strength="strong"]::chunk {{ background-color: {SUCCESS_HOVER}; }}
+
+/* ================= Registration ================= */
+QFrame#registrationFormPanel {{ background-color: {SURFACE}; border-radius: 12px; }}
+#registrationFormPanel QLabel[role="heading"] {{ color: {BRAND_TOP}; }}
+#registrationFormPanel QLabel[role="error"] {{ font-size: 10px; padding-left: 0; }}
+#registrationFormPanel QPushButton {{ border-radius: 5px; }}
+
+/* ================= Main window ================= */
+#mainWindow {{ background-color: {BACKGROUND}; }}
+#mainWindow QGraphicsView {{ background-color: {BACKGROUND}; }}
+QFrame#headerBar {{ background-color: {SURFACE}; border-bottom: 1px solid {BORDER}; }}
+QLineEdit#globalSearch {{ padding: 6px 12px; }}
+QLabel#traceOverlay {{
+    background-color: rgba(26, 32, 44, 0.85);
+    color: {BORDER};
+    border-radius: 8px;
+    padding: 8px 10px;
+}}
+
+QLineEdit#employeeSearch {{ padding: 6px 12px; }}
+QTableView#employeeTable, QTableView#jobsTable, QTableView#auditTable {{
+    background-color: {SURFACE};
+    border: none;
+    border-radius: 10px;
+    alternate-background-color: {SURFACE_ALT};
+}}
+#employeeTable QHeaderView::section, #jobsTable QHeaderView::section,
+#auditTable QHeaderView::section {{
+    background-color: {SURFACE_SUNKEN};
+    color: {TEXT_BODY};
+    padding: 6px;
+    border: none;
+    font-weight: 600;
+}}
+"""
+
+
+def apply_theme(app=None):
+    """Install the stylesheet on the application once; later calls are free
+
+    Windows call this before building their widgets, so each widget is
+    polished exactly once against the final sheet.
+    """
+    app = app or QApplication.instance()
+    if app is None or app.property("hrmThemed"):
+        return
+    app.setStyleSheet(STYLESHEET)
+    app.setProperty("hrmThemed", True)
+
+
+def set_role(widget, role):
+    """Tag a widget with a theme role before it is first polished"""
+    widget.setProperty("role", role)
+    return widget
+
+
+def set_variant(button, variant):
+    button.setProperty("variant", variant)
+    return button
@@ -0,0 +1,57 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer
+from tracing import connect_untraced, start_tracing, tracer
+
+WINDOW_S = 10.0
+
+
+class TraceOverlay(QLabel):
+    """Live event-loop figures floating over a window's bottom-right corner
+
+    Shows heartbeat lag, stalls and the slowest slots of the last WINDOW_S
+    seconds. Starts the tracer (without a trace file) if HRM_TRACE did not.
+    """
+    UPDATE_MS = 500
+    MARGIN = 12
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setObjectName("traceOverlay")
+        self.setFont(QFont("Consolas", 9))
+        self.setTextFormat(Qt.PlainText)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.UPDATE_MS)
+        # Untraced, so the overlay does not show up in its own slowest-slot list
+        connect_untraced(self.timer.timeout, self.refresh)
+
+    def toggle(self):
+        if self.isVisible():
+            self.timer.stop()
+            self.hide()
+            return
+        if tracer() is None or not tracer().running:
+            start_tracing()
+        self.refresh()
+        self.show()
+        self.raise_()
+        self.timer.start()
+
+    def refresh(self):
+        figures = tracer().summary(WINDOW_S)
+        lines = [
+            f"event loop lag  p50 {figures['lag_p50'] * 1000:6.1f} ms   p99 {figures['lag_p99'] * 1000:6.1f} ms",
+            f"stalls {figures['stalls']:>3}   longest {figures['longest_stall'] * 1000:6.0f} ms"
+            f"   (last {WINDOW_S:.0f} s)",
+        ]
+        if figures["slots"]:
+            lines.append("slowest slots")
+            for name, (calls, total, longest) in figures["slots"]:
+                lines.append(f"  {longest * 1000:7.1f} ms  x{calls:<4} {name[:48]}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.MARGIN, parent.height() - self.height() - self.MARGIN)
@@ -0,0 +1,281 @@
+"""Opt-in event-loop instrumentation: stalls, slot timings, Chrome trace output
+
+Enable with HRM_TRACE=<file.json> (or HRM_TRACE=1 for a timestamped file in
+the working directory) before starting the app; the trace is written when
+the app exits and opens in chrome://tracing or ui.perfetto.dev.
+
+Three things are recorded, all on one timeline:
+
+* Slots. While tracing, every signal connected on the GUI thread goes
+  through a timing wrapper (pyqtBoundSignal.connect is patched), so each
+  slot call shows up with its signal, e.g. textChanged -> on_username_changed.
+  Only connections made after start() are timed, which is why the
+  environment variable is read before any window is built.
+* Event-loop lag. A HEARTBEAT_MS timer notes how late each tick arrives.
+* Stalls. A watchdog thread samples the GUI thread's Python stack while
+  no tick has arrived for the stall threshold (HRM_TRACE_STALL_MS, default
+  STALL_MS); the stall and its stacks are recorded once the loop resumes.
+
+Tracing adds about two microseconds per slot call (measured by
+benchmarks/bench_tracing.py); nothing is patched or started unless it is
+enabled.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtBoundSignal
+
+STALL_MS = 100
+HEARTBEAT_MS = 20
+MAX_EVENTS = 500000         # oldest events are dropped past this
+MAX_STACK_SAMPLES = 20      # per stall
+STACK_DEPTH = 25
+LAG_RECORD_MS = 5           # heartbeat lag above this goes into the trace as a counter
+
+_original_connect = pyqtBoundSignal.connect
+_tracer = None
+
+
+def connect_untraced(signal, slot):
+    """Connect without timing (for the instrumentation's own timers)"""
+    return _original_connect(signal, slot)
+
+
+def _traced_connect(signal, slot, *args, **kwargs):
+    # Installed as pyqtBoundSignal.connect while a tracer runs
+    return _tracer._connect(signal, slot, *args, **kwargs)
+
+
+def _slot_name(slot):
+    func = getattr(slot, "__func__", slot)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or type(slot).__name__
+    if name.endswith("<lambda>"):
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            name = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return name
+
+
+def _max_args(slot):
+    """Positional arguments `slot` takes; PyQt drops the signal's extra ones, so must we"""
+    import inspect      # only needed once tracing is on; kept off the startup imports
+    try:
+        parameters = inspect.signature(slot).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    count = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+            count += 1
+    return count
+
+
+def _stack(frame):
+    return [f"{os.path.basename(entry.filename)}:{entry.lineno} {entry.name}"
+            for entry in traceback.extract_stack(frame, limit=STACK_DEPTH)]
+
+
+class Tracer:
+    """Records slot calls, heartbeat lag and stalls of the GUI thread"""
+
+    def __init__(self, path=None, stall_ms=STALL_MS):
+        self.path = path
+        self.stall_s = stall_ms / 1000
+        self.events = deque(maxlen=MAX_EVENTS)      # (kind, name, start s, duration s, args)
+        self.lags = deque(maxlen=int(60000 / HEARTBEAT_MS))     # (time s, lag s): the last minute
+        self.running = False
+        self._origin = time.perf_counter()
+        self._gui_ident = None
+        self._last_beat = 0.0
+        self._samples = []
+        self._samples_lock = threading.Lock()
+        self._watchdog = None
+        self._heartbeat = None
+
+    # -------- Control --------
+    def start(self):
+        """Begin tracing; call on the GUI thread after the QApplication exists"""
+        if self.running:
+            return
+        self.running = True
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        pyqtBoundSignal.connect = _traced_connect
+
+        self._heartbeat = QTimer()
+        self._heartbeat.setTimerType(Qt.PreciseTimer)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        connect_untraced(self._heartbeat.timeout, self._beat)
+        self._heartbeat.start()
+        self._watchdog = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        """Stop tracing and write the trace file if there is one"""
+        if not self.running:
+            return
+        self.running = False
+        pyqtBoundSignal.connect = _original_connect
+        if not sip.isdeleted(self._heartbeat):
+            self._heartbeat.stop()
+        if self.path:
+            self.save(self.path)
+
+    # -------- Slots --------
+    def _connect(self, signal, slot, *args, **kwargs):
+        # Only Python slots connected on the GUI thread are timed; Qt's own methods (timer.start,
+        # widget.close) and signal-to-signal connections keep PyQt's overload resolution
+        if (self.running and hasattr(getattr(slot, "__func__", slot), "__code__")
+                and threading.get_ident() == self._gui_ident):
+            slot = self._timed(signal, slot)
+        return _original_connect(signal, slot, *args, **kwargs)
+
+    def _timed(self, signal, slot):
+        name = _slot_name(slot)
+        signal_name = signal.signal.lstrip("0123456789")
+        limit = _max_args(slot)
+        events = self.events
+        origin = self._origin
+        receiver = getattr(slot, "__self__", None)
+        if isinstance(receiver, QObject):
+            # Hold the receiver weakly, as PyQt does, and skip it once Qt has deleted it
+            method = weakref.WeakMethod(slot)
+
+            def target():
+                bound = method()
+                return None if bound is None or sip.isdeleted(bound.__self__) else bound
+        else:
+            def target():
+                return slot
+
+        def timed_slot(*args):
+            call = target()
+            if call is None:
+                return None
+            if limit is not None:
+                args = args[:limit]
+            started = time.perf_counter()
+            try:
+                return call(*args)
+            finally:
+                events.append(("slot", name, started - origin, time.perf_counter() - started, signal_name))
+
+        return timed_slot
+
+    # -------- Heartbeat and stalls --------
+    def _beat(self):
+        now = time.perf_counter()
+        lag = now - self._last_beat - HEARTBEAT_MS / 1000
+        self._last_beat = now
+        self.lags.append((now - self._origin, max(0.0, lag)))
+        if lag * 1000 >= LAG_RECORD_MS:
+            self.events.append(("lag", "event loop lag", now - self._origin, 0.0, lag))
+        # Stacks sampled during a gap that stayed just under the threshold are dropped here
+        with self._samples_lock:
+            samples, self._samples = self._samples, []
+        if lag >= self.stall_s:
+            self.events.append(("stall", "stall", now - lag - self._origin, lag, samples))
+
+    def _watch(self):
+        # Wakes twice per threshold: a stall is sampled at least once, and every half threshold after
+        while self.running:
+            time.sleep(self.stall_s / 2)
+            if time.perf_counter() - self._last_beat < self.stall_s:
+                continue
+            frame = sys._current_frames().get(self._gui_ident)
+            if frame is None:
+                continue
+            stack = _stack(frame)
+            with self._samples_lock:
+                if len(self._samples) < MAX_STACK_SAMPLES:
+                    self._samples.append((time.perf_counter() - self._origin, stack))
+
+    # -------- Summaries --------
+    def summary(self, window_s=10.0, top=5):
+        """Figures for the overlay over the last `window_s` seconds"""
+        since = time.perf_counter() - self._origin - window_s
+        lags = sorted(lag for at, lag in list(self.lags) if at >= since)
+        stalls, slots = [], {}
+        for kind, name, start, duration, _ in reversed(list(self.events)):
+            if start < since:
+                break
+            if kind == "stall":
+                stalls.append(duration)
+            elif kind == "slot":
+                calls, total, longest = slots.get(name, (0, 0.0, 0.0))
+                slots[name] = (calls + 1, total + duration, max(longest, duration))
+        slowest = sorted(slots.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        return {
+            "lag_p50": lags[len(lags) // 2] if lags else 0.0,
+            "lag_p99": lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0,
+            "stalls": len(stalls),
+            "longest_stall": max(stalls, default=0.0),
+            "slots": slowest,
+        }
+
+    # -------- Output --------
+    def trace_events(self):
+        """The recording as Chrome trace event dicts (timestamps in microseconds)"""
+        pid = os.getpid()
+        tid = self._gui_ident or 0
+        trace = [
+            {"ph": "M", "name": "process_name", "pid": pid, "tid": tid, "args": {"name": "HRM"}},
+            {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": "GUI thread"}},
+        ]
+        for kind, name, start, duration, extra in list(self.events):
+            ts = round(start * 1e6, 1)
+            if kind == "slot":
+                trace.append({"ph": "X", "cat": "slot", "name": name, "pid": pid, "tid": tid,
+                              "ts": ts, "dur": round(duration * 1e6, 1), "args": {"signal": extra}})
+            elif kind == "lag":
+                trace.append({"ph": "C", "name": name, "pid": pid, "tid": tid, "ts": ts,
+                              "args": {"ms": round(extra * 1000, 2)}})
+            else:
+                trace.append({"ph": "X", "cat": "stall", "name": f"stall {duration * 1000:.0f} ms",
+                              "pid": pid, "tid": tid, "ts": ts, "dur": round(duration * 1e6, 1),
+                              "args": {"samples": [{"at_ms": round((at - start) * 1000, 1), "stack": stack}
+                                                   for at, stack in extra]}})
+                for at, stack in extra:
+                    trace.append({"ph": "i", "cat": "stall", "name": stack[-1] if stack else "?",
+                                  "s": "t", "pid": pid, "tid": tid, "ts": round(at * 1e6, 1),
+                                  "args": {"stack": stack}})
+        return trace
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
+
+
+def tracer():
+    """The active Tracer, or None when tracing is off"""
+    return _tracer
+
+
+def start_tracing(path=None, stall_ms=STALL_MS):
+    """Start the app-wide tracer (idempotent); the trace is written to `path` at exit"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path, stall_ms)
+        atexit.register(_tracer.stop)
+    _tracer.start()
+    return _tracer
+
+
+def install_from_environment():
+    """Start tracing when HRM_TRACE is set; returns the tracer or None"""
+    setting = os.environ.get("HRM_TRACE", "")
+    if not setting or setting == "0":
+        return None
+    path = time.strftime("hrm_trace_%Y%m%d_%H%M%S.json") if setting == "1" else setting
+    return start_tracing(os.path.abspath(path), int(os.environ.get("HRM_TRACE_STALL_MS", STALL_MS)))
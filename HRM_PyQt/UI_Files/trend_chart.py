@@ -0,0 +1,303 @@
+"""Line charts for long attendance histories
+
+A TrendChart keeps every point of its series in growable numpy buffers but
+hands QtCharts only what the plot can show: the visible x range is cut into
+one bucket per horizontal pixel and each bucket contributes its lowest and
+highest point (or, with mode="lttb", the point that keeps the most visual
+area), so a series of several hundred thousand points redraws about as fast
+as one of a thousand and spikes never disappear between pixels. Zooming in
+(drag across the plot; right click zooms back out) re-samples the narrower
+range, so detail comes back as the window shrinks.
+
+append() writes new points into the buffers in place. While the whole series
+is drawn point for point they are appended to the QLineSeries directly;
+otherwise one redraw is scheduled for the next event loop pass, however many
+batches arrive before it runs.
+
+Above LARGE_SERIES_POINTS the chart drops its animations and the view its
+antialiasing; both come back if the series shrinks again.
+"""
+import math
+
+import numpy as np
+from PyQt5.QtChart import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
+from PyQt5.QtCore import Qt, QDateTime, QTimer
+from PyQt5.QtGui import QFont, QPainter, QPolygonF
+
+LARGE_SERIES_POINTS = 5000
+MIN_BUCKETS = 100
+Y_TICKS = 5
+
+# Days are plotted at noon UTC so the axis shows the right date in any time zone
+NOON_MS = 12 * 3600 * 1000
+
+
+# ================= Downsampling =================
+def minmax_indices(y, buckets):
+    """Indices of the lowest and highest value in each of `buckets` equal index slices
+
+    Fully vectorised; the first and last points are always kept. Returns
+    every index when the series already fits.
+    """
+    n = len(y)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    # Pad the last bucket with its final value: argmin/argmax return the first
+    # occurrence, so a padding slot is never picked over the real point.
+    grid = np.empty(buckets * size, dtype=np.float64)
+    grid[:n] = y
+    grid[n:] = y[-1]
+    grid = grid.reshape(buckets, size)
+    base = np.arange(buckets) * size
+    picked = np.concatenate(([0, n - 1], base + grid.argmin(axis=1), base + grid.argmax(axis=1)))
+    return np.unique(picked)
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets: `threshold` indices that best keep the line's shape
+
+    Slower than minmax_indices (one small numpy step per output point) but
+    gives a smoother line for noisy series.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    counts = np.diff(edges)
+    # Average of each bucket, and for each bucket the average of the next one
+    avg_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    next_x = np.append(avg_x[1:], x[n - 1]).tolist()
+    next_y = np.append(avg_y[1:], y[n - 1]).tolist()
+    edges = edges.tolist()
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+DOWNSAMPLERS = {
+    "minmax": lambda x, y, width: minmax_indices(y, width),
+    "lttb": lambda x, y, width: lttb_indices(x, y, width),
+}
+
+
+# ================= Axes =================
+def _nice_number(x, ceiling):
+    z = 10 ** math.floor(math.log10(x))
+    q = x / z
+    if ceiling:
+        q = 1 if q <= 1 else 2 if q <= 2 else 5 if q <= 5 else 10
+    else:
+        q = 1 if q < 1.5 else 2 if q < 3 else 5 if q < 7 else 10
+    return q * z
+
+
+def nice_range(low, high, ticks):
+    """(low, high, ticks) rounded out to round steps, as QValueAxis.applyNiceNumbers() would
+
+    Computed here so the axis takes one range change instead of two.
+    """
+    step = _nice_number(_nice_number(high - low, True) / (ticks - 1), False)
+    low, high = math.floor(low / step), math.ceil(high / step)
+    return low * step, high * step, int(high - low) + 1
+
+
+def dates_to_msecs(dates):
+    """ISO dates -> float milliseconds since the epoch, as QDateTimeAxis expects"""
+    days = np.asarray(dates, dtype="datetime64[D]")
+    return days.astype("datetime64[ms]").astype(np.float64) + NOON_MS
+
+
+def _polygon(x, y):
+    """Pack coordinates straight into a QPolygonF, without a QPointF per point"""
+    polygon = QPolygonF(len(x))
+    if len(x):
+        buffer = polygon.data()
+        buffer.setsize(len(x) * 16)
+        coords = np.frombuffer(buffer, dtype=np.float64)
+        coords[0::2] = x
+        coords[1::2] = y
+    return polygon
+
+
+# ================= Chart =================
+class TrendChart(QChartView):
+    """Date/value line chart that stays responsive with very long series"""
+
+    def __init__(self, title="", mode="minmax", parent=None):
+        super().__init__(QChart(), parent)
+        self.downsample = DOWNSAMPLERS[mode]
+        self._x = np.empty(1024, dtype=np.float64)
+        self._y = np.empty(1024, dtype=np.float64)
+        self._count = 0
+        # x range the user zoomed to; None shows (and follows) the whole series
+        self._view_range = None
+        self._drawn_raw = True
+        self._setting_axes = False
+        self._y_wanted = None
+        self._large = None
+
+        chart = self.chart()
+        chart.setTitle(title)
+        chart.setTitleFont(QFont("Segoe UI", 12, QFont.Bold))
+        chart.legend().setVisible(False)
+        chart.setBackgroundRoundness(12)
+        chart.setBackgroundBrush(Qt.white)
+
+        self.series = QLineSeries()
+        self.series.setColor(Qt.darkBlue)
+        chart.addSeries(self.series)
+
+        self.axis_x = QDateTimeAxis()
+        self.axis_x.setFormat("MMM yyyy")
+        self.axis_x.setTickCount(7)
+        self.axis_y = QValueAxis()
+        self.axis_y.setLabelFormat("%d")
+        chart.addAxis(self.axis_x, Qt.AlignBottom)
+        chart.addAxis(self.axis_y, Qt.AlignLeft)
+        self.series.attachAxis(self.axis_x)
+        self.series.attachAxis(self.axis_y)
+        self.axis_x.rangeChanged.connect(self._on_zoomed)
+
+        self.setRubberBand(QChartView.HorizontalRubberBand)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self.redraw)
+        self._apply_render_mode()
+
+    def __len__(self):
+        return self._count
+
+    # -------- Data --------
+    def set_data(self, x, y):
+        """Replace the whole series (x in epoch milliseconds, ascending)"""
+        self._count = 0
+        self._view_range = None
+        self._store(x, y)
+        self.schedule_redraw()
+
+    def append(self, x, y):
+        """Add points to the end of the series
+
+        Points at or before the current last x replace the tail from there on,
+        so re-sending the most recent (still changing) day updates it in place.
+        """
+        previous = self._count
+        x, y, start = self._store(x, y)
+        if not len(x):
+            return
+        if (self._drawn_raw and start == previous and self._view_range is None
+                and not self._redraw_timer.isActive() and self._count <= 2 * self._pixel_width()):
+            self.series.append(_polygon(x, y))
+            self._fit_axes(self._x[:self._count], self._y[:self._count])
+            self._apply_render_mode()
+        else:
+            self.schedule_redraw()
+
+    def clear(self):
+        self._count = 0
+        self._view_range = None
+        self.schedule_redraw()
+
+    def _store(self, x, y):
+        """Write points into the buffers from the first x not before x[0]; returns (x, y, start)"""
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        start = int(np.searchsorted(self._x[:self._count], x[0])) if len(x) else self._count
+        end = start + len(x)
+        self._reserve(end)
+        self._x[start:end] = x
+        self._y[start:end] = y
+        self._count = end
+        return x, y, start
+
+    def _reserve(self, size):
+        if size > len(self._x):
+            capacity = max(size, 2 * len(self._x))
+            self._x = np.resize(self._x, capacity)
+            self._y = np.resize(self._y, capacity)
+
+    # -------- Drawing --------
+    def schedule_redraw(self):
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start(0)
+
+    def redraw(self):
+        """Re-sample the visible range to the plot width and swap it into the series"""
+        self._redraw_timer.stop()
+        x, y = self._x[:self._count], self._y[:self._count]
+        lo, hi = 0, len(x)
+        if self._view_range is not None and len(x):
+            # One point beyond each edge so the line runs to the plot border
+            lo = max(0, int(np.searchsorted(x, self._view_range[0])) - 1)
+            hi = min(len(x), int(np.searchsorted(x, self._view_range[1], side="right")) + 1)
+        x, y = x[lo:hi], y[lo:hi]
+
+        picked = self.downsample(x, y, self._pixel_width())
+        self._drawn_raw = len(picked) == len(x)
+        if not self._drawn_raw:
+            x, y = x[picked], y[picked]
+        self.series.replace(_polygon(x, y))
+        self._fit_axes(x, y)
+        self._apply_render_mode()
+
+    def _pixel_width(self):
+        width = int(self.chart().plotArea().width()) or self.width()
+        return max(MIN_BUCKETS, width)
+
+    def _fit_axes(self, x, y):
+        self._setting_axes = True
+        try:
+            if self._view_range is not None:
+                first, last = self._view_range
+            elif len(x):
+                first, last = x[0], x[-1]
+            else:
+                first = last = QDateTime.currentMSecsSinceEpoch()
+            self.axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(first)),
+                                 QDateTime.fromMSecsSinceEpoch(int(last)))
+            top = float(y.max()) if len(y) else 0.0
+            bottom = min(0.0, float(y.min())) if len(y) else 0.0
+            # Each range change re-lays out the whole chart (a few ms), and an
+            # append rarely moves the extremes: only touch the axis when they move
+            wanted = (bottom, max(1.0, top * 1.05))
+            if wanted != self._y_wanted:
+                self._y_wanted = wanted
+                low, high, ticks = nice_range(*wanted, Y_TICKS)
+                if ticks != self.axis_y.tickCount():
+                    self.axis_y.setTickCount(ticks)
+                self.axis_y.setRange(low, high)
+        finally:
+            self._setting_axes = False
+
+    def _apply_render_mode(self):
+        large = self._count > LARGE_SERIES_POINTS
+        if large != self._large:
+            self._large = large
+            self.chart().setAnimationOptions(QChart.NoAnimation if large else QChart.SeriesAnimations)
+            self.setRenderHint(QPainter.Antialiasing, not large)
+
+    # -------- Zoom --------
+    def _on_zoomed(self, first, last):
+        if self._setting_axes:
+            return
+        first, last = first.toMSecsSinceEpoch(), last.toMSecsSinceEpoch()
+        if not self._count or (first <= self._x[0] and last >= self._x[self._count - 1]):
+            self._view_range = None
+        else:
+            self._view_range = (first, last)
+        self.schedule_redraw()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_redraw()
@@ -0,0 +1,144 @@
+import re
+import string
+from collections import namedtuple
+
+
+class ValidationResult(namedtuple("ValidationResult", "state message strength")):
+    """state is "" (nothing entered), "true" or "false", matching the `valid` stylesheet property"""
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        return self.state == "true"
+
+
+NEUTRAL = ValidationResult("", "", 0)
+VALID = ValidationResult("true", "", 0)
+
+# ================= Character classes =================
+UPPER = frozenset(string.ascii_uppercase)
+LOWER = frozenset(string.ascii_lowercase)
+DIGITS = frozenset(string.digits)
+SYMBOLS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?/")
+USERNAME_FORBIDDEN = frozenset('<>"\';()[]{}|\\/')
+ASCII = frozenset(map(chr, range(128)))
+
+EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+DOMAIN_TLD_RE = re.compile(r"\.[^.]{2,}$")
+
+POSITIONS = ("HR", "Project Manager", "Director")
+EMAIL_TAKEN = "Email is already registered"
+CATEGORIES = ("Staff", "Labour")
+
+
+class CharacterProfile:
+    """Which character classes a string contains, from a single pass over it"""
+    __slots__ = ("chars", "upper", "lower", "digit", "symbol")
+
+    def __init__(self, text):
+        chars = set(text)
+        self.chars = chars
+        self.upper = not chars.isdisjoint(UPPER)
+        self.lower = not chars.isdisjoint(LOWER)
+        self.digit = not chars.isdisjoint(DIGITS)
+        self.symbol = not chars.isdisjoint(SYMBOLS)
+        if not chars <= ASCII:
+            # Only non-ASCII characters need the slower Unicode-aware checks
+            for c in chars - ASCII:
+                self.upper = self.upper or c.isupper()
+                self.lower = self.lower or c.islower()
+                self.digit = self.digit or c.isdigit()
+
+
+# ================= Rules =================
+# A rule is (predicate(text, profile) -> bool, message shown when it fails).
+# Rules run in order and the first failure wins unless a field collects them.
+def min_length(n, message):
+    return (lambda text, profile: len(text) >= n, message)
+
+
+def login_email_domain(text, profile):
+    if "@" not in profile.chars:
+        return True
+    domain = text.partition("@")[2].partition("@")[0]
+    return DOMAIN_TLD_RE.search(domain) is not None
+
+
+USERNAME_RULES = [
+    min_length(3, "Username must be at least 3 characters"),
+    (login_email_domain, "Please enter a valid email address"),
+    (lambda text, profile: profile.chars.isdisjoint(USERNAME_FORBIDDEN), "Contains invalid characters"),
+]
+
+LOGIN_PASSWORD_RULES = [
+    min_length(6, "Minimum 6 characters"),
+    (lambda text, profile: profile.upper, "At least one uppercase letter"),
+    (lambda text, profile: profile.digit, "At least one number"),
+]
+
+NAME_RULES = [min_length(3, "Name must be at least 3 characters")]
+EMAIL_RULES = [(lambda text, profile: EMAIL_RE.match(text) is not None, "Invalid email format")]
+REGISTRATION_PASSWORD_RULES = [min_length(6, "Password must be at least 6 characters")]
+
+
+def password_strength(text, profile):
+    """0-100 score from length and character variety"""
+    length = len(text)
+    strength = 25 if length >= 8 else 15 if length >= 6 else 0
+    return min(100, strength + 20 * (profile.upper + profile.lower + profile.digit + profile.symbol))
+
+
+def strength_level(strength):
+    if strength >= 80:
+        return "strong"
+    if strength >= 60:
+        return "good"
+    if strength >= 40:
+        return "fair"
+    return "weak"
+
+
+def run_rules(rules, text, profile, collect=0):
+    """First failing message, or the first `collect` failures joined with ' • '"""
+    if not collect:
+        for check, message in rules:
+            if not check(text, profile):
+                return message
+        return ""
+    failures = [message for check, message in rules if not check(text, profile)]
+    return " • ".join(failures[:collect])
+
+
+# ================= Field checks =================
+def check_username(text):
+    text = text.strip()
+    if not text:
+        return NEUTRAL
+    message = run_rules(USERNAME_RULES, text, CharacterProfile(text))
+    return ValidationResult("false", message, 0) if message else VALID
+
+
+def check_login_password(text):
+    text = text.strip()
+    if not text:
+        return NEUTRAL
+    profile = CharacterProfile(text)
+    strength = password_strength(text, profile)
+    message = run_rules(LOGIN_PASSWORD_RULES, text, profile, collect=2)
+    return ValidationResult("false" if message else "true", message, strength)
+
+
+def check_name(text):
+    text = text.strip()
+    message = run_rules(NAME_RULES, text, None)
+    return ValidationResult("false", message, 0) if message else VALID
+
+
+def check_email(text):
+    message = run_rules(EMAIL_RULES, text, None)
+    return ValidationResult("false", message, 0) if message else VALID
+
+
+def check_registration_password(text):
+    message = run_rules(REGISTRATION_PASSWORD_RULES, text, None)
+    return ValidationResult("false", message, 0) if message else VALID
@@ -0,0 +1,241 @@
+"""Working days per site and shift pattern, counted in constant time
+
+A shift pattern is a working week, Monday first ("1111100" is Monday to
+Friday). Patterns can be defined company-wide (site '') or overridden per
+site, holidays close one site or all of them, and each employee works one
+pattern at one site (work_assignments; unassigned employees work the
+standard week at no particular site).
+
+WorkCalendar lays every (site, pattern) out as a row of day flags over a
+span of whole years and keeps a running total alongside, so the working
+days between any two dates are one subtraction:
+
+    prefix[row, end + 1] - prefix[row, start]
+
+working_days_bulk() does the same for whole arrays of date ranges at once,
+which is how a payroll run pro-rates every employee in one step.
+
+work_calendar(repository) returns a shared calendar that is rebuilt only
+when patterns or holidays change (any process bumps `calendar_version` in
+app_settings when it writes them) or a year outside the span is needed.
+"""
+import threading
+from datetime import date
+
+import numpy as np
+
+DEFAULT_PATTERN = "standard"
+# Company-wide patterns used until the work_patterns table says otherwise
+DEFAULT_PATTERNS = {
+    "standard": "1111100",
+    "six-day": "1111110",
+    "continuous": "1111111",
+}
+YEARS_BACK = 5
+YEARS_AHEAD = 2
+
+SQL_PATTERNS = "SELECT site, pattern, week FROM work_patterns"
+SQL_HOLIDAYS = "SELECT site, holiday_date FROM holidays"
+SQL_ASSIGNMENT = "SELECT site, pattern FROM work_assignments WHERE employee_id = ?"
+SQL_VERSION = "SELECT value FROM app_settings WHERE key = 'calendar_version'"
+SQL_BUMP_VERSION = """
+    INSERT INTO app_settings (key, value) VALUES ('calendar_version', '1')
+    ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+"""
+SQL_SET_PATTERN = """
+    INSERT INTO work_patterns (site, pattern, week) VALUES (?, ?, ?)
+    ON CONFLICT(site, pattern) DO UPDATE SET week = excluded.week
+"""
+SQL_ADD_HOLIDAY = """
+    INSERT INTO holidays (holiday_date, site, name) VALUES (?, ?, ?)
+    ON CONFLICT(holiday_date, site) DO UPDATE SET name = excluded.name
+"""
+SQL_REMOVE_HOLIDAY = "DELETE FROM holidays WHERE holiday_date = ? AND site = ?"
+SQL_ASSIGN = """
+    INSERT INTO work_assignments (employee_id, site, pattern) VALUES (?, ?, ?)
+    ON CONFLICT(employee_id) DO UPDATE SET site = excluded.site, pattern = excluded.pattern
+"""
+
+
+class CalendarError(Exception):
+    """Raised for unknown shift patterns, malformed weeks and dates outside the calendar"""
+
+
+def _check_week(week):
+    if len(week) != 7 or set(week) - {"0", "1"}:
+        raise CalendarError(f"A working week is seven 0/1 flags, Monday first (got {week!r})")
+
+
+class WorkCalendar:
+    """Working-day flags and running totals for every (site, pattern) over whole years
+
+    `weeks` maps (site, pattern) to a week string; site '' entries apply to
+    every site without its own. `holidays` maps a site ('' for all) to ISO
+    dates. Sites with neither get the company rows (see row()).
+    """
+
+    def __init__(self, first_year, last_year, weeks, holidays=None):
+        holidays = holidays or {}
+        self.first_year, self.last_year = first_year, last_year
+        self.first = np.datetime64(date(first_year, 1, 1), "D")
+        self.days = (np.datetime64(date(last_year + 1, 1, 1), "D") - self.first).astype(np.int64)
+
+        company = {pattern: week for (site, pattern), week in weeks.items() if site == ""}
+        every_site = {""} | {site for site, _ in weeks} | set(holidays)
+        self.rows = {}
+        row_weeks, row_sites = [], []
+        for site in sorted(every_site):
+            patterns = dict(company)
+            patterns.update({pattern: week for (s, pattern), week in weeks.items() if s == site})
+            for pattern, week in sorted(patterns.items()):
+                _check_week(week)
+                self.rows[(site, pattern)] = len(row_weeks)
+                row_weeks.append(week)
+                row_sites.append(site)
+
+        # Day 0 of the span is first_year-01-01; weekdays count from Monday, as in the week strings
+        weekday = (np.arange(self.days) + date(first_year, 1, 1).weekday()) % 7
+        week_flags = np.array([[flag == "1" for flag in week] for week in row_weeks], dtype=bool)
+        self.working = week_flags[:, weekday]
+        for row, site in enumerate(row_sites):
+            for holiday_site in {"", site}:
+                closed = self._offsets(holidays.get(holiday_site, ()))
+                self.working[row, closed[(closed >= 0) & (closed < self.days)]] = False
+
+        # prefix[row, i] = working days before day i, so a range is two reads
+        self.prefix = np.zeros((len(row_weeks), self.days + 1), dtype=np.int32)
+        np.cumsum(self.working, axis=1, out=self.prefix[:, 1:])
+
+    def _offsets(self, days):
+        return (np.asarray(days, dtype="datetime64[D]") - self.first).astype(np.int64)
+
+    def covers(self, year):
+        return self.first_year <= year <= self.last_year
+
+    # -------- Single lookups --------
+    def row(self, site="", pattern=DEFAULT_PATTERN):
+        """Row of (site, pattern); a site the calendar has never seen gets the company row"""
+        row = self.rows.get((site or "", pattern or DEFAULT_PATTERN))
+        if row is None:
+            row = self.rows.get(("", pattern or DEFAULT_PATTERN))
+            if row is None:
+                raise CalendarError(f"Unknown shift pattern: {pattern}")
+        return row
+
+    def _offset(self, day):
+        offset = day.toordinal() - date(self.first_year, 1, 1).toordinal()
+        if not 0 <= offset < self.days:
+            raise CalendarError(f"{day} is outside the calendar ({self.first_year}-{self.last_year})")
+        return offset
+
+    def is_working_day(self, day, site="", pattern=DEFAULT_PATTERN):
+        return bool(self.working[self.row(site, pattern), self._offset(day)])
+
+    def working_days(self, start, end, site="", pattern=DEFAULT_PATTERN):
+        """Working days from `start` to `end` inclusive (0 if end is before start)"""
+        if end < start:
+            return 0
+        prefix = self.prefix[self.row(site, pattern)]
+        return int(prefix[self._offset(end) + 1] - prefix[self._offset(start)])
+
+    # -------- Bulk lookups --------
+    def rows_for(self, sites, patterns):
+        """Rows for parallel sequences of sites and patterns (e.g. the columns of a query)
+
+        Each distinct pair is resolved once; the per-employee mapping is a C-level dict lookup.
+        """
+        pairs = list(zip(sites, patterns))
+        lookup = {pair: self.row(*pair) for pair in set(pairs)}
+        return np.fromiter(map(lookup.__getitem__, pairs), dtype=np.int64, count=len(pairs))
+
+    def working_days_bulk(self, starts, ends, rows):
+        """Element-wise working days from starts to ends inclusive
+
+        `starts` and `ends` are datetime64[D] arrays (or anything numpy
+        converts to them); `rows` come from rows_for(). Ranges that end
+        before they start count 0, as in working_days(); any other range
+        reaching outside the calendar raises CalendarError.
+        """
+        first = self._offsets(starts)
+        last = self._offsets(ends) + 1
+        counted = last > first
+        outside = counted & ((first < 0) | (last > self.days))
+        if outside.any():
+            i = int(np.argmax(outside))
+            raise CalendarError(f"{np.datetime_as_string(np.asarray(starts, dtype='datetime64[D]')[i])} to "
+                                f"{np.datetime_as_string(np.asarray(ends, dtype='datetime64[D]')[i])} is "
+                                f"outside the calendar ({self.first_year}-{self.last_year})")
+        first = np.where(counted, first, 0)
+        last = np.where(counted, last, 0)
+        return self.prefix[rows, last] - self.prefix[rows, first]
+
+
+# ================= Shared calendars =================
+_calendars = {}
+_calendars_lock = threading.Lock()
+
+
+def load_calendar(conn, first_year, last_year):
+    """Build a WorkCalendar from the calendar tables"""
+    weeks = {("", pattern): week for pattern, week in DEFAULT_PATTERNS.items()}
+    weeks.update({(site, pattern): week for site, pattern, week in conn.execute(SQL_PATTERNS)})
+    holidays = {}
+    for site, day in conn.execute(SQL_HOLIDAYS):
+        holidays.setdefault(site, []).append(day)
+    return WorkCalendar(first_year, last_year, weeks, holidays)
+
+
+def work_calendar(repository, years=()):
+    """The shared calendar for `repository`, covering this year's span and every one of `years`"""
+    conn = repository.pool.connection()
+    row = conn.execute(SQL_VERSION).fetchone()
+    version = row[0] if row else "0"
+    this_year = date.today().year
+    with _calendars_lock:
+        entry = _calendars.get(repository.pool.path)
+        if entry is not None and entry[0] == version and all(entry[1].covers(year) for year in years):
+            return entry[1]
+        first_year = min([this_year - YEARS_BACK, *years])
+        last_year = max([this_year + YEARS_AHEAD, *years])
+        if entry is not None and entry[0] == version:
+            # Only widening: keep every year the current calendar already covers
+            first_year = min(first_year, entry[1].first_year)
+            last_year = max(last_year, entry[1].last_year)
+        calendar = load_calendar(conn, first_year, last_year)
+        _calendars[repository.pool.path] = (version, calendar)
+        return calendar
+
+
+def employee_work_pattern(repository, employee_id):
+    """(site, pattern) the employee works; the standard week for unassigned employees"""
+    row = repository.pool.connection().execute(SQL_ASSIGNMENT, (employee_id,)).fetchone()
+    return (row[0], row[1]) if row else ("", DEFAULT_PATTERN)
+
+
+# ================= Changes =================
+def set_work_pattern(repository, pattern, week, site=""):
+    """Define or change the working week of `pattern` at `site` ('' = company-wide)"""
+    _check_week(week)
+    with repository.pool.transaction() as conn:
+        conn.execute(SQL_SET_PATTERN, (site, pattern, week))
+        conn.execute(SQL_BUMP_VERSION)
+
+
+def add_holiday(repository, day, name, site=""):
+    """Close `site` (every site for '') on `day`"""
+    with repository.pool.transaction() as conn:
+        conn.execute(SQL_ADD_HOLIDAY, (day.isoformat(), site, name))
+        conn.execute(SQL_BUMP_VERSION)
+
+
+def remove_holiday(repository, day, site=""):
+    with repository.pool.transaction() as conn:
+        conn.execute(SQL_REMOVE_HOLIDAY, (day.isoformat(), site))
+        conn.execute(SQL_BUMP_VERSION)
+
+
+def assign_work_pattern(repository, employee_id, site="", pattern=DEFAULT_PATTERN):
+    """Set the site and shift pattern an employee works"""
+    work_calendar(repository).row(site, pattern)    # CalendarError for an unknown pattern
+    with repository.pool.transaction() as conn:
+        conn.execute(SQL_ASSIGN, (employee_id, site, pattern))
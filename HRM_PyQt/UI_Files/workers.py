@@ -0,0 +1,73 @@
+import sys
+import traceback
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker (delivered on the GUI thread)"""
+    result = pyqtSignal(object)
+    progress = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """Run a function on the application thread pool and report back through signals"""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            self.signals.error.emit(traceback.format_exc())
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+_pool = None
+
+
+def thread_pool():
+    """The pool background work runs on
+
+    Deliberately not QThreadPool.globalInstance(): Qt splits image format
+    conversion and scaling across that pool and waits for the pieces on the
+    calling thread while it still holds the GIL. A Python job occupying the
+    global pool would then wait for the GIL forever.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+    return _pool
+
+
+def run_in_background(fn, *args, on_result=None, on_error=None, on_progress=None, **kwargs):
+    """Start fn(*args, **kwargs) on thread_pool() and return the Worker
+
+    For short tasks (validation lookups, dashboard refreshes). Long
+    operations are submitted to jobs.job_manager(), which runs them on a
+    pool of its own, and CPU-heavy steps go to jobs.process_pool().
+
+    With on_progress, fn also receives a `progress` callback whose arguments
+    are delivered to on_progress on the GUI thread as a tuple.
+    """
+    worker = Worker(fn, *args, **kwargs)
+    if on_progress is not None:
+        signals = worker.signals
+        worker.kwargs["progress"] = lambda *values: signals.progress.emit(values)
+        worker.signals.progress.connect(on_progress)
+    if on_result is not None:
+        worker.signals.result.connect(on_result)
+    if on_error is not None:
+        worker.signals.error.connect(on_error)
+    thread_pool().start(worker)
+    return worker
@@ -0,0 +1,123 @@
+"""Audit log benchmark
+
+Records N events from several threads through the public record() call
+(the cost every audited action pays), waits for the writer to commit them
+across rotated segments, then times the viewer's queries over the whole log:
+everything, one user, one event family and a narrow time window, plus
+decoding the first screenful of a result. Finally cuts the last segment's
+index short, as a crash between the two writes would, and checks that
+reopening the log indexes the lost lines again.
+
+    python benchmarks/bench_audit.py --events 2000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from audit import INDEX_DTYPE, INDEX_SUFFIX, AuditLog, AuditReader, _segments  # noqa: E402
+
+RECORD_P99_BUDGET_US = 50.0
+QUERY_BUDGET_MS = 500.0
+SCREEN_ROWS = 40
+USERS = [f"user{i:03d}" for i in range(200)]
+EVENTS = ["login.success", "login.failure", "employee.register", "loan.create", "loan.settle",
+          "loan.reschedule", "payroll.run"]
+
+
+def produce(log, count, seed, latencies):
+    for i in range(count):
+        n = seed + i
+        started = time.perf_counter()
+        log.record(EVENTS[n % len(EVENTS)], user=USERS[n % len(USERS)], loan_id=n, amount=n % 100000)
+        if i % 100 == 0:
+            latencies.append(time.perf_counter() - started)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:<34} {elapsed:8.1f} ms   {len(result):>10,} entries")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--segment-mb", type=int, default=32)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="hrm_audit_")
+    log = AuditLog(directory, segment_bytes=args.segment_mb * 1024 * 1024)
+    latencies = []
+    per_thread = args.events // args.threads
+    threads = [threading.Thread(target=produce, args=(log, per_thread, t * per_thread, latencies))
+               for t in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    queued = time.perf_counter() - start
+    log.flush()
+    written = time.perf_counter() - start
+    total = per_thread * args.threads
+    segments = _segments(directory)
+    size = sum(os.path.getsize(path) for _, path in segments)
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1e6
+    print(f"record() {total:,} events             p99 {p99:6.1f} us   "
+          f"{'OK' if p99 < RECORD_P99_BUDGET_US else 'SLOW'}")
+    print(f"queued in {queued:.2f}s, on disk in {written:.2f}s   ({total / written:,.0f} events/s, "
+          f"{size / 2 ** 20:,.0f} MB in {len(segments)} segments)")
+
+    reader = AuditReader(directory)
+    everything, _ = timed("query everything", lambda: reader.query())
+    first, last = everything[len(everything) - 1].ts, everything[0].ts
+    middle = (first + last) // 2
+    window = max(1, (last - first) // 100)
+    slowest = 0.0
+    for label, kwargs in (
+        ("query one user", {"user": USERS[7]}),
+        ("query event family 'loan.'", {"event": "loan."}),
+        ("query one user, one event", {"user": USERS[7], "event": "loan.settle"}),
+        ("query 1% time window", {"start": middle, "end": middle + window}),
+    ):
+        matches, elapsed = timed(label, lambda: reader.query(**kwargs))
+        slowest = max(slowest, elapsed)
+        wrong = [entry for entry in (matches[i] for i in range(min(SCREEN_ROWS, len(matches))))
+                 if entry.user != kwargs.get("user", entry.user)
+                 or not entry.event.startswith(kwargs.get("event", entry.event))]
+        if wrong:
+            print(f"    wrong entry returned: {wrong[0]}")
+            slowest = float("inf")
+        matches.close()
+    start = time.perf_counter()
+    screen = [everything[i] for i in range(SCREEN_ROWS)]
+    print(f"decode first {len(screen)} rows                {(time.perf_counter() - start) * 1000:8.2f} ms")
+    everything.close()
+    queries_ok = slowest < QUERY_BUDGET_MS
+    print(f"slowest filter                     {slowest:8.1f} ms   {'OK' if queries_ok else 'SLOW'}")
+
+    # Crash between the log write and the index write: the last 100 lines lose their index
+    index_path = segments[-1][1] + INDEX_SUFFIX
+    size = os.path.getsize(index_path)
+    os.truncate(index_path, size - 100 * INDEX_DTYPE.itemsize - 7)
+    reopened = AuditLog(directory, segment_bytes=args.segment_mb * 1024 * 1024)
+    reopened.flush()
+    recovered = len(AuditReader(directory).query())
+    recovery_ok = recovered == total
+    print(f"recovery after torn index          {recovered:,} of {total:,} entries   "
+          f"{'OK' if recovery_ok else 'FAILED'}")
+
+    sys.exit(0 if p99 < RECORD_P99_BUDGET_US and queries_ok and recovery_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Working-day calendar benchmark
+
+Builds a calendar of SITES sites (each with its own holidays and a six-day
+override) over the default span of years, then times single range counts
+against walking the days one by one, and one bulk lookup of a whole payroll
+run's ranges. Every timed answer is checked against the day walk.
+
+    python benchmarks/bench_calendar.py --sites 20 --employees 40000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from work_calendar import DEFAULT_PATTERNS, YEARS_AHEAD, YEARS_BACK, WorkCalendar  # noqa: E402
+
+BUILD_BUDGET_MS = 50.0
+LOOKUP_BUDGET_US = 5.0
+BULK_BUDGET_MS = 20.0
+LOOKUPS = 100000
+CHECKED = 2000
+
+
+def walk(calendar_weeks, holidays, site, pattern, start, end):
+    """The slow reference: look at every day in the range"""
+    week = calendar_weeks.get((site, pattern)) or calendar_weeks[("", pattern)]
+    closed = set(holidays.get("", ())) | set(holidays.get(site, ()))
+    days, day = 0, start
+    while day <= end:
+        if week[day.weekday()] == "1" and day.isoformat() not in closed:
+            days += 1
+        day += timedelta(days=1)
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=20)
+    parser.add_argument("--employees", type=int, default=40000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    this_year = date.today().year
+    first_year, last_year = this_year - YEARS_BACK, this_year + YEARS_AHEAD
+    span = (date(last_year + 1, 1, 1) - date(first_year, 1, 1)).days
+    origin = date(first_year, 1, 1)
+    sites = [f"Site {i}" for i in range(args.sites)]
+
+    weeks = {("", pattern): week for pattern, week in DEFAULT_PATTERNS.items()}
+    weeks.update({(site, "six-day"): "1111101" for site in sites[::2]})
+    holidays = {"": [(origin + timedelta(days=int(d))).isoformat() for d in rng.integers(0, span, 20 * 8)]}
+    for site in sites:
+        holidays[site] = [(origin + timedelta(days=int(d))).isoformat() for d in rng.integers(0, span, 5 * 8)]
+
+    start = time.perf_counter()
+    calendar = WorkCalendar(first_year, last_year, weeks, holidays)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"build {len(calendar.rows)} rows x {span:,} days        {build_ms:8.2f} ms   "
+          f"{'OK' if build_ms < BUILD_BUDGET_MS else 'SLOW'}")
+
+    pairs = [(site, pattern) for site in [""] + sites for pattern in DEFAULT_PATTERNS]
+    ranges = []
+    for _ in range(LOOKUPS):
+        a, b = sorted(rng.integers(0, span, 2))
+        site, pattern = pairs[rng.integers(len(pairs))]
+        ranges.append((origin + timedelta(days=int(a)), origin + timedelta(days=int(b)), site, pattern))
+
+    start = time.perf_counter()
+    counts = [calendar.working_days(a, b, site, pattern) for a, b, site, pattern in ranges]
+    lookup_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+    start = time.perf_counter()
+    expected = [walk(weeks, holidays, site, pattern, a, b) for a, b, site, pattern in ranges[:CHECKED]]
+    walk_us = (time.perf_counter() - start) / CHECKED * 1e6
+    single_ok = counts[:CHECKED] == expected
+    print(f"working_days() per range          {lookup_us:8.2f} us   day walk {walk_us:,.0f} us   "
+          f"{'OK' if single_ok and lookup_us < LOOKUP_BUDGET_US else 'FAILED' if not single_ok else 'SLOW'}")
+
+    # A payroll month: everyone's calendar row, joiners starting part-way through
+    n = args.employees
+    # Tuples of strings, as the payroll query's columns arrive
+    emp_sites = tuple(pairs[i][0] for i in rng.integers(len(pairs), size=n))
+    emp_patterns = tuple(pairs[i][1] for i in rng.integers(len(pairs), size=n))
+    first_day = np.datetime64(f"{this_year}-03-01")
+    starts = first_day + np.where(rng.random(n) < 0.05, rng.integers(0, 31, n), 0)
+    ends = np.full(n, np.datetime64(f"{this_year}-03-31"))
+    start = time.perf_counter()
+    rows = calendar.rows_for(emp_sites, emp_patterns)
+    bulk = calendar.working_days_bulk(starts, ends, rows)
+    bulk_ms = (time.perf_counter() - start) * 1000
+    sample = rng.integers(0, n, CHECKED)
+    bulk_ok = all(
+        bulk[i] == walk(weeks, holidays, emp_sites[i], emp_patterns[i], starts[i].item(), ends[i].item())
+        for i in sample
+    )
+    print(f"bulk lookup x{n:,}               {bulk_ms:8.2f} ms   "
+          f"{'OK' if bulk_ok and bulk_ms < BULK_BUDGET_MS else 'FAILED' if not bulk_ok else 'SLOW'}")
+
+    sys.exit(0 if build_ms < BUILD_BUDGET_MS and single_ok and lookup_us < LOOKUP_BUDGET_US
+             and bulk_ok and bulk_ms < BULK_BUDGET_MS else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Large-series chart benchmark
+
+Plots a synthetic multi-year trend under the offscreen platform and times:
+
+  load     set_data() of the whole series through to the first painted frame
+  append   one live batch appended and painted (the import progress path)
+  zoom     a zoom to a narrower window re-sampled and painted
+
+For comparison the same series is also drawn the plain QtCharts way, with
+every point handed to a QLineSeries.
+
+    python benchmarks/bench_charts.py --points 500000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+import numpy as np  # noqa: E402
+from PyQt5.QtCore import QDateTime, QPointF  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+FRAME_BUDGET_MS = 16.0
+LOAD_BUDGET_MS = 100.0
+DAY_MS = 86400 * 1000.0
+
+
+def synthetic_series(points, start_ms=1.5e12):
+    rng = np.random.default_rng(7)
+    x = start_ms + np.arange(points) * (DAY_MS / 24)   # hourly samples
+    y = 400 + 80 * np.sin(np.arange(points) / 2000.0) + rng.normal(0, 15, points)
+    y[rng.integers(0, points, 50)] += 300               # spikes downsampling must keep
+    return x, y
+
+
+def paint(app, view):
+    app.processEvents()     # runs the scheduled redraw
+    view.viewport().repaint()
+
+
+def timed(fn, repeat):
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples, budget=None):
+    median = statistics.median(samples)
+    line = f"{name:<28} median {median:8.2f} ms   max {max(samples):8.2f} ms"
+    if budget is None:
+        print(line)
+        return False
+    ok = median < budget
+    print(f"{line}   budget {budget:5.0f} ms   {'OK' if ok else 'OVER BUDGET'}")
+    return not ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=500000)
+    parser.add_argument("--batch", type=int, default=1000, help="points per appended batch")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--mode", choices=("minmax", "lttb"), default="minmax")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from trend_chart import TrendChart
+
+    x, y = synthetic_series(args.points + args.batch * args.repeat)
+    base_x, base_y = x[:args.points], y[:args.points]
+
+    view = TrendChart("Benchmark", mode=args.mode)
+    view.resize(900, 400)
+    view.show()
+    app.processEvents()
+
+    def load(_):
+        view.set_data(base_x, base_y)
+        paint(app, view)
+
+    failed = report(f"load {args.points:,} points", timed(load, args.repeat), LOAD_BUDGET_MS)
+    print(f"{'':<28} drawn {view.series.count():,} points, antialiasing "
+          f"{'on' if view.renderHints() & 1 else 'off'}")
+
+    def append(i):
+        lo = args.points + i * args.batch
+        view.append(x[lo:lo + args.batch], y[lo:lo + args.batch])
+        paint(app, view)
+
+    failed |= report(f"append {args.batch:,} points", timed(append, args.repeat), FRAME_BUDGET_MS)
+
+    span = x[len(view) - 1] - x[0]
+
+    def zoom(i):
+        first = x[0] + span * (i % 5) / 10
+        view.axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(first)),
+                             QDateTime.fromMSecsSinceEpoch(int(first + span / 20)))
+        paint(app, view)
+
+    failed |= report("zoom to 5% of the range", timed(zoom, args.repeat), FRAME_BUDGET_MS)
+    view.close()
+
+    # ---- Baseline: every point handed to QtCharts ----
+    from PyQt5.QtChart import QChartView, QLineSeries
+    plain = QChartView()
+    plain.resize(900, 400)
+    plain.show()
+
+    def plain_load(_):
+        series = QLineSeries()
+        series.replace([QPointF(a, b) for a, b in zip(base_x.tolist(), base_y.tolist())])
+        plain.chart().removeAllSeries()
+        plain.chart().addSeries(series)
+        plain.chart().createDefaultAxes()
+        plain.viewport().repaint()
+        app.processEvents()
+
+    report("plain QLineSeries load", timed(plain_load, max(1, args.repeat // 5)))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Dashboard query benchmark
+
+Seeds a throwaway database with N employees and M attendance rows, then times
+the queries behind the dashboard cards and charts.
+
+    python benchmarks/bench_database.py --employees 40000 --attendance 10000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from attendance_rollups import rebuild_rollups  # noqa: E402
+
+BUDGET_MS = 20.0
+DEPARTMENTS = ["Production", "Fabrication", "Erection", "Design", "Finance", "HR", "Stores", "QA"]
+
+
+def seed(pool, employees, attendance_rows):
+    conn = pool.connection()
+    with pool.transaction():
+        conn.executemany(
+            "INSERT INTO employees (emp_no, name, email, department, category, joined_on) "
+            "VALUES (?, ?, ?, ?, ?, '2020-01-01')",
+            (
+                (f"EMP{i:06d}", f"Employee {i}", f"employee{i}@fbsl.lk",
+                 DEPARTMENTS[i % len(DEPARTMENTS)], "Labour" if i % 3 == 0 else "Staff")
+                for i in range(1, employees + 1)
+            )
+        )
+
+    # One row per employee per day, walking back from today until the target is reached
+    days = max(1, attendance_rows // employees)
+    first_day = date.today() - timedelta(days=days - 1)
+    with pool.transaction():
+        conn.execute("""
+            WITH RECURSIVE d(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM d WHERE n < ?)
+            INSERT INTO attendance (employee_id, work_date, check_in, check_out)
+            SELECT e.id, date(?, '+' || d.n || ' days'), '08:00', '17:00'
+            FROM d, employees e
+        """, (days - 1, first_day.isoformat()))
+    rebuild_rollups(pool)
+    return days * employees
+
+
+def time_query(fn, repeat):
+    fn()  # warm the page cache and statement cache
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=40000)
+    parser.add_argument("--attendance", type=int, default=10000000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--db", help="database file (default: temporary file)")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "bench.db")
+    pool = ConnectionPool(path)
+    repo = HRMRepository(pool)
+
+    if not repo.headcount()["total"]:
+        start = time.perf_counter()
+        rows = seed(pool, args.employees, args.attendance)
+        print(f"Seeded {args.employees} employees / {rows} attendance rows "
+              f"in {time.perf_counter() - start:.1f}s ({path})")
+
+    queries = {
+        "headcount cards": repo.headcount,
+        "today attendance card": repo.present_on,
+        "monthly attendance chart": repo.monthly_attendance,
+    }
+
+    failed = False
+    for name, fn in queries.items():
+        samples = time_query(fn, args.repeat)
+        median = statistics.median(samples)
+        worst = max(samples)
+        ok = worst < BUDGET_MS
+        failed |= not ok
+        print(f"{name:<28} median {median:7.3f} ms   max {worst:7.3f} ms   {'OK' if ok else 'OVER BUDGET'}")
+
+    pool.close_all()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
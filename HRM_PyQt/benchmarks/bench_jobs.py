@@ -0,0 +1,123 @@
+"""Background job benchmark: GUI responsiveness under load
+
+Runs a real payroll job (departments on the shared process pool) together
+with CPU-bound jobs that keep every process pool worker busy, while a 10 ms
+QTimer on the GUI thread records how late each tick fires. Then checks that
+a running payroll job stops promptly when cancelled and stores nothing.
+
+    python benchmarks/bench_jobs.py --employees 40000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from PyQt5.QtCore import QElapsedTimer, QTimer  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from jobs import LOW, PROCESS_WORKERS, job_manager, process_pool  # noqa: E402
+from payroll import run_payroll  # noqa: E402
+from bench_payroll import seed  # noqa: E402
+
+TICK_MS = 10
+LATENCY_BUDGET_MS = 50.0      # p99 lateness of a GUI timer tick
+CANCEL_BUDGET_S = 1.0
+
+
+def burn(seconds):
+    """Process pool task: spin the CPU for `seconds`"""
+    end = time.perf_counter() + seconds
+    n = 0
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+def saturate(seconds, cancelled):
+    """Job: keep every process pool worker busy until done or cancelled"""
+    futures = [process_pool().submit(burn, seconds) for _ in range(PROCESS_WORKERS)]
+    while not all(future.done() for future in futures):
+        if cancelled():
+            break
+        time.sleep(0.05)
+    return len(futures)
+
+
+def measure_latency(app, until):
+    """Run the event loop until `until()` is true; return each tick's lateness in ms"""
+    late = []
+    clock = QElapsedTimer()
+    clock.start()
+    expected = [TICK_MS]
+
+    def tick():
+        late.append(max(0, clock.elapsed() - expected[0]))
+        expected[0] = clock.elapsed() + TICK_MS
+        if until():
+            timer.stop()
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(TICK_MS)
+    app.exec_()
+    return late
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=40000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    manager = job_manager()
+    failed = False
+
+    period = date.today().strftime("%Y-%m")
+    path = os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "jobs.db")
+    pool = ConnectionPool(path)
+    repo = HRMRepository(pool)
+    seed(pool, args.employees, period)
+    # Warm the pool up so the spawn cost is not counted as a stall
+    process_pool().submit(burn, 0).result()
+
+    # ----- Responsiveness -----
+    start = time.perf_counter()
+    manager.submit("export", "CPU load", saturate, 3.0, priority=LOW)
+    payroll = manager.submit("payroll", f"Payroll {period}", run_payroll, repo, period,
+                             workers=max(2, PROCESS_WORKERS), executor=process_pool())
+    late = measure_latency(app, lambda: not manager.active())
+    p99 = sorted(late)[min(len(late) - 1, int(len(late) * 0.99))]
+    ok = p99 < LATENCY_BUDGET_MS and payroll.state == "done"
+    failed |= not ok
+    print(f"{PROCESS_WORKERS} busy workers + payroll ({payroll.state}, {time.perf_counter() - start:.1f} s)   "
+          f"tick lateness median {statistics.median(late):5.1f} ms   p99 {p99:5.1f} ms   "
+          f"{'OK' if ok else 'OVER BUDGET'}")
+
+    # ----- Cancellation -----
+    runs = pool.connection().execute("SELECT COUNT(*) FROM payroll_runs").fetchone()[0]
+    manager.submit("export", "CPU load", saturate, 2.0)
+    payroll = manager.submit("payroll", "Payroll (cancelled)", run_payroll, repo, period,
+                             workers=max(2, PROCESS_WORKERS), executor=process_pool())
+    QTimer.singleShot(300, lambda: manager.cancel(payroll))
+    measure_latency(app, lambda: payroll.finished)
+    stopped = payroll.ended_at - payroll.started_at - 0.3
+    stored = pool.connection().execute("SELECT COUNT(*) FROM payroll_runs").fetchone()[0] - runs
+    ok = payroll.state == "cancelled" and stored == 0 and stopped < CANCEL_BUDGET_S
+    failed |= not ok
+    print(f"cancel running payroll           {payroll.state}, stopped {stopped:.2f} s after cancel, "
+          f"{stored} runs stored   {'OK' if ok else 'FAILED'}")
+
+    manager.wait()
+    pool.close_all()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Wallboard card benchmark
+
+Lays out CARDS dashboard cards in a grid, as a department wallboard would,
+and times a refresh that changes every card's value and paints the result,
+for the self-painted KPICard and for the stylesheet card (a QFrame with two
+QLabels) the dashboard used before. Also times a resize of the whole board,
+which must not cost KPICard more than it costs the stylesheet card.
+
+    python benchmarks/bench_kpi_cards.py --cards 24 --refreshes 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from PyQt5.QtWidgets import QApplication, QFrame, QGridLayout, QLabel, QVBoxLayout, QWidget  # noqa: E402
+from PyQt5.QtGui import QFont  # noqa: E402
+from theme import ACCENTS, SURFACE, apply_theme, set_role  # noqa: E402
+from kpi_card import KPICard  # noqa: E402
+
+REFRESH_BUDGET_MS = 8.0     # half a 60 Hz frame for the whole board
+COLUMNS = 6
+
+# The previous dashboard card, for comparison
+STYLESHEET_CARD = f"""
+QFrame[role="card"] {{
+    background-color: {SURFACE};
+    border-radius: 15px;
+    border-left: 8px solid {ACCENTS["blue"]};
+    padding: 15px;
+}}
+"""
+
+
+class StylesheetCard(QFrame):
+    def __init__(self, title):
+        super().__init__()
+        self.setMinimumWidth(200)
+        self.setMaximumWidth(300)
+        set_role(self, "card")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        heading = QLabel(title)
+        heading.setFont(QFont("Segoe UI", 11))
+        set_role(heading, "muted")
+        self.label = QLabel("–")
+        self.label.setFont(QFont("Segoe UI", 28, QFont.Bold))
+        set_role(self.label, "heading")
+        layout.addWidget(heading)
+        layout.addStretch()
+        layout.addWidget(self.label)
+
+    def set_value(self, value):
+        self.label.setText(f"{value:,}")
+
+
+def build_board(app, make_card, count):
+    board = QWidget()
+    grid = QGridLayout(board)
+    cards = []
+    for i in range(count):
+        card = make_card(i)
+        grid.addWidget(card, i // COLUMNS, i % COLUMNS)
+        cards.append(card)
+    board.resize(COLUMNS * 260, (count // COLUMNS + 1) * 140)
+    board.show()
+    app.processEvents()
+    return board, cards
+
+
+def time_board(app, name, make_card, count, refreshes):
+    board, cards = build_board(app, make_card, count)
+    samples = []
+    for r in range(refreshes):
+        start = time.perf_counter()
+        for i, card in enumerate(cards):
+            card.set_value(1000 + r * 37 + i)
+        # Relayout and paint whatever the updates marked dirty, as the event loop would
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+    resizes = []
+    for r in range(20):
+        start = time.perf_counter()
+        board.resize(board.width() + (10 if r % 2 else -10), board.height())
+        app.processEvents()
+        resizes.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(samples)
+    resize = statistics.median(resizes)
+    print(f"{name:<16} refresh median {median:7.2f} ms   max {max(samples):7.2f} ms   "
+          f"resize median {resize:7.2f} ms")
+    board.close()
+    return median, resize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=24)
+    parser.add_argument("--refreshes", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    apply_theme(app)
+    app.setStyleSheet(app.styleSheet() + STYLESHEET_CARD)
+    accents = list(ACCENTS)
+
+    print(f"{args.cards} cards, every value changing on each refresh")
+    kpi, kpi_resize = time_board(app, "KPICard", lambda i: KPICard(f"Department {i}", accents[i % len(accents)]),
+                     args.cards, args.refreshes)
+    stylesheet, stylesheet_resize = time_board(app, "stylesheet card", lambda i: StylesheetCard(f"Department {i}"),
+                            args.cards, args.refreshes)
+    ok = kpi < REFRESH_BUDGET_MS and kpi_resize < stylesheet_resize
+    print(f"KPICard {stylesheet / kpi:.1f}x faster per refresh, "
+          f"{stylesheet_resize / kpi_resize:.1f}x per resize   {'OK' if ok else 'SLOW'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
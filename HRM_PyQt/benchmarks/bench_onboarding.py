@@ -0,0 +1,105 @@
+"""Bulk onboarding benchmark
+
+Writes a CSV of N new employees, about 2% of them broken in the ways real
+exports are (short names, bad emails, unknown positions, duplicate rows,
+emails already registered), into a database that already holds EXISTING
+employees, then times validation alone and the full onboarding.
+
+    python benchmarks/bench_onboarding.py --rows 10000 --existing 40000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from employee_search import get_search_index  # noqa: E402
+from onboarding import onboard_employees  # noqa: E402
+
+ONBOARD_BUDGET_S = 5.0
+POSITIONS = ["HR", "Project Manager", "Director", ""]
+DEPARTMENTS = ["Production", "Fabrication", "Erection", "Design", "Finance", "HR", "Stores", "QA"]
+
+
+def seed(pool, existing):
+    with pool.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO employees (emp_no, name, email, department, joined_on) VALUES (?, ?, ?, ?, '2020-01-01')",
+            ((f"EMP{i:06d}", f"Existing {i}", f"existing{i}@fbsl.lk", DEPARTMENTS[i % len(DEPARTMENTS)])
+             for i in range(1, existing + 1))
+        )
+
+
+def write_csv(path, rows, existing):
+    rng = random.Random(5)
+    broken = 0
+    previous_broken = True
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Full Name", "Email", "Position", "Department", "Category", "NIC", "Join Date"])
+        for i in range(rows):
+            row = [f"New Hire {i}", f"new.hire{i}@site.fbsl.lk", rng.choice(POSITIONS),
+                   rng.choice(DEPARTMENTS), rng.choice(["Staff", "labour"]),
+                   f"{rng.randint(195000000000, 200499999999)}", "2026-10-01"]
+            fault = rng.randrange(250)
+            if fault == 4 and previous_broken:
+                fault = None    # duplicating a rejected row would not be caught as a duplicate
+            if fault == 0:
+                row[0] = "Al"
+            elif fault == 1:
+                row[1] = "not-an-email"
+            elif fault == 2:
+                row[2] = "Intern"
+            elif fault == 3:
+                row[1] = f"existing{rng.randint(1, existing)}@FBSL.lk"
+            elif fault == 4:
+                row[1] = f"new.hire{i - 1}@site.fbsl.lk"
+            previous_broken = fault is not None and fault < 5
+            broken += previous_broken
+            writer.writerow(row)
+    return broken
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--existing", type=int, default=40000)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="hrm_bench_")
+    pool = ConnectionPool(os.path.join(folder, "onboarding.db"))
+    repo = HRMRepository(pool)
+    seed(pool, args.existing)
+    path = os.path.join(folder, "new_site.csv")
+    broken = write_csv(path, args.rows, args.existing)
+    # The header search index follows every insert, as it does in the app
+    get_search_index(repo).build()
+
+    start = time.perf_counter()
+    checked = onboard_employees(repo, path, dry_run=True)
+    print(f"validate {args.rows:,} rows            {(time.perf_counter() - start) * 1000:8.1f} ms   "
+          f"{len(checked.errors)} rejected ({broken} broken on purpose)")
+
+    result = onboard_employees(repo, path)
+    ok = (result.elapsed < ONBOARD_BUDGET_S and len(result.errors) == broken
+          and result.inserted == args.rows - broken)
+    print(f"onboard {args.rows:,} rows             {result.elapsed * 1000:8.1f} ms   "
+          f"{result.inserted:,} added   {'OK' if ok else 'FAILED'}")
+    for error in result.errors[:5]:
+        print(f"    line {error.line}: {error.field} {error.value!r} - {error.message}")
+
+    again = onboard_employees(repo, path)
+    ok_again = again.inserted == 0 and len(again.errors) == args.rows
+    print(f"re-run rejects every row         {again.elapsed * 1000:8.1f} ms   {'OK' if ok_again else 'FAILED'}")
+
+    pool.close_all()
+    sys.exit(0 if ok and ok_again else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Payroll run benchmark
+
+Times the vectorized payroll engine on its own and a full monthly run
+(read inputs, compute, write payslips) in-process and across a process pool.
+
+    python benchmarks/bench_payroll.py --employees 40000 --workers 4
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from payroll import PayrollInputs, compute_payroll, run_payroll  # noqa: E402
+
+COMPUTE_BUDGET_MS = 50.0
+RUN_BUDGET_S = 5.0
+DEPARTMENTS = ["Production", "Fabrication", "Erection", "Design", "Finance", "HR", "Stores", "QA"]
+
+
+def synthetic_inputs(n):
+    rng = np.random.default_rng(42)
+    return PayrollInputs(
+        employee_id=np.arange(1, n + 1, dtype=np.int64),
+        department=np.array([DEPARTMENTS[i % len(DEPARTMENTS)] for i in range(n)], dtype=object),
+        basic=rng.uniform(45000, 450000, n).round(-2),
+        allowances=rng.uniform(0, 25000, n).round(-2),
+        overtime_hours=rng.uniform(0, 60, n).round(2),
+        days_present=rng.integers(15, 27, n),
+        other_deductions=np.zeros(n),
+        # One in twenty joined part-way through the month
+        scheduled_days=np.full(n, 22),
+        payable_days=np.where(np.arange(n) % 20 == 0, rng.integers(1, 22, n), 22),
+    )
+
+
+def seed(pool, employees, period):
+    conn = pool.connection()
+    rng = np.random.default_rng(7)
+    with pool.transaction():
+        conn.executemany(
+            "INSERT INTO employees (emp_no, name, email, department, category, joined_on) "
+            "VALUES (?, ?, ?, ?, 'Staff', '2020-01-01')",
+            ((f"EMP{i:06d}", f"Employee {i}", f"employee{i}@fbsl.lk", DEPARTMENTS[i % len(DEPARTMENTS)])
+             for i in range(1, employees + 1))
+        )
+        conn.executemany(
+            "INSERT INTO salary_structures (employee_id, basic_salary, fixed_allowance) VALUES (?, ?, ?)",
+            zip(range(1, employees + 1),
+                rng.uniform(45000, 450000, employees).round(-2).tolist(),
+                rng.uniform(0, 25000, employees).round(-2).tolist())
+        )
+        # 22 working days, leaving between 17:00 and 20:59
+        conn.execute("""
+            WITH RECURSIVE d(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM d WHERE n < 22)
+            INSERT INTO attendance (employee_id, work_date, check_in, check_out)
+            SELECT e.id, printf('%s-%02d', ?, d.n), '08:00:00',
+                   printf('%02d:%02d:00', 17 + abs(random()) % 4, abs(random()) % 60)
+            FROM d, employees e
+        """, (period,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=40000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    failed = False
+
+    # ----- Engine only -----
+    inputs = synthetic_inputs(args.employees)
+    compute_payroll(inputs)
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        compute_payroll(inputs)
+        samples.append((time.perf_counter() - start) * 1000)
+    ok = statistics.median(samples) < COMPUTE_BUDGET_MS
+    failed |= not ok
+    print(f"compute_payroll x{args.employees:<8} median {statistics.median(samples):8.2f} ms   "
+          f"{'OK' if ok else 'OVER BUDGET'}")
+
+    # ----- Full run -----
+    period = date.today().strftime("%Y-%m")
+    path = os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "payroll.db")
+    pool = ConnectionPool(path)
+    repo = HRMRepository(pool)
+    start = time.perf_counter()
+    seed(pool, args.employees, period)
+    print(f"Seeded {args.employees} employees with one month of attendance in "
+          f"{time.perf_counter() - start:.1f}s ({path})")
+
+    for workers in sorted({1, args.workers}):
+        result = run_payroll(repo, period, workers=workers)
+        ok = result.elapsed < RUN_BUDGET_S
+        failed |= not ok
+        print(f"run_payroll workers={workers:<3}         {result.elapsed:8.2f} s    "
+              f"{result.employees} payslips, net {result.total_net:,.2f}   {'OK' if ok else 'OVER BUDGET'}")
+
+    pool.close_all()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Session permissions benchmark
+
+Seeds EMPLOYEES employees, a manager with REPORTS direct and indirect
+reports, and the default roles, then times compiling the manager's session
+(the one-off cost at sign-in), the per-render and per-row checks made
+afterwards, and the first employee page fetched with and without the
+session's row filter.
+
+    python benchmarks/bench_permissions.py --employees 40000 --reports 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from permissions import AccessControl, VIEW_SALARY, VIEW_EMPLOYEES, PERMISSION_BITS  # noqa: E402
+
+COMPILE_BUDGET_MS = 50.0
+CHECK_BUDGET_US = 1.0
+CHECKS = 1000000
+PAGE_SIZE = 200
+DEPARTMENTS = ["Production", "Fabrication", "Erection", "Design", "Finance", "HR", "Stores", "QA"]
+
+
+def seed(pool, employees, reports):
+    with pool.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO employees (emp_no, name, email, position, department, joined_on) "
+            "VALUES (?, ?, ?, ?, ?, '2020-01-01')",
+            ((f"EMP{i:06d}", f"Employee {i}", f"employee{i}@fbsl.lk", "Project Manager" if i == 1 else None,
+              DEPARTMENTS[i % len(DEPARTMENTS)]) for i in range(1, employees + 1))
+        )
+        # A tree under employee 1: every report has up to ten reports of its own
+        conn.executemany(
+            "INSERT INTO reporting_lines (employee_id, manager_id) VALUES (?, ?)",
+            ((i, 1 + (i - 2) // 10) for i in range(2, reports + 2))
+        )
+        conn.execute("INSERT INTO user_accounts (username, employee_id, password_hash) VALUES ('pm', 1, 'x')")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=40000)
+    parser.add_argument("--reports", type=int, default=2000)
+    args = parser.parse_args()
+
+    pool = ConnectionPool(os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "permissions.db"))
+    repo = HRMRepository(pool)
+    seed(pool, args.employees, args.reports)
+    access = AccessControl(repo)
+    access.seed(assignments={"pm": "Project Manager"})
+
+    start = time.perf_counter()
+    session = access.compile("pm")
+    compile_ms = (time.perf_counter() - start) * 1000
+    print(f"compile session ({len(session.employee_ids) - 1:,} reports)  {compile_ms:8.2f} ms   "
+          f"{'OK' if compile_ms < COMPILE_BUDGET_MS else 'SLOW'}")
+
+    pages = list(PERMISSION_BITS.values())
+    start = time.perf_counter()
+    for i in range(CHECKS):
+        session.can(pages[i % len(pages)])
+    can_us = (time.perf_counter() - start) / CHECKS * 1e6
+    start = time.perf_counter()
+    for i in range(CHECKS):
+        session.can_see(i % args.employees, "QA")
+    see_us = (time.perf_counter() - start) / CHECKS * 1e6
+    checks_ok = can_us < CHECK_BUDGET_US and see_us < CHECK_BUDGET_US
+    print(f"can() per check                   {can_us:8.3f} us")
+    print(f"can_see() per row                 {see_us:8.3f} us   {'OK' if checks_ok else 'SLOW'}")
+    print(f"    salary {session.can(VIEW_SALARY)}, employees {session.can(VIEW_EMPLOYEES)}")
+
+    for label, scope in (("first page, every row", None), ("first page, manager's rows", session.row_filter)):
+        repo.employee_page(PAGE_SIZE, scope=scope)
+        start = time.perf_counter()
+        rows = repo.employee_page(PAGE_SIZE, scope=scope)
+        print(f"{label:<33} {(time.perf_counter() - start) * 1000:8.2f} ms   {len(rows)} rows")
+    scoped_ok = all(session.can_see(row[0]) for row in repo.employee_page(PAGE_SIZE, scope=session.row_filter))
+    print(f"scoped rows all visible           {'OK' if scoped_ok else 'FAILED'}")
+
+    pool.close_all()
+    sys.exit(0 if compile_ms < COMPILE_BUDGET_MS and checks_ok and scoped_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
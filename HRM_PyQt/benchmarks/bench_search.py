@@ -0,0 +1,118 @@
+"""Header search benchmark
+
+Seeds a throwaway database with N employees (realistic names, emails, NICs
+and departments), builds the in-memory search index and times lookups for
+the kinds of text people type: one or two letters, a name prefix, two name
+fragments, an employee number, a NIC, an email and a mid-word fragment.
+Then times the incremental update after an insert and an edit.
+
+    python benchmarks/bench_search.py --employees 40000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from database import ConnectionPool, HRMRepository  # noqa: E402
+from employee_search import get_search_index  # noqa: E402
+
+LOOKUP_BUDGET_MS = 5.0
+UPDATE_BUDGET_MS = 5.0
+DEPARTMENTS = ["Production", "Fabrication", "Erection", "Design", "Finance", "HR", "Stores", "QA"]
+FIRST = ["Nimal", "Kamal", "Sunil", "Saman", "Ruwan", "Chamari", "Dilani", "Nadeesha", "Kasun",
+         "Tharindu", "Ishara", "Amal", "Anjali", "Joanne", "Priyanka", "Mahesh", "Sanduni", "Lahiru"]
+LAST = ["Perera", "Silva", "Fernando", "Jayasinghe", "Bandara", "Wickramasinghe", "Dissanayake",
+        "Gunawardena", "Rathnayake", "Herath", "Kumara", "Senanayake", "Weerasinghe", "Abeysekara"]
+
+
+def seed(pool, employees):
+    rng = random.Random(11)
+    rows = []
+    for i in range(1, employees + 1):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        rows.append((
+            f"EMP{i:06d}", f"{first} {last}", f"{first}.{last}{i}@fbsl.lk".lower(),
+            f"{rng.randint(195000000000, 200499999999)}", DEPARTMENTS[i % len(DEPARTMENTS)]
+        ))
+    with pool.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO employees (emp_no, name, email, nic, department, joined_on) "
+            "VALUES (?, ?, ?, ?, ?, '2020-01-01')", rows
+        )
+    return rows
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples, budget):
+    p99 = sorted(samples)[min(len(samples) - 1, int(len(samples) * 0.99))]
+    ok = p99 < budget
+    print(f"{name:<30} median {statistics.median(samples):7.3f} ms   p99 {p99:7.3f} ms   "
+          f"{'OK' if ok else 'OVER BUDGET'}")
+    return not ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=40000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    pool = ConnectionPool(os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "bench.db"))
+    repo = HRMRepository(pool)
+    rows = seed(pool, args.employees)
+    index = get_search_index(repo)
+
+    start = time.perf_counter()
+    index.build()
+    print(f"index build ({len(index):,} employees)   {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    probe = rows[len(rows) // 2]
+    queries = {
+        "one letter": "s",
+        "two letters": "ka",
+        "name prefix": "wickram",
+        "two name fragments": "jo sil",
+        "employee number": probe[0].lower(),
+        "employee number prefix": "emp0123",
+        "NIC": probe[3],
+        "email": probe[2],
+        "mid-word fragment": "nayak",
+        "department": "fabric",
+        "no match": "zzqx",
+    }
+    failed = False
+    for name, text in queries.items():
+        hits = index.search(text)
+        failed |= report(f"{name} ({len(hits)} hits)", timed(lambda: index.search(text), args.repeat),
+                         LOOKUP_BUDGET_MS)
+
+    counter = iter(range(10 ** 6))
+
+    def insert():
+        i = next(counter)
+        repo.add_employee(f"Bench Person{i}", f"bench{i}@fbsl.lk", department="QA")
+
+    def edit():
+        repo.update_employee(1, name=f"Renamed {next(counter)}")
+
+    failed |= report("insert -> searchable", timed(insert, 50), UPDATE_BUDGET_MS)
+    failed |= report("edit -> searchable", timed(edit, 50), UPDATE_BUDGET_MS)
+    assert index.search("bench person0")[0].name == "Bench Person0"
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Cold start benchmark: process launch to first paint
+
+Every sample runs in a fresh interpreter under the offscreen platform, so
+module imports are as cold as they are for a user:
+
+  login      launch -> DesktopLoginWindow painted
+  dashboard  launch -> HRMMainWindow painted
+  handoff    sign-in -> HRMMainWindow painted, with the dashboard pre-built
+             behind the login screen and built on demand for comparison
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+UI_FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files")
+
+LOGIN_BUDGET_MS = 500.0
+DASHBOARD_BUDGET_MS = 750.0
+HANDOFF_BUDGET_MS = 50.0
+
+
+# ================= Child process =================
+def run_child(mode, launched):
+    """Measure one start-up in this (fresh) process and print the timings as JSON"""
+    sys.path.insert(0, UI_FILES)
+    from PyQt5.QtCore import QObject, QEvent, QTimer
+    from PyQt5.QtWidgets import QApplication, QWidget
+    from workers import thread_pool
+
+    app = QApplication(sys.argv)
+    timings = {}
+
+    class FirstPaint(QObject):
+        """Calls back once the first frame of `window` has been painted"""
+
+        def __init__(self, window, callback):
+            super().__init__()
+            self.window = window
+            self.callback = callback
+            app.installEventFilter(self)
+
+        def eventFilter(self, watched, event):
+            if (event.type() == QEvent.Paint and isinstance(watched, QWidget)
+                    and watched.window() is self.window):
+                app.removeEventFilter(self)
+                # Runs after the rest of this frame has been painted
+                QTimer.singleShot(0, self.callback)
+            return False
+
+    def finish():
+        thread_pool().waitForDone()
+        print(json.dumps(timings))
+        app.quit()
+
+    if mode == "dashboard":
+        from mainWindow import HRMMainWindow
+        window = HRMMainWindow()
+
+        def painted():
+            timings["first_paint"] = (time.time() - launched) * 1000
+            window.refresher.stop()
+            finish()
+
+        watcher = FirstPaint(window, painted)
+        window.show()
+        return app.exec_()
+
+    from login_window import DesktopLoginWindow
+    login = DesktopLoginWindow()
+    state = {}
+
+    def open_dashboard():
+        # Sign-in itself is not measured: only what happens after it succeeds
+        thread_pool().waitForDone()
+        state["watcher"] = FirstPaint(login.main_window, dashboard_painted) if login.main_window else None
+        state["start"] = time.perf_counter()
+        login.open_dashboard()
+        if state["watcher"] is None:
+            state["watcher"] = FirstPaint(login.main_window, dashboard_painted)
+
+    def dashboard_painted():
+        timings["handoff"] = (time.perf_counter() - state["start"]) * 1000
+        login.main_window.refresher.stop()
+        finish()
+
+    def wait_for_prebuild():
+        if login.main_window is None:
+            QTimer.singleShot(10, wait_for_prebuild)
+        else:
+            open_dashboard()
+
+    def login_painted():
+        timings["first_paint"] = (time.time() - launched) * 1000
+        if mode == "login":
+            finish()
+        elif mode == "handoff-prebuilt":
+            login.prebuild_dashboard()
+            wait_for_prebuild()
+        else:
+            open_dashboard()
+
+    watcher = FirstPaint(login, login_painted)
+    login.show()
+    return app.exec_()
+
+
+# ================= Parent process =================
+def sample(mode, env):
+    launched = time.time()
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, "--launched", repr(launched)],
+        env=env, cwd=UI_FILES, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def report(name, samples, budget=None):
+    median = statistics.median(samples)
+    line = f"{name:<34} median {median:8.1f} ms   min {min(samples):8.1f} ms"
+    if budget is None:
+        print(line)
+        return False
+    ok = median < budget
+    print(f"{line}   budget {budget:5.0f} ms   {'OK' if ok else 'OVER BUDGET'}")
+    return not ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--launched", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.exit(run_child(args.child, args.launched))
+
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.setdefault("HRM_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "bench.db"))
+
+    # Warm-up: creates the database and calibrates password hashing once
+    sample("login", env)
+
+    results = {mode: [sample(mode, env) for _ in range(args.repeat)]
+               for mode in ("login", "dashboard", "handoff-prebuilt", "handoff-cold")}
+
+    failed = report("launch -> login painted", [r["first_paint"] for r in results["login"]], LOGIN_BUDGET_MS)
+    failed |= report("launch -> dashboard painted",
+                     [r["first_paint"] for r in results["dashboard"]], DASHBOARD_BUDGET_MS)
+    failed |= report("sign-in -> dashboard (pre-built)",
+                     [r["handoff"] for r in results["handoff-prebuilt"]], HANDOFF_BUDGET_MS)
+    report("sign-in -> dashboard (cold)", [r["handoff"] for r in results["handoff-cold"]])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Styling cost benchmark for the application theme
+
+Builds and shows each window repeatedly under the offscreen platform (the
+theme is installed once, as in the app) and times construction to first
+paint. Then times the state flips that happen while typing: the sign-in
+button enabling/disabling, a field's `valid` property and the password
+strength level, each of which should only re-match cached theme rules.
+
+    python benchmarks/bench_theme.py --repeat 10
+"""
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("HRM_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "bench.db"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from permissions import unrestricted_session  # noqa: E402
+from workers import thread_pool  # noqa: E402
+
+WINDOW_BUDGET_MS = {
+    "DesktopLoginWindow": 40.0,
+    "RegistrationWindow": 25.0,
+    "HRMMainWindow": 80.0,
+}
+STATE_FLIP_BUDGET_MS = 0.5
+# Windows that need a signed-in session to show their usual state
+WINDOW_ARGS = {
+    "RegistrationWindow": lambda: {"session": unrestricted_session()},
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def time_windows(app, classes, repeat):
+    failed = False
+    for cls in classes:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            window = cls(**WINDOW_ARGS.get(cls.__name__, dict)())
+            window.show()
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1000)
+            if hasattr(window, "refresher"):
+                window.refresher.stop()
+            window.close()
+            window.deleteLater()
+            app.processEvents()
+        median = statistics.median(samples)
+        ok = median < WINDOW_BUDGET_MS[cls.__name__]
+        failed |= not ok
+        print(f"{cls.__name__:<20} construct + first paint median {median:7.2f} ms "
+              f"max {max(samples):7.2f} ms   {'OK' if ok else 'OVER BUDGET'}")
+    return failed
+
+
+def time_flips(name, flips, repeat):
+    samples = []
+    # A collection pause would land on whichever flip triggered it (timeit turns it off too)
+    gc.disable()
+    try:
+        for i in range(repeat):
+            for flip in flips:
+                start = time.perf_counter()
+                flip(i)
+                samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+    p99 = percentile(samples, 99)
+    ok = p99 < STATE_FLIP_BUDGET_MS
+    print(f"{name:<20} state flip median {statistics.median(samples):7.4f} ms "
+          f"p99 {p99:7.4f} ms   {'OK' if ok else 'OVER BUDGET'}")
+    return not ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from form_validation import repolish
+    from login_window import DesktopLoginWindow
+    from RegistrationForm import RegistrationWindow
+    from mainWindow import HRMMainWindow
+
+    failed = time_windows(app, (DesktopLoginWindow, RegistrationWindow, HRMMainWindow), args.repeat)
+
+    login = DesktopLoginWindow()
+    login.show()
+    app.processEvents()
+    # The window starts account seeding and hash calibration on a worker; let
+    # them finish, or the flips are timed against a few hundred ms of hashing
+    thread_pool().waitForDone()
+
+    def toggle_button(i):
+        login.username_valid = login.password_valid = bool(i % 2)
+        login.update_login_button()
+
+    def flip_valid(i):
+        login.username.setProperty("valid", "true" if i % 2 else "false")
+        repolish(login.username)
+
+    def flip_strength(i):
+        login.password_strength.setProperty("strength", ("weak", "fair", "good", "strong")[i % 4])
+        repolish(login.password_strength)
+
+    flips = args.repeat * 50
+    failed |= time_flips("sign-in button", [toggle_button], flips)
+    failed |= time_flips("field validity", [flip_valid], flips)
+    failed |= time_flips("password strength", [flip_strength], flips)
+
+    thread_pool().waitForDone()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Tracing overhead benchmark
+
+Emits a signal N times into a trivial Python slot, first untraced and then
+with the tracer's timing wrapper, and reports the cost the wrapper adds per
+slot call. Then blocks the event loop for STALL_S and checks the stall is
+recorded with a stack that points at the blocking call, and that the trace
+file is valid Chrome trace JSON.
+
+    python benchmarks/bench_tracing.py --emits 200000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from PyQt5.QtCore import QEventLoop, QObject, QTimer, pyqtSignal  # noqa: E402
+from tracing import start_tracing  # noqa: E402
+
+OVERHEAD_BUDGET_US = 5.0
+STALL_S = 0.3
+
+
+class Emitter(QObject):
+    fired = pyqtSignal(int)
+
+
+class Receiver(QObject):
+    def __init__(self):
+        super().__init__()
+        self.total = 0
+
+    def on_fired(self, value):
+        self.total += value
+
+
+def per_emit(emits):
+    emitter, receiver = Emitter(), Receiver()
+    emitter.fired.connect(receiver.on_fired)
+    start = time.perf_counter()
+    for i in range(emits):
+        emitter.fired.emit(i)
+    elapsed = time.perf_counter() - start
+    assert receiver.total == emits * (emits - 1) // 2
+    return elapsed / emits * 1e6
+
+
+def block_event_loop():
+    time.sleep(STALL_S)
+
+
+def run_loop(ms):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec_()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emits", type=int, default=200000)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)  # noqa: F841
+    plain = per_emit(args.emits)
+    path = os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "trace.json")
+    tracer = start_tracing(path)
+    traced = per_emit(args.emits)
+    overhead = traced - plain
+    print(f"slot call untraced               {plain:7.2f} us")
+    print(f"slot call traced                 {traced:7.2f} us   +{overhead:.2f} us   "
+          f"{'OK' if overhead < OVERHEAD_BUDGET_US else 'SLOW'}")
+
+    run_loop(100)
+    QTimer.singleShot(0, block_event_loop)
+    run_loop(int(STALL_S * 1000) + 200)
+    tracer.stop()
+
+    with open(path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    # The traced emit loop above blocks the loop too; look for the stall the sleep caused
+    stalls = [e for e in events if e.get("cat") == "stall" and e["ph"] == "X"
+              and any("block_event_loop" in line for sample in e["args"]["samples"] for line in sample["stack"])]
+    stall_ok = len(stalls) == 1
+    stack = stalls[0]["args"]["samples"][0]["stack"] if stall_ok else []
+    slots = sum(1 for e in events if e.get("cat") == "slot")
+    print(f"stall detected                   {stalls[0]['dur'] / 1000 if stalls else 0:7.1f} ms   "
+          f"{'OK' if stall_ok else 'FAILED'}   ({stack[-1] if stack else 'no stack'})")
+    print(f"trace file                       {os.path.getsize(path) / 2 ** 20:7.1f} MB   {slots:,} slot events")
+    sys.exit(0 if overhead < OVERHEAD_BUDGET_US and stall_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Keystroke latency benchmark for the login and registration forms
+
+Types into every validated field with QTest under the offscreen platform and
+times each keystroke (what the user feels) and each debounced validation
+pass separately.
+
+    python benchmarks/bench_validation.py --repeat 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("HRM_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="hrm_bench_"), "bench.db"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "UI_Files"))
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+from workers import thread_pool  # noqa: E402
+
+KEYSTROKE_BUDGET_MS = 1.0
+VALIDATION_BUDGET_MS = 2.0
+
+SAMPLES = {
+    "username": "test.user@company.com",
+    "password": "Sup3r$ecretPassw0rd",
+    "name_input": "Nimal Perera",
+    "email_input": "nimal.perera@fbsl.lk",
+    "password_input": "Regist3r@2024",
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    from login_window import DesktopLoginWindow
+    from RegistrationForm import RegistrationWindow
+    from permissions import unrestricted_session
+
+    login = DesktopLoginWindow()
+    registration = RegistrationWindow(session=unrestricted_session())
+    fields = [
+        (login, "username", login.username_check),
+        (login, "password", login.password_check),
+        (registration, "name_input", registration.name_check),
+        (registration, "email_input", registration.email_check),
+        (registration, "password_input", registration.password_check),
+    ]
+    login.show()
+    registration.show()
+    app.processEvents()
+    # Let credential calibration finish so it does not compete for the CPU
+    thread_pool().waitForDone()
+
+    failed = False
+    for window, attr, validator in fields:
+        field = getattr(window, attr)
+        keystrokes, validations = [], []
+        for _ in range(args.repeat):
+            field.clear()
+            validator.flush()
+            for ch in SAMPLES[attr]:
+                start = time.perf_counter()
+                QTest.keyClicks(field, ch)
+                keystrokes.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                validator.flush()
+                validations.append((time.perf_counter() - start) * 1000)
+            app.processEvents()
+
+        key_p99 = percentile(keystrokes, 99)
+        val_p99 = percentile(validations, 99)
+        ok = key_p99 < KEYSTROKE_BUDGET_MS and val_p99 < VALIDATION_BUDGET_MS
+        failed |= not ok
+        print(f"{type(window).__name__}.{attr:<15} keystroke median {statistics.median(keystrokes):6.3f} ms "
+              f"p99 {key_p99:6.3f} ms   validation median {statistics.median(validations):6.3f} ms "
+              f"p99 {val_p99:6.3f} ms   {'OK' if ok else 'OVER BUDGET'}")
+
+    thread_pool().waitForDone()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()